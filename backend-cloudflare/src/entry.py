@@ -40,6 +40,49 @@ _WORKER_ENV_KEYS = (
     "OPENAI_API_KEY",
     "CANLII_API_KEY",
     "REDIS_URL",
+    "CHAT_CASE_SEARCH_TIMEOUT_SECONDS",
+    "CHAT_RESEARCH_PREVIEW_TIMEOUT_SECONDS",
+    "CHAT_ANSWER_CACHE_ENABLED",
+    "CHAT_ANSWER_CACHE_MAX_ENTRIES",
+    "CHAT_ANSWER_CACHE_TTL_SECONDS",
+    "CHAT_REQUEST_COALESCING_ENABLED",
+    "CHAT_BATCH_MAX_ITEMS",
+    "CHAT_BATCH_MAX_CONCURRENCY",
+    "CHAT_REQUEST_DEADLINE_SECONDS",
+    "CHAT_BROWNOUT_ENABLED",
+    "CHAT_BROWNOUT_MAX_EVENT_LOOP_LAG_MS",
+    "CHAT_BROWNOUT_MAX_QUEUE_DEPTH",
+    "CHAT_BROWNOUT_MAX_P95_LATENCY_MS",
+    "PROVIDER_RETRY_BUDGET_RATIO",
+    "PROVIDER_RETRY_BUDGET_MAX_TOKENS",
+    "GEMINI_MODEL_FAILURE_THRESHOLD",
+    "GEMINI_MODEL_COOLDOWN_SECONDS",
+    "CHAT_PRECOMPUTED_ANSWERS_PATH",
+    "GROUNDING_SECTION_INDEX_PATH",
+    "GROUNDING_SECTION_INDEX_TOP_K",
+    "GROUNDING_SECTION_VECTORS_PATH",
+    "GROUNDING_EMBEDDER",
+    "CHAT_SESSION_MEMORY_ENABLED",
+    "CHAT_SESSION_MEMORY_MAX_TURNS",
+    "CHAT_SESSION_MEMORY_MAX_SESSIONS",
+    "CHAT_SESSION_MEMORY_TTL_SECONDS",
+    "PROVIDER_HEDGE_ENABLED",
+    "PROVIDER_HEDGE_LATENCY_PERCENTILE",
+    "PROVIDER_HEDGE_MIN_SAMPLES",
+    "PROVIDER_HEDGE_MAX_RATIO",
+    "PROVIDER_ADAPTIVE_ORDERING_ENABLED",
+    "PROVIDER_ADAPTIVE_MIN_SAMPLES",
+    "PROVIDER_ADAPTIVE_SWITCH_MARGIN",
+    "PROVIDER_BULKHEAD_MAX_CONCURRENT",
+    "DEPENDENCY_BULKHEAD_LIMITS",
+    "BULKHEAD_MAX_QUEUE_WAIT_SECONDS",
+    "PROVIDER_CIRCUIT_BREAKER_HALF_OPEN_MAX_PROBES",
+    "PROVIDER_CIRCUIT_BREAKER_SHARED_STATE_ENABLED",
+    "PROVIDER_HTTP_MAX_CONNECTIONS",
+    "PROVIDER_HTTP_MAX_KEEPALIVE_CONNECTIONS",
+    "PROVIDER_HTTP_KEEPALIVE_EXPIRY_SECONDS",
+    "GEMINI_PROMPT_TOKEN_BUDGET",
+    "OPENAI_PROMPT_TOKEN_BUDGET",
 )
 
 
@@ -5,8 +5,8 @@ from datetime import datetime, timezone
 import hashlib
 import json
 from pathlib import Path
-import time
 from typing import Callable
+from urllib.parse import urlsplit
 
 import httpx
 
@@ -21,6 +21,7 @@ from immcad_api.policy.source_policy import (
     is_source_ingest_allowed,
     load_source_policy,
 )
+from immcad_api.retry import Retrier, RetryBudgetRegistry, RetryPolicy
 from immcad_api.sources import (
     SourceRegistryEntry,
     load_source_registry,
@@ -191,30 +192,31 @@ def _fetch_with_retry_budget(
     source: SourceRegistryEntry,
     context: FetchContext,
     fetch_policy: SourceFetchPolicy,
+    retry_budgets: RetryBudgetRegistry,
 ) -> FetchResult:
     source_fetch_policy = fetch_policy.for_source(source.source_id)
-    attempts = source_fetch_policy.max_retries + 1
-    last_error: Exception | None = None
-
-    for attempt_index in range(attempts):
-        try:
-            return fetcher(source, context)
-        except Exception as exc:
-            last_error = exc
-            if attempt_index + 1 >= attempts:
-                break
-            backoff_seconds = source_fetch_policy.retry_backoff_seconds * (
-                attempt_index + 1
-            )
-            if backoff_seconds > 0:
-                time.sleep(backoff_seconds)
+    base_delay_seconds = source_fetch_policy.retry_backoff_seconds
+    retrier = Retrier(
+        RetryPolicy(
+            max_retries=source_fetch_policy.max_retries,
+            base_delay_seconds=base_delay_seconds,
+            max_delay_seconds=base_delay_seconds * 8,
+        ),
+        # Sources on one host share a budget so an outage there cannot turn
+        # every source's retry allowance into a burst against the same server.
+        budget=retry_budgets.get(urlsplit(str(source.url)).netloc),
+    )
+    attempts = 0
 
-    if last_error is not None:
-        raise RuntimeError(
-            f"fetch failed after {attempts} attempts: {last_error}"
-        ) from last_error
+    def attempt() -> FetchResult:
+        nonlocal attempts
+        attempts += 1
+        return fetcher(source, context)
 
-    raise RuntimeError(f"fetch failed after {attempts} attempts")
+    try:
+        return retrier.call(attempt)
+    except Exception as exc:
+        raise RuntimeError(f"fetch failed after {attempts} attempts: {exc}") from exc
 
 
 def _execute_jobs(
@@ -232,6 +234,7 @@ def _execute_jobs(
     started_at = _utc_now_iso()
     results: list[IngestionSourceResult] = []
     updated_checkpoints = dict(checkpoints)
+    retry_budgets = RetryBudgetRegistry()
 
     for source in sources:
         fetched_at = _utc_now_iso()
@@ -269,6 +272,7 @@ def _execute_jobs(
                 source=source,
                 context=context,
                 fetch_policy=fetch_policy,
+                retry_budgets=retry_budgets,
             )
 
             if fetch_result.http_status == 304:
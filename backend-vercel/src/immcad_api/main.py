@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+from contextlib import asynccontextmanager, suppress
 import ipaddress
 import json
 import logging
@@ -30,10 +32,17 @@ from immcad_api.middleware.rate_limit import build_rate_limiter
 from immcad_api.policy import load_source_policy
 from immcad_api.providers import (
     GeminiProvider,
+    HedgePolicy,
+    ModelHealthTracker,
     OpenAIProvider,
+    ProviderHttpPool,
     ProviderRouter,
+    ProviderScoreboard,
     ScaffoldProvider,
 )
+from immcad_api.providers.bulkhead import BulkheadRegistry
+from immcad_api.providers.circuit_breaker import build_circuit_state_store
+from immcad_api.retry import RetryBudgetRegistry
 from immcad_api.schemas import ErrorEnvelope
 from immcad_api.services import (
     CaseSearchService,
@@ -42,11 +51,23 @@ from immcad_api.services import (
     KeywordGroundingAdapter,
     LawyerCaseResearchService,
     RedisDocumentMatterStore,
+    HybridGroundingAdapter,
+    SectionIndex,
+    SectionIndexGroundingAdapter,
+    SectionVectorIndex,
+    SourceCatalogVersionTracker,
     StaticGroundingAdapter,
+    build_answer_cache,
     build_document_matter_store,
+    build_text_embedder,
     official_grounding_catalog,
     scaffold_grounded_citations,
 )
+from immcad_api.services.brownout import BrownoutController
+from immcad_api.services.precomputed_answers import load_precomputed_answer_store
+from immcad_api.services.request_coalescing import RequestCoalescer
+from immcad_api.services.retrieval_fanout import RetrievalFanout
+from immcad_api.services.session_memory import build_session_memory_store
 from immcad_api.settings import is_hardened_environment, load_settings
 from immcad_api.sources import CanLIIClient, OfficialCaseLawClient, load_source_registry
 from immcad_api.sources.canlii_usage_limiter import build_canlii_usage_limiter
@@ -236,12 +257,30 @@ def _build_priority_source_freshness_snapshot(
 def create_app() -> FastAPI:
     settings = load_settings()
 
+    def build_provider_http_pool() -> ProviderHttpPool:
+        return ProviderHttpPool(
+            timeout_seconds=settings.provider_timeout_seconds,
+            max_connections=settings.provider_http_max_connections,
+            max_keepalive_connections=settings.provider_http_max_keepalive_connections,
+            keepalive_expiry_seconds=settings.provider_http_keepalive_expiry_seconds,
+        )
+
+    # Shared per dependency so retries across all requests stay a bounded
+    # fraction of traffic while a provider is failing.
+    retry_budgets = RetryBudgetRegistry(
+        retry_ratio=settings.provider_retry_budget_ratio,
+        max_tokens=settings.provider_retry_budget_max_tokens,
+    )
+
     provider_registry = {
         "openai": OpenAIProvider(
             settings.openai_api_key,
             model=settings.openai_model,
             timeout_seconds=settings.provider_timeout_seconds,
             max_retries=settings.provider_max_retries,
+            http_pool=build_provider_http_pool(),
+            prompt_token_budget=settings.openai_prompt_token_budget or None,
+            retry_budget=retry_budgets.get("openai"),
         ),
         "gemini": GeminiProvider(
             settings.gemini_api_key,
@@ -249,8 +288,19 @@ def create_app() -> FastAPI:
             fallback_models=settings.gemini_model_fallbacks,
             timeout_seconds=settings.provider_timeout_seconds,
             max_retries=settings.provider_max_retries,
+            http_pool=build_provider_http_pool(),
+            prompt_token_budget=settings.gemini_prompt_token_budget or None,
+            retry_budget=retry_budgets.get("gemini"),
+            model_health=ModelHealthTracker(
+                failure_threshold=settings.gemini_model_failure_threshold,
+                cooldown_seconds=settings.gemini_model_cooldown_seconds,
+            ),
         ),
     }
+    provider_metrics = ProviderMetrics()
+    provider_metrics.track_model_health(
+        provider="gemini", snapshot=provider_registry["gemini"].model_health.snapshot
+    )
 
     providers = []
     if settings.enable_openai_provider:
@@ -278,18 +328,95 @@ def create_app() -> FastAPI:
         )
         providers = reordered
 
+    request_metrics = RequestMetrics()
+    # Providers get the default per-provider limit; any dependency (provider or chat
+    # retrieval stage) can be overridden or added via DEPENDENCY_BULKHEAD_LIMITS.
+    bulkhead_limits = (
+        {name: settings.provider_bulkhead_max_concurrent for name in provider_names}
+        if settings.provider_bulkhead_max_concurrent > 0
+        else {}
+    )
+    bulkhead_limits.update(settings.dependency_bulkhead_limits)
+    bulkheads = (
+        BulkheadRegistry(
+            limits=bulkhead_limits,
+            max_queue_wait_seconds=settings.bulkhead_max_queue_wait_seconds,
+            metrics=request_metrics,
+        )
+        if bulkhead_limits
+        else None
+    )
+
     provider_router = ProviderRouter(
         providers=providers,
         primary_provider_name=primary_provider_name,
         circuit_breaker_failure_threshold=settings.provider_circuit_breaker_failure_threshold,
         circuit_breaker_open_seconds=settings.provider_circuit_breaker_open_seconds,
-        telemetry=ProviderMetrics(),
+        circuit_half_open_max_probes=settings.provider_circuit_breaker_half_open_max_probes,
+        circuit_state_store=(
+            build_circuit_state_store(redis_url=settings.redis_url)
+            if settings.provider_circuit_breaker_shared_state_enabled
+            else None
+        ),
+        telemetry=provider_metrics,
+        hedge_policy=(
+            HedgePolicy(
+                latency_percentile=settings.provider_hedge_latency_percentile,
+                min_samples=settings.provider_hedge_min_samples,
+                window_size=max(200, settings.provider_hedge_min_samples),
+                max_hedge_ratio=settings.provider_hedge_max_ratio,
+            )
+            if settings.provider_hedge_enabled
+            else None
+        ),
+        scoreboard=(
+            ProviderScoreboard(
+                min_samples=settings.provider_adaptive_min_samples,
+                switch_margin=settings.provider_adaptive_switch_margin,
+            )
+            if settings.provider_adaptive_ordering_enabled
+            else None
+        ),
+        bulkheads=bulkheads,
     )
 
+    section_index: SectionIndex | None = None
+    section_vectors: SectionVectorIndex | None = None
     if settings.allow_scaffold_synthetic_citations:
         grounding_adapter = StaticGroundingAdapter(scaffold_grounded_citations())
     else:
-        grounding_adapter = KeywordGroundingAdapter(official_grounding_catalog())
+        keyword_grounding_adapter = KeywordGroundingAdapter(official_grounding_catalog())
+        grounding_adapter = keyword_grounding_adapter
+        if settings.grounding_section_index_path:
+            try:
+                section_index = SectionIndex(settings.grounding_section_index_path)
+            except FileNotFoundError:
+                LOGGER.warning(
+                    "Grounding section index not found at %s; using the keyword catalog",
+                    settings.grounding_section_index_path,
+                )
+            else:
+                grounding_adapter = SectionIndexGroundingAdapter(
+                    section_index,
+                    max_citations=settings.grounding_section_index_top_k,
+                    fallback=keyword_grounding_adapter,
+                )
+        if section_index is not None and settings.grounding_section_vectors_path:
+            try:
+                section_vectors = SectionVectorIndex(settings.grounding_section_vectors_path)
+            except FileNotFoundError:
+                LOGGER.warning(
+                    "Grounding section vectors not found at %s; using lexical section search",
+                    settings.grounding_section_vectors_path,
+                )
+            else:
+                grounding_adapter = HybridGroundingAdapter(
+                    section_index,
+                    section_vectors,
+                    build_text_embedder(settings.grounding_embedder),
+                    max_citations=settings.grounding_section_index_top_k,
+                    fallback=keyword_grounding_adapter,
+                )
     hardened_environment = is_hardened_environment(settings.environment)
     case_search_service: CaseSearchService | None = None
     lawyer_case_research_service: LawyerCaseResearchService | None = None
@@ -330,6 +457,7 @@ def create_app() -> FastAPI:
                 )
                 if settings.enable_official_case_sources
                 else None,
+                bulkheads=bulkheads,
             )
             lawyer_case_research_service = LawyerCaseResearchService(
                 case_search_service=case_search_service,
@@ -355,6 +483,54 @@ def create_app() -> FastAPI:
             source_registry_for_transparency = None
             source_policy_for_transparency = None
 
+    # Re-read so a catalog refresh invalidates cached and precomputed answers
+    # without a restart.
+    catalog_version = SourceCatalogVersionTracker()
+    answer_cache = None
+    if settings.chat_answer_cache_enabled:
+        answer_cache = build_answer_cache(
+            redis_url=settings.redis_url,
+            max_entries=settings.chat_answer_cache_max_entries,
+            ttl_seconds=settings.chat_answer_cache_ttl_seconds,
+            version_provider=catalog_version,
+        )
+
+    precomputed_answers = (
+        load_precomputed_answer_store(
+            settings.chat_precomputed_answers_path,
+            version_provider=catalog_version,
+        )
+        if settings.chat_precomputed_answers_path
+        else None
+    )
+
+    session_memory = (
+        build_session_memory_store(
+            redis_url=settings.redis_url,
+            max_recent_turns=settings.chat_session_memory_max_turns,
+            max_sessions=settings.chat_session_memory_max_sessions,
+            ttl_seconds=settings.chat_session_memory_ttl_seconds,
+        )
+        if settings.chat_session_memory_enabled
+        else None
+    )
+
+    request_coalescer = (
+        RequestCoalescer() if settings.chat_request_coalescing_enabled else None
+    )
+    retrieval_fanout = RetrievalFanout(bulkheads=bulkheads)
+    brownout_controller = (
+        BrownoutController(
+            request_metrics=request_metrics,
+            queue_depth_fn=retrieval_fanout.queue_depth,
+            max_event_loop_lag_seconds=settings.chat_brownout_max_event_loop_lag_ms
+            / 1000.0,
+            max_queue_depth=settings.chat_brownout_max_queue_depth,
+            max_p95_latency_ms=settings.chat_brownout_max_p95_latency_ms,
+        )
+        if settings.chat_brownout_enabled
+        else None
+    )
     chat_service = ChatService(
         provider_router,
         grounding_adapter=grounding_adapter,
@@ -362,11 +538,44 @@ def create_app() -> FastAPI:
         source_policy=source_policy,
         case_search_tool=case_search_service,
         lawyer_research_service=lawyer_case_research_service,
+        case_search_tool_timeout_seconds=settings.chat_case_search_timeout_seconds,
+        research_preview_timeout_seconds=settings.chat_research_preview_timeout_seconds,
+        answer_cache=answer_cache,
+        retrieval_fanout=retrieval_fanout,
+        request_coalescer=request_coalescer,
+        brownout_controller=brownout_controller,
+        precomputed_answers=precomputed_answers,
+        session_memory=session_memory,
     )
 
     has_api_bearer_token = bool(settings.api_bearer_token)
 
-    app = FastAPI(title=settings.app_name, version="0.1.0")
+    @asynccontextmanager
+    async def lifespan(_: FastAPI):
+        lag_monitor = (
+            asyncio.create_task(brownout_controller.monitor_event_loop())
+            if brownout_controller is not None
+            else None
+        )
+        yield
+        if lag_monitor is not None:
+            lag_monitor.cancel()
+            with suppress(asyncio.CancelledError):
+                await lag_monitor
+        for provider in provider_registry.values():
+            await provider.aclose()
+        provider_router.close()
+        chat_service.retrieval_fanout.close()
+        if section_vectors is not None:
+            section_vectors.close()
+        if section_index is not None:
+            section_index.close()
+
+    app = FastAPI(title=settings.app_name, version="0.1.0", lifespan=lifespan)
+    # Offline jobs (scripts/build_precomputed_answers.py) answer through the same
+    # service and stamp results with the same catalog version.
+    app.state.chat_service = chat_service
+    app.state.source_catalog_version_provider = catalog_version
     app.add_middleware(
         CORSMiddleware,
         allow_origins=list(settings.cors_allowed_origins),
@@ -376,7 +585,6 @@ def create_app() -> FastAPI:
         expose_headers=["x-trace-id"],
         max_age=600,
     )
-    request_metrics = RequestMetrics()
     document_matter_store = build_document_matter_store(redis_url=settings.redis_url)
     if isinstance(document_matter_store, RedisDocumentMatterStore):
         document_matter_store_backend = "redis"
@@ -471,8 +679,9 @@ def create_app() -> FastAPI:
                     )
                 request.state.client_id = client_id
 
-                allowed = rate_limiter.allow(client_id)
-                if not allowed:
+                # Every request, including malformed or oversized chat batches,
+                # costs one unit here; the batch route charges its extra items.
+                if not rate_limiter.allow(client_id):
                     error = ErrorEnvelope(
                         error={
                             "code": "RATE_LIMITED",
@@ -560,7 +769,16 @@ def create_app() -> FastAPI:
             headers={"x-trace-id": trace_id},
         )
 
-    app.include_router(build_chat_router(chat_service, request_metrics=request_metrics))
+    app.include_router(
+        build_chat_router(
+            chat_service,
+            request_metrics=request_metrics,
+            rate_limiter=rate_limiter,
+            batch_max_items=settings.chat_batch_max_items,
+            batch_max_concurrency=settings.chat_batch_max_concurrency,
+            request_deadline_seconds=settings.chat_request_deadline_seconds,
+        )
+    )
     app.include_router(
         build_documents_router(
             request_metrics=request_metrics,
@@ -630,7 +848,26 @@ def create_app() -> FastAPI:
                 "backend": document_matter_store_backend,
             },
             "provider_routing_metrics": provider_router.telemetry_snapshot(),
+            "provider_routing_scores": provider_router.scoring_snapshot(),
+            "provider_circuits": provider_router.circuit_snapshot(),
+            "provider_prompt_tokens": provider_router.prompt_token_snapshot(),
+            "provider_model_health": provider_router.model_health_snapshot(),
+            "provider_retry_budgets": retry_budgets.snapshot(),
+            "bulkheads": bulkheads.snapshot() if bulkheads else {},
             "canlii_usage_metrics": canlii_metrics_snapshot,
+            "answer_cache": answer_cache.snapshot() if answer_cache else {},
+            "chat_request_coalescing": (
+                request_coalescer.snapshot() if request_coalescer else {}
+            ),
+            "chat_precomputed_answers": (
+                precomputed_answers.snapshot() if precomputed_answers else {}
+            ),
+            "chat_session_memory": (
+                session_memory.snapshot() if session_memory else {}
+            ),
+            "chat_brownout": (
+                brownout_controller.snapshot() if brownout_controller else {}
+            ),
             "official_source_freshness": priority_source_freshness,
         }
 
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Generator, NamedTuple, Protocol
 
 from immcad_api.schemas import Citation, Confidence
 
 
 class ProviderError(Exception):
-    def __init__(self, provider: str, code: str, message: str) -> None:
+    def __init__(
+        self,
+        provider: str,
+        code: str,
+        message: str,
+        *,
+        retry_after_seconds: float | None = None,
+    ) -> None:
         super().__init__(message)
         self.provider = provider
         self.code = code
         self.message = message
+        # Server-requested wait from a Retry-After header, when one was sent.
+        self.retry_after_seconds = retry_after_seconds
 
 
 @dataclass
@@ -20,6 +29,24 @@ class ProviderResult:
     answer: str
     citations: list[Citation]
     confidence: Confidence
+    # Locally estimated prompt size; None when the provider does not build a prompt.
+    prompt_tokens: int | None = None
+    # Prompt tokens the provider served from its prefix cache, when it reports them.
+    cached_prompt_tokens: int | None = None
+
+
+class ProviderCompletion(NamedTuple):
+    """Answer text and usage details parsed from one provider response."""
+
+    text: str
+    cached_prompt_tokens: int | None = None
+
+
+class StreamUsage(NamedTuple):
+    """Prompt usage a provider stream returns once its last delta has been yielded."""
+
+    prompt_tokens: int | None = None
+    cached_prompt_tokens: int | None = None
 
 
 class Provider(Protocol):
@@ -27,3 +54,22 @@ class Provider(Protocol):
 
     def generate(self, *, message: str, citations: list[Citation], locale: str) -> ProviderResult:
         ...
+
+
+class AsyncProvider(Provider, Protocol):
+    async def generate_async(
+        self, *, message: str, citations: list[Citation], locale: str
+    ) -> ProviderResult:
+        ...
+
+
+class StreamingProvider(Provider, Protocol):
+    def stream(
+        self, *, message: str, citations: list[Citation], locale: str
+    ) -> Generator[str, None, StreamUsage | None]:
+        """Yield answer text deltas as the upstream model produces them.
+
+        The generator may return a ``StreamUsage`` so streamed turns report the
+        same prompt-token telemetry as ``generate``.
+        """
+        ...
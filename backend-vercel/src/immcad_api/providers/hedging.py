@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from collections import deque
+from threading import Lock
+
+
+class HedgePolicy:
+    """Decide when ``ProviderRouter`` should hedge a slow primary call.
+
+    A hedge is sent once the primary has been running longer than the configured
+    percentile of its recent successful latencies. Hedges draw from a token budget
+    that refills by ``max_hedge_ratio`` per routed request, so hedged traffic stays
+    at or below that fraction of provider calls.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency_percentile: float = 95.0,
+        min_samples: int = 20,
+        window_size: int = 200,
+        max_hedge_ratio: float = 0.1,
+        max_burst: float = 5.0,
+        min_delay_seconds: float = 0.05,
+    ) -> None:
+        if not 0 < latency_percentile < 100:
+            raise ValueError("latency_percentile must be between 0 and 100")
+        if min_samples < 1:
+            raise ValueError("min_samples must be >= 1")
+        if window_size < min_samples:
+            raise ValueError("window_size must be >= min_samples")
+        if not 0 < max_hedge_ratio <= 1:
+            raise ValueError("max_hedge_ratio must be > 0 and <= 1")
+        if max_burst < 1:
+            raise ValueError("max_burst must be >= 1")
+        if min_delay_seconds < 0:
+            raise ValueError("min_delay_seconds must be >= 0")
+        self.latency_percentile = latency_percentile
+        self.min_samples = min_samples
+        self.window_size = window_size
+        self.max_hedge_ratio = max_hedge_ratio
+        self.max_burst = max_burst
+        self.min_delay_seconds = min_delay_seconds
+        self._lock = Lock()
+        self._latencies: dict[str, deque[float]] = {}
+        # Start with one hedge available so a cold process can still hedge.
+        self._tokens = 1.0
+
+    def record_latency(self, provider_name: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._latencies.get(provider_name)
+            if samples is None:
+                samples = deque(maxlen=self.window_size)
+                self._latencies[provider_name] = samples
+            samples.append(max(0.0, seconds))
+
+    def hedge_delay(self, provider_name: str) -> float | None:
+        """Seconds to wait on ``provider_name`` before hedging, or ``None`` when
+        there are too few samples to estimate its latency."""
+        with self._lock:
+            samples = self._latencies.get(provider_name)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        index = min(
+            len(ordered) - 1,
+            int(len(ordered) * self.latency_percentile / 100.0),
+        )
+        return max(self.min_delay_seconds, ordered[index])
+
+    def record_request(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_burst, self._tokens + self.max_hedge_ratio)
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            providers = list(self._latencies)
+            tokens = self._tokens
+        return {
+            "latency_percentile": self.latency_percentile,
+            "max_hedge_ratio": self.max_hedge_ratio,
+            "budget_tokens": round(tokens, 3),
+            "hedge_delay_seconds": {
+                provider: self.hedge_delay(provider) for provider in providers
+            },
+        }
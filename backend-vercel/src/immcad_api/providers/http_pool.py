@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+import logging
+from threading import Lock
+from typing import AsyncIterator, Iterator
+
+import httpx
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ProviderHttpPool:
+    """Long-lived, connection-pooled httpx clients shared by one provider.
+
+    The sync client is created once. Async clients are bound to the event loop
+    that opened their connections, so one is kept per running loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout_seconds: float,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry_seconds: float = 30.0,
+    ) -> None:
+        if max_connections < 1:
+            raise ValueError("max_connections must be >= 1")
+        if max_keepalive_connections < 0:
+            raise ValueError("max_keepalive_connections must be >= 0")
+        if keepalive_expiry_seconds <= 0:
+            raise ValueError("keepalive_expiry_seconds must be > 0")
+        self.timeout_seconds = timeout_seconds
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(max_keepalive_connections, max_connections),
+            keepalive_expiry=keepalive_expiry_seconds,
+        )
+        self._lock = Lock()
+        self._sync_client: httpx.Client | None = None
+        self._async_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._closed = False
+
+    def sync_client(self) -> httpx.Client:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("ProviderHttpPool is closed")
+            if self._sync_client is None:
+                self._sync_client = httpx.Client(
+                    timeout=self.timeout_seconds,
+                    limits=self.limits,
+                )
+            return self._sync_client
+
+    def async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("ProviderHttpPool is closed")
+            # Drop clients whose loop has gone away (e.g. per-request test loops).
+            for stale_loop in [item for item in self._async_clients if item.is_closed()]:
+                del self._async_clients[stale_loop]
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = httpx.AsyncClient(
+                    timeout=self.timeout_seconds,
+                    limits=self.limits,
+                )
+                self._async_clients[loop] = client
+            return client
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._closed = True
+            sync_client, self._sync_client = self._sync_client, None
+            async_clients, self._async_clients = self._async_clients, {}
+        if sync_client is not None:
+            sync_client.close()
+        for client_loop, client in async_clients.items():
+            if client_loop is loop:
+                await client.aclose()
+            else:
+                LOGGER.debug("Dropping pooled async client bound to another event loop")
+
+
+@contextmanager
+def sync_http_client(
+    pool: ProviderHttpPool | None, *, timeout_seconds: float
+) -> Iterator[httpx.Client]:
+    """Yield the pooled client, or a one-shot client when no pool is configured."""
+    if pool is not None:
+        yield pool.sync_client()
+        return
+    with httpx.Client(timeout=timeout_seconds) as client:
+        yield client
+
+
+@asynccontextmanager
+async def async_http_client(
+    pool: ProviderHttpPool | None, *, timeout_seconds: float
+) -> AsyncIterator[httpx.AsyncClient]:
+    if pool is not None:
+        yield pool.async_client()
+        return
+    async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+        yield client
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from threading import Lock
+import time
+from typing import Callable, Sequence
+
+
+@dataclass
+class _ModelHealth:
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    cooldowns: int = 0
+    cooldown_until: float = 0.0
+    latency_seconds: float | None = None
+    last_error_code: str | None = None
+
+
+class ModelHealthTracker:
+    """Per-model failure, cooldown and latency state for one provider's model chain.
+
+    ``failure_threshold`` consecutive failures put a model into a cooldown of
+    ``cooldown_seconds``; cooling models are skipped by ``order``. When the
+    cooldown lapses the model is tried again, and one more failure starts a new
+    cooldown immediately. Healthy models are ordered fastest first by an
+    exponentially weighted average of successful-call latency; models that have
+    not succeeded yet follow in their configured order. A model back from
+    cooldown keeps its last latency, so a previously fastest model is probed
+    first as soon as its cooldown ends.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 60.0,
+        smoothing: float = 0.2,
+        time_fn: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be >= 1")
+        if cooldown_seconds <= 0:
+            raise ValueError("cooldown_seconds must be > 0")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be > 0 and <= 1")
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.smoothing = smoothing
+        self._time_fn = time_fn
+        self._lock = Lock()
+        self._models: dict[str, _ModelHealth] = {}
+
+    def _entry(self, model: str) -> _ModelHealth:
+        entry = self._models.get(model)
+        if entry is None:
+            entry = _ModelHealth()
+            self._models[model] = entry
+        return entry
+
+    def record_success(self, model: str, latency_seconds: float) -> None:
+        latency_seconds = max(0.0, latency_seconds)
+        with self._lock:
+            entry = self._entry(model)
+            entry.successes += 1
+            entry.consecutive_failures = 0
+            entry.cooldown_until = 0.0
+            if entry.latency_seconds is None:
+                entry.latency_seconds = latency_seconds
+            else:
+                entry.latency_seconds += self.smoothing * (
+                    latency_seconds - entry.latency_seconds
+                )
+
+    def record_failure(self, model: str, *, error_code: str | None = None) -> None:
+        with self._lock:
+            entry = self._entry(model)
+            entry.failures += 1
+            entry.consecutive_failures += 1
+            entry.last_error_code = error_code
+            if entry.consecutive_failures >= self.failure_threshold:
+                entry.cooldown_until = self._time_fn() + self.cooldown_seconds
+                entry.cooldowns += 1
+
+    def order(self, models: Sequence[str]) -> list[str]:
+        """Return healthy ``models`` fastest first, skipping cooling ones.
+
+        If every model is cooling down, the one that recovers soonest is returned
+        so the provider still makes one attempt; the router's circuit breaker is
+        what takes the whole provider out of rotation.
+        """
+        now = self._time_fn()
+        with self._lock:
+            state = {
+                model: (
+                    (entry.cooldown_until, entry.latency_seconds)
+                    if (entry := self._models.get(model)) is not None
+                    else (0.0, None)
+                )
+                for model in models
+            }
+        static_index = {model: index for index, model in enumerate(models)}
+        healthy = [model for model in models if state[model][0] <= now]
+        if not healthy:
+            return [min(models, key=lambda model: state[model][0])]
+
+        def rank(model: str) -> tuple[bool, float, int]:
+            latency = state[model][1]
+            return (latency is None, latency or 0.0, static_index[model])
+
+        return sorted(healthy, key=rank)
+
+    def snapshot(self) -> dict[str, dict[str, object]]:
+        now = self._time_fn()
+        with self._lock:
+            return {
+                model: {
+                    "state": "cooldown" if entry.cooldown_until > now else "healthy",
+                    "cooldown_remaining_seconds": round(
+                        max(0.0, entry.cooldown_until - now), 3
+                    ),
+                    "successes": entry.successes,
+                    "failures": entry.failures,
+                    "consecutive_failures": entry.consecutive_failures,
+                    "cooldowns": entry.cooldowns,
+                    "latency_ewma_ms": (
+                        round(entry.latency_seconds * 1000.0, 2)
+                        if entry.latency_seconds is not None
+                        else None
+                    ),
+                    "last_error_code": entry.last_error_code,
+                }
+                for model, entry in self._models.items()
+            }
@@ -1,17 +1,38 @@
 from __future__ import annotations
 
+import asyncio
+from functools import partial
 import importlib
+import inspect
 import json
-import time
+from threading import Lock
+from typing import Callable, Generator, Iterator
 
 import httpx
 
-from immcad_api.providers.base import ProviderError, ProviderResult
+from immcad_api.deadline import current_deadline, remaining_timeout
+from immcad_api.providers.base import (
+    ProviderCompletion,
+    ProviderError,
+    ProviderResult,
+    StreamUsage,
+)
 from immcad_api.providers.error_mapping import map_provider_exception
-from immcad_api.providers.prompt_builder import build_runtime_prompts
+from immcad_api.providers.http_pool import (
+    ProviderHttpPool,
+    async_http_client,
+    sync_http_client,
+)
+from immcad_api.providers.prompt_builder import assemble_runtime_prompt
+from immcad_api.providers.streaming import iter_sse_data, stream_with_retries
+from immcad_api.retry import Retrier, RetryBudget, RetryPolicy, parse_retry_after
 from immcad_api.schemas import Citation
 
 OpenAI = None
+AsyncOpenAI = None
+
+# Asks for a final usage chunk so streamed turns report cached prompt tokens.
+_STREAM_USAGE_OPTIONS = {"stream_options": {"include_usage": True}}
 
 
 class OpenAIProvider:
@@ -29,11 +50,76 @@ class OpenAIProvider:
         model: str,
         timeout_seconds: float,
         max_retries: int,
+        http_pool: ProviderHttpPool | None = None,
+        prompt_token_budget: int | None = None,
+        retry_budget: RetryBudget | None = None,
     ) -> None:
         self.api_key = api_key
         self.model = model
         self.timeout_seconds = timeout_seconds
         self.max_retries = max(0, max_retries)
+        self.http_pool = http_pool
+        self.prompt_token_budget = prompt_token_budget
+        self.retrier = Retrier(
+            RetryPolicy(max_retries=self.max_retries), budget=retry_budget
+        )
+        self._sdk_client_lock = Lock()
+        self._sdk_clients: dict[tuple[object, asyncio.AbstractEventLoop | None], object] = {}
+
+    def _sdk_client(self, sdk_client_ctor, *, asynchronous: bool):  # noqa: ANN001
+        # Reuse one SDK client per constructor so its connection pool survives
+        # across calls and retries, and aclose() can release it. Async clients
+        # hold connections bound to one event loop, so they are kept per loop.
+        loop = asyncio.get_running_loop() if asynchronous else None
+        with self._sdk_client_lock:
+            for stale_key in [
+                key
+                for key in self._sdk_clients
+                if key[1] is not None and key[1].is_closed()
+            ]:
+                del self._sdk_clients[stale_key]
+            client = self._sdk_clients.get((sdk_client_ctor, loop))
+            if client is None:
+                client_kwargs: dict[str, object] = {
+                    "api_key": self.api_key,
+                    "timeout": self.timeout_seconds,
+                    # Retries go through self.retrier and the shared RetryBudget;
+                    # SDK retries would multiply every attempt behind their back.
+                    "max_retries": 0,
+                }
+                if self.http_pool is not None:
+                    client_kwargs["http_client"] = (
+                        self.http_pool.async_client()
+                        if asynchronous
+                        else self.http_pool.sync_client()
+                    )
+                client = sdk_client_ctor(**client_kwargs)
+                self._sdk_clients[(sdk_client_ctor, loop)] = client
+            return client
+
+    def _sync_sdk_client(self, sdk_client_ctor):  # noqa: ANN001
+        return self._sdk_client(sdk_client_ctor, asynchronous=False)
+
+    def _async_sdk_client(self, sdk_client_ctor):  # noqa: ANN001
+        return self._sdk_client(sdk_client_ctor, asynchronous=True)
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._sdk_client_lock:
+            clients, self._sdk_clients = dict(self._sdk_clients), {}
+        if self.http_pool is not None:
+            await self.http_pool.aclose()
+            return
+        for (_, client_loop), client in clients.items():
+            if client_loop not in (None, loop):
+                # Its connections belong to another loop and cannot be awaited here.
+                continue
+            close = getattr(client, "close", None)
+            if callable(close):
+                closed = close()
+                # AsyncOpenAI.close() is a coroutine.
+                if inspect.isawaitable(closed):
+                    await closed
 
     def generate(
         self, *, message: str, citations: list[Citation], locale: str
@@ -43,34 +129,131 @@ class OpenAIProvider:
                 self.name, "provider_error", "OPENAI_API_KEY not configured"
             )
 
-        system_prompt, prompt = build_runtime_prompts(
+        runtime_prompt = assemble_runtime_prompt(
             message=message,
             citations=citations,
             locale=locale,
+            token_budget=self.prompt_token_budget,
         )
+        system_prompt, prompt = runtime_prompt.system_prompt, runtime_prompt.user_prompt
 
         sdk_client_ctor = self._resolve_openai_client_constructor()
         if sdk_client_ctor is not None:
-            answer = self._generate_with_sdk(
+            completion = self._generate_with_sdk(
                 sdk_client_ctor=sdk_client_ctor,
                 system_prompt=system_prompt,
                 prompt=prompt,
+                prompt_cache_key=runtime_prompt.prompt_cache_key,
             )
         else:
-            answer = self._generate_with_httpx(
+            completion = self._generate_with_httpx(
                 system_prompt=system_prompt,
                 prompt=prompt,
+                prompt_cache_key=runtime_prompt.prompt_cache_key,
             )
 
-        if not answer:
+        return self._result(completion, prompt_tokens=runtime_prompt.prompt_tokens)
+
+    async def generate_async(
+        self, *, message: str, citations: list[Citation], locale: str
+    ) -> ProviderResult:
+        if not self.api_key:
+            raise ProviderError(
+                self.name, "provider_error", "OPENAI_API_KEY not configured"
+            )
+
+        runtime_prompt = assemble_runtime_prompt(
+            message=message,
+            citations=citations,
+            locale=locale,
+            token_budget=self.prompt_token_budget,
+        )
+        system_prompt, prompt = runtime_prompt.system_prompt, runtime_prompt.user_prompt
+
+        sdk_client_ctor = self._resolve_async_openai_client_constructor()
+        if sdk_client_ctor is not None:
+            completion = await self._generate_with_async_sdk(
+                sdk_client_ctor=sdk_client_ctor,
+                system_prompt=system_prompt,
+                prompt=prompt,
+                prompt_cache_key=runtime_prompt.prompt_cache_key,
+            )
+        else:
+            completion = await self._generate_with_async_httpx(
+                system_prompt=system_prompt,
+                prompt=prompt,
+                prompt_cache_key=runtime_prompt.prompt_cache_key,
+            )
+        return self._result(completion, prompt_tokens=runtime_prompt.prompt_tokens)
+
+    def _result(
+        self, completion: ProviderCompletion, *, prompt_tokens: int
+    ) -> ProviderResult:
+        if not completion.text:
             raise ProviderError(self.name, "provider_error", "Empty OpenAI response")
 
         return ProviderResult(
             provider=self.name,
-            answer=answer,
+            answer=completion.text,
             # The provider currently returns plain text only; do not imply model-emitted citations.
             citations=[],
             confidence="medium",
+            prompt_tokens=prompt_tokens,
+            cached_prompt_tokens=completion.cached_prompt_tokens,
+        )
+
+    def stream(
+        self, *, message: str, citations: list[Citation], locale: str
+    ) -> Generator[str, None, StreamUsage]:
+        if not self.api_key:
+            raise ProviderError(
+                self.name, "provider_error", "OPENAI_API_KEY not configured"
+            )
+
+        runtime_prompt = assemble_runtime_prompt(
+            message=message,
+            citations=citations,
+            locale=locale,
+            token_budget=self.prompt_token_budget,
+        )
+        system_prompt, prompt = runtime_prompt.system_prompt, runtime_prompt.user_prompt
+
+        # The final usage chunk of the attempt that succeeded reports cached tokens.
+        cached_prompt_tokens: list[int | None] = [None]
+
+        def record_cached_tokens(tokens: int | None) -> None:
+            cached_prompt_tokens[0] = tokens
+
+        sdk_client_ctor = self._resolve_openai_client_constructor()
+        if sdk_client_ctor is not None:
+            open_stream = partial(
+                self._open_sdk_stream,
+                sdk_client_ctor=sdk_client_ctor,
+                system_prompt=system_prompt,
+                prompt=prompt,
+                prompt_cache_key=runtime_prompt.prompt_cache_key,
+                on_cached_tokens=record_cached_tokens,
+            )
+        else:
+            open_stream = partial(
+                self._open_httpx_stream,
+                system_prompt=system_prompt,
+                prompt=prompt,
+                prompt_cache_key=runtime_prompt.prompt_cache_key,
+                on_cached_tokens=record_cached_tokens,
+            )
+
+        emitted = False
+        for delta in stream_with_retries(
+            self.name, open_stream, retrier=self.retrier
+        ):
+            emitted = True
+            yield delta
+        if not emitted:
+            raise ProviderError(self.name, "provider_error", "Empty OpenAI response")
+        return StreamUsage(
+            prompt_tokens=runtime_prompt.prompt_tokens,
+            cached_prompt_tokens=cached_prompt_tokens[0],
         )
 
     @staticmethod
@@ -84,155 +267,333 @@ class OpenAIProvider:
         except Exception:
             return None
 
-    def _generate_with_sdk(
-        self, *, sdk_client_ctor, system_prompt: str, prompt: str
-    ) -> str:  # noqa: ANN001
-        client = sdk_client_ctor(api_key=self.api_key, timeout=self.timeout_seconds)
-        answer = ""
-        last_error: ProviderError | None = None
-        for attempt in range(self.max_retries + 1):
-            try:
-                completion = client.chat.completions.create(
-                    model=self.model,
-                    temperature=0.2,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": system_prompt,
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                )
-                if not completion.choices:
-                    raise ProviderError(
-                        self.name,
-                        "provider_error",
-                        "OpenAI response contained no choices",
-                    )
-                first_choice = completion.choices[0]
-                message_obj = getattr(first_choice, "message", None)
-                content = getattr(message_obj, "content", None) if message_obj else None
-                if content is None:
-                    raise ProviderError(
-                        self.name,
-                        "provider_error",
-                        "OpenAI response contained no message content",
-                    )
-                answer = content
-                break
-            except ProviderError as exc:
-                lowered = exc.message.lower()
-                is_non_transient = exc.code == "provider_error" and any(
-                    marker in lowered
-                    for marker in self._NON_TRANSIENT_PROVIDER_ERROR_MESSAGES
-                )
-                if is_non_transient:
-                    raise
-                last_error = exc
-            except Exception as exc:  # pragma: no cover
-                last_error = map_provider_exception(self.name, exc)
-
-            if attempt < self.max_retries:
-                time.sleep(0.4 * (attempt + 1))
-                continue
-            if last_error:
-                raise last_error
+    @staticmethod
+    def _resolve_async_openai_client_constructor():
+        if AsyncOpenAI is not None:  # pragma: no cover - test monkeypatch path.
+            return AsyncOpenAI
+        try:
+            openai_module = importlib.import_module("openai")
+            client_ctor = getattr(openai_module, "AsyncOpenAI", None)
+            return client_ctor if callable(client_ctor) else None
+        except Exception:
+            return None
 
-        if not answer:
-            raise ProviderError(self.name, "provider_error", "Empty OpenAI response")
-        return answer
+    @staticmethod
+    def _chat_messages(system_prompt: str, prompt: str) -> list[dict[str, str]]:
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt},
+        ]
 
-    def _generate_with_httpx(self, *, system_prompt: str, prompt: str) -> str:
-        headers = {
-            "authorization": f"Bearer {self.api_key}",
-            "content-type": "application/json",
-        }
-        payload = {
+    def _http_payload(
+        self,
+        *,
+        system_prompt: str,
+        prompt: str,
+        prompt_cache_key: str | None = None,
+        stream: bool = False,
+    ) -> dict[str, object]:
+        payload: dict[str, object] = {
             "model": self.model,
             "temperature": 0.2,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt},
-            ],
+            "messages": self._chat_messages(system_prompt, prompt),
         }
+        if prompt_cache_key:
+            payload["prompt_cache_key"] = prompt_cache_key
+        if stream:
+            payload["stream"] = True
+            payload.update(_STREAM_USAGE_OPTIONS)
+        return payload
 
-        answer = ""
-        last_error: ProviderError | None = None
-        for attempt in range(self.max_retries + 1):
-            try:
-                with httpx.Client(timeout=self.timeout_seconds) as client:
-                    response = client.post(
-                        self._OPENAI_CHAT_COMPLETIONS_URL,
-                        headers=headers,
-                        content=json.dumps(payload),
-                    )
-                if response.status_code == 429:
-                    raise ProviderError(self.name, "rate_limit", response.text)
+    def _request_timeout_seconds(self) -> float:
+        return remaining_timeout(self.timeout_seconds)
+
+    def _sdk_request_options(
+        self, prompt_cache_key: str | None, *, stream: bool = False
+    ) -> dict[str, object]:
+        options: dict[str, object] = {}
+        extra_body: dict[str, object] = {}
+        if prompt_cache_key:
+            extra_body["prompt_cache_key"] = prompt_cache_key
+        if stream:
+            extra_body.update(_STREAM_USAGE_OPTIONS)
+        if extra_body:
+            # Sent as extra_body so SDK versions without the named arguments still pass them.
+            options["extra_body"] = extra_body
+        deadline = current_deadline()
+        if deadline is not None:
+            # The client-level timeout is fixed; narrow it to the request deadline.
+            options["timeout"] = deadline.clamp(self.timeout_seconds)
+        return options
+
+    def _http_headers(self) -> dict[str, str]:
+        return {
+            "authorization": f"Bearer {self.api_key}",
+            "content-type": "application/json",
+        }
+
+    def _answer_from_sdk_completion(self, completion) -> ProviderCompletion:  # noqa: ANN001
+        if not completion.choices:
+            raise ProviderError(
+                self.name,
+                "provider_error",
+                "OpenAI response contained no choices",
+            )
+        first_choice = completion.choices[0]
+        message_obj = getattr(first_choice, "message", None)
+        content = getattr(message_obj, "content", None) if message_obj else None
+        if content is None:
+            raise ProviderError(
+                self.name,
+                "provider_error",
+                "OpenAI response contained no message content",
+            )
+        return ProviderCompletion(
+            content, _cached_prompt_tokens(getattr(completion, "usage", None))
+        )
+
+    def _answer_from_http_response(self, response: httpx.Response) -> ProviderCompletion:
+        if response.status_code == 429:
+            raise self._rate_limit_error(response)
+        if response.status_code >= 400:
+            raise ProviderError(
+                self.name,
+                "provider_error",
+                f"OpenAI API returned HTTP {response.status_code}: {response.text}",
+            )
+        data = response.json()
+        choices = data.get("choices")
+        if not isinstance(choices, list) or not choices:
+            raise ProviderError(
+                self.name,
+                "provider_error",
+                "OpenAI response contained no choices",
+            )
+        first_choice = choices[0]
+        message_payload = (
+            first_choice.get("message") if isinstance(first_choice, dict) else None
+        )
+        content = (
+            message_payload.get("content") if isinstance(message_payload, dict) else None
+        )
+        if isinstance(content, str):
+            answer = content
+        elif isinstance(content, list):
+            # The responses API may emit structured text segments.
+            answer = "".join(
+                str(item.get("text", "")) for item in content if isinstance(item, dict)
+            ).strip()
+        else:
+            answer = ""
+        if not answer:
+            raise ProviderError(
+                self.name,
+                "provider_error",
+                "OpenAI response contained no message content",
+            )
+        return ProviderCompletion(answer, _cached_prompt_tokens(data.get("usage")))
+
+    def _rate_limit_error(self, response: httpx.Response) -> ProviderError:
+        return ProviderError(
+            self.name,
+            "rate_limit",
+            response.text,
+            retry_after_seconds=parse_retry_after(response.headers.get("retry-after")),
+        )
+
+    def _retryable_error(self, exc: Exception) -> ProviderError:
+        """Map a failed attempt to a retryable error; re-raise non-transient ones."""
+        if isinstance(exc, ProviderError):
+            lowered = exc.message.lower()
+            is_non_transient = exc.code == "provider_error" and any(
+                marker in lowered for marker in self._NON_TRANSIENT_PROVIDER_ERROR_MESSAGES
+            )
+            if is_non_transient:
+                raise exc
+            return exc
+        if isinstance(exc, httpx.TimeoutException):
+            return ProviderError(self.name, "timeout", str(exc))
+        return map_provider_exception(self.name, exc)
+
+    def _generate_with_sdk(
+        self,
+        *,
+        sdk_client_ctor,  # noqa: ANN001
+        system_prompt: str,
+        prompt: str,
+        prompt_cache_key: str | None = None,
+    ) -> ProviderCompletion:
+        client = self._sync_sdk_client(sdk_client_ctor)
+
+        def attempt() -> ProviderCompletion:
+            completion = client.chat.completions.create(
+                model=self.model,
+                temperature=0.2,
+                messages=self._chat_messages(system_prompt, prompt),
+                **self._sdk_request_options(prompt_cache_key),
+            )
+            return self._answer_from_sdk_completion(completion)
+
+        return self.retrier.call(attempt, on_error=self._retryable_error)
+
+    def _generate_with_httpx(
+        self, *, system_prompt: str, prompt: str, prompt_cache_key: str | None = None
+    ) -> ProviderCompletion:
+        payload = self._http_payload(
+            system_prompt=system_prompt,
+            prompt=prompt,
+            prompt_cache_key=prompt_cache_key,
+        )
+
+        def attempt() -> ProviderCompletion:
+            with sync_http_client(
+                self.http_pool, timeout_seconds=self.timeout_seconds
+            ) as client:
+                response = client.post(
+                    self._OPENAI_CHAT_COMPLETIONS_URL,
+                    headers=self._http_headers(),
+                    content=json.dumps(payload),
+                    timeout=self._request_timeout_seconds(),
+                )
+            return self._answer_from_http_response(response)
+
+        return self.retrier.call(attempt, on_error=self._retryable_error)
+
+    async def _generate_with_async_sdk(
+        self,
+        *,
+        sdk_client_ctor,  # noqa: ANN001
+        system_prompt: str,
+        prompt: str,
+        prompt_cache_key: str | None = None,
+    ) -> ProviderCompletion:
+        client = self._async_sdk_client(sdk_client_ctor)
+
+        async def attempt() -> ProviderCompletion:
+            completion = await client.chat.completions.create(
+                model=self.model,
+                temperature=0.2,
+                messages=self._chat_messages(system_prompt, prompt),
+                **self._sdk_request_options(prompt_cache_key),
+            )
+            return self._answer_from_sdk_completion(completion)
+
+        return await self.retrier.call_async(attempt, on_error=self._retryable_error)
+
+    async def _generate_with_async_httpx(
+        self, *, system_prompt: str, prompt: str, prompt_cache_key: str | None = None
+    ) -> ProviderCompletion:
+        payload = self._http_payload(
+            system_prompt=system_prompt,
+            prompt=prompt,
+            prompt_cache_key=prompt_cache_key,
+        )
+
+        async def attempt() -> ProviderCompletion:
+            async with async_http_client(
+                self.http_pool, timeout_seconds=self.timeout_seconds
+            ) as client:
+                response = await client.post(
+                    self._OPENAI_CHAT_COMPLETIONS_URL,
+                    headers=self._http_headers(),
+                    content=json.dumps(payload),
+                    timeout=self._request_timeout_seconds(),
+                )
+            return self._answer_from_http_response(response)
+
+        return await self.retrier.call_async(attempt, on_error=self._retryable_error)
+
+    def _open_sdk_stream(
+        self,
+        *,
+        sdk_client_ctor,  # noqa: ANN001
+        system_prompt: str,
+        prompt: str,
+        prompt_cache_key: str | None,
+        on_cached_tokens: Callable[[int | None], None],
+    ) -> Iterator[str]:
+        client = self._sync_sdk_client(sdk_client_ctor)
+        completion_stream = client.chat.completions.create(
+            model=self.model,
+            temperature=0.2,
+            messages=self._chat_messages(system_prompt, prompt),
+            stream=True,
+            **self._sdk_request_options(prompt_cache_key, stream=True),
+        )
+        for chunk in completion_stream:
+            usage = getattr(chunk, "usage", None)
+            if usage is not None:
+                on_cached_tokens(_cached_prompt_tokens(usage))
+            choices = getattr(chunk, "choices", None) or []
+            if not choices:
+                continue
+            delta = getattr(choices[0], "delta", None)
+            content = getattr(delta, "content", None) if delta else None
+            if isinstance(content, str) and content:
+                yield content
+
+    def _open_httpx_stream(
+        self,
+        *,
+        system_prompt: str,
+        prompt: str,
+        prompt_cache_key: str | None,
+        on_cached_tokens: Callable[[int | None], None],
+    ) -> Iterator[str]:
+        headers = {**self._http_headers(), "accept": "text/event-stream"}
+        payload = self._http_payload(
+            system_prompt=system_prompt,
+            prompt=prompt,
+            prompt_cache_key=prompt_cache_key,
+            stream=True,
+        )
+        with sync_http_client(
+            self.http_pool, timeout_seconds=self.timeout_seconds
+        ) as client:
+            with client.stream(
+                "POST",
+                self._OPENAI_CHAT_COMPLETIONS_URL,
+                headers=headers,
+                content=json.dumps(payload),
+                timeout=self._request_timeout_seconds(),
+            ) as response:
                 if response.status_code >= 400:
+                    response.read()
+                    if response.status_code == 429:
+                        raise self._rate_limit_error(response)
                     raise ProviderError(
                         self.name,
                         "provider_error",
                         f"OpenAI API returned HTTP {response.status_code}: {response.text}",
                     )
-                data = response.json()
-                choices = data.get("choices")
-                if not isinstance(choices, list) or not choices:
-                    raise ProviderError(
-                        self.name,
-                        "provider_error",
-                        "OpenAI response contained no choices",
-                    )
-                first_choice = choices[0]
-                message_payload = (
-                    first_choice.get("message")
-                    if isinstance(first_choice, dict)
-                    else None
-                )
-                content = (
-                    message_payload.get("content")
-                    if isinstance(message_payload, dict)
-                    else None
-                )
-                if isinstance(content, str):
-                    answer = content
-                elif isinstance(content, list):
-                    # The responses API may emit structured text segments.
-                    answer = "".join(
-                        str(item.get("text", ""))
-                        for item in content
-                        if isinstance(item, dict)
-                    ).strip()
-                else:
-                    answer = ""
-                if not answer:
-                    raise ProviderError(
-                        self.name,
-                        "provider_error",
-                        "OpenAI response contained no message content",
+                for data in iter_sse_data(response.iter_lines()):
+                    if data.strip() == "[DONE]":
+                        return
+                    chunk = json.loads(data)
+                    usage = chunk.get("usage") if isinstance(chunk, dict) else None
+                    if usage is not None:
+                        on_cached_tokens(_cached_prompt_tokens(usage))
+                    choices = chunk.get("choices") if isinstance(chunk, dict) else None
+                    if not isinstance(choices, list) or not choices:
+                        continue
+                    first_choice = choices[0]
+                    delta = (
+                        first_choice.get("delta")
+                        if isinstance(first_choice, dict)
+                        else None
                     )
-                break
-            except httpx.TimeoutException as exc:
-                last_error = ProviderError(self.name, "timeout", str(exc))
-            except httpx.HTTPError as exc:
-                last_error = map_provider_exception(self.name, exc)
-            except ProviderError as exc:
-                lowered = exc.message.lower()
-                is_non_transient = exc.code == "provider_error" and any(
-                    marker in lowered
-                    for marker in self._NON_TRANSIENT_PROVIDER_ERROR_MESSAGES
-                )
-                if is_non_transient:
-                    raise
-                last_error = exc
-            except Exception as exc:  # pragma: no cover
-                last_error = map_provider_exception(self.name, exc)
-
-            if attempt < self.max_retries:
-                time.sleep(0.4 * (attempt + 1))
-                continue
-            if last_error:
-                raise last_error
+                    content = delta.get("content") if isinstance(delta, dict) else None
+                    if isinstance(content, str) and content:
+                        yield content
 
-        if not answer:
-            raise ProviderError(self.name, "provider_error", "Empty OpenAI response")
-        return answer
+
+def _cached_prompt_tokens(usage: object) -> int | None:
+    """Read ``usage.prompt_tokens_details.cached_tokens`` from a JSON body or SDK object."""
+
+    def field(value: object, name: str) -> object:
+        if isinstance(value, dict):
+            return value.get(name)
+        return getattr(value, name, None)
+
+    cached_tokens = field(field(usage, "prompt_tokens_details"), "cached_tokens")
+    return cached_tokens if isinstance(cached_tokens, int) else None
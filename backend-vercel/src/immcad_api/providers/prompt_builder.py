@@ -1,35 +1,272 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import lru_cache
+import hashlib
+import math
+import re
+
+from immcad_api.conversation import ConversationHistory, current_conversation
 from immcad_api.policy.prompts import (
-    QA_PROMPT,
-    RUNTIME_CONTEXT_TEMPLATE,
+    QA_INSTRUCTIONS,
+    RUNTIME_HISTORY_TEMPLATE,
+    RUNTIME_PREAMBLE_TEMPLATE,
+    RUNTIME_REQUEST_TEMPLATE,
     SYSTEM_PROMPT,
 )
 from immcad_api.schemas import Citation
 
 _MAX_PROMPT_CITATIONS = 8
+# Excerpts shorter than this after truncation carry too little context to keep.
+_MIN_EXCERPT_TOKENS = 24
+_NO_CITATIONS_LINE = "- No grounded citations were provided."
+_BUDGET_EXHAUSTED_LINE = "- Grounded citations were omitted to fit the prompt budget."
+# Conversation history gets a fixed share of the prompt so per-turn cost stays
+# flat however long a session runs.
+_MAX_HISTORY_TOKENS = 600
+_MAX_HISTORY_QUESTION_TOKENS = 80
+_MAX_HISTORY_ANSWER_TOKENS = 160
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+_TERM_PATTERN = re.compile(r"[a-z0-9]{3,}")
+
+
+@dataclass(frozen=True)
+class RuntimePrompt:
+    """A provider prompt split into a cacheable prefix and a per-request part.
+
+    ``system_prompt`` depends only on the locale, so it is byte-identical across
+    requests and providers can serve it from their prompt-prefix caches;
+    ``user_prompt`` holds the citations and the question.
+    """
+
+    system_prompt: str
+    user_prompt: str
+    prompt_tokens: int
+    citations_included: int
+    prefix_tokens: int
+    prompt_cache_key: str
+
+    @property
+    def combined(self) -> str:
+        return f"{self.system_prompt}\n\n{self.user_prompt}"
+
+
+def estimate_tokens(text: str) -> int:
+    """Conservative local token estimate; no tokenizer dependency.
+
+    Each word or punctuation mark counts as at least one token, and long words
+    count one token per four characters, which over-estimates BPE tokenizers
+    slightly so budgets are not exceeded in practice.
+    """
+    return sum(max(1, math.ceil(len(piece) / 4)) for piece in _TOKEN_PATTERN.findall(text))
+
+
+def _citation_header(citation: Citation) -> str:
+    source_id = citation.source_id.strip() if citation.source_id else "SOURCE"
+    title = citation.title.strip() if citation.title else "Untitled citation"
+    pin = citation.pin.strip() if citation.pin else "n/a"
+    url = citation.url.strip() if citation.url else ""
+
+    parts = [f"- [{source_id}] {title} ({pin})"]
+    if url:
+        parts.append(url)
+    return " ".join(parts)
+
+
+def _format_citation(header: str, snippet: str) -> str:
+    if not snippet:
+        return header
+    return f'{header} Excerpt: "{snippet}"'
 
 
-def _format_prompt_citations(citations: list[Citation]) -> str:
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut ``text`` at a word boundary so it fits in ``max_tokens`` (ellipsis included)."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    budget = max_tokens - 1
+    used = 0
+    end = 0
+    for match in _TOKEN_PATTERN.finditer(text):
+        cost = max(1, math.ceil(len(match.group()) / 4))
+        if used + cost > budget:
+            break
+        used += cost
+        end = match.end()
+    return f"{text[:end].rstrip()}…" if end else ""
+
+
+def _rank_citations(message: str, citations: list[Citation]) -> list[Citation]:
+    """Order citations by term overlap with the question, keeping retrieval order on ties."""
+    terms = set(_TERM_PATTERN.findall(message.lower()))
+    if not terms:
+        return list(citations)
+
+    def overlap(citation: Citation) -> int:
+        text = f"{citation.title or ''} {citation.snippet or ''}".lower()
+        return len(terms.intersection(_TERM_PATTERN.findall(text)))
+
+    scored = [(-overlap(citation), index, citation) for index, citation in enumerate(citations)]
+    return [citation for _, _, citation in sorted(scored, key=lambda item: item[:2])]
+
+
+def _format_prompt_citations(
+    citations: list[Citation],
+    *,
+    token_budget: int | None = None,
+    message: str = "",
+) -> tuple[str, int]:
+    """Render citation lines; returns the block and how many citations it holds."""
     if not citations:
-        return "- No grounded citations were provided."
+        return _NO_CITATIONS_LINE, 0
 
-    lines: list[str] = []
-    for citation in citations[:_MAX_PROMPT_CITATIONS]:
-        source_id = citation.source_id.strip() if citation.source_id else "SOURCE"
-        title = citation.title.strip() if citation.title else "Untitled citation"
-        pin = citation.pin.strip() if citation.pin else "n/a"
-        url = citation.url.strip() if citation.url else ""
+    if token_budget is None:
+        lines = [
+            _format_citation(
+                _citation_header(citation),
+                citation.snippet.strip() if citation.snippet else "",
+            )
+            for citation in citations[:_MAX_PROMPT_CITATIONS]
+        ]
+        return "\n".join(lines), len(lines)
+
+    remaining = token_budget
+    lines = []
+    for citation in _rank_citations(message, citations)[:_MAX_PROMPT_CITATIONS]:
+        header = _citation_header(citation)
+        header_tokens = estimate_tokens(header)
+        if header_tokens > remaining:
+            break
         snippet = citation.snippet.strip() if citation.snippet else ""
+        line = _format_citation(header, snippet)
+        line_tokens = estimate_tokens(line)
+        if line_tokens > remaining:
+            # Keep the citation with a shortened excerpt, or without one if too
+            # little room is left for a useful excerpt.
+            excerpt_budget = remaining - line_tokens + estimate_tokens(snippet)
+            snippet = (
+                _truncate_to_tokens(snippet, excerpt_budget)
+                if excerpt_budget >= _MIN_EXCERPT_TOKENS
+                else ""
+            )
+            line = _format_citation(header, snippet)
+            line_tokens = estimate_tokens(line)
+        lines.append(line)
+        remaining -= line_tokens
+
+    if not lines:
+        return _BUDGET_EXHAUSTED_LINE, 0
+    return "\n".join(lines), len(lines)
+
+
+@dataclass(frozen=True)
+class _CacheablePrefix:
+    text: str
+    tokens: int
+    cache_key: str
+
 
-        parts = [f"- [{source_id}] {title} ({pin})"]
-        if url:
-            parts.append(url)
-        if snippet:
-            parts.append(f'Excerpt: "{snippet}"')
-        lines.append(" ".join(parts))
+@lru_cache(maxsize=8)
+def _cacheable_prefix(locale: str) -> _CacheablePrefix:
+    text = "\n\n".join(
+        (
+            SYSTEM_PROMPT.strip(),
+            QA_INSTRUCTIONS.strip(),
+            "Runtime context:\n" + RUNTIME_PREAMBLE_TEMPLATE.format(locale=locale).strip(),
+        )
+    )
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+    return _CacheablePrefix(
+        text=text, tokens=estimate_tokens(text), cache_key=f"immcad-{digest}"
+    )
+
+
+def _format_history(history: ConversationHistory | None) -> str:
+    """Render the newest turns that fit ``_MAX_HISTORY_TOKENS``, then as much summary as fits."""
+    if history is None or history.is_empty():
+        return ""
+    remaining = _MAX_HISTORY_TOKENS
+    turn_blocks: list[str] = []
+    for turn in reversed(history.turns):
+        block = "\n".join(
+            (
+                f"User: {_truncate_to_tokens(turn.question.strip(), _MAX_HISTORY_QUESTION_TOKENS)}",
+                f"Assistant: {_truncate_to_tokens(turn.answer.strip(), _MAX_HISTORY_ANSWER_TOKENS)}",
+            )
+        )
+        block_tokens = estimate_tokens(block)
+        if block_tokens > remaining:
+            break
+        turn_blocks.append(block)
+        remaining -= block_tokens
+    lines: list[str] = []
+    summary = history.summary.strip()
+    if summary and remaining > _MIN_EXCERPT_TOKENS:
+        summary = _truncate_to_tokens(summary, remaining - 2)
+        if summary:
+            lines.append(f"Summary: {summary}")
+    lines.extend(reversed(turn_blocks))
+    if not lines:
+        return ""
+    return RUNTIME_HISTORY_TEMPLATE.format(history="\n".join(lines)).strip()
+
+
+def _render_user_prompt(
+    *, message: str, citations_block: str, history_block: str = ""
+) -> str:
+    request = RUNTIME_REQUEST_TEMPLATE.format(
+        citations=citations_block,
+        input=message.strip(),
+    ).strip()
+    return f"{history_block}\n\n{request}" if history_block else request
+
+
+def assemble_runtime_prompt(
+    *,
+    message: str,
+    citations: list[Citation],
+    locale: str,
+    token_budget: int | None = None,
+    history: ConversationHistory | None = None,
+) -> RuntimePrompt:
+    """Build the runtime prompt, fitting citation excerpts into ``token_budget``.
 
-    return "\n".join(lines)
+    The cacheable prefix (system prompt, answer instructions, runtime context) and
+    the user message are always kept whole; the budget left after them is spent on
+    the most relevant citations first, with excerpts truncated and trailing
+    citations dropped as needed. Without a budget the first
+    ``_MAX_PROMPT_CITATIONS`` citations are included verbatim.
+
+    ``history`` (by default the current request's conversation) is rendered
+    ahead of the citations, capped at ``_MAX_HISTORY_TOKENS``.
+    """
+    prefix = _cacheable_prefix(locale)
+    history_block = _format_history(
+        history if history is not None else current_conversation()
+    )
+    citation_budget: int | None = None
+    if token_budget is not None:
+        # Separator lines between citations are counted with each line's tokens.
+        skeleton = _render_user_prompt(
+            message=message, citations_block="", history_block=history_block
+        )
+        citation_budget = token_budget - prefix.tokens - estimate_tokens(skeleton)
+
+    citations_block, included = _format_prompt_citations(
+        citations,
+        token_budget=citation_budget,
+        message=message,
+    )
+    user_prompt = _render_user_prompt(
+        message=message, citations_block=citations_block, history_block=history_block
+    )
+    return RuntimePrompt(
+        system_prompt=prefix.text,
+        user_prompt=user_prompt,
+        prompt_tokens=prefix.tokens + estimate_tokens(user_prompt),
+        citations_included=included,
+        prefix_tokens=prefix.tokens,
+        prompt_cache_key=prefix.cache_key,
+    )
 
 
 def build_runtime_prompts(
@@ -37,16 +274,15 @@ def build_runtime_prompts(
     message: str,
     citations: list[Citation],
     locale: str,
+    token_budget: int | None = None,
 ) -> tuple[str, str]:
-    context = RUNTIME_CONTEXT_TEMPLATE.format(
+    prompt = assemble_runtime_prompt(
+        message=message,
+        citations=citations,
         locale=locale,
-        citations=_format_prompt_citations(citations),
+        token_budget=token_budget,
     )
-    user_prompt = QA_PROMPT.format(
-        input=message.strip(),
-        context=context,
-    ).strip()
-    return SYSTEM_PROMPT.strip(), user_prompt
+    return prompt.system_prompt, prompt.user_prompt
 
 
 def build_combined_runtime_prompt(
@@ -54,10 +290,11 @@ def build_combined_runtime_prompt(
     message: str,
     citations: list[Citation],
     locale: str,
+    token_budget: int | None = None,
 ) -> str:
-    system_prompt, user_prompt = build_runtime_prompts(
+    return assemble_runtime_prompt(
         message=message,
         citations=citations,
         locale=locale,
-    )
-    return f"{system_prompt}\n\n{user_prompt}"
+        token_budget=token_budget,
+    ).combined
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import Callable, Iterable, Iterator
+
+import httpx
+
+from immcad_api.providers.base import ProviderError
+from immcad_api.providers.error_mapping import map_provider_exception
+from immcad_api.retry import Retrier
+
+
+def iter_sse_data(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the ``data`` payload of each server-sent event in ``lines``."""
+    data_lines: list[str] = []
+    for line in lines:
+        if not line:
+            if data_lines:
+                yield "\n".join(data_lines)
+                data_lines = []
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        if field != "data":
+            continue
+        data_lines.append(value[1:] if value.startswith(" ") else value)
+    if data_lines:
+        yield "\n".join(data_lines)
+
+
+def stream_with_retries(
+    provider_name: str,
+    open_stream: Callable[[], Iterator[str]],
+    *,
+    retrier: Retrier,
+) -> Iterator[str]:
+    """Retry a provider stream until its first delta has been yielded.
+
+    Once text has reached the caller a retry would duplicate it, so failures
+    after the first delta are raised immediately as ``ProviderError``.
+    """
+    retrier.record_call()
+    retry_number = 0
+    while True:
+        emitted = False
+        try:
+            for delta in open_stream():
+                emitted = True
+                yield delta
+            return
+        except ProviderError as exc:
+            if emitted:
+                raise
+            last_error = exc
+        except httpx.TimeoutException as exc:
+            last_error = ProviderError(provider_name, "timeout", str(exc))
+            if emitted:
+                raise last_error from exc
+        except Exception as exc:
+            last_error = map_provider_exception(provider_name, exc)
+            if emitted:
+                raise last_error from exc
+
+        retry_number += 1
+        delay = retrier.next_delay(retry_number, last_error)
+        if delay is None:
+            raise last_error
+        retrier.sleep(delay)
@@ -0,0 +1,366 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import importlib
+import json
+import logging
+import re
+from threading import Lock
+import time
+from typing import Callable, Protocol, Sequence
+
+from immcad_api.policy.source_policy import SourcePolicy, load_source_policy
+from immcad_api.schemas import Citation
+from immcad_api.sources.source_registry import SourceRegistry, load_source_registry
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedAnswer:
+    answer: str
+    citations: tuple[Citation, ...]
+    confidence: str
+    provider: str
+
+
+class AnswerCacheTier(Protocol):
+    def get(self, key: str) -> CachedAnswer | None: ...
+
+    def put(self, key: str, value: CachedAnswer) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class InMemoryAnswerCacheTier:
+    """Bounded LRU answer tier with per-entry TTL."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 512,
+        ttl_seconds: float = 3600.0,
+        time_fn: Callable[[], float] | None = None,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be > 0")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._time_fn = time_fn or time.monotonic
+        self._lock = Lock()
+        self._entries: OrderedDict[str, tuple[float, CachedAnswer]] = OrderedDict()
+
+    def get(self, key: str) -> CachedAnswer | None:
+        now = self._time_fn()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if now >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: CachedAnswer) -> None:
+        expires_at = self._time_fn() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class RedisAnswerCacheTier:
+    def __init__(
+        self,
+        redis_client,
+        *,
+        prefix: str = "immcad:chat:answers",
+        ttl_seconds: int = 3600,
+    ) -> None:
+        self.redis_client = redis_client
+        self.prefix = prefix
+        self.ttl_seconds = max(int(ttl_seconds), 1)
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get(self, key: str) -> CachedAnswer | None:
+        try:
+            payload = self.redis_client.get(self._key(key))
+        except Exception:
+            LOGGER.warning("Unable to read chat answer from Redis", exc_info=True)
+            return None
+        if not payload:
+            return None
+        try:
+            if isinstance(payload, bytes):
+                payload = payload.decode("utf-8")
+            data = json.loads(payload)
+            return CachedAnswer(
+                answer=str(data["answer"]),
+                citations=tuple(
+                    Citation.model_validate(item) for item in data.get("citations") or []
+                ),
+                confidence=str(data["confidence"]),
+                provider=str(data["provider"]),
+            )
+        except Exception:
+            LOGGER.warning("Unable to decode cached chat answer", exc_info=True)
+            return None
+
+    def put(self, key: str, value: CachedAnswer) -> None:
+        payload = json.dumps(
+            {
+                "answer": value.answer,
+                "citations": [citation.model_dump() for citation in value.citations],
+                "confidence": value.confidence,
+                "provider": value.provider,
+            }
+        )
+        try:
+            self.redis_client.setex(self._key(key), self.ttl_seconds, payload)
+        except Exception:
+            LOGGER.warning("Unable to persist chat answer in Redis", exc_info=True)
+
+    def clear(self) -> None:
+        # Redis entries are namespaced by catalog version and expire by TTL.
+        return None
+
+
+def normalize_cache_message(message: str) -> str:
+    return re.sub(r"\s+", " ", message.strip().lower())
+
+
+def citation_set_fingerprint(citations: Sequence[Citation]) -> str:
+    digest = hashlib.sha256()
+    for citation in citations:
+        digest.update(
+            json.dumps(
+                [
+                    citation.source_id,
+                    citation.title,
+                    citation.url,
+                    citation.pin,
+                    citation.snippet,
+                ]
+            ).encode("utf-8")
+        )
+    return digest.hexdigest()
+
+
+def source_catalog_version(
+    *,
+    source_registry: SourceRegistry | None,
+    source_policy: SourcePolicy | None,
+) -> str:
+    """Identify the loaded registry/policy so cached answers never outlive them."""
+    digest = hashlib.sha256()
+    parts: list[str] = []
+    for label, document in (("registry", source_registry), ("policy", source_policy)):
+        if document is None:
+            parts.append(f"{label}:none")
+            continue
+        parts.append(f"{label}:{document.version}")
+        digest.update(document.model_dump_json().encode("utf-8"))
+    return f"{'|'.join(parts)}|{digest.hexdigest()[:16]}"
+
+
+def _load_source_catalog() -> tuple[SourceRegistry | None, SourcePolicy | None]:
+    try:
+        return load_source_registry(), load_source_policy()
+    except FileNotFoundError:
+        return None, None
+
+
+class SourceCatalogVersionTracker:
+    """Report the current ``source_catalog_version``, re-reading the catalog as it changes.
+
+    ``load_catalog`` runs again at most once per ``refresh_seconds``. A refreshed
+    registry or policy therefore invalidates cached answers without a restart, and
+    requests do not parse both documents every time.
+    """
+
+    def __init__(
+        self,
+        load_catalog: Callable[
+            [], tuple[SourceRegistry | None, SourcePolicy | None]
+        ] = _load_source_catalog,
+        *,
+        refresh_seconds: float = 30.0,
+        time_fn: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if refresh_seconds < 0:
+            raise ValueError("refresh_seconds must be >= 0")
+        self._load_catalog = load_catalog
+        self.refresh_seconds = refresh_seconds
+        self._time_fn = time_fn
+        self._lock = Lock()
+        self._version: str | None = None
+        self._checked_at = 0.0
+
+    def __call__(self) -> str:
+        now = self._time_fn()
+        with self._lock:
+            if self._version is not None and now - self._checked_at < self.refresh_seconds:
+                return self._version
+            self._checked_at = now
+            try:
+                source_registry, source_policy = self._load_catalog()
+            except Exception:
+                if self._version is None:
+                    raise
+                # A half-written or invalid catalog keeps serving the last good version.
+                LOGGER.warning("Source catalog reload failed", exc_info=True)
+                return self._version
+            self._version = source_catalog_version(
+                source_registry=source_registry, source_policy=source_policy
+            )
+            return self._version
+
+
+class ChatAnswerCache:
+    """Two-tier (in-process LRU, optional Redis) cache of validated chat answers.
+
+    Keys are scoped to the source catalog version; when the version reported by
+    ``version_provider`` changes, the in-process tier is cleared and Redis entries
+    from the previous version become unreachable until their TTL expires.
+    """
+
+    def __init__(
+        self,
+        *,
+        memory_tier: InMemoryAnswerCacheTier | None = None,
+        redis_tier: RedisAnswerCacheTier | None = None,
+        version_provider: Callable[[], str] | None = None,
+    ) -> None:
+        self.memory_tier = memory_tier or InMemoryAnswerCacheTier()
+        self.redis_tier = redis_tier
+        self._version_provider = version_provider or (lambda: "unversioned")
+        self._lock = Lock()
+        self._active_version: str | None = None
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._rejected = 0
+        self._invalidations = 0
+
+    def _current_version(self) -> str:
+        version = self._version_provider()
+        with self._lock:
+            if self._active_version is None:
+                self._active_version = version
+            elif self._active_version != version:
+                self._active_version = version
+                self._invalidations += 1
+                self.memory_tier.clear()
+        return version
+
+    def build_key(
+        self,
+        *,
+        message: str,
+        locale: str,
+        mode: str,
+        citations: Sequence[Citation],
+    ) -> str:
+        payload = json.dumps(
+            [
+                self._current_version(),
+                normalize_cache_message(message),
+                locale,
+                mode,
+                citation_set_fingerprint(citations),
+            ]
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> CachedAnswer | None:
+        value = self.memory_tier.get(key)
+        if value is None and self.redis_tier is not None:
+            value = self.redis_tier.get(key)
+            if value is not None:
+                self.memory_tier.put(key, value)
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+    def put(self, key: str, value: CachedAnswer) -> None:
+        self.memory_tier.put(key, value)
+        if self.redis_tier is not None:
+            self.redis_tier.put(key, value)
+        with self._lock:
+            self._stores += 1
+
+    def record_rejected(self) -> None:
+        with self._lock:
+            self._rejected += 1
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "backend": "memory+redis" if self.redis_tier is not None else "memory",
+                "version": self._active_version,
+                "entries": len(self.memory_tier),
+                "hits": self._hits,
+                "misses": self._misses,
+                "stores": self._stores,
+                "rejected": self._rejected,
+                "invalidations": self._invalidations,
+            }
+
+
+def build_answer_cache(
+    *,
+    redis_url: str | None,
+    max_entries: int,
+    ttl_seconds: float,
+    version_provider: Callable[[], str],
+) -> ChatAnswerCache:
+    memory_tier = InMemoryAnswerCacheTier(
+        max_entries=max_entries,
+        ttl_seconds=ttl_seconds,
+    )
+    if not redis_url:
+        LOGGER.info("Using in-memory chat answer cache (redis_url not configured)")
+        return ChatAnswerCache(memory_tier=memory_tier, version_provider=version_provider)
+
+    try:
+        redis = importlib.import_module("redis")
+
+        redis_client = redis.Redis.from_url(
+            redis_url,
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5,
+        )
+        redis_client.ping()
+        LOGGER.info("Using Redis-backed chat answer cache tier")
+        return ChatAnswerCache(
+            memory_tier=memory_tier,
+            redis_tier=RedisAnswerCacheTier(redis_client, ttl_seconds=int(ttl_seconds)),
+            version_provider=version_provider,
+        )
+    except Exception:
+        LOGGER.warning(
+            "Redis chat answer cache unavailable; using in-memory tier only",
+            exc_info=True,
+        )
+        return ChatAnswerCache(memory_tier=memory_tier, version_provider=version_provider)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from functools import lru_cache
+import hashlib
+import importlib
+import math
+import re
+from typing import Protocol, Sequence
+
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_HASHING_EMBEDDER_SPEC = "hashing"
+_SENTENCE_TRANSFORMERS_PREFIX = "sentence-transformers:"
+
+
+class TextEmbedder(Protocol):
+    """Local text embedder; ``name`` identifies the model a vector file was built with."""
+
+    name: str
+    dimensions: int
+
+    def embed(self, texts: Sequence[str]) -> list[list[float]]: ...
+
+
+@lru_cache(maxsize=65536)
+def _feature_slot(feature: str, dimensions: int) -> tuple[int, float]:
+    digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest())
+    return digest % dimensions, 1.0 if digest >> 63 else -1.0
+
+
+class HashingEmbedder:
+    """Deterministic feature-hashing embedder: words plus character trigrams.
+
+    Needs no model download and gives identical vectors on every machine, which
+    makes it the test embedder and a usable CPU-only default. Trigrams let
+    inflections and compounds ("spouse", "spousal") land near each other; it
+    does not capture synonyms the way a trained model does.
+    """
+
+    def __init__(self, *, dimensions: int = 256) -> None:
+        if dimensions < 8 or dimensions % 8:
+            raise ValueError("dimensions must be a positive multiple of 8")
+        self.dimensions = dimensions
+        self.name = f"hashing-v1-{dimensions}"
+
+    def _embed_one(self, text: str) -> list[float]:
+        vector = [0.0] * self.dimensions
+        for word in _WORD_RE.findall(text.lower()):
+            slot, sign = _feature_slot(word, self.dimensions)
+            vector[slot] += sign
+            padded = f"<{word}>"
+            for start in range(len(padded) - 2):
+                slot, sign = _feature_slot(padded[start : start + 3], self.dimensions)
+                vector[slot] += 0.5 * sign
+        norm = math.sqrt(sum(value * value for value in vector))
+        if norm == 0:
+            return vector
+        return [value / norm for value in vector]
+
+    def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        return [self._embed_one(text) for text in texts]
+
+
+class SentenceTransformerEmbedder:
+    """Local sentence-transformers model, run on CPU; an optional dependency."""
+
+    def __init__(self, model_name: str) -> None:
+        sentence_transformers = importlib.import_module("sentence_transformers")
+        self._model = sentence_transformers.SentenceTransformer(model_name, device="cpu")
+        self.dimensions = int(self._model.get_sentence_embedding_dimension())
+        self.name = f"{_SENTENCE_TRANSFORMERS_PREFIX}{model_name}"
+
+    def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        vectors = self._model.encode(list(texts), normalize_embeddings=True)
+        return [list(map(float, vector)) for vector in vectors]
+
+
+def is_valid_embedder_spec(spec: str) -> bool:
+    return spec == _HASHING_EMBEDDER_SPEC or (
+        spec.startswith(_SENTENCE_TRANSFORMERS_PREFIX)
+        and bool(spec[len(_SENTENCE_TRANSFORMERS_PREFIX) :].strip())
+    )
+
+
+def build_text_embedder(spec: str) -> TextEmbedder:
+    """Build the embedder named by ``spec``: ``hashing`` or ``sentence-transformers:<model>``."""
+    if not is_valid_embedder_spec(spec):
+        raise ValueError(f"Unsupported embedder: {spec!r}")
+    if spec == _HASHING_EMBEDDER_SPEC:
+        return HashingEmbedder()
+    return SentenceTransformerEmbedder(spec[len(_SENTENCE_TRANSFORMERS_PREFIX) :].strip())
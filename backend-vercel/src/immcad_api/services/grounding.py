@@ -1,9 +1,15 @@
 from __future__ import annotations
 
-import re
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Protocol, Sequence
 
+from immcad_api.policy.message_analysis import DEFAULT_MESSAGE_ANALYZER, MessageAnalyzer
 from immcad_api.schemas import Citation
+from immcad_api.services.embeddings import TextEmbedder
+from immcad_api.services.section_index import SectionIndex, section_index_terms
+from immcad_api.services.section_vectors import SectionVectorIndex
 
 
 class GroundingAdapter(Protocol):
@@ -18,11 +24,14 @@ class GroundingAdapter(Protocol):
 
 
 class StaticGroundingAdapter:
-    """Simple grounding adapter backed by explicit citation inputs."""
+    """Simple grounding adapter backed by explicit citation inputs.
+
+    ``Citation`` is frozen, so adapters hold the catalog's instances and return
+    references to them; each request only gets a fresh list.
+    """
 
     def __init__(self, grounded_citations: Sequence[Citation] | None = None) -> None:
-        citations = grounded_citations or []
-        self._grounded_citations = tuple(citation.model_copy(deep=True) for citation in citations)
+        self._grounded_citations = tuple(grounded_citations or ())
 
     def citation_candidates(
         self,
@@ -32,27 +41,95 @@ class StaticGroundingAdapter:
         mode: str,
     ) -> list[Citation]:
         del message, locale, mode
-        return [citation.model_copy(deep=True) for citation in self._grounded_citations]
+        return list(self._grounded_citations)
+
+
+@dataclass(frozen=True)
+class _KeywordIndex:
+    """Inverted index over catalog keywords, built once per adapter.
+
+    Single-word keywords post ``(entry, weight)`` pairs under the word. Phrases
+    match anywhere in the normalized message (as a substring, like the original
+    scan), so they are posted under their last word: a phrase occurring in the
+    message implies that word begins one of the message's space-separated
+    words. That prefix lookup only narrows the candidates; each candidate phrase
+    is still confirmed with a substring test.
+    """
+
+    term_postings: dict[str, tuple[tuple[int, int], ...]]
+    phrase_postings: dict[str, tuple[tuple[str, tuple[tuple[int, int], ...]], ...]]
+    phrase_anchor_lengths: tuple[int, ...]
+
+    @classmethod
+    def build(cls, keyword_sets: Sequence[tuple[str, ...]]) -> _KeywordIndex:
+        term_weights: dict[str, dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        phrase_weights: dict[str, dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        for index, keywords in enumerate(keyword_sets):
+            for keyword in keywords:
+                if not keyword:
+                    continue
+                if " " in keyword:
+                    phrase_weights[keyword][index] += 2
+                else:
+                    term_weights[keyword][index] += 1
+
+        anchored: dict[str, list[tuple[str, tuple[tuple[int, int], ...]]]] = defaultdict(list)
+        for phrase, weights in phrase_weights.items():
+            anchored[phrase.rsplit(" ", 1)[1]].append((phrase, tuple(weights.items())))
+        return cls(
+            term_postings={term: tuple(weights.items()) for term, weights in term_weights.items()},
+            phrase_postings={anchor: tuple(phrases) for anchor, phrases in anchored.items()},
+            phrase_anchor_lengths=tuple(sorted({len(anchor) for anchor in anchored})),
+        )
+
+    def score(self, *, normalized_message: str, tokens: frozenset[str]) -> dict[int, int]:
+        scores: dict[int, int] = defaultdict(int)
+        for token in tokens:
+            for index, weight in self.term_postings.get(token, ()):
+                scores[index] += weight
+
+        if self.phrase_postings:
+            anchors: set[str] = set()
+            for word in set(normalized_message.split(" ")):
+                for length in self.phrase_anchor_lengths:
+                    if length > len(word):
+                        break
+                    anchors.add(word[:length])
+            for anchor in anchors:
+                for phrase, postings in self.phrase_postings.get(anchor, ()):
+                    if phrase not in normalized_message:
+                        continue
+                    for index, weight in postings:
+                        scores[index] += weight
+        return scores
 
 
 class KeywordGroundingAdapter:
-    """Select grounded citations from a curated catalog using keyword overlap."""
+    """Select grounded citations from a curated catalog using keyword overlap.
+
+    Each catalog entry scores one point per single-word keyword found among the
+    message tokens and two per phrase found in the message. Lookups go through
+    an inverted index, so their cost follows the message's terms rather than
+    the catalog size.
+    """
 
     def __init__(
         self,
         catalog: Sequence[tuple[Citation, tuple[str, ...]]],
         *,
         max_citations: int = 3,
+        message_analyzer: MessageAnalyzer | None = None,
     ) -> None:
         if not catalog:
             raise ValueError("KeywordGroundingAdapter requires a non-empty citation catalog")
         if max_citations < 1:
             raise ValueError("max_citations must be >= 1")
-        self._catalog = tuple(
-            (citation.model_copy(deep=True), tuple(keyword.strip().lower() for keyword in keywords))
-            for citation, keywords in catalog
+        self._citations = tuple(citation for citation, _ in catalog)
+        self._index = _KeywordIndex.build(
+            [tuple(keyword.strip().lower() for keyword in keywords) for _, keywords in catalog]
         )
         self._max_citations = max_citations
+        self._message_analyzer = message_analyzer or DEFAULT_MESSAGE_ANALYZER
 
     def citation_candidates(
         self,
@@ -62,33 +139,20 @@ class KeywordGroundingAdapter:
         mode: str,
     ) -> list[Citation]:
         del locale, mode
-        normalized_message = re.sub(r"\s+", " ", message.lower()).strip()
-        tokens = set(re.findall(r"[a-z0-9]+", normalized_message))
+        analysis = self._message_analyzer.analyze(message)
+        scores = self._index.score(
+            normalized_message=analysis.normalized, tokens=analysis.tokens
+        )
 
         selected: list[Citation] = []
         selected_keys: set[tuple[str, str]] = set()
-
-        scored: list[tuple[int, int, Citation]] = []
-        for index, (citation, keywords) in enumerate(self._catalog):
-            score = 0
-            for keyword in keywords:
-                if not keyword:
-                    continue
-                if " " in keyword:
-                    if keyword in normalized_message:
-                        score += 2
-                    continue
-                if keyword in tokens:
-                    score += 1
-            if score <= 0:
-                continue
-            scored.append((score, -index, citation))
-
-        for _, _, citation in sorted(scored, reverse=True):
+        # Highest score first; ties keep catalog order.
+        for index in sorted(scores, key=lambda index: (-scores[index], index)):
+            citation = self._citations[index]
             key = (citation.source_id, citation.pin)
             if key in selected_keys:
                 continue
-            selected.append(citation.model_copy(deep=True))
+            selected.append(citation)
             selected_keys.add(key)
             if len(selected) >= self._max_citations:
                 break
@@ -96,20 +160,126 @@ class KeywordGroundingAdapter:
         return selected
 
 
+class SectionIndexGroundingAdapter:
+    """Select federal-law section citations from a memory-mapped BM25 section index.
+
+    Messages with no indexed terms in common with any section are passed to
+    ``fallback`` (typically the curated keyword catalog) when one is given.
+    """
+
+    def __init__(
+        self,
+        index: SectionIndex,
+        *,
+        max_citations: int = 3,
+        fallback: GroundingAdapter | None = None,
+    ) -> None:
+        if max_citations < 1:
+            raise ValueError("max_citations must be >= 1")
+        self._index = index
+        self._max_citations = max_citations
+        self._fallback = fallback
+
+    def citation_candidates(
+        self,
+        *,
+        message: str,
+        locale: str,
+        mode: str,
+    ) -> list[Citation]:
+        hits = self._index.search(section_index_terms(message), top_k=self._max_citations)
+        if not hits and self._fallback is not None:
+            return self._fallback.citation_candidates(message=message, locale=locale, mode=mode)
+        return [self._index.citation(doc_id) for doc_id, _ in hits]
+
+
+class HybridGroundingAdapter:
+    """Fuse BM25 and dense vector matches over the same federal-law sections.
+
+    Each retriever contributes its ``candidates_per_retriever`` best sections and
+    the lists are merged by reciprocal rank (``1 / (rrf_k + rank)``), so a section
+    both retrievers rank well comes first, while one found only by paraphrase or
+    only by exact wording can still make the cut. Dense matches below
+    ``min_dense_similarity`` are dropped; when neither retriever finds anything,
+    ``fallback`` answers instead.
+    """
+
+    def __init__(
+        self,
+        index: SectionIndex,
+        vectors: SectionVectorIndex,
+        embedder: TextEmbedder,
+        *,
+        max_citations: int = 3,
+        candidates_per_retriever: int = 20,
+        rrf_k: int = 60,
+        min_dense_similarity: float = 0.2,
+        fallback: GroundingAdapter | None = None,
+    ) -> None:
+        if max_citations < 1:
+            raise ValueError("max_citations must be >= 1")
+        if candidates_per_retriever < max_citations:
+            raise ValueError("candidates_per_retriever must be >= max_citations")
+        if vectors.fingerprint != index.fingerprint:
+            raise ValueError("Section vectors were not built from the indexed sections")
+        vectors.check_embedder(embedder)
+        self._index = index
+        self._vectors = vectors
+        self._embedder = embedder
+        self._max_citations = max_citations
+        self._candidates = candidates_per_retriever
+        self._rrf_k = rrf_k
+        self._min_dense_similarity = min_dense_similarity
+        self._fallback = fallback
+
+    def citation_candidates(
+        self,
+        *,
+        message: str,
+        locale: str,
+        mode: str,
+    ) -> list[Citation]:
+        lexical = self._index.search(section_index_terms(message), top_k=self._candidates)
+        dense = self._vectors.search(
+            self._embedder.embed([message])[0],
+            top_k=self._candidates,
+            min_similarity=self._min_dense_similarity,
+        )
+        fused: dict[int, float] = defaultdict(float)
+        for ranking in (lexical, dense):
+            for rank, (doc_id, _) in enumerate(ranking, start=1):
+                fused[doc_id] += 1.0 / (self._rrf_k + rank)
+        if not fused and self._fallback is not None:
+            return self._fallback.citation_candidates(message=message, locale=locale, mode=mode)
+        ranked = sorted(fused, key=lambda doc_id: (-fused[doc_id], doc_id))
+        return [self._index.citation(doc_id) for doc_id in ranked[: self._max_citations]]
+
+
 def scaffold_grounded_citations() -> list[Citation]:
-    return [
+    return list(_scaffold_grounded_citations())
+
+
+def official_grounding_catalog() -> list[tuple[Citation, tuple[str, ...]]]:
+    return list(_official_grounding_catalog())
+
+
+# The built-in catalogs are built once per process and shared by every adapter.
+@lru_cache(maxsize=1)
+def _scaffold_grounded_citations() -> tuple[Citation, ...]:
+    return (
         Citation(
             source_id="IRPA",
             snippet="Reference to IRPA; user context omitted for privacy.",
             title="Immigration and Refugee Protection Act",
             url="https://laws-lois.justice.gc.ca/eng/acts/I-2.5/FullText.html",
             pin="s. 11",
-        )
-    ]
+        ),
+    )
 
 
-def official_grounding_catalog() -> list[tuple[Citation, tuple[str, ...]]]:
-    return [
+@lru_cache(maxsize=1)
+def _official_grounding_catalog() -> tuple[tuple[Citation, tuple[str, ...]], ...]:
+    return (
         (
             Citation(
                 source_id="IRPA",
@@ -349,4 +519,4 @@ def official_grounding_catalog() -> list[tuple[Citation, tuple[str, ...]]]:
                 "temporary resident",
             ),
         ),
-    ]
+    )
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import json
+import logging
+from pathlib import Path
+import re
+from threading import Lock
+from typing import Callable, Iterable, Protocol
+
+from immcad_api.policy.compliance import SAFE_CONSTRAINED_RESPONSE
+from immcad_api.schemas import ChatRequest, ChatResponse, Citation
+
+
+LOGGER = logging.getLogger(__name__)
+
+PRECOMPUTED_ANSWERS_FORMAT_VERSION = 1
+_PRECOMPUTED_SESSION_ID = "precomputed-answers"
+_TRAILING_PUNCTUATION_RE = re.compile(r"[\s?!.]+$")
+
+
+def normalize_precomputed_question(message: str) -> str:
+    """Case-fold, collapse whitespace and drop trailing ``?!.`` so near-identical phrasings match."""
+    collapsed = re.sub(r"\s+", " ", message.strip().casefold())
+    return _TRAILING_PUNCTUATION_RE.sub("", collapsed)
+
+
+@dataclass(frozen=True)
+class PrecomputedAnswer:
+    question: str
+    locale: str
+    mode: str
+    answer: str
+    citations: tuple[Citation, ...]
+    confidence: str
+    catalog_version: str
+    generated_at: str
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "question": self.question,
+            "locale": self.locale,
+            "mode": self.mode,
+            "answer": self.answer,
+            "citations": [citation.model_dump() for citation in self.citations],
+            "confidence": self.confidence,
+            "catalog_version": self.catalog_version,
+            "generated_at": self.generated_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, object]) -> PrecomputedAnswer:
+        raw_citations = data.get("citations") or []
+        if not isinstance(raw_citations, list):
+            raise ValueError("citations must be a list")
+        return cls(
+            question=str(data["question"]),
+            locale=str(data["locale"]),
+            mode=str(data["mode"]),
+            answer=str(data["answer"]),
+            citations=tuple(Citation.model_validate(item) for item in raw_citations),
+            confidence=str(data["confidence"]),
+            catalog_version=str(data["catalog_version"]),
+            generated_at=str(data.get("generated_at") or ""),
+        )
+
+
+class PrecomputedAnswerStore:
+    """Answers to high-frequency questions computed offline, keyed by normalized question.
+
+    Every entry records the source catalog version it was generated against.
+    ``lookup`` only returns entries whose version matches ``version_provider()``,
+    so a registry or policy change retires the whole store until it is rebuilt.
+    """
+
+    def __init__(
+        self,
+        answers: Iterable[PrecomputedAnswer] = (),
+        *,
+        version_provider: Callable[[], str] | None = None,
+    ) -> None:
+        self._version_provider = version_provider or (lambda: "unversioned")
+        self._entries: dict[tuple[str, str, str], PrecomputedAnswer] = {}
+        for answer in answers:
+            key = (normalize_precomputed_question(answer.question), answer.locale, answer.mode)
+            self._entries[key] = answer
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, *, message: str, locale: str, mode: str) -> PrecomputedAnswer | None:
+        entry = self._entries.get((normalize_precomputed_question(message), locale, mode))
+        if entry is not None and entry.catalog_version != self._version_provider():
+            with self._lock:
+                self._stale += 1
+            return None
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return entry
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "version": self._version_provider(),
+                "hits": self._hits,
+                "misses": self._misses,
+                "stale_rejections": self._stale,
+            }
+
+
+def load_precomputed_answer_store(
+    path: str | Path,
+    *,
+    version_provider: Callable[[], str],
+) -> PrecomputedAnswerStore:
+    """Load a store written by ``write_precomputed_answers``; a missing file yields an empty store."""
+    store_path = Path(path)
+    if not store_path.exists():
+        LOGGER.warning("Precomputed answer store not found at %s", store_path)
+        return PrecomputedAnswerStore(version_provider=version_provider)
+    payload = json.loads(store_path.read_text(encoding="utf-8"))
+    if payload.get("format_version") != PRECOMPUTED_ANSWERS_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported precomputed answer store format: {payload.get('format_version')!r}"
+        )
+    answers = [PrecomputedAnswer.from_dict(item) for item in payload.get("answers") or []]
+    return PrecomputedAnswerStore(answers, version_provider=version_provider)
+
+
+def write_precomputed_answers(
+    path: str | Path,
+    answers: Iterable[PrecomputedAnswer],
+) -> None:
+    store_path = Path(path)
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "format_version": PRECOMPUTED_ANSWERS_FORMAT_VERSION,
+        "answers": [answer.to_dict() for answer in answers],
+    }
+    store_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+class _ChatHandler(Protocol):
+    def handle_chat(self, request: ChatRequest) -> ChatResponse: ...
+
+
+@dataclass(frozen=True)
+class PrecomputedAnswerBuild:
+    answers: tuple[PrecomputedAnswer, ...]
+    rejected: tuple[tuple[str, str], ...]
+
+
+def _rejection_reason(response: ChatResponse) -> str | None:
+    if response.fallback_used.used:
+        return "fallback_used"
+    if not response.citations or response.answer == SAFE_CONSTRAINED_RESPONSE:
+        return "ungrounded"
+    if response.research_preview is not None:
+        # Research previews summarize live case-law results that a stored
+        # answer could not reproduce.
+        return "research_preview"
+    return None
+
+
+def build_precomputed_answers(
+    chat_service: _ChatHandler,
+    questions: Iterable[str],
+    *,
+    catalog_version: str,
+    locale: str = "en-CA",
+    mode: str = "standard",
+) -> PrecomputedAnswerBuild:
+    """Answer ``questions`` through ``chat_service`` and keep the grounded answers.
+
+    Answers that used a fallback, carry no validated citations, or include a
+    research preview are rejected with a reason. Questions that normalize to the
+    same text are answered once.
+    """
+    generated_at = datetime.now(tz=timezone.utc).isoformat().replace("+00:00", "Z")
+    answers: list[PrecomputedAnswer] = []
+    rejected: list[tuple[str, str]] = []
+    seen: set[str] = set()
+    for index, question in enumerate(questions):
+        normalized = normalize_precomputed_question(question)
+        if not normalized or normalized in seen:
+            continue
+        seen.add(normalized)
+        response = chat_service.handle_chat(
+            ChatRequest(
+                # One session per question, so session memory never carries
+                # an earlier question into a stored answer.
+                session_id=f"{_PRECOMPUTED_SESSION_ID}-{index}",
+                message=question.strip(),
+                locale=locale,
+                mode=mode,
+            )
+        )
+        reason = _rejection_reason(response)
+        if reason is not None:
+            rejected.append((question, reason))
+            continue
+        answers.append(
+            PrecomputedAnswer(
+                question=question.strip(),
+                locale=locale,
+                mode=mode,
+                answer=response.answer,
+                citations=tuple(response.citations),
+                confidence=response.confidence,
+                catalog_version=catalog_version,
+                generated_at=generated_at,
+            )
+        )
+    return PrecomputedAnswerBuild(answers=tuple(answers), rejected=tuple(rejected))
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future
+from threading import Lock
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _LeaderAbandoned(Exception):
+    """The leader was cancelled before producing a result; followers run on their own."""
+
+
+class RequestCoalescer(Generic[T]):
+    """Singleflight execution of identical concurrent calls.
+
+    The first caller for a key becomes the leader and runs the call; callers that
+    arrive while it is in flight wait for and share its outcome, including any
+    exception. Nothing is cached: the key is released as soon as the leader
+    finishes, so the next caller starts a fresh call. Sync and async callers share
+    one in-flight table, so a thread can follow an event-loop leader and vice versa.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._in_flight: dict[Hashable, Future[T]] = {}
+        self._leaders = 0
+        self._followers = 0
+
+    def _claim(self, key: Hashable) -> tuple[Future[T], bool]:
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                self._followers += 1
+                return future, False
+            future = Future()
+            self._in_flight[key] = future
+            self._leaders += 1
+            return future, True
+
+    def _release(self, key: Hashable, future: Future[T]) -> None:
+        # Unpublish before settling so late arrivals start a new call instead of
+        # reading a finished result.
+        with self._lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    def run(self, key: Hashable, call: Callable[[], T]) -> tuple[T, bool]:
+        """Run ``call`` or join an identical one; returns ``(value, coalesced)``."""
+        future, is_leader = self._claim(key)
+        if not is_leader:
+            try:
+                return future.result(), True
+            except _LeaderAbandoned:
+                return call(), False
+        try:
+            value = call()
+        except Exception as exc:
+            self._release(key, future)
+            future.set_exception(exc)
+            raise
+        except BaseException:
+            self._release(key, future)
+            future.set_exception(_LeaderAbandoned())
+            raise
+        self._release(key, future)
+        future.set_result(value)
+        return value, False
+
+    async def run_async(
+        self, key: Hashable, call: Callable[[], Awaitable[T]]
+    ) -> tuple[T, bool]:
+        future, is_leader = self._claim(key)
+        if not is_leader:
+            try:
+                # Shield so a cancelled follower does not cancel the shared future.
+                return await asyncio.shield(asyncio.wrap_future(future)), True
+            except _LeaderAbandoned:
+                return await call(), False
+        try:
+            value = await call()
+        except Exception as exc:
+            self._release(key, future)
+            future.set_exception(exc)
+            raise
+        except BaseException:
+            self._release(key, future)
+            future.set_exception(_LeaderAbandoned())
+            raise
+        self._release(key, future)
+        future.set_result(value)
+        return value, False
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "in_flight": len(self._in_flight),
+                "leaders": self._leaders,
+                "followers": self._followers,
+            }
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextvars import copy_context
+from dataclasses import dataclass
+import inspect
+from threading import Lock
+import time
+from typing import Awaitable, Callable, Sequence
+
+from immcad_api.providers.bulkhead import BulkheadFullError, BulkheadRegistry
+
+
+@dataclass(frozen=True)
+class RetrievalStage:
+    name: str
+    run: Callable[[], object]
+    timeout_seconds: float
+
+
+@dataclass(frozen=True)
+class RetrievalStageOutcome:
+    name: str
+    value: object | None
+    timed_out: bool = False
+    shed: bool = False
+
+
+_SHED = object()
+
+
+class RetrievalFanout:
+    """Run independent chat retrieval stages concurrently with per-stage timeouts.
+
+    Threadless runtimes (Cloudflare Python Workers) cannot start executor threads.
+    ``run`` then runs stages inline in submission order so the chat turn still
+    completes; ``run_async`` runs them as tasks on the event loop, each bounded by
+    its timeout. A stage whose ``run`` returns an awaitable is awaited there, so it
+    overlaps with the other stages and is cancelled when it times out.
+    Stages whose name has a bulkhead in ``bulkheads`` wait for a slot on their worker
+    and are reported as ``shed`` when the bulkhead queue is full.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = 8,
+        time_fn: Callable[[], float] | None = None,
+        bulkheads: BulkheadRegistry | None = None,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        self.max_workers = max_workers
+        self._time_fn = time_fn or time.monotonic
+        self._lock = Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._threads_unavailable = False
+        self._queued = 0
+        self.bulkheads = bulkheads
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="immcad-retrieval",
+                )
+            return self._executor
+
+    def _dequeue(self) -> None:
+        with self._lock:
+            self._queued = max(0, self._queued - 1)
+
+    def queue_depth(self) -> int:
+        """Stages submitted to the executor that no worker has started yet."""
+        with self._lock:
+            return self._queued
+
+    def _run_queued_stage(self, stage: RetrievalStage) -> object:
+        self._dequeue()
+        return self._run_stage(stage)
+
+    def _cancel(self, future: Future[object]) -> None:
+        # A future that never started still counts as queued until cancelled.
+        if future.cancel():
+            self._dequeue()
+
+    def _run_stage(self, stage: RetrievalStage) -> object:
+        bulkhead = self.bulkheads.get(stage.name) if self.bulkheads is not None else None
+        if bulkhead is None:
+            return stage.run()
+        try:
+            bulkhead.acquire()
+        except BulkheadFullError:
+            return _SHED
+        try:
+            return stage.run()
+        finally:
+            bulkhead.release()
+
+    async def _run_stage_async(self, stage: RetrievalStage) -> object:
+        bulkhead = self.bulkheads.get(stage.name) if self.bulkheads is not None else None
+        if bulkhead is None:
+            return await self._call_stage(stage)
+        try:
+            await bulkhead.acquire_async()
+        except BulkheadFullError:
+            return _SHED
+        try:
+            return await self._call_stage(stage)
+        finally:
+            bulkhead.release()
+
+    @staticmethod
+    async def _call_stage(stage: RetrievalStage) -> object:
+        value = stage.run()
+        if inspect.isawaitable(value):
+            value = await value
+        return value
+
+    @staticmethod
+    def _outcome(stage: RetrievalStage, value: object) -> RetrievalStageOutcome:
+        if value is _SHED:
+            return RetrievalStageOutcome(name=stage.name, value=None, shed=True)
+        return RetrievalStageOutcome(name=stage.name, value=value)
+
+    def _submit(self, stage: RetrievalStage) -> Future[object] | None:
+        if self._threads_unavailable:
+            return None
+        # Counted before submitting so a worker that starts at once cannot
+        # dequeue the stage before it was queued.
+        with self._lock:
+            self._queued += 1
+        try:
+            # Copy the context so stages see the caller's request deadline.
+            return self._get_executor().submit(
+                copy_context().run, self._run_queued_stage, stage
+            )
+        except RuntimeError:
+            # Raised when threads cannot be started (threadless runtimes) or the
+            # executor has been shut down; degrade to inline execution.
+            self._dequeue()
+            self._threads_unavailable = True
+            return None
+
+    @staticmethod
+    def _validate(stages: Sequence[RetrievalStage]) -> None:
+        for stage in stages:
+            if stage.timeout_seconds <= 0:
+                raise ValueError(f"timeout_seconds must be > 0 for stage '{stage.name}'")
+
+    def run(self, stages: Sequence[RetrievalStage]) -> list[RetrievalStageOutcome]:
+        self._validate(stages)
+        started_at = self._time_fn()
+        futures = [self._submit(stage) for stage in stages]
+
+        outcomes: list[RetrievalStageOutcome] = []
+        for stage, future in zip(stages, futures):
+            if future is None:
+                outcomes.append(self._outcome(stage, self._run_stage(stage)))
+                continue
+            remaining = stage.timeout_seconds - (self._time_fn() - started_at)
+            try:
+                value = future.result(timeout=max(remaining, 0.0))
+            except FutureTimeoutError:
+                self._cancel(future)
+                outcomes.append(
+                    RetrievalStageOutcome(name=stage.name, value=None, timed_out=True)
+                )
+                continue
+            outcomes.append(self._outcome(stage, value))
+        return outcomes
+
+    async def run_async(
+        self, stages: Sequence[RetrievalStage]
+    ) -> list[RetrievalStageOutcome]:
+        """Like ``run`` but awaits stage results without blocking the event loop."""
+        self._validate(stages)
+        started_at = self._time_fn()
+        futures = [self._submit(stage) for stage in stages]
+        # Without worker threads, stages run as tasks on this loop instead.
+        pending: list[Awaitable[object]] = [
+            asyncio.wrap_future(future)
+            if future is not None
+            else asyncio.ensure_future(self._run_stage_async(stage))
+            for stage, future in zip(stages, futures)
+        ]
+
+        outcomes: list[RetrievalStageOutcome] = []
+        for stage, future, awaitable in zip(stages, futures, pending):
+            remaining = stage.timeout_seconds - (self._time_fn() - started_at)
+            try:
+                value = await asyncio.wait_for(awaitable, timeout=max(remaining, 0.0))
+            except asyncio.TimeoutError:
+                if future is not None:
+                    self._cancel(future)
+                outcomes.append(
+                    RetrievalStageOutcome(name=stage.name, value=None, timed_out=True)
+                )
+                continue
+            outcomes.append(self._outcome(stage, value))
+        return outcomes
+
+    def close(self) -> None:
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            self._queued = 0
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
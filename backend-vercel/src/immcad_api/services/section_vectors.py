@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+import heapq
+import json
+import mmap
+from operator import mul
+from pathlib import Path
+import struct
+from typing import Iterable, Mapping
+
+from immcad_api.services.embeddings import TextEmbedder
+from immcad_api.services.section_index import (
+    encode_section_citation,
+    indexable_sections,
+    sections_fingerprint,
+)
+
+
+SECTION_VECTORS_FORMAT_VERSION = 1
+_MAGIC = b"IMCADSV1"
+_HEADER_LENGTH = struct.Struct("<Q")
+_ALIGNMENT = 8
+_QUANTIZATION_SCALE = 127
+
+
+def _padding(length: int) -> bytes:
+    return b"\0" * (-length % _ALIGNMENT)
+
+
+def _sign_code(vector: list[float]) -> int:
+    code = 0
+    for bit, value in enumerate(vector):
+        if value > 0:
+            code |= 1 << bit
+    return code
+
+
+def _quantize(vector: list[float]) -> bytes:
+    return bytes(
+        round(max(-1.0, min(1.0, value)) * _QUANTIZATION_SCALE) & 0xFF for value in vector
+    )
+
+
+@dataclass(frozen=True)
+class SectionVectorBuild:
+    sections_embedded: int
+    dimensions: int
+    embedder: str
+
+
+def write_section_vectors(
+    path: str | Path,
+    records: Iterable[Mapping[str, object]],
+    *,
+    embedder: TextEmbedder,
+    batch_size: int = 64,
+) -> SectionVectorBuild:
+    """Embed the sections ``write_section_index`` would index, in the same order.
+
+    Each unit-length embedding is stored twice, both compact: as a sign-bit code
+    (``dimensions / 8`` bytes) used to shortlist candidates by Hamming distance,
+    and as int8 components (``dimensions`` bytes) used to rescore the shortlist.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    code_width = embedder.dimensions // 8
+    payloads: list[bytes] = []
+    codes = bytearray()
+    quantized = bytearray()
+    batch: list[str] = []
+
+    def flush() -> None:
+        for vector in embedder.embed(batch):
+            if len(vector) != embedder.dimensions:
+                raise ValueError("Embedder returned a vector of unexpected size")
+            codes.extend(_sign_code(vector).to_bytes(code_width, "little"))
+            quantized.extend(_quantize(vector))
+        batch.clear()
+
+    for citation, text in indexable_sections(records):
+        if citation is None:
+            continue
+        payloads.append(encode_section_citation(citation))
+        batch.append(text)
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+
+    sections = {"codes": bytes(codes), "quantized": bytes(quantized)}
+    layout: dict[str, list[int]] = {}
+    offset = 0
+    for name, payload in sections.items():
+        layout[name] = [offset, len(payload)]
+        offset += len(payload) + len(_padding(len(payload)))
+    header = json.dumps(
+        {
+            "format_version": SECTION_VECTORS_FORMAT_VERSION,
+            "doc_count": len(payloads),
+            "dimensions": embedder.dimensions,
+            "embedder": embedder.name,
+            "fingerprint": sections_fingerprint(payloads),
+            "layout": layout,
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    vectors_path = Path(path)
+    vectors_path.parent.mkdir(parents=True, exist_ok=True)
+    with vectors_path.open("wb") as handle:
+        handle.write(_MAGIC)
+        handle.write(_HEADER_LENGTH.pack(len(header)))
+        handle.write(header)
+        handle.write(_padding(len(_MAGIC) + _HEADER_LENGTH.size + len(header)))
+        for payload in sections.values():
+            handle.write(payload)
+            handle.write(_padding(len(payload)))
+    return SectionVectorBuild(
+        sections_embedded=len(payloads),
+        dimensions=embedder.dimensions,
+        embedder=embedder.name,
+    )
+
+
+class SectionVectorIndex:
+    """Quantized section embeddings, memory-mapped from a ``write_section_vectors`` file.
+
+    A search ranks every section by Hamming distance between sign codes (one XOR
+    and popcount each), then rescores the ``rescore_candidates`` closest with
+    the int8 components, so only the shortlist pays for a full dot product.
+    """
+
+    def __init__(self, path: str | Path, *, rescore_candidates: int = 200) -> None:
+        if rescore_candidates < 1:
+            raise ValueError("rescore_candidates must be >= 1")
+        self.path = Path(path)
+        self.rescore_candidates = rescore_candidates
+        self._views: list[memoryview] = []
+        with self.path.open("rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._load()
+        except Exception:
+            self.close()
+            raise
+
+    def _load(self) -> None:
+        if self._mmap[: len(_MAGIC)] != _MAGIC:
+            raise ValueError(f"Not a section vector file: {self.path}")
+        header_start = len(_MAGIC) + _HEADER_LENGTH.size
+        (header_length,) = _HEADER_LENGTH.unpack_from(self._mmap, len(_MAGIC))
+        header = json.loads(self._mmap[header_start : header_start + header_length])
+        if header.get("format_version") != SECTION_VECTORS_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported section vector format: {header.get('format_version')!r}"
+            )
+        data_start = header_start + header_length
+        data_start += -data_start % _ALIGNMENT
+        mapped = memoryview(self._mmap)
+        self._views.append(mapped)
+
+        def section(name: str, fmt: str) -> memoryview:
+            offset, length = header["layout"][name]
+            start = data_start + offset
+            view = mapped[start : start + length].cast(fmt)
+            self._views.append(view)
+            return view
+
+        self.doc_count: int = header["doc_count"]
+        self.dimensions: int = header["dimensions"]
+        self.embedder: str = header["embedder"]
+        self.fingerprint: str = header["fingerprint"]
+        self._quantized = section("quantized", "b")
+        codes = section("codes", "B")
+        width = self.dimensions // 8
+        # Codes are compared against every query, so they are decoded to ints once.
+        self._codes = [
+            int.from_bytes(codes[row * width : (row + 1) * width], "little")
+            for row in range(self.doc_count)
+        ]
+
+    def __len__(self) -> int:
+        return self.doc_count
+
+    def check_embedder(self, embedder: TextEmbedder) -> None:
+        if (embedder.name, embedder.dimensions) != (self.embedder, self.dimensions):
+            raise ValueError(
+                f"Section vectors were built with {self.embedder!r} "
+                f"({self.dimensions} dimensions), not {embedder.name!r}"
+            )
+
+    def search(
+        self,
+        vector: list[float],
+        *,
+        top_k: int,
+        min_similarity: float = 0.0,
+    ) -> list[tuple[int, float]]:
+        """Return up to ``top_k`` ``(section, cosine similarity)`` pairs, best first."""
+        if not self._codes:
+            return []
+        query_code = _sign_code(vector)
+        distances = [(query_code ^ code).bit_count() for code in self._codes]
+        # Smallest distance that still admits ``rescore_candidates`` sections.
+        cutoff, admitted = 0, 0
+        for cutoff, count in sorted(Counter(distances).items()):
+            admitted += count
+            if admitted >= self.rescore_candidates:
+                break
+        shortlist = [row for row, distance in enumerate(distances) if distance < cutoff]
+        shortlist += [row for row, distance in enumerate(distances) if distance == cutoff][
+            : max(self.rescore_candidates - len(shortlist), 0)
+        ]
+
+        dimensions = self.dimensions
+        quantized = self._quantized
+        scored = []
+        for row in shortlist:
+            start = row * dimensions
+            similarity = (
+                sum(map(mul, vector, quantized[start : start + dimensions]))
+                / _QUANTIZATION_SCALE
+            )
+            if similarity >= min_similarity:
+                scored.append((row, similarity))
+        return heapq.nlargest(top_k, scored, key=lambda item: (item[1], -item[0]))
+
+    def close(self) -> None:
+        # Views must be released before the map can close; last taken, first released.
+        while self._views:
+            self._views.pop().release()
+        if not self._mmap.closed:
+            self._mmap.close()
@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import importlib
+import json
+import logging
+import re
+from threading import Lock
+import time
+from typing import Callable, Protocol
+
+from immcad_api.conversation import ConversationHistory, ConversationTurn
+
+
+LOGGER = logging.getLogger(__name__)
+
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s")
+# Recent turns are kept verbatim up to this length; the prompt builder trims further.
+_MAX_STORED_TURN_CHARS = 2000
+
+# Compare-and-set: write the new history only if the session still holds the
+# payload the update was computed from ("" for a missing session).
+_REDIS_COMPARE_AND_SET_SCRIPT = """
+local current = redis.call("GET", KEYS[1])
+if (current or "") ~= ARGV[1] then
+  return 0
+end
+redis.call("SETEX", KEYS[1], ARGV[2], ARGV[3])
+return 1
+"""
+
+
+class SessionMemoryTier(Protocol):
+    def get(self, session_id: str) -> ConversationHistory | None: ...
+
+    def put(self, session_id: str, history: ConversationHistory) -> None: ...
+
+
+class InMemorySessionTier:
+    """Bounded LRU of session histories with an idle TTL per session."""
+
+    def __init__(
+        self,
+        *,
+        max_sessions: int = 1000,
+        ttl_seconds: float = 3600.0,
+        time_fn: Callable[[], float] | None = None,
+    ) -> None:
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be >= 1")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be > 0")
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self._time_fn = time_fn or time.monotonic
+        self._lock = Lock()
+        self._sessions: OrderedDict[str, tuple[float, ConversationHistory]] = OrderedDict()
+
+    def get(self, session_id: str) -> ConversationHistory | None:
+        now = self._time_fn()
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            expires_at, history = entry
+            if now >= expires_at:
+                del self._sessions[session_id]
+                return None
+            self._sessions.move_to_end(session_id)
+            return history
+
+    def put(self, session_id: str, history: ConversationHistory) -> None:
+        expires_at = self._time_fn() + self.ttl_seconds
+        with self._lock:
+            self._sessions[session_id] = (expires_at, history)
+            self._sessions.move_to_end(session_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+
+class RedisSessionTier:
+    """Redis session tier; ``update`` applies a turn with an atomic compare-and-set."""
+
+    def __init__(
+        self,
+        redis_client,
+        *,
+        prefix: str = "immcad:chat:sessions",
+        ttl_seconds: int = 3600,
+        max_update_attempts: int = 5,
+    ) -> None:
+        if max_update_attempts < 1:
+            raise ValueError("max_update_attempts must be >= 1")
+        self.redis_client = redis_client
+        self.prefix = prefix
+        self.ttl_seconds = max(int(ttl_seconds), 1)
+        self.max_update_attempts = max_update_attempts
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.prefix}:{session_id}"
+
+    def _read_payload(self, session_id: str) -> str | None:
+        """The stored JSON ("" when absent), or ``None`` when Redis is unavailable."""
+        try:
+            payload = self.redis_client.get(self._key(session_id))
+        except Exception:
+            LOGGER.warning("Unable to read chat session from Redis", exc_info=True)
+            return None
+        if isinstance(payload, bytes):
+            payload = payload.decode("utf-8")
+        return payload or ""
+
+    def get(self, session_id: str) -> ConversationHistory | None:
+        payload = self._read_payload(session_id)
+        return self._decode(payload) if payload else None
+
+    @staticmethod
+    def _decode(payload: str) -> ConversationHistory | None:
+        try:
+            data = json.loads(payload)
+            return ConversationHistory(
+                summary=str(data.get("summary") or ""),
+                turns=tuple(
+                    ConversationTurn(question=str(question), answer=str(answer))
+                    for question, answer in data.get("turns") or []
+                ),
+            )
+        except Exception:
+            LOGGER.warning("Unable to decode chat session", exc_info=True)
+            return None
+
+    @staticmethod
+    def _encode(history: ConversationHistory) -> str:
+        return json.dumps(
+            {
+                "summary": history.summary,
+                "turns": [[turn.question, turn.answer] for turn in history.turns],
+            }
+        )
+
+    def put(self, session_id: str, history: ConversationHistory) -> None:
+        try:
+            self.redis_client.setex(
+                self._key(session_id), self.ttl_seconds, self._encode(history)
+            )
+        except Exception:
+            LOGGER.warning("Unable to persist chat session in Redis", exc_info=True)
+
+    def update(
+        self,
+        session_id: str,
+        apply: Callable[[ConversationHistory | None], ConversationHistory],
+    ) -> ConversationHistory | None:
+        """Store ``apply(current history)`` unless another writer got there first.
+
+        A concurrent write makes the compare-and-set fail and the update is
+        recomputed from the new history, so parallel turns are never lost.
+        Returns the stored history, or ``None`` when Redis is unavailable or the
+        session kept changing for ``max_update_attempts`` tries.
+        """
+        for _ in range(self.max_update_attempts):
+            expected = self._read_payload(session_id)
+            if expected is None:
+                return None
+            updated = apply(self._decode(expected) if expected else None)
+            try:
+                stored = self.redis_client.eval(
+                    _REDIS_COMPARE_AND_SET_SCRIPT,
+                    1,
+                    self._key(session_id),
+                    expected,
+                    self.ttl_seconds,
+                    self._encode(updated),
+                )
+            except Exception:
+                LOGGER.warning("Unable to persist chat session in Redis", exc_info=True)
+                return None
+            if int(stored):
+                return updated
+        LOGGER.warning("Chat session kept changing in Redis; turn kept in memory only")
+        return None
+
+
+def _clip(text: str, max_chars: int) -> str:
+    text = re.sub(r"\s+", " ", text).strip()
+    if len(text) <= max_chars:
+        return text
+    return f"{text[: max_chars - 1].rstrip()}…"
+
+
+def summarize_turn(turn: ConversationTurn) -> str:
+    """One summary line per folded turn: the question and the answer's first sentence.
+
+    Extractive on purpose, so folding a turn never costs a provider call.
+    """
+    first_sentence = _SENTENCE_END_RE.split(turn.answer.strip(), maxsplit=1)[0]
+    return f"Asked: {_clip(turn.question, 160)} Answered: {_clip(first_sentence, 220)}"
+
+
+class SessionMemoryStore:
+    """Server-side chat session memory: the latest turns verbatim plus a rolling summary.
+
+    Once a session holds more than ``max_recent_turns`` turns, the oldest turn is
+    folded into the summary, and the summary keeps only its newest lines within
+    ``max_summary_chars``. A session's stored size is therefore bounded however
+    long the conversation runs. When a Redis tier is configured it is read first
+    so every worker sees the latest turn; the in-process tier is the fallback
+    while Redis is unavailable. Recording a turn is atomic per session: Redis
+    updates use compare-and-set and in-process updates hold a lock, so parallel
+    turns of one session are all kept.
+    """
+
+    def __init__(
+        self,
+        *,
+        memory_tier: InMemorySessionTier | None = None,
+        redis_tier: RedisSessionTier | None = None,
+        max_recent_turns: int = 4,
+        max_summary_chars: int = 1200,
+        summarizer: Callable[[ConversationTurn], str] = summarize_turn,
+    ) -> None:
+        if max_recent_turns < 1:
+            raise ValueError("max_recent_turns must be >= 1")
+        if max_summary_chars < 1:
+            raise ValueError("max_summary_chars must be >= 1")
+        self.memory_tier = memory_tier or InMemorySessionTier()
+        self.redis_tier = redis_tier
+        self.max_recent_turns = max_recent_turns
+        self.max_summary_chars = max_summary_chars
+        self._summarizer = summarizer
+        self._lock = Lock()
+        self._update_lock = Lock()
+        self._loads = 0
+        self._hits = 0
+        self._turns_recorded = 0
+        self._turns_summarized = 0
+
+    def _read(self, session_id: str) -> ConversationHistory | None:
+        if self.redis_tier is not None:
+            history = self.redis_tier.get(session_id)
+            if history is not None:
+                return history
+        return self.memory_tier.get(session_id)
+
+    def load(self, session_id: str) -> ConversationHistory | None:
+        history = self._read(session_id)
+        with self._lock:
+            self._loads += 1
+            if history is not None:
+                self._hits += 1
+        return history
+
+    def record_turn(self, session_id: str, *, question: str, answer: str) -> None:
+        turn = ConversationTurn(
+            question=_clip(question, _MAX_STORED_TURN_CHARS),
+            answer=_clip(answer, _MAX_STORED_TURN_CHARS),
+        )
+        folded = 0
+
+        def append_turn(history: ConversationHistory | None) -> ConversationHistory:
+            nonlocal folded
+            # Redis may have evicted a session the in-process tier still holds.
+            history = history or self.memory_tier.get(session_id) or ConversationHistory()
+            turns = [*history.turns, turn]
+            summary_lines = history.summary.splitlines() if history.summary else []
+            folded = 0
+            while len(turns) > self.max_recent_turns:
+                summary_lines.append(self._summarizer(turns.pop(0)))
+                folded += 1
+            while summary_lines and len("\n".join(summary_lines)) > self.max_summary_chars:
+                summary_lines.pop(0)
+            return ConversationHistory(summary="\n".join(summary_lines), turns=tuple(turns))
+
+        updated = (
+            self.redis_tier.update(session_id, append_turn)
+            if self.redis_tier is not None
+            else None
+        )
+        if updated is not None:
+            self.memory_tier.put(session_id, updated)
+        else:
+            with self._update_lock:
+                self.memory_tier.put(
+                    session_id, append_turn(self.memory_tier.get(session_id))
+                )
+        with self._lock:
+            self._turns_recorded += 1
+            self._turns_summarized += folded
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "backend": "memory+redis" if self.redis_tier is not None else "memory",
+                "sessions": len(self.memory_tier),
+                "loads": self._loads,
+                "hits": self._hits,
+                "turns_recorded": self._turns_recorded,
+                "turns_summarized": self._turns_summarized,
+            }
+
+
+def build_session_memory_store(
+    *,
+    redis_url: str | None,
+    max_recent_turns: int,
+    max_sessions: int,
+    ttl_seconds: float,
+) -> SessionMemoryStore:
+    memory_tier = InMemorySessionTier(max_sessions=max_sessions, ttl_seconds=ttl_seconds)
+    if not redis_url:
+        LOGGER.info("Using in-memory chat session store (redis_url not configured)")
+        return SessionMemoryStore(memory_tier=memory_tier, max_recent_turns=max_recent_turns)
+
+    try:
+        redis = importlib.import_module("redis")
+
+        redis_client = redis.Redis.from_url(
+            redis_url,
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5,
+        )
+        redis_client.ping()
+        LOGGER.info("Using Redis-backed chat session store tier")
+        return SessionMemoryStore(
+            memory_tier=memory_tier,
+            redis_tier=RedisSessionTier(redis_client, ttl_seconds=int(ttl_seconds)),
+            max_recent_turns=max_recent_turns,
+        )
+    except Exception:
+        LOGGER.warning(
+            "Redis chat session store unavailable; using in-memory tier only",
+            exc_info=True,
+        )
+        return SessionMemoryStore(memory_tier=memory_tier, max_recent_turns=max_recent_turns)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
 from dataclasses import dataclass, field
 from datetime import date
 import re
@@ -10,6 +11,7 @@ import xml.etree.ElementTree as ET
 
 import httpx
 
+from immcad_api.deadline import deadline_expired, remaining_timeout
 from immcad_api.errors import SourceUnavailableError
 from immcad_api.schemas import CaseSearchRequest, CaseSearchResponse, CaseSearchResult
 from immcad_api.sources.canada_courts import (
@@ -189,13 +191,16 @@ class OfficialCaseLawClient:
                     )
                     return self._build_search_response(records, request)
 
-            fallback_records_by_source, fetch_errors = self._fetch_records_for_sources(
-                fallback_sources
-            )
-            errors.extend(fetch_errors)
-            if fallback_records_by_source:
-                self._update_cache(fallback_records_by_source)
-                records_by_source.update(fallback_records_by_source)
+            if deadline_expired():
+                errors.append("request deadline exceeded before fetching source feeds")
+            else:
+                fallback_records_by_source, fetch_errors = (
+                    self._fetch_records_for_sources(fallback_sources)
+                )
+                errors.extend(fetch_errors)
+                if fallback_records_by_source:
+                    self._update_cache(fallback_records_by_source)
+                    records_by_source.update(fallback_records_by_source)
 
         if records_by_source:
             records = self._collect_records(source_ids, records_by_source)
@@ -287,7 +292,7 @@ class OfficialCaseLawClient:
         source_url: str,
     ) -> list[CourtDecisionRecord]:
         with httpx.Client(
-            timeout=self.timeout_seconds,
+            timeout=remaining_timeout(self.timeout_seconds),
             follow_redirects=True,
         ) as client:
             response = client.get(source_url)
@@ -302,8 +307,11 @@ class OfficialCaseLawClient:
         errors: list[str] = []
         max_workers = min(len(resolved_sources), 3)
         with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # Copied per task so feed fetches honour the caller's request deadline;
+            # background refreshes run without one.
             futures = {
                 pool.submit(
+                    copy_context().run,
                     self._fetch_and_parse_source_payload,
                     source_id=source_id,
                     source_url=source_url,
@@ -334,6 +342,9 @@ class OfficialCaseLawClient:
             if source_id not in _SEARCH_CONFIG_BY_SOURCE:
                 fallback_sources.append((source_id, source_url))
                 continue
+            if deadline_expired():
+                errors.append(f"{source_id}: request deadline exceeded")
+                continue
             try:
                 records_by_source[source_id] = self._fetch_source_records_via_query_search(
                     source_id=source_id,
@@ -365,7 +376,7 @@ class OfficialCaseLawClient:
             params["d2"] = request.decision_date_to.isoformat()
 
         with httpx.Client(
-            timeout=self.timeout_seconds,
+            timeout=remaining_timeout(self.timeout_seconds),
             follow_redirects=True,
         ) as client:
             response = client.get(endpoint_url, params=params)
@@ -1,21 +1,74 @@
 from __future__ import annotations
 
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, deque
+import math
 from threading import Lock
+from typing import Callable
+
+_PROMPT_TOKEN_WINDOW = 500
 
 
 class ProviderMetrics:
     def __init__(self) -> None:
         self._lock = Lock()
         self._counters: dict[str, Counter[str]] = defaultdict(Counter)
+        self._prompt_tokens: dict[str, deque[int]] = defaultdict(
+            lambda: deque(maxlen=_PROMPT_TOKEN_WINDOW)
+        )
+        self._model_health: dict[str, Callable[[], dict[str, dict[str, object]]]] = {}
 
     def increment(self, *, provider: str, event: str) -> None:
         with self._lock:
             self._counters[provider][event] += 1
 
+    def record_prompt_tokens(self, *, provider: str, tokens: int) -> None:
+        with self._lock:
+            self._counters[provider]["prompt_tokens_total"] += tokens
+            self._prompt_tokens[provider].append(tokens)
+
+    def record_cached_prompt_tokens(self, *, provider: str, tokens: int) -> None:
+        """Record how many prompt tokens the provider served from its prompt cache."""
+        with self._lock:
+            counter = self._counters[provider]
+            counter["prompt_cache_reports"] += 1
+            counter["cached_prompt_tokens_total"] += tokens
+            if tokens > 0:
+                counter["prompt_cache_hits"] += 1
+
+    def track_model_health(
+        self,
+        *,
+        provider: str,
+        snapshot: Callable[[], dict[str, dict[str, object]]],
+    ) -> None:
+        """Report ``snapshot()`` as the per-model health state of ``provider``."""
+        with self._lock:
+            self._model_health[provider] = snapshot
+
     def snapshot(self) -> dict[str, dict[str, int]]:
         with self._lock:
             return {
                 provider: dict(counter)
                 for provider, counter in self._counters.items()
             }
+
+    def prompt_token_snapshot(self) -> dict[str, dict[str, int]]:
+        """Prompt size distribution per provider over the most recent requests."""
+        with self._lock:
+            snapshot: dict[str, dict[str, int]] = {}
+            for provider, samples in self._prompt_tokens.items():
+                ordered = sorted(samples)
+                snapshot[provider] = {
+                    "requests": len(ordered),
+                    "last": samples[-1],
+                    "p50": ordered[math.ceil(len(ordered) * 0.50) - 1],
+                    "p95": ordered[math.ceil(len(ordered) * 0.95) - 1],
+                    "max": ordered[-1],
+                }
+            return snapshot
+
+    def model_health_snapshot(self) -> dict[str, dict[str, dict[str, object]]]:
+        """Per-model health state for providers that fall back across models."""
+        with self._lock:
+            sources = dict(self._model_health)
+        return {provider: snapshot() for provider, snapshot in sources.items()}
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = REPO_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+_MESSAGE = "My study permit expires soon; how do I extend my status as a student?"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measure per-request allocation of grounding and citation verification, "
+            "sharing frozen catalog citations versus deep-copying them"
+        )
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=500,
+        help="Requests simulated per scenario.",
+    )
+    parser.add_argument(
+        "--catalog-size",
+        type=int,
+        default=1000,
+        help="Citations in the synthetic static catalog.",
+    )
+    return parser.parse_args()
+
+
+def _static_catalog(size: int):  # noqa: ANN202
+    from immcad_api.services.grounding import official_grounding_catalog
+
+    base = [citation for citation, _ in official_grounding_catalog()]
+    return [
+        base[index % len(base)].model_copy(
+            update={"pin": f"{base[index % len(base)].pin} ({index})"}
+        )
+        for index in range(size)
+    ]
+
+
+def _measure(run_request: Callable[[], object], iterations: int) -> dict[str, object]:
+    run_request()
+    peak_bytes = 0
+    tracemalloc.start()
+    for _ in range(iterations):
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = run_request()
+        _, peak = tracemalloc.get_traced_memory()
+        peak_bytes += peak - baseline
+        del result
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        run_request()
+    elapsed = time.perf_counter() - started
+    return {
+        "iterations": iterations,
+        "per_request_us": round(elapsed / iterations * 1_000_000, 2),
+        "per_request_peak_kib": round(peak_bytes / iterations / 1024, 2),
+    }
+
+
+def main() -> int:
+    from immcad_api.policy.compliance import (
+        DEFAULT_TRUSTED_CITATION_DOMAINS,
+        verify_grounded_citations,
+    )
+    from immcad_api.services.grounding import (
+        KeywordGroundingAdapter,
+        StaticGroundingAdapter,
+        official_grounding_catalog,
+    )
+
+    args = parse_args()
+    if args.iterations < 1:
+        raise SystemExit("--iterations must be >= 1")
+    if args.catalog_size < 1:
+        raise SystemExit("--catalog-size must be >= 1")
+
+    adapters = {
+        "static": StaticGroundingAdapter(_static_catalog(args.catalog_size)),
+        "keyword": KeywordGroundingAdapter(official_grounding_catalog()),
+    }
+
+    def request(adapter, *, deep_copy: bool) -> Callable[[], object]:  # noqa: ANN001
+        def copied(citations: list) -> list:  # noqa: ANN001
+            if not deep_copy:
+                return citations
+            return [citation.model_copy(deep=True) for citation in citations]
+
+        def run() -> object:
+            # The previous implementation deep-copied the candidates in the adapter
+            # and again in verification; the baseline reproduces those copies.
+            candidates = copied(
+                adapter.citation_candidates(message=_MESSAGE, locale="en-CA", mode="standard")
+            )
+            verified = verify_grounded_citations(
+                candidates,
+                grounded_citations=copied(candidates),
+                trusted_domains=DEFAULT_TRUSTED_CITATION_DOMAINS,
+            )
+            return copied(verified)
+
+        return run
+
+    results: dict[str, dict[str, object]] = {}
+    for name, adapter in adapters.items():
+        for variant, deep_copy in (("shared", False), ("deep_copy_baseline", True)):
+            results[f"{name}_{variant}"] = _measure(
+                request(adapter, deep_copy=deep_copy), args.iterations
+            )
+    results["catalog"] = {
+        "static_citations": args.catalog_size,
+        "keyword_citations": len(official_grounding_catalog()),
+    }
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
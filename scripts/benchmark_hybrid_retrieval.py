@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+from typing import Callable
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = REPO_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+_TOPIC_WORDS = (
+    "permit study work spouse partner sponsor child family permanent resident card "
+    "travel document visa officer foreign national refugee claim protection appeal "
+    "removal order inadmissibility misrepresentation citizenship residence"
+).split()
+_QUERIES = (
+    "can my spouse work while I study",
+    "how do I sponsor my dependent child",
+    "my permanent resident card expired while travelling",
+    "what happens after a removal order is issued",
+    "is misrepresentation on an application a ground of inadmissibility",
+)
+DEFAULT_BUDGET_MS = 25.0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measure per-query latency of lexical, dense and hybrid section retrieval "
+            "on a synthetic federal-law corpus"
+        )
+    )
+    parser.add_argument("--sections", type=int, default=20000, help="Synthetic sections.")
+    parser.add_argument("--iterations", type=int, default=20, help="Passes over the queries.")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help="Fail (exit 1) when hybrid p95 latency exceeds this budget.",
+    )
+    return parser.parse_args()
+
+
+def _synthetic_sections(count: int) -> list[dict[str, object]]:
+    rng = random.Random(7)
+    filler = [f"term{index}" for index in range(count)]
+    return [
+        {
+            "source_id": "IRPA",
+            "act_title": "Immigration and Refugee Protection Act",
+            "section_label": str(index),
+            "section_title": " ".join(rng.sample(_TOPIC_WORDS, 2)).capitalize(),
+            "section_url": (
+                f"https://laws-lois.justice.gc.ca/eng/acts/I-2.5/section-{index}.html"
+            ),
+            "text": " ".join(rng.choices(filler, k=60) + rng.choices(_TOPIC_WORDS, k=12)),
+        }
+        for index in range(count)
+    ]
+
+
+def _latencies_ms(run_query: Callable[[str], object], iterations: int) -> list[float]:
+    run_query(_QUERIES[0])
+    latencies: list[float] = []
+    for _ in range(iterations):
+        for query in _QUERIES:
+            started = time.perf_counter()
+            run_query(query)
+            latencies.append((time.perf_counter() - started) * 1000)
+    return sorted(latencies)
+
+
+def _summary(latencies: list[float]) -> dict[str, float]:
+    return {
+        "p50_ms": round(latencies[len(latencies) // 2], 3),
+        "p95_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 3),
+        "max_ms": round(latencies[-1], 3),
+    }
+
+
+def main() -> int:
+    from immcad_api.services.embeddings import HashingEmbedder
+    from immcad_api.services.grounding import HybridGroundingAdapter
+    from immcad_api.services.section_index import (
+        SectionIndex,
+        section_index_terms,
+        write_section_index,
+    )
+    from immcad_api.services.section_vectors import SectionVectorIndex, write_section_vectors
+
+    args = parse_args()
+    if args.sections < 1 or args.iterations < 1:
+        raise SystemExit("--sections and --iterations must be >= 1")
+
+    sections = _synthetic_sections(args.sections)
+    embedder = HashingEmbedder()
+    with tempfile.TemporaryDirectory() as workdir:
+        index_path = Path(workdir) / "sections.idx"
+        vectors_path = Path(workdir) / "sections.vec"
+        write_section_index(index_path, sections)
+        write_section_vectors(vectors_path, sections, embedder=embedder)
+
+        started = time.perf_counter()
+        index = SectionIndex(index_path)
+        vectors = SectionVectorIndex(vectors_path)
+        load_ms = (time.perf_counter() - started) * 1000
+        adapter = HybridGroundingAdapter(index, vectors, embedder)
+        try:
+            results = {
+                "lexical": _summary(
+                    _latencies_ms(
+                        lambda query: index.search(section_index_terms(query), top_k=20),
+                        args.iterations,
+                    )
+                ),
+                "dense": _summary(
+                    _latencies_ms(
+                        lambda query: vectors.search(
+                            embedder.embed([query])[0], top_k=20, min_similarity=0.2
+                        ),
+                        args.iterations,
+                    )
+                ),
+                "hybrid": _summary(
+                    _latencies_ms(
+                        lambda query: adapter.citation_candidates(
+                            message=query, locale="en-CA", mode="standard"
+                        ),
+                        args.iterations,
+                    )
+                ),
+            }
+            results["corpus"] = {
+                "sections": args.sections,
+                "dimensions": embedder.dimensions,
+                "index_bytes": index_path.stat().st_size,
+                "vector_bytes": vectors_path.stat().st_size,
+                "load_ms": round(load_ms, 3),
+                "budget_ms": args.budget_ms,
+            }
+        finally:
+            vectors.close()
+            index.close()
+
+    print(json.dumps(results, indent=2))
+    if results["hybrid"]["p95_ms"] > args.budget_ms:
+        print(
+            f"ERROR: hybrid p95 {results['hybrid']['p95_ms']}ms exceeds "
+            f"{args.budget_ms}ms budget",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
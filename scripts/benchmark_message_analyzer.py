@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+import time
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = REPO_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+MAX_MESSAGE_CHARS = 8000
+_FILLER = (
+    "My spouse and I applied for permanent residence through express entry last year "
+    "and we are unsure which documents the officer still needs from us. "
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure per-message cost of the compiled chat message analyzer"
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=2000,
+        help="Messages analyzed per scenario.",
+    )
+    parser.add_argument(
+        "--message-chars",
+        type=int,
+        default=MAX_MESSAGE_CHARS,
+        help="Message length in characters (ChatRequest.message allows up to 8000).",
+    )
+    return parser.parse_args()
+
+
+def _pad(suffix: str, length: int) -> str:
+    body_length = max(0, length - len(suffix) - 1)
+    body = (_FILLER * (body_length // len(_FILLER) + 1))[:body_length]
+    return f"{body} {suffix}"[:length]
+
+
+def _scenarios(length: int) -> dict[str, str]:
+    return {
+        "informational": _pad("What does the Federal Court say about this?", length),
+        "policy_refusal": _pad("Can you guarantee I will be approved?", length),
+        "greeting": "Hello there!",
+    }
+
+
+def main() -> int:
+    from immcad_api.policy.message_analysis import MessageAnalyzer
+
+    args = parse_args()
+    if args.iterations < 1:
+        raise SystemExit("--iterations must be >= 1")
+    # Disable memoization so every iteration pays the full analysis cost.
+    analyzer = MessageAnalyzer(cache_size=0)
+    results: dict[str, dict[str, object]] = {}
+    for name, message in _scenarios(args.message_chars).items():
+        # Distinct string objects per iteration so nothing is shared between runs.
+        messages = [f"{message}{' ' * (index % 2)}" for index in range(args.iterations)]
+        started = time.perf_counter()
+        for candidate in messages:
+            analysis = analyzer.analyze(candidate)
+        elapsed = time.perf_counter() - started
+        results[name] = {
+            "message_chars": len(message),
+            "iterations": args.iterations,
+            "per_message_us": round(elapsed / args.iterations * 1_000_000, 2),
+            "refusal_category": analysis.refusal_category,
+            "is_greeting": analysis.is_greeting,
+            "case_law_intent": analysis.case_law_intent,
+        }
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
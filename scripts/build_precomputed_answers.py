@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+import sys
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = REPO_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Precompute chat answers for high-frequency questions"
+    )
+    parser.add_argument(
+        "--questions",
+        required=True,
+        help=(
+            "Question list: a text file with one question per line, or a JSON array "
+            "of strings (for example a list exported from chat logs)."
+        ),
+    )
+    parser.add_argument(
+        "--output",
+        default="artifacts/chat/precomputed-answers.json",
+        help="Store path; point CHAT_PRECOMPUTED_ANSWERS_PATH at it to serve it.",
+    )
+    parser.add_argument("--locale", choices=["en-CA", "fr-CA"], default="en-CA")
+    parser.add_argument("--mode", choices=["standard", "research"], default="standard")
+    return parser.parse_args()
+
+
+def load_questions(path: Path) -> list[str]:
+    raw = path.read_text(encoding="utf-8")
+    if path.suffix.lower() == ".json":
+        questions = json.loads(raw)
+        if not isinstance(questions, list):
+            raise ValueError("JSON question list must be an array of strings")
+        return [str(question) for question in questions]
+    return [line for line in raw.splitlines() if line.strip() and not line.startswith("#")]
+
+
+def main() -> int:
+    args = parse_args()
+    # Answer every question through the live pipeline, not an older store.
+    os.environ["CHAT_PRECOMPUTED_ANSWERS_PATH"] = ""
+
+    from immcad_api.main import create_app
+    from immcad_api.services.precomputed_answers import (
+        build_precomputed_answers,
+        write_precomputed_answers,
+    )
+
+    try:
+        questions = load_questions(Path(args.questions))
+    except (OSError, ValueError) as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 2
+
+    app = create_app()
+    build = build_precomputed_answers(
+        app.state.chat_service,
+        questions,
+        catalog_version=app.state.source_catalog_version_provider(),
+        locale=args.locale,
+        mode=args.mode,
+    )
+    write_precomputed_answers(args.output, build.answers)
+
+    print(
+        "Precomputed answer store generated "
+        f"(questions={len(questions)}, stored={len(build.answers)}, "
+        f"rejected={len(build.rejected)})"
+    )
+    for question, reason in build.rejected:
+        print(f"  rejected [{reason}]: {question}")
+    print(f"Store path: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = REPO_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Build the BM25 grounding index, and optionally the section vectors, "
+            "over materialized federal-law sections"
+        )
+    )
+    parser.add_argument(
+        "--sections",
+        default="artifacts/ingestion/federal-laws-sections.jsonl",
+        help="Section chunk JSONL written by run_cloudflare_ingestion_hourly.py.",
+    )
+    parser.add_argument(
+        "--output",
+        default="artifacts/grounding/federal-laws-sections.idx",
+        help="Index path; point GROUNDING_SECTION_INDEX_PATH at it to serve it.",
+    )
+    parser.add_argument(
+        "--vectors-output",
+        default="",
+        help=(
+            "Quantized section embedding path for hybrid retrieval; point "
+            "GROUNDING_SECTION_VECTORS_PATH at it to serve it. Skipped when empty."
+        ),
+    )
+    parser.add_argument(
+        "--embedder",
+        default="hashing",
+        help="'hashing' or 'sentence-transformers:<model>'; must match GROUNDING_EMBEDDER.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    from immcad_api.services.embeddings import build_text_embedder
+    from immcad_api.services.section_index import read_section_records, write_section_index
+    from immcad_api.services.section_vectors import write_section_vectors
+
+    args = parse_args()
+    sections_path = Path(args.sections)
+    if not sections_path.exists():
+        print(f"ERROR: section chunks not found: {sections_path}", file=sys.stderr)
+        return 2
+
+    build = write_section_index(args.output, read_section_records(sections_path))
+    print(
+        "Section index generated "
+        f"(sections={build.sections_indexed}, skipped={build.sections_skipped}, "
+        f"terms={build.terms})"
+    )
+    print(f"Index path: {args.output}")
+    if args.vectors_output:
+        vectors = write_section_vectors(
+            args.vectors_output,
+            read_section_records(sections_path),
+            embedder=build_text_embedder(args.embedder),
+        )
+        print(
+            "Section vectors generated "
+            f"(sections={vectors.sections_embedded}, dimensions={vectors.dimensions}, "
+            f"embedder={vectors.embedder})"
+        )
+        print(f"Vectors path: {args.vectors_output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,55 +1,272 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
+from typing import AsyncIterator
+
 from fastapi.concurrency import run_in_threadpool
 from fastapi import APIRouter, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from immcad_api.api.routes._threadpool import (
     is_threadpool_unavailable_runtime_error,
 )
+from immcad_api.deadline import Deadline
+from immcad_api.errors import ApiError
 from immcad_api.policy.compliance import SAFE_CONSTRAINED_RESPONSE
-from immcad_api.schemas import ChatRequest, ChatResponse
+from immcad_api.schemas import (
+    ChatBatchItemResult,
+    ChatBatchRequest,
+    ChatBatchResponse,
+    ChatRequest,
+    ChatResponse,
+    ErrorBody,
+    ErrorEnvelope,
+)
 from immcad_api.services import ChatService
 from immcad_api.services.chat_service import is_friendly_greeting_answer
 from immcad_api.telemetry import RequestMetrics
 
 
+LOGGER = logging.getLogger(__name__)
+# Optional client budget for the whole request, in milliseconds. It can only
+# shorten the server's configured deadline.
+REQUEST_TIMEOUT_HEADER = "x-request-timeout-ms"
+
+
+def _format_sse_event(event: str, data: dict[str, object]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
 def build_chat_router(
     chat_service: ChatService,
     *,
     request_metrics: RequestMetrics | None = None,
+    rate_limiter=None,  # noqa: ANN001
+    batch_max_items: int = 25,
+    batch_max_concurrency: int = 4,
+    request_deadline_seconds: float = 25.0,
 ) -> APIRouter:
     router = APIRouter(prefix="/api", tags=["chat"])
 
+    def request_deadline(request: Request) -> Deadline | None:
+        """Deadline for this request, or ``None`` when the timeout header is invalid."""
+        raw_timeout = request.headers.get(REQUEST_TIMEOUT_HEADER)
+        if raw_timeout is None:
+            return Deadline.after(request_deadline_seconds)
+        try:
+            timeout_ms = int(raw_timeout.strip())
+        except ValueError:
+            return None
+        if timeout_ms < 1:
+            return None
+        return Deadline.after(min(timeout_ms / 1000.0, request_deadline_seconds))
+
+    def invalid_timeout_response(trace_id: str) -> JSONResponse:
+        return error_response(
+            status_code=422,
+            trace_id=trace_id,
+            code="VALIDATION_ERROR",
+            message=f"{REQUEST_TIMEOUT_HEADER} must be a positive integer",
+        )
+
+    def error_response(
+        *, status_code: int, trace_id: str, code: str, message: str
+    ) -> JSONResponse:
+        error = ErrorEnvelope(
+            error={"code": code, "message": message, "trace_id": trace_id}
+        )
+        return JSONResponse(
+            status_code=status_code,
+            content=error.model_dump(mode="json"),
+            headers={"x-trace-id": trace_id},
+        )
+
+    def record_chat_outcome(chat_response: ChatResponse) -> None:
+        if not request_metrics:
+            return
+        constrained_used = chat_response.answer == SAFE_CONSTRAINED_RESPONSE
+        friendly_used = is_friendly_greeting_answer(chat_response.answer)
+        request_metrics.record_chat_outcome(
+            fallback_used=chat_response.fallback_used.used,
+            refusal_used=chat_response.fallback_used.reason == "policy_block",
+            friendly_used=friendly_used,
+            constrained_used=constrained_used,
+        )
+
     @router.post("/chat", response_model=ChatResponse)
     async def chat(
         payload: ChatRequest, request: Request, response: Response
-    ) -> ChatResponse:
+    ) -> ChatResponse | JSONResponse:
         trace_id = getattr(request.state, "trace_id", "")
         response.headers["x-trace-id"] = trace_id
-        try:
-            chat_response = await run_in_threadpool(
-                chat_service.handle_chat,
-                payload,
+        deadline = request_deadline(request)
+        if deadline is None:
+            return invalid_timeout_response(trace_id)
+        # Provider calls are awaited natively and retrieval stages run on the
+        # fanout executor, so no threadpool slot is held for the whole turn.
+        chat_response = await chat_service.handle_chat_async(
+            payload,
+            trace_id=trace_id,
+            deadline=deadline,
+            client_id=getattr(request.state, "client_id", None),
+        )
+        record_chat_outcome(chat_response)
+        return chat_response
+
+    @router.post("/chat/batch", response_model=ChatBatchResponse)
+    async def chat_batch(
+        payload: ChatBatchRequest, request: Request, response: Response
+    ) -> ChatBatchResponse | JSONResponse:
+        """Answer many chat items in one request.
+
+        The API middleware charges one unit like any request; the remaining
+        ``len(items) - 1`` are charged here once the batch has been validated.
+        Results keep the order of ``items``.
+        """
+        trace_id = getattr(request.state, "trace_id", "")
+        response.headers["x-trace-id"] = trace_id
+        deadline = request_deadline(request)
+        if deadline is None:
+            return invalid_timeout_response(trace_id)
+        if len(payload.items) > batch_max_items:
+            return error_response(
+                status_code=422,
                 trace_id=trace_id,
+                code="VALIDATION_ERROR",
+                message=f"Chat batch exceeds the maximum of {batch_max_items} items",
             )
-        except RuntimeError as exc:
-            if not is_threadpool_unavailable_runtime_error(exc):
-                raise
-            # Python Workers can run in threadless runtimes where threadpool execution
-            # is unavailable; fallback to direct invocation for compatibility.
-            chat_response = chat_service.handle_chat(
-                payload,
+        client_id = getattr(request.state, "client_id", None)
+        extra_items = len(payload.items) - 1
+        if (
+            rate_limiter is not None
+            and client_id
+            and extra_items > 0
+            and not rate_limiter.allow(client_id, weight=extra_items)
+        ):
+            return error_response(
+                status_code=429,
                 trace_id=trace_id,
+                code="RATE_LIMITED",
+                message="Request rate exceeded allowed threshold",
             )
-        if request_metrics:
-            constrained_used = chat_response.answer == SAFE_CONSTRAINED_RESPONSE
-            friendly_used = is_friendly_greeting_answer(chat_response.answer)
-            request_metrics.record_chat_outcome(
-                fallback_used=chat_response.fallback_used.used,
-                refusal_used=chat_response.fallback_used.reason == "policy_block",
-                friendly_used=friendly_used,
-                constrained_used=constrained_used,
+
+        outcomes = await chat_service.handle_chat_batch_async(
+            payload.items,
+            trace_id=trace_id,
+            max_concurrency=batch_max_concurrency,
+            deadline=deadline,
+            client_id=client_id,
+        )
+        results: list[ChatBatchItemResult] = []
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, ApiError):
+                results.append(
+                    ChatBatchItemResult(
+                        index=index,
+                        error=ErrorBody(
+                            code=outcome.code,
+                            message=outcome.message,
+                            trace_id=f"{trace_id}:{index}",
+                        ),
+                    )
+                )
+                continue
+            record_chat_outcome(outcome)
+            results.append(ChatBatchItemResult(index=index, response=outcome))
+        failed = sum(1 for result in results if result.error is not None)
+        return ChatBatchResponse(
+            results=results,
+            succeeded=len(results) - failed,
+            failed=failed,
+        )
+
+    @router.post("/chat/stream")
+    async def chat_stream(payload: ChatRequest, request: Request) -> Response:
+        """Stream a chat answer as server-sent events.
+
+        ``delta`` events carry provisional answer text as the provider produces it.
+        A single ``final`` event carries the full ``ChatResponse`` (after citation
+        enforcement) plus ``trace_id``; clients must render its ``answer`` in place
+        of the accumulated deltas. Failures end the stream with an ``error`` event
+        holding the standard error envelope.
+        """
+        trace_id = getattr(request.state, "trace_id", "")
+        deadline = request_deadline(request)
+        if deadline is None:
+            return invalid_timeout_response(trace_id)
+        client_id = getattr(request.state, "client_id", None)
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue[str | None] = asyncio.Queue()
+
+        def emit(event: str | None) -> None:
+            loop.call_soon_threadsafe(events.put_nowait, event)
+
+        def on_answer_delta(text: str) -> None:
+            emit(_format_sse_event("delta", {"text": text}))
+
+        def emit_error(code: str, message: str) -> None:
+            envelope = ErrorEnvelope(
+                error={"code": code, "message": message, "trace_id": trace_id}
             )
-        return chat_response
+            emit(_format_sse_event("error", envelope.model_dump()))
+
+        async def produce() -> None:
+            try:
+                try:
+                    chat_response = await run_in_threadpool(
+                        chat_service.handle_chat,
+                        payload,
+                        trace_id=trace_id,
+                        on_answer_delta=on_answer_delta,
+                        deadline=deadline,
+                        client_id=client_id,
+                    )
+                except RuntimeError as exc:
+                    if not is_threadpool_unavailable_runtime_error(exc):
+                        raise
+                    # Threadless runtimes still stream, but deltas are flushed
+                    # together once the provider call has completed.
+                    chat_response = chat_service.handle_chat(
+                        payload,
+                        trace_id=trace_id,
+                        on_answer_delta=on_answer_delta,
+                        deadline=deadline,
+                        client_id=client_id,
+                    )
+                record_chat_outcome(chat_response)
+                emit(
+                    _format_sse_event(
+                        "final",
+                        {**chat_response.model_dump(mode="json"), "trace_id": trace_id},
+                    )
+                )
+            except ApiError as exc:
+                emit_error(exc.code, exc.message)
+            except Exception:
+                LOGGER.exception("Unhandled chat stream exception")
+                emit_error("PROVIDER_ERROR", "Unexpected server error")
+            finally:
+                emit(None)
+
+        async def event_stream() -> AsyncIterator[str]:
+            producer = asyncio.create_task(produce())
+            try:
+                while (event := await events.get()) is not None:
+                    yield event
+            finally:
+                if not producer.done():
+                    producer.cancel()
+
+        return StreamingResponse(
+            event_stream(),
+            media_type="text/event-stream",
+            headers={
+                "x-trace-id": trace_id,
+                "cache-control": "no-cache",
+                "x-accel-buffering": "no",
+            },
+        )
 
     return router
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+from typing import Callable, ParamSpec, TypeVar
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+
+async def run_blocking(
+    func: Callable[_P, _T], /, *args: _P.args, **kwargs: _P.kwargs
+) -> _T:
+    """Run synchronous ``func`` on the loop's default executor and await its result.
+
+    The current context (request deadline, conversation history) follows the call
+    into the worker thread. Runtimes that cannot start threads, such as Cloudflare
+    Python Workers, reject the submission; ``func`` then runs inline instead.
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    try:
+        future = loop.run_in_executor(None, call)
+    except RuntimeError:
+        return func(*args, **kwargs)
+    return await future
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator
+
+
+@dataclass(frozen=True)
+class ConversationTurn:
+    question: str
+    answer: str
+
+
+@dataclass(frozen=True)
+class ConversationHistory:
+    """Earlier turns of one chat session: a rolling summary plus the latest turns verbatim."""
+
+    summary: str = ""
+    turns: tuple[ConversationTurn, ...] = ()
+
+    def is_empty(self) -> bool:
+        return not self.summary and not self.turns
+
+
+_CURRENT_CONVERSATION: ContextVar[ConversationHistory | None] = ContextVar(
+    "immcad_conversation_history", default=None
+)
+
+
+def current_conversation() -> ConversationHistory | None:
+    return _CURRENT_CONVERSATION.get()
+
+
+@contextmanager
+def conversation_scope(history: ConversationHistory | None) -> Iterator[None]:
+    """Make ``history`` the conversation the prompt builder renders for this request.
+
+    Like the request deadline, the history follows the context into asyncio tasks
+    and into threads started with ``contextvars.copy_context().run``. Empty
+    histories are stored as ``None`` so callers can test for "no history" directly.
+    """
+    token = _CURRENT_CONVERSATION.set(
+        history if history is not None and not history.is_empty() else None
+    )
+    try:
+        yield
+    finally:
+        _CURRENT_CONVERSATION.reset(token)
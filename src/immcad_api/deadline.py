@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+import time
+from typing import Callable, Iterator
+
+
+class Deadline:
+    """Absolute point in time by which a request must be answered.
+
+    Deadlines use a monotonic clock, so they are only meaningful within one process.
+    """
+
+    def __init__(
+        self, expires_at: float, *, time_fn: Callable[[], float] | None = None
+    ) -> None:
+        self.expires_at = expires_at
+        self._time_fn = time_fn or time.monotonic
+
+    @classmethod
+    def after(
+        cls, seconds: float, *, time_fn: Callable[[], float] | None = None
+    ) -> Deadline:
+        if seconds <= 0:
+            raise ValueError("seconds must be > 0")
+        clock = time_fn or time.monotonic
+        return cls(clock() + seconds, time_fn=clock)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - self._time_fn())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def allows(self, seconds: float) -> bool:
+        """Whether at least ``seconds`` are left before the deadline."""
+        return self.remaining() >= seconds
+
+    def clamp(self, timeout_seconds: float) -> float:
+        return min(timeout_seconds, self.remaining())
+
+
+_CURRENT_DEADLINE: ContextVar[Deadline | None] = ContextVar(
+    "immcad_request_deadline", default=None
+)
+
+
+def current_deadline() -> Deadline | None:
+    return _CURRENT_DEADLINE.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Deadline | None) -> Iterator[None]:
+    """Make ``deadline`` the current deadline; ``None`` keeps the enclosing one.
+
+    The deadline follows the context into asyncio tasks. Code that hands work to
+    other threads must copy the context (``contextvars.copy_context().run``).
+    """
+    if deadline is None:
+        yield
+        return
+    token = _CURRENT_DEADLINE.set(deadline)
+    try:
+        yield
+    finally:
+        _CURRENT_DEADLINE.reset(token)
+
+
+def remaining_timeout(timeout_seconds: float) -> float:
+    """Clamp a component timeout to what is left of the current deadline."""
+    deadline = current_deadline()
+    if deadline is None:
+        return timeout_seconds
+    return deadline.clamp(timeout_seconds)
+
+
+def deadline_allows(seconds: float) -> bool:
+    """Whether optional work needing ``seconds`` still fits the current deadline."""
+    deadline = current_deadline()
+    return deadline is None or deadline.allows(seconds)
+
+
+def deadline_expired() -> bool:
+    deadline = current_deadline()
+    return deadline is not None and deadline.expired()
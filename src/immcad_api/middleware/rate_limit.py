@@ -18,7 +18,8 @@ class InMemoryRateLimiter:
         self._events: dict[str, deque[float]] = defaultdict(deque)
         self._lock = Lock()
 
-    def allow(self, client_id: str) -> bool:
+    def allow(self, client_id: str, *, weight: int = 1) -> bool:
+        """Charge ``weight`` request units to ``client_id``; a rejected call charges nothing."""
         now = time.time()
         window_start = now - 60
 
@@ -27,10 +28,10 @@ class InMemoryRateLimiter:
             while bucket and bucket[0] < window_start:
                 bucket.popleft()
 
-            if len(bucket) >= self.limit_per_minute:
+            if len(bucket) + weight > self.limit_per_minute:
                 return False
 
-            bucket.append(now)
+            bucket.extend([now] * weight)
             return True
 
 
@@ -44,13 +45,18 @@ class RedisRateLimiter:
         self.limit_per_minute = max(limit_per_minute, 1)
         self.prefix = prefix
 
-    def allow(self, client_id: str) -> bool:
+    def allow(self, client_id: str, *, weight: int = 1) -> bool:
+        """Charge ``weight`` request units to ``client_id``; a rejected call charges nothing."""
         current_window = int(time.time() // 60)
         key = f"{self.prefix}:{client_id}:{current_window}"
-        value = self.redis_client.incr(key)
-        if value == 1:
+        value = self.redis_client.incr(key, weight)
+        if value == weight:
             self.redis_client.expire(key, 65)
-        return int(value) <= self.limit_per_minute
+        if int(value) <= self.limit_per_minute:
+            return True
+        # Give the units back so a rejected batch cannot exhaust the window.
+        self.redis_client.decr(key, weight)
+        return False
 
 
 def build_rate_limiter(*, limit_per_minute: int, redis_url: str | None):
@@ -11,6 +11,11 @@ from immcad_api.policy.document_requirements import (
     ReadinessResult,
     evaluate_readiness,
 )
+from immcad_api.policy.message_analysis import (
+    MessageAnalysis,
+    MessageAnalyzer,
+    analyze_message,
+)
 from immcad_api.policy.prompts import QA_PROMPT, SYSTEM_PROMPT
 from immcad_api.policy.source_policy import (
     SourcePolicy,
@@ -25,6 +30,8 @@ __all__ = [
     "DISCLAIMER_TEXT",
     "DEFAULT_TRUSTED_CITATION_DOMAINS",
     "FilingForum",
+    "MessageAnalysis",
+    "MessageAnalyzer",
     "POLICY_REFUSAL_TEXT",
     "QA_PROMPT",
     "ReadinessResult",
@@ -32,6 +39,7 @@ __all__ = [
     "evaluate_readiness",
     "SourcePolicy",
     "SourcePolicyEntry",
+    "analyze_message",
     "enforce_citation_requirement",
     "is_source_export_allowed",
     "is_source_ingest_allowed",
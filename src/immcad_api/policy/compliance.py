@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import re
 from urllib.parse import urlparse, urlunparse
 
+from immcad_api.policy.message_analysis import analyze_message
 from immcad_api.schemas import Citation
 
 DISCLAIMER_TEXT = (
@@ -122,7 +122,7 @@ def verify_grounded_citations(
     for grounded in grounded_citations:
         if not _is_well_formed_citation(grounded, trusted_domains=normalized_trusted_domains):
             continue
-        grounded_index[_citation_lookup_key(grounded)] = grounded.model_copy(deep=True)
+        grounded_index[_citation_lookup_key(grounded)] = grounded
 
     if not grounded_index:
         return []
@@ -139,31 +139,14 @@ def verify_grounded_citations(
         matched_grounded = grounded_index.get(key)
         if matched_grounded is None or key in seen:
             continue
-        verified.append(matched_grounded.model_copy(deep=True))
+        # Grounded citations are frozen; the verified list shares them.
+        verified.append(matched_grounded)
         seen.add(key)
     return verified
 
 
 def should_refuse_for_policy(message: str) -> bool:
-    normalized = re.sub(r"\s+", " ", message.lower()).strip()
-    blocked_patterns = [
-        r"\brepresent (?:me|my case)\b",
-        r"\bbe my (?:representative|lawyer|counsel)\b",
-        r"\bspeak for me\b",
-        r"\b(?:appear|argue)(?: [a-z]+){0,6} for me\b",
-        r"\b(?:handle|take over)(?: [a-z]+){0,6} my (?:case|appeal|hearing)\b",
-        r"\bfile my(?: [a-z]+)* application\b",
-        r"\b(?:submit|prepare)(?: [a-z]+){0,6} my (?:forms|documents|paperwork) for me\b",
-        r"\b(?:fill out|complete|draft)(?: [a-z]+){0,6} my (?:forms|application|paperwork)\b",
-        r"\b(?:file|submit|prepare)(?: [a-z]+){0,6} on my behalf\b",
-        r"\bact as my (?:lawyer|counsel)\b",
-        r"\b(?:personalized|personalised|tailored|custom)(?: [a-z]+){0,6} (?:strategy|plan|advice)\b",
-        r"\b(?:strategy|plan)(?: [a-z]+){0,6} for my (?:case|situation|application)\b",
-        r"\bguarantee(?: that i will get)?(?: [a-z]+){0,6} (?:visa|pr|permanent residence|citizenship|approval|success)\b",
-        r"\b(?:promise|assure)(?: [a-z]+){0,6} (?:visa|pr|permanent residence|citizenship|approval|success)\b",
-        r"\b(?:guarantee|promise|assure)(?: [a-z]+){0,8} (?:i(?:'ll| will) (?:be )?(?:approved|accepted)|approval)\b",
-    ]
-    return any(re.search(pattern, normalized) for pattern in blocked_patterns)
+    return analyze_message(message).should_refuse
 
 
 def enforce_citation_requirement(
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+import re
+
+# Each category is one alternation of the phrases that trigger a policy refusal.
+# They are compiled into a single pattern so a message is scanned once.
+_REFUSAL_PATTERNS: dict[str, tuple[str, ...]] = {
+    "representation": (
+        r"\brepresent (?:me|my case)\b",
+        r"\bbe my (?:representative|lawyer|counsel)\b",
+        r"\bspeak for me\b",
+        r"\b(?:appear|argue)(?: [a-z]+){0,6} for me\b",
+        r"\b(?:handle|take over)(?: [a-z]+){0,6} my (?:case|appeal|hearing)\b",
+        r"\bact as my (?:lawyer|counsel)\b",
+    ),
+    "filing_on_behalf": (
+        r"\bfile my(?: [a-z]+)* application\b",
+        r"\b(?:submit|prepare)(?: [a-z]+){0,6} my (?:forms|documents|paperwork) for me\b",
+        r"\b(?:fill out|complete|draft)(?: [a-z]+){0,6} my (?:forms|application|paperwork)\b",
+        r"\b(?:file|submit|prepare)(?: [a-z]+){0,6} on my behalf\b",
+    ),
+    "personalized_strategy": (
+        r"\b(?:personalized|personalised|tailored|custom)(?: [a-z]+){0,6} (?:strategy|plan|advice)\b",
+        r"\b(?:strategy|plan)(?: [a-z]+){0,6} for my (?:case|situation|application)\b",
+    ),
+    "outcome_guarantee": (
+        r"\bguarantee(?: that i will get)?(?: [a-z]+){0,6} (?:visa|pr|permanent residence|citizenship|approval|success)\b",
+        r"\b(?:promise|assure)(?: [a-z]+){0,6} (?:visa|pr|permanent residence|citizenship|approval|success)\b",
+        r"\b(?:guarantee|promise|assure)(?: [a-z]+){0,8} (?:i(?:'ll| will) (?:be )?(?:approved|accepted)|approval)\b",
+    ),
+}
+# Every refusal phrase starts with one of these words. Checking them in a lookahead
+# first lets the combined pattern reject most positions without trying each
+# alternative.
+_REFUSAL_LEAD_WORDS = (
+    "represent",
+    "be",
+    "speak",
+    "appear",
+    "argue",
+    "handle",
+    "take",
+    "act",
+    "file",
+    "submit",
+    "prepare",
+    "fill",
+    "complete",
+    "draft",
+    "personali",
+    "tailored",
+    "custom",
+    "strategy",
+    "plan",
+    "guarantee",
+    "promise",
+    "assure",
+)
+_CASE_LAW_INTENT_PATTERN = (
+    r"\b(case law|precedent|judg(?:e)?ment|decision|ruling|canlii|"
+    r"supreme court|federal court|court of appeal)\b"
+)
+_LEGAL_TOPIC_PATTERN = (
+    r"\b(irpa|irpr|lipr|immigration|citizenship|citoyennet|visa|permit|permis|"
+    r"application|demande|inadmissib|refugee|refugi|appeal|appel|hearing|audience|"
+    r"court|cour|case|dossier|ircc|express entry|judicial review|"
+    r"sponsorship|parrainage|permanent resident|resident permanent|pr card|"
+    r"lawyer|avocat|rcic)\b"
+)
+_GREETING_PHRASE_PATTERN = (
+    r"^(hi|hello|hey|hiya|greetings|good morning|good afternoon|good evening|"
+    r"bonjour|salut|bonsoir)\b"
+)
+_SMALL_TALK_PHRASES = frozenset(
+    {
+        "hi",
+        "hello",
+        "hey",
+        "hiya",
+        "greetings",
+        "good morning",
+        "good afternoon",
+        "good evening",
+        "bonjour",
+        "salut",
+        "bonsoir",
+        "how are you",
+        "how are you doing",
+        "comment ca va",
+        "ca va",
+        "thanks",
+        "thank you",
+        "merci",
+    }
+)
+_MAX_GREETING_WORDS = 6
+
+
+@dataclass(frozen=True)
+class MessageAnalysis:
+    """Signals derived from one chat message.
+
+    ``normalized`` is the lower-cased message with whitespace collapsed, and
+    ``tokens`` are its ASCII alphanumeric words.
+    """
+
+    normalized: str
+    tokens: frozenset[str]
+    refusal_category: str | None
+    is_greeting: bool
+    case_law_intent: bool
+
+    @property
+    def should_refuse(self) -> bool:
+        return self.refusal_category is not None
+
+
+class MessageAnalyzer:
+    """Compiled policy and intent checks shared by every consumer of a chat message.
+
+    Patterns are compiled once, the message is normalized once, and results are
+    memoized per message so the policy gate, greeting check, case-law routing and
+    keyword grounding of one request all reuse the same analysis.
+    """
+
+    def __init__(self, *, cache_size: int = 128) -> None:
+        categories = "|".join(
+            f"(?P<{category}>{'|'.join(patterns)})"
+            for category, patterns in _REFUSAL_PATTERNS.items()
+        )
+        self._refusal_pattern = re.compile(
+            rf"\b(?={'|'.join(_REFUSAL_LEAD_WORDS)})(?:{categories})"
+        )
+        self._case_law_pattern = re.compile(_CASE_LAW_INTENT_PATTERN)
+        self._legal_topic_pattern = re.compile(_LEGAL_TOPIC_PATTERN)
+        self._greeting_pattern = re.compile(_GREETING_PHRASE_PATTERN)
+        self._whitespace_pattern = re.compile(r"\s+")
+        self._token_pattern = re.compile(r"[a-z0-9]+")
+        self.analyze = lru_cache(maxsize=cache_size)(self._analyze)
+
+    def _analyze(self, message: str) -> MessageAnalysis:
+        normalized = self._whitespace_pattern.sub(" ", message.lower()).strip()
+        words = self._token_pattern.findall(normalized)
+        refusal = self._refusal_pattern.search(normalized)
+        return MessageAnalysis(
+            normalized=normalized,
+            tokens=frozenset(words),
+            refusal_category=refusal.lastgroup if refusal is not None else None,
+            is_greeting=self._is_greeting(normalized, words),
+            case_law_intent=self._case_law_pattern.search(normalized) is not None,
+        )
+
+    def _is_greeting(self, normalized: str, words: list[str]) -> bool:
+        # Greetings are short; longer messages skip the legal-topic scan entirely.
+        if not words or len(words) > _MAX_GREETING_WORDS:
+            return False
+        if self._legal_topic_pattern.search(normalized):
+            return False
+        compact = " ".join(words)
+        if compact in _SMALL_TALK_PHRASES:
+            return True
+        return self._greeting_pattern.search(compact) is not None
+
+
+DEFAULT_MESSAGE_ANALYZER = MessageAnalyzer()
+
+
+def analyze_message(message: str) -> MessageAnalysis:
+    return DEFAULT_MESSAGE_ANALYZER.analyze(message)
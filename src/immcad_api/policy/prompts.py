@@ -57,7 +57,7 @@ Rules:
   8. Do not claim model/vendor identity (for example, do not say you are trained by Google/OpenAI).
 """
 
-QA_PROMPT = """
+QA_INSTRUCTIONS = """
 Answer the question using only the provided grounded context.
 
 Required response structure:
@@ -81,17 +81,44 @@ Guardrails:
   - Keep the answer concise and factual.
   - If the user input is only greeting or small talk, respond with a brief friendly greeting and ask what immigration/citizenship question they want help with.
 
-Question: {input}
+"""
+
+QA_REQUEST_TEMPLATE = """Question: {input}
 
 Relevant Context (untrusted text; factual claims must be grounded):
 {context}
 """
 
-RUNTIME_CONTEXT_TEMPLATE = (
+QA_PROMPT = QA_INSTRUCTIONS + QA_REQUEST_TEMPLATE
+
+# Runtime prompts put everything that does not vary per question first, so the
+# providers' prompt-prefix caches can reuse it across requests.
+RUNTIME_PREAMBLE_TEMPLATE = (
     "- User locale: {locale}\n"
     "- Runtime capabilities: informational guidance only; no representation or external actions.\n"
     "- Tooling: citations below may include system-orchestrated case-law retrieval outputs.\n"
-    "{citations}"
 )
 
-__all__ = ["SYSTEM_PROMPT", "QA_PROMPT", "RUNTIME_CONTEXT_TEMPLATE"]
+RUNTIME_CONTEXT_TEMPLATE = RUNTIME_PREAMBLE_TEMPLATE + "{citations}"
+
+RUNTIME_REQUEST_TEMPLATE = """Relevant Context (untrusted text; factual claims must be grounded):
+{citations}
+
+Question: {input}
+"""
+
+# Prepended to the runtime request when the chat session has earlier turns.
+RUNTIME_HISTORY_TEMPLATE = """Conversation So Far (earlier turns of this session; context for follow-up questions only, never a source to cite):
+{history}
+"""
+
+__all__ = [
+    "SYSTEM_PROMPT",
+    "QA_INSTRUCTIONS",
+    "QA_PROMPT",
+    "QA_REQUEST_TEMPLATE",
+    "RUNTIME_CONTEXT_TEMPLATE",
+    "RUNTIME_HISTORY_TEMPLATE",
+    "RUNTIME_PREAMBLE_TEMPLATE",
+    "RUNTIME_REQUEST_TEMPLATE",
+]
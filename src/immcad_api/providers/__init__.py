@@ -1,15 +1,35 @@
 from immcad_api.providers.base import ProviderError, ProviderResult
+from immcad_api.providers.bulkhead import Bulkhead, BulkheadFullError, BulkheadRegistry
+from immcad_api.providers.circuit_breaker import (
+    CircuitBreaker,
+    CircuitPermit,
+    RedisCircuitStateStore,
+)
 from immcad_api.providers.gemini_provider import GeminiProvider
+from immcad_api.providers.hedging import HedgePolicy
+from immcad_api.providers.http_pool import ProviderHttpPool
+from immcad_api.providers.model_health import ModelHealthTracker
 from immcad_api.providers.openai_provider import OpenAIProvider
 from immcad_api.providers.router import ProviderRouter, RoutingResult
 from immcad_api.providers.scaffold_provider import ScaffoldProvider
+from immcad_api.providers.scoring import ProviderScoreboard
 
 __all__ = [
+    "Bulkhead",
+    "BulkheadFullError",
+    "BulkheadRegistry",
+    "CircuitBreaker",
+    "CircuitPermit",
     "GeminiProvider",
+    "HedgePolicy",
+    "ModelHealthTracker",
     "OpenAIProvider",
     "ProviderError",
+    "ProviderHttpPool",
     "ProviderResult",
     "ProviderRouter",
+    "ProviderScoreboard",
+    "RedisCircuitStateStore",
     "RoutingResult",
     "ScaffoldProvider",
 ]
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from threading import Event, Lock
+import time
+from typing import AsyncIterator, Iterator, Mapping
+
+from immcad_api.telemetry import RequestMetrics
+
+
+class BulkheadFullError(Exception):
+    """Raised when a call waited longer than the bulkhead's queue budget."""
+
+    def __init__(self, name: str, max_queue_wait_seconds: float) -> None:
+        super().__init__(
+            f"Bulkhead '{name}' is saturated (queued longer than {max_queue_wait_seconds}s)"
+        )
+        self.name = name
+
+
+@dataclass(eq=False)
+class _Waiter:
+    event: Event | None = None
+    loop: asyncio.AbstractEventLoop | None = None
+    future: asyncio.Future[None] | None = None
+    granted: bool = False
+
+    def wake(self) -> bool:
+        """Grant the slot; returns ``False`` if the waiter's event loop is gone."""
+        if self.event is not None:
+            self.granted = True
+            self.event.set()
+            return True
+        assert self.loop is not None and self.future is not None
+        try:
+            self.loop.call_soon_threadsafe(_resolve, self.future)
+        except RuntimeError:
+            return False
+        self.granted = True
+        return True
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class Bulkhead:
+    """Concurrency limit for one downstream dependency, shared by threads and loops.
+
+    At most ``max_concurrent`` calls run at once. Further calls queue in FIFO order;
+    a call that would wait longer than ``max_queue_wait_seconds`` is shed with
+    ``BulkheadFullError`` so the caller can fail over instead of piling up. Freed
+    slots are handed directly to the oldest waiter.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_concurrent: int,
+        max_queue_wait_seconds: float,
+        metrics: RequestMetrics | None = None,
+    ) -> None:
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be >= 1")
+        if max_queue_wait_seconds < 0:
+            raise ValueError("max_queue_wait_seconds must be >= 0")
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue_wait_seconds = max_queue_wait_seconds
+        self.metrics = metrics
+        self._lock = Lock()
+        self._in_flight = 0
+        self._waiters: deque[_Waiter] = deque()
+
+    def _try_enter(self, waiter: _Waiter) -> bool:
+        """Take a free slot, or enqueue ``waiter``. Caller holds the lock."""
+        if self._in_flight < self.max_concurrent and not self._waiters:
+            self._in_flight += 1
+            return True
+        self._waiters.append(waiter)
+        return False
+
+    def _abandon(self, waiter: _Waiter) -> bool:
+        """Dequeue a timed-out waiter; returns ``True`` if it was granted meanwhile."""
+        with self._lock:
+            if waiter.granted:
+                return True
+            self._waiters.remove(waiter)
+            return False
+
+    def _record(self, *, shed: bool, queue_depth: int, waited_seconds: float) -> None:
+        if self.metrics is not None:
+            self.metrics.record_bulkhead_outcome(
+                dependency=self.name,
+                shed=shed,
+                queue_depth=queue_depth,
+                queue_wait_seconds=waited_seconds,
+            )
+
+    def acquire(self) -> None:
+        waiter = _Waiter(event=Event())
+        started = time.monotonic()
+        with self._lock:
+            entered = self._try_enter(waiter)
+            queue_depth = len(self._waiters)
+        if not entered:
+            assert waiter.event is not None
+            if not waiter.event.wait(self.max_queue_wait_seconds) and not self._abandon(
+                waiter
+            ):
+                self._record(
+                    shed=True,
+                    queue_depth=queue_depth,
+                    waited_seconds=time.monotonic() - started,
+                )
+                raise BulkheadFullError(self.name, self.max_queue_wait_seconds)
+        self._record(
+            shed=False, queue_depth=queue_depth, waited_seconds=time.monotonic() - started
+        )
+
+    async def acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(loop=loop, future=loop.create_future())
+        started = time.monotonic()
+        with self._lock:
+            entered = self._try_enter(waiter)
+            queue_depth = len(self._waiters)
+        if not entered:
+            assert waiter.future is not None
+            try:
+                await asyncio.wait_for(
+                    asyncio.shield(waiter.future), timeout=self.max_queue_wait_seconds
+                )
+            except asyncio.TimeoutError:
+                if not self._abandon(waiter):
+                    self._record(
+                        shed=True,
+                        queue_depth=queue_depth,
+                        waited_seconds=time.monotonic() - started,
+                    )
+                    raise BulkheadFullError(
+                        self.name, self.max_queue_wait_seconds
+                    ) from None
+            except asyncio.CancelledError:
+                if self._abandon(waiter):
+                    self.release()
+                raise
+        self._record(
+            shed=False, queue_depth=queue_depth, waited_seconds=time.monotonic() - started
+        )
+
+    def release(self) -> None:
+        with self._lock:
+            while self._waiters:
+                # Hand the slot straight to the oldest waiter; in-flight is unchanged.
+                if self._waiters.popleft().wake():
+                    return
+            self._in_flight = max(0, self._in_flight - 1)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def slot_async(self) -> AsyncIterator[None]:
+        await self.acquire_async()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "max_concurrent": self.max_concurrent,
+                "in_flight": self._in_flight,
+                "queued": len(self._waiters),
+                "max_queue_wait_seconds": self.max_queue_wait_seconds,
+            }
+
+
+class BulkheadRegistry:
+    """Named bulkheads, one per provider or downstream dependency.
+
+    Dependencies without a configured limit are unbounded.
+    """
+
+    def __init__(
+        self,
+        *,
+        limits: Mapping[str, int],
+        max_queue_wait_seconds: float = 0.25,
+        metrics: RequestMetrics | None = None,
+    ) -> None:
+        self._bulkheads: dict[str, Bulkhead] = {
+            name: Bulkhead(
+                name,
+                max_concurrent=max_concurrent,
+                max_queue_wait_seconds=max_queue_wait_seconds,
+                metrics=metrics,
+            )
+            for name, max_concurrent in limits.items()
+        }
+
+    def get(self, name: str) -> Bulkhead | None:
+        return self._bulkheads.get(name)
+
+    def snapshot(self) -> dict[str, dict[str, object]]:
+        return {name: bulkhead.snapshot() for name, bulkhead in self._bulkheads.items()}
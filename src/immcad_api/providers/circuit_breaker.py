@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import importlib
+import logging
+from threading import Lock
+import time
+from typing import Callable, Literal, Protocol
+
+
+LOGGER = logging.getLogger(__name__)
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+@dataclass(frozen=True, eq=False)
+class CircuitPermit:
+    """Admission for one call, handed back to ``CircuitBreaker.release``.
+
+    ``probe_started`` is set only when the call holds a half-open probe slot.
+    """
+
+    probe_started: float | None = None
+
+    @property
+    def probe(self) -> bool:
+        return self.probe_started is not None
+
+
+_CLOSED_PERMIT = CircuitPermit()
+
+
+class CircuitStateStore(Protocol):
+    """Breaker state shared between workers (for example several uvicorn processes)."""
+
+    def open(self, provider_name: str, seconds: float) -> None:
+        ...
+
+    def remaining_open_seconds(self, provider_name: str) -> float:
+        ...
+
+    def try_acquire_probe(self, provider_name: str, seconds: float) -> bool:
+        ...
+
+    def release_probe(self, provider_name: str) -> None:
+        ...
+
+    def close(self, provider_name: str) -> None:
+        ...
+
+
+class RedisCircuitStateStore:
+    """Redis-backed breaker state.
+
+    An open circuit is a key whose TTL is the remaining cooldown, so workers do not
+    need synchronized clocks. Half-open probes take a short ``SET NX`` lock so only
+    one worker probes a recovering provider at a time. Redis errors are logged and
+    treated as "no shared state"; each worker's local breaker still applies.
+    """
+
+    def __init__(self, redis_client, *, prefix: str = "immcad:circuit") -> None:
+        self.redis_client = redis_client
+        self.prefix = prefix
+
+    def _open_key(self, provider_name: str) -> str:
+        return f"{self.prefix}:{provider_name}:open"
+
+    def _probe_key(self, provider_name: str) -> str:
+        return f"{self.prefix}:{provider_name}:probe"
+
+    def open(self, provider_name: str, seconds: float) -> None:
+        try:
+            self.redis_client.set(
+                self._open_key(provider_name), "1", px=max(1, int(seconds * 1000))
+            )
+            self.redis_client.delete(self._probe_key(provider_name))
+        except Exception:
+            LOGGER.warning("Unable to publish open circuit to Redis", exc_info=True)
+
+    def remaining_open_seconds(self, provider_name: str) -> float:
+        try:
+            remaining_ms = self.redis_client.pttl(self._open_key(provider_name))
+        except Exception:
+            LOGGER.warning("Unable to read shared circuit state from Redis", exc_info=True)
+            return 0.0
+        # PTTL returns -2 for a missing key and -1 for a key without expiry.
+        if remaining_ms is None or int(remaining_ms) <= 0:
+            return 0.0
+        return int(remaining_ms) / 1000.0
+
+    def try_acquire_probe(self, provider_name: str, seconds: float) -> bool:
+        try:
+            return bool(
+                self.redis_client.set(
+                    self._probe_key(provider_name),
+                    "1",
+                    nx=True,
+                    px=max(1, int(seconds * 1000)),
+                )
+            )
+        except Exception:
+            LOGGER.warning("Unable to acquire shared circuit probe in Redis", exc_info=True)
+            return True
+
+    def release_probe(self, provider_name: str) -> None:
+        try:
+            self.redis_client.delete(self._probe_key(provider_name))
+        except Exception:
+            LOGGER.warning("Unable to release shared circuit probe in Redis", exc_info=True)
+
+    def close(self, provider_name: str) -> None:
+        try:
+            self.redis_client.delete(
+                self._open_key(provider_name), self._probe_key(provider_name)
+            )
+        except Exception:
+            LOGGER.warning("Unable to publish closed circuit to Redis", exc_info=True)
+
+
+class CircuitBreaker:
+    """Thread-safe closed/open/half-open circuit breaker for one provider.
+
+    ``failure_threshold`` consecutive failures open the circuit for ``open_seconds``.
+    After the cooldown the breaker turns half-open and admits at most
+    ``half_open_max_probes`` concurrent probe calls; a probe success closes it and a
+    probe failure reopens it. A probe that never reports back frees its slot after
+    ``open_seconds``. With a ``shared_state`` store, opening and closing are published
+    to other workers, which poll the store at most every ``shared_refresh_seconds``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = 3,
+        open_seconds: float = 30.0,
+        half_open_max_probes: int = 1,
+        time_fn: Callable[[], float] | None = None,
+        shared_state: CircuitStateStore | None = None,
+        shared_refresh_seconds: float = 1.0,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be >= 1")
+        if open_seconds <= 0:
+            raise ValueError("open_seconds must be > 0")
+        if half_open_max_probes < 1:
+            raise ValueError("half_open_max_probes must be >= 1")
+        if shared_refresh_seconds < 0:
+            raise ValueError("shared_refresh_seconds must be >= 0")
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.half_open_max_probes = half_open_max_probes
+        self.shared_state = shared_state
+        self.shared_refresh_seconds = shared_refresh_seconds
+        self._time_fn = time_fn or time.monotonic
+        self._lock = Lock()
+        self._state: CircuitState = "closed"
+        self._failures = 0
+        self._open_until = 0.0
+        self._probe_started: list[float] = []
+        self._next_shared_refresh = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._advance(self._time_fn())
+            return self._state
+
+    def _advance(self, now: float) -> None:
+        if self._state == "open" and now >= self._open_until:
+            self._state = "half_open"
+            self._probe_started = []
+        if self._state == "half_open":
+            # Probes that never reported back (cancelled or crashed) free their slot.
+            self._probe_started = [
+                started
+                for started in self._probe_started
+                if now - started < self.open_seconds
+            ]
+
+    def _sync_shared_state(self, now: float) -> None:
+        if self.shared_state is None or self._state != "closed":
+            return
+        if now < self._next_shared_refresh:
+            return
+        self._next_shared_refresh = now + self.shared_refresh_seconds
+        remaining = self.shared_state.remaining_open_seconds(self.name)
+        if remaining > 0:
+            self._state = "open"
+            self._open_until = now + remaining
+
+    def allows_requests(self) -> bool:
+        """Whether a call could currently be admitted, without taking a probe slot."""
+        with self._lock:
+            now = self._time_fn()
+            self._sync_shared_state(now)
+            self._advance(now)
+            if self._state == "open":
+                return False
+            if self._state == "half_open":
+                return len(self._probe_started) < self.half_open_max_probes
+            return True
+
+    def try_acquire(self) -> CircuitPermit | None:
+        """Admit a call, or return ``None`` when the circuit rejects it.
+
+        Callers must report an admitted call via ``record_success``,
+        ``record_failure`` or ``release(permit)``.
+        """
+        with self._lock:
+            now = self._time_fn()
+            self._sync_shared_state(now)
+            self._advance(now)
+            if self._state == "closed":
+                return _CLOSED_PERMIT
+            if self._state == "open":
+                return None
+            if len(self._probe_started) >= self.half_open_max_probes:
+                return None
+            if self.shared_state is not None:
+                # Another worker's probe may already have reopened the circuit.
+                remaining = self.shared_state.remaining_open_seconds(self.name)
+                if remaining > 0:
+                    self._state = "open"
+                    self._open_until = now + remaining
+                    return None
+                if not self.shared_state.try_acquire_probe(self.name, self.open_seconds):
+                    return None
+            self._probe_started.append(now)
+            return CircuitPermit(probe_started=now)
+
+    def _finish_probe(self) -> None:
+        if self._probe_started:
+            self._probe_started.pop(0)
+
+    def release(self, permit: CircuitPermit) -> None:
+        """Give back an admitted call that ended without a provider outcome.
+
+        Only a probe permit frees anything: calls admitted while the circuit was
+        closed never held a probe slot or the shared probe lock.
+        """
+        if permit.probe_started is None:
+            return
+        with self._lock:
+            # A probe that outlived its slot (or a circuit that has moved on)
+            # no longer owns the slot, and the shared lock may be another worker's.
+            if self._state != "half_open" or permit.probe_started not in self._probe_started:
+                return
+            self._probe_started.remove(permit.probe_started)
+        if self.shared_state is not None:
+            # Free the shared probe lock too, or no worker could probe until it expires.
+            self.shared_state.release_probe(self.name)
+
+    def record_success(self) -> CircuitState:
+        """Record a success; returns the state before it was applied."""
+        with self._lock:
+            previous = self._state
+            self._failures = 0
+            # A late success from a call admitted before the circuit opened does
+            # not close it; only a half-open probe can.
+            if previous != "half_open":
+                return previous
+            self._state = "closed"
+            self._probe_started = []
+        if self.shared_state is not None:
+            self.shared_state.close(self.name)
+        return previous
+
+    def record_failure(self) -> bool:
+        """Record a failure; returns ``True`` when this failure opened the circuit."""
+        with self._lock:
+            now = self._time_fn()
+            if self._state == "open":
+                return False
+            if self._state == "half_open":
+                self._finish_probe()
+            else:
+                self._failures += 1
+                if self._failures < self.failure_threshold:
+                    return False
+            self._state = "open"
+            self._open_until = now + self.open_seconds
+            self._failures = 0
+            self._probe_started = []
+        if self.shared_state is not None:
+            self.shared_state.open(self.name, self.open_seconds)
+        return True
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            now = self._time_fn()
+            self._advance(now)
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "open_remaining_seconds": (
+                    round(max(0.0, self._open_until - now), 3)
+                    if self._state == "open"
+                    else 0.0
+                ),
+                "probes_in_flight": len(self._probe_started),
+            }
+
+
+def build_circuit_state_store(*, redis_url: str | None) -> CircuitStateStore | None:
+    if not redis_url:
+        LOGGER.info("Using process-local provider circuit breakers (redis_url not configured)")
+        return None
+
+    try:
+        redis = importlib.import_module("redis")
+
+        redis_client = redis.Redis.from_url(
+            redis_url,
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5,
+        )
+        redis_client.ping()
+        LOGGER.info("Using Redis-backed shared provider circuit state")
+        return RedisCircuitStateStore(redis_client)
+    except Exception as exc:
+        LOGGER.warning(
+            "Redis circuit state unavailable; using process-local circuit breakers",
+            exc_info=exc,
+        )
+        return None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from immcad_api.providers.base import ProviderError
+from immcad_api.retry import retry_after_from_exception
 
 
 def map_provider_exception(provider: str, exc: Exception) -> ProviderError:
@@ -8,7 +9,12 @@ def map_provider_exception(provider: str, exc: Exception) -> ProviderError:
     lowered = message.lower()
 
     if "rate" in lowered or "429" in lowered or "quota" in lowered:
-        return ProviderError(provider, "rate_limit", message)
+        return ProviderError(
+            provider,
+            "rate_limit",
+            message,
+            retry_after_seconds=retry_after_from_exception(exc),
+        )
 
     if "timeout" in lowered or "timed out" in lowered or "deadline" in lowered:
         return ProviderError(provider, "timeout", message)
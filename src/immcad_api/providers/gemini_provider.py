@@ -1,19 +1,39 @@
 from __future__ import annotations
 
+import asyncio
+from functools import partial
 import importlib
+import json
+from threading import Lock
 import time
+from typing import Awaitable, Callable, Generator, Iterator
 
 import httpx
 
-from immcad_api.providers.base import ProviderError, ProviderResult
+from immcad_api.deadline import current_deadline, deadline_expired, remaining_timeout
+from immcad_api.providers.base import (
+    ProviderCompletion,
+    ProviderError,
+    ProviderResult,
+    StreamUsage,
+)
 from immcad_api.providers.error_mapping import map_provider_exception
-from immcad_api.providers.prompt_builder import build_combined_runtime_prompt
+from immcad_api.providers.http_pool import (
+    ProviderHttpPool,
+    async_http_client,
+    sync_http_client,
+)
+from immcad_api.providers.model_health import ModelHealthTracker
+from immcad_api.providers.prompt_builder import assemble_runtime_prompt
+from immcad_api.providers.streaming import iter_sse_data, stream_with_retries
+from immcad_api.retry import Retrier, RetryBudget, RetryPolicy, parse_retry_after
 from immcad_api.schemas import Citation
 
 
 class GeminiProvider:
     name = "gemini"
     _GEMINI_API_ENDPOINT = "https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
+    _GEMINI_STREAM_API_ENDPOINT = "https://generativelanguage.googleapis.com/v1beta/models/{model}:streamGenerateContent?alt=sse"
 
     def __init__(
         self,
@@ -23,12 +43,40 @@ class GeminiProvider:
         fallback_models: tuple[str, ...] = (),
         timeout_seconds: float,
         max_retries: int,
+        http_pool: ProviderHttpPool | None = None,
+        prompt_token_budget: int | None = None,
+        retry_budget: RetryBudget | None = None,
+        model_health: ModelHealthTracker | None = None,
     ) -> None:
         self.api_key = api_key
         self.model = model
         self.fallback_models = fallback_models
         self.timeout_seconds = timeout_seconds
         self.max_retries = max(0, max_retries)
+        self.http_pool = http_pool
+        self.prompt_token_budget = prompt_token_budget
+        self.retrier = Retrier(
+            RetryPolicy(max_retries=self.max_retries), budget=retry_budget
+        )
+        self.model_health = model_health or ModelHealthTracker()
+        self._sdk_client_lock = Lock()
+        self._sdk_clients: dict[tuple[object, asyncio.AbstractEventLoop | None], object] = {}
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._sdk_client_lock:
+            clients, self._sdk_clients = dict(self._sdk_clients), {}
+        for (_, client_loop), client in clients.items():
+            close = getattr(client, "close", None)
+            if callable(close):
+                close()
+            # The SDK leaves pooled clients open; the pool below closes them.
+            aio = getattr(client, "aio", None)
+            aclose = getattr(aio, "aclose", None)
+            if client_loop is loop and callable(aclose):
+                await aclose()
+        if self.http_pool is not None:
+            await self.http_pool.aclose()
 
     def generate(
         self, *, message: str, citations: list[Citation], locale: str
@@ -41,32 +89,128 @@ class GeminiProvider:
         # google-genai SDK is optional; Cloudflare native runtime uses HTTP fallback.
         genai_module, genai_types = self._load_google_genai_sdk()
 
-        prompt = build_combined_runtime_prompt(
+        runtime_prompt = assemble_runtime_prompt(
+            message=message,
+            locale=locale,
+            citations=citations,
+            token_budget=self.prompt_token_budget,
+        )
+        prompt = runtime_prompt.combined
+
+        if genai_module is not None and genai_types is not None:
+            completion = self._generate_with_sdk(
+                prompt=prompt,
+                genai=genai_module,
+                types=genai_types,
+            )
+        else:
+            completion = self._generate_with_httpx(prompt=prompt)
+
+        return self._result(completion, prompt_tokens=runtime_prompt.prompt_tokens)
+
+    async def generate_async(
+        self, *, message: str, citations: list[Citation], locale: str
+    ) -> ProviderResult:
+        if not self.api_key:
+            raise ProviderError(
+                self.name, "provider_error", "GEMINI_API_KEY not configured"
+            )
+
+        genai_module, genai_types = self._load_google_genai_sdk()
+        runtime_prompt = assemble_runtime_prompt(
             message=message,
             locale=locale,
             citations=citations,
+            token_budget=self.prompt_token_budget,
         )
+        prompt = runtime_prompt.combined
 
         if genai_module is not None and genai_types is not None:
-            answer = self._generate_with_sdk(
+            completion = await self._generate_with_async_sdk(
                 prompt=prompt,
                 genai=genai_module,
                 types=genai_types,
             )
         else:
-            answer = self._generate_with_httpx(prompt=prompt)
+            completion = await self._generate_with_async_httpx(prompt=prompt)
+        return self._result(completion, prompt_tokens=runtime_prompt.prompt_tokens)
 
-        if not answer:
+    def _result(
+        self, completion: ProviderCompletion, *, prompt_tokens: int
+    ) -> ProviderResult:
+        if not completion.text:
             raise ProviderError(self.name, "provider_error", "Empty Gemini response")
 
         return ProviderResult(
             provider=self.name,
-            answer=answer,
+            answer=completion.text,
             # The provider currently returns plain text only; do not imply model-emitted citations.
             citations=[],
             confidence="medium",
+            prompt_tokens=prompt_tokens,
+            cached_prompt_tokens=completion.cached_prompt_tokens,
         )
 
+    def stream(
+        self, *, message: str, citations: list[Citation], locale: str
+    ) -> Generator[str, None, StreamUsage]:
+        if not self.api_key:
+            raise ProviderError(
+                self.name, "provider_error", "GEMINI_API_KEY not configured"
+            )
+
+        genai_module, genai_types = self._load_google_genai_sdk()
+        runtime_prompt = assemble_runtime_prompt(
+            message=message,
+            locale=locale,
+            citations=citations,
+            token_budget=self.prompt_token_budget,
+        )
+        prompt = runtime_prompt.combined
+
+        models_to_try = self._models_to_try()
+        last_error: ProviderError | None = None
+        for model_name in models_to_try:
+            if genai_module is not None and genai_types is not None:
+                open_stream = partial(
+                    self._open_sdk_stream,
+                    prompt=prompt,
+                    model_name=model_name,
+                    genai=genai_module,
+                    types=genai_types,
+                )
+            else:
+                open_stream = partial(
+                    self._open_httpx_stream,
+                    prompt=prompt,
+                    model_name=model_name,
+                )
+            emitted = False
+            started_at = time.perf_counter()
+            try:
+                for delta in stream_with_retries(
+                    self.name, open_stream, retrier=self.retrier
+                ):
+                    if not emitted:
+                        self.model_health.record_success(
+                            model_name, time.perf_counter() - started_at
+                        )
+                    emitted = True
+                    yield delta
+            except ProviderError as exc:
+                # Fallback models are only tried before any text reached the caller.
+                if emitted:
+                    raise
+                self.model_health.record_failure(model_name, error_code=exc.code)
+                last_error = exc
+                continue
+            if emitted:
+                return StreamUsage(prompt_tokens=runtime_prompt.prompt_tokens)
+            last_error = self._empty_model_response_error(model_name)
+            self.model_health.record_failure(model_name, error_code=last_error.code)
+
+        raise self._models_exhausted_error(last_error, models_to_try) from last_error
+
     @staticmethod
     def _load_google_genai_sdk():
         try:
@@ -78,131 +222,307 @@ class GeminiProvider:
         except Exception:  # pragma: no cover
             return None, None
 
-    def _generate_with_sdk(self, *, prompt: str, genai, types) -> str:  # noqa: ANN001
-        # google-genai HttpOptions.timeout is interpreted in milliseconds.
-        timeout_millis = max(1000, int(self.timeout_seconds * 1000))
-        client = genai.Client(
-            api_key=self.api_key,
-            http_options=types.HttpOptions(timeout=timeout_millis),
+    def _sdk_client(self, *, genai, types, asynchronous: bool = False):  # noqa: ANN001
+        # One SDK client per provider keeps its connections alive across model
+        # fallback and retries instead of re-handshaking on every attempt. The
+        # SDK sends through the shared ProviderHttpPool when one is configured;
+        # async clients are bound to one event loop, so they are kept per loop.
+        loop = asyncio.get_running_loop() if asynchronous else None
+        with self._sdk_client_lock:
+            for stale_key in [
+                key
+                for key in self._sdk_clients
+                if key[1] is not None and key[1].is_closed()
+            ]:
+                del self._sdk_clients[stale_key]
+            client = self._sdk_clients.get((genai, loop))
+            if client is None:
+                # google-genai HttpOptions.timeout is interpreted in milliseconds.
+                timeout_millis = max(1000, int(self.timeout_seconds * 1000))
+                pooled_clients: dict[str, object] = {}
+                if self.http_pool is not None:
+                    pooled_clients["httpx_client"] = self.http_pool.sync_client()
+                    if asynchronous:
+                        pooled_clients["httpx_async_client"] = (
+                            self.http_pool.async_client()
+                        )
+                client = genai.Client(
+                    api_key=self.api_key,
+                    http_options=self._http_options(
+                        types, timeout_millis=timeout_millis, **pooled_clients
+                    ),
+                )
+                self._sdk_clients[(genai, loop)] = client
+            return client
+
+    def _sdk_config(self, types):  # noqa: ANN001
+        config_kwargs: dict[str, object] = {"temperature": 0.2}
+        if current_deadline() is not None:
+            # The cached client's timeout is fixed; narrow each call to the request deadline.
+            config_kwargs["http_options"] = self._http_options(
+                types, timeout_millis=max(1, int(self._http_timeout_seconds() * 1000))
+            )
+        return types.GenerateContentConfig(**config_kwargs)
+
+    @staticmethod
+    def _http_options(types, *, timeout_millis: int, **client_options: object):  # noqa: ANN001
+        # One attempt per call: retries go through self.retrier and the shared
+        # RetryBudget, so the SDK's own tenacity retries stay off.
+        return types.HttpOptions(
+            timeout=timeout_millis,
+            retry_options=types.HttpRetryOptions(attempts=1),
+            **client_options,
         )
 
-        answer = ""
+    def _http_timeout_seconds(self) -> float:
+        return remaining_timeout(max(1000, int(self.timeout_seconds * 1000)) / 1000.0)
+
+    def _http_headers(self) -> dict[str, str]:
+        return {
+            "content-type": "application/json",
+            "x-goog-api-key": self.api_key or "",
+        }
+
+    @staticmethod
+    def _http_payload(prompt: str) -> dict[str, object]:
+        return {
+            "contents": [{"parts": [{"text": prompt}]}],
+            "generationConfig": {"temperature": 0.2},
+        }
+
+    def _raise_for_status(self, response: httpx.Response) -> None:
+        if response.status_code == 429:
+            raise ProviderError(
+                self.name,
+                "rate_limit",
+                response.text,
+                retry_after_seconds=parse_retry_after(
+                    response.headers.get("retry-after")
+                ),
+            )
+        if response.status_code >= 400:
+            raise ProviderError(
+                self.name,
+                "provider_error",
+                f"Gemini API returned HTTP {response.status_code}: {response.text}",
+            )
+
+    def _attempt_error(self, exc: Exception) -> ProviderError:
+        if isinstance(exc, ProviderError):
+            return exc
+        if isinstance(exc, httpx.TimeoutException):
+            return ProviderError(self.name, "timeout", str(exc))
+        return map_provider_exception(self.name, exc)
+
+    def _empty_model_response_error(self, model_name: str) -> ProviderError:
+        return ProviderError(
+            self.name,
+            "provider_error",
+            f"Empty Gemini response from model '{model_name}'",
+        )
+
+    def _models_exhausted_error(
+        self, last_error: ProviderError | None, models_to_try: list[str]
+    ) -> ProviderError:
+        if last_error:
+            return ProviderError(
+                self.name,
+                last_error.code,
+                f"{last_error.message} (models tried: {', '.join(models_to_try)})",
+            )
+        return ProviderError(self.name, "provider_error", "Empty Gemini response")
+
+    def _models_to_try(self) -> list[str]:
+        return self.model_health.order([self.model, *self.fallback_models])
+
+    def _require_text(
+        self, attempt_model: Callable[[str], ProviderCompletion], model_name: str
+    ) -> ProviderCompletion:
+        completion = attempt_model(model_name)
+        if not completion.text:
+            raise self._empty_model_response_error(model_name)
+        return completion
+
+    async def _require_text_async(
+        self,
+        attempt_model: Callable[[str], Awaitable[ProviderCompletion]],
+        model_name: str,
+    ) -> ProviderCompletion:
+        completion = await attempt_model(model_name)
+        if not completion.text:
+            raise self._empty_model_response_error(model_name)
+        return completion
+
+    def _generate_across_models(
+        self, attempt_model: Callable[[str], ProviderCompletion]
+    ) -> ProviderCompletion:
+        models_to_try = self._models_to_try()
         last_error: ProviderError | None = None
-        models_to_try = [self.model, *self.fallback_models]
         for model_name in models_to_try:
-            for attempt in range(self.max_retries + 1):
-                try:
-                    response = client.models.generate_content(
-                        model=model_name,
-                        contents=prompt,
-                        config=types.GenerateContentConfig(
-                            temperature=0.2,
-                        ),
-                    )
-                    answer = response.text or ""
-                    if answer:
-                        break
-                    last_error = ProviderError(
-                        self.name,
-                        "provider_error",
-                        f"Empty Gemini response from model '{model_name}'",
-                    )
-                except Exception as exc:  # pragma: no cover
-                    last_error = map_provider_exception(self.name, exc)
-
-                if attempt < self.max_retries:
-                    time.sleep(0.4 * (attempt + 1))
-                    continue
-            if answer:
+            if last_error is not None and deadline_expired():
                 break
+            started_at = time.perf_counter()
+            try:
+                completion = self.retrier.call(
+                    partial(self._require_text, attempt_model, model_name),
+                    on_error=self._attempt_error,
+                )
+            except ProviderError as exc:
+                self.model_health.record_failure(model_name, error_code=exc.code)
+                last_error = exc
+                continue
+            self.model_health.record_success(model_name, time.perf_counter() - started_at)
+            return completion
+        raise self._models_exhausted_error(last_error, models_to_try) from last_error
 
-        if not answer:
-            if last_error:
-                raise ProviderError(
-                    self.name,
-                    last_error.code,
-                    f"{last_error.message} (models tried: {', '.join(models_to_try)})",
-                ) from last_error
-            raise ProviderError(self.name, "provider_error", "Empty Gemini response")
-        return answer
-
-    def _generate_with_httpx(self, *, prompt: str) -> str:
-        timeout_millis = max(1000, int(self.timeout_seconds * 1000))
-        models_to_try = [self.model, *self.fallback_models]
-        answer = ""
+    async def _generate_across_models_async(
+        self, attempt_model: Callable[[str], Awaitable[ProviderCompletion]]
+    ) -> ProviderCompletion:
+        models_to_try = self._models_to_try()
         last_error: ProviderError | None = None
         for model_name in models_to_try:
-            endpoint = self._GEMINI_API_ENDPOINT.format(model=model_name)
-            headers = {
-                "content-type": "application/json",
-                "x-goog-api-key": self.api_key or "",
-            }
-            payload = {
-                "contents": [{"parts": [{"text": prompt}]}],
-                "generationConfig": {"temperature": 0.2},
-            }
-            for attempt in range(self.max_retries + 1):
-                try:
-                    with httpx.Client(timeout=timeout_millis / 1000.0) as client:
-                        response = client.post(
-                            endpoint,
-                            headers=headers,
-                            json=payload,
-                        )
-                    if response.status_code == 429:
-                        raise ProviderError(self.name, "rate_limit", response.text)
-                    if response.status_code >= 400:
-                        raise ProviderError(
-                            self.name,
-                            "provider_error",
-                            f"Gemini API returned HTTP {response.status_code}: {response.text}",
-                        )
-                    data = response.json()
-                    candidates = data.get("candidates")
-                    if isinstance(candidates, list) and candidates:
-                        first_candidate = candidates[0]
-                        content = (
-                            first_candidate.get("content")
-                            if isinstance(first_candidate, dict)
-                            else None
-                        )
-                        parts = (
-                            content.get("parts") if isinstance(content, dict) else None
-                        )
-                        if isinstance(parts, list):
-                            answer = "".join(
-                                str(part.get("text", ""))
-                                for part in parts
-                                if isinstance(part, dict)
-                            ).strip()
-                    if not answer:
-                        raise ProviderError(
-                            self.name,
-                            "provider_error",
-                            f"Empty Gemini response from model '{model_name}'",
-                        )
-                    break
-                except httpx.TimeoutException as exc:
-                    last_error = ProviderError(self.name, "timeout", str(exc))
-                except httpx.HTTPError as exc:
-                    last_error = map_provider_exception(self.name, exc)
-                except ProviderError as exc:
-                    last_error = exc
-                except Exception as exc:  # pragma: no cover
-                    last_error = map_provider_exception(self.name, exc)
-
-                if attempt < self.max_retries:
-                    time.sleep(0.4 * (attempt + 1))
-                    continue
-            if answer:
+            if last_error is not None and deadline_expired():
                 break
+            started_at = time.perf_counter()
+            try:
+                completion = await self.retrier.call_async(
+                    partial(self._require_text_async, attempt_model, model_name),
+                    on_error=self._attempt_error,
+                )
+            except ProviderError as exc:
+                self.model_health.record_failure(model_name, error_code=exc.code)
+                last_error = exc
+                continue
+            self.model_health.record_success(model_name, time.perf_counter() - started_at)
+            return completion
+        raise self._models_exhausted_error(last_error, models_to_try) from last_error
 
-        if not answer:
-            if last_error:
-                raise ProviderError(
-                    self.name,
-                    last_error.code,
-                    f"{last_error.message} (models tried: {', '.join(models_to_try)})",
-                ) from last_error
-            raise ProviderError(self.name, "provider_error", "Empty Gemini response")
-        return answer
+    def _generate_with_sdk(
+        self, *, prompt: str, genai, types  # noqa: ANN001
+    ) -> ProviderCompletion:
+        client = self._sdk_client(genai=genai, types=types)
+
+        def attempt_model(model_name: str) -> ProviderCompletion:
+            response = client.models.generate_content(
+                model=model_name,
+                contents=prompt,
+                config=self._sdk_config(types),
+            )
+            return _sdk_completion(response)
+
+        return self._generate_across_models(attempt_model)
+
+    def _generate_with_httpx(self, *, prompt: str) -> ProviderCompletion:
+        def attempt_model(model_name: str) -> ProviderCompletion:
+            with sync_http_client(
+                self.http_pool, timeout_seconds=self._http_timeout_seconds()
+            ) as client:
+                response = client.post(
+                    self._GEMINI_API_ENDPOINT.format(model=model_name),
+                    headers=self._http_headers(),
+                    json=self._http_payload(prompt),
+                    timeout=self._http_timeout_seconds(),
+                )
+            self._raise_for_status(response)
+            return _http_completion(response.json())
+
+        return self._generate_across_models(attempt_model)
+
+    async def _generate_with_async_sdk(
+        self, *, prompt: str, genai, types  # noqa: ANN001
+    ) -> ProviderCompletion:
+        client = self._sdk_client(genai=genai, types=types, asynchronous=True)
+
+        async def attempt_model(model_name: str) -> ProviderCompletion:
+            response = await client.aio.models.generate_content(
+                model=model_name,
+                contents=prompt,
+                config=self._sdk_config(types),
+            )
+            return _sdk_completion(response)
+
+        return await self._generate_across_models_async(attempt_model)
+
+    async def _generate_with_async_httpx(self, *, prompt: str) -> ProviderCompletion:
+        async def attempt_model(model_name: str) -> ProviderCompletion:
+            async with async_http_client(
+                self.http_pool, timeout_seconds=self._http_timeout_seconds()
+            ) as client:
+                response = await client.post(
+                    self._GEMINI_API_ENDPOINT.format(model=model_name),
+                    headers=self._http_headers(),
+                    json=self._http_payload(prompt),
+                    timeout=self._http_timeout_seconds(),
+                )
+            self._raise_for_status(response)
+            return _http_completion(response.json())
+
+        return await self._generate_across_models_async(attempt_model)
+
+    def _open_sdk_stream(
+        self, *, prompt: str, model_name: str, genai, types
+    ) -> Iterator[str]:  # noqa: ANN001
+        client = self._sdk_client(genai=genai, types=types)
+        for chunk in client.models.generate_content_stream(
+            model=model_name,
+            contents=prompt,
+            config=self._sdk_config(types),
+        ):
+            text = getattr(chunk, "text", None)
+            if isinstance(text, str) and text:
+                yield text
+
+    def _open_httpx_stream(self, *, prompt: str, model_name: str) -> Iterator[str]:
+        with sync_http_client(
+            self.http_pool, timeout_seconds=self._http_timeout_seconds()
+        ) as client:
+            with client.stream(
+                "POST",
+                self._GEMINI_STREAM_API_ENDPOINT.format(model=model_name),
+                headers={**self._http_headers(), "accept": "text/event-stream"},
+                json=self._http_payload(prompt),
+                timeout=self._http_timeout_seconds(),
+            ) as response:
+                if response.status_code >= 400:
+                    response.read()
+                    self._raise_for_status(response)
+                for data in iter_sse_data(response.iter_lines()):
+                    text = _candidate_text(json.loads(data))
+                    if text:
+                        yield text
+
+
+def _candidate_text(data: object) -> str:
+    candidates = data.get("candidates") if isinstance(data, dict) else None
+    if not isinstance(candidates, list) or not candidates:
+        return ""
+    first_candidate = candidates[0]
+    content = (
+        first_candidate.get("content") if isinstance(first_candidate, dict) else None
+    )
+    parts = content.get("parts") if isinstance(content, dict) else None
+    if not isinstance(parts, list):
+        return ""
+    return "".join(
+        str(part.get("text", "")) for part in parts if isinstance(part, dict)
+    )
+
+
+def _http_completion(data: object) -> ProviderCompletion:
+    usage = data.get("usageMetadata") if isinstance(data, dict) else None
+    cached_tokens = (
+        usage.get("cachedContentTokenCount") if isinstance(usage, dict) else None
+    )
+    return ProviderCompletion(
+        _candidate_text(data).strip(),
+        cached_tokens if isinstance(cached_tokens, int) else None,
+    )
+
+
+def _sdk_completion(response) -> ProviderCompletion:  # noqa: ANN001
+    usage = getattr(response, "usage_metadata", None)
+    cached_tokens = getattr(usage, "cached_content_token_count", None)
+    return ProviderCompletion(
+        response.text or "",
+        cached_tokens if isinstance(cached_tokens, int) else None,
+    )
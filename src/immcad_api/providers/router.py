@@ -1,11 +1,60 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
 from dataclasses import dataclass
+from threading import Event, Lock
 import time
+from typing import Awaitable, Callable
 
+from immcad_api.blocking import run_blocking
+from immcad_api.deadline import current_deadline
 from immcad_api.telemetry import ProviderMetrics
 
-from immcad_api.providers.base import Provider, ProviderError, ProviderResult
+from immcad_api.providers.base import (
+    Provider,
+    ProviderError,
+    ProviderResult,
+    StreamUsage,
+)
+from immcad_api.providers.bulkhead import BulkheadFullError, BulkheadRegistry
+from immcad_api.providers.circuit_breaker import (
+    CircuitBreaker,
+    CircuitPermit,
+    CircuitStateStore,
+)
+from immcad_api.providers.hedging import HedgePolicy
+from immcad_api.providers.scoring import ProviderScoreboard
+
+
+class _ProviderShedError(ProviderError):
+    """The provider's bulkhead queue was full; the provider itself did not fail."""
+
+    def __init__(self, provider: str, exc: BulkheadFullError) -> None:
+        super().__init__(provider, "timeout", str(exc))
+
+
+def _bulkhead_capacity(
+    providers: list[Provider], bulkheads: BulkheadRegistry | None
+) -> int:
+    """Provider calls the bulkheads let run at once; 0 when any provider is unbounded."""
+    if bulkheads is None:
+        return 0
+    limits = [bulkheads.get(provider.name) for provider in providers]
+    if any(bulkhead is None for bulkhead in limits):
+        return 0
+    return sum(bulkhead.max_concurrent for bulkhead in limits if bulkhead is not None)
+
+
+@dataclass
+class _HedgePlan:
+    primary: Provider
+    secondary: Provider
+    delay: float
+    remaining: list[Provider]
+    last_error: ProviderError | None
+    primary_permit: CircuitPermit
 
 
 @dataclass
@@ -15,12 +64,6 @@ class RoutingResult:
     fallback_reason: str | None
 
 
-@dataclass
-class _CircuitState:
-    failures: int = 0
-    open_until: float | None = None
-
-
 class ProviderRouter:
     def __init__(
         self,
@@ -31,6 +74,12 @@ class ProviderRouter:
         circuit_breaker_open_seconds: float = 30.0,
         telemetry: ProviderMetrics | None = None,
         time_fn=None,
+        hedge_policy: HedgePolicy | None = None,
+        hedge_max_workers: int = 16,
+        scoreboard: ProviderScoreboard | None = None,
+        circuit_half_open_max_probes: int = 1,
+        circuit_state_store: CircuitStateStore | None = None,
+        bulkheads: BulkheadRegistry | None = None,
     ) -> None:
         if not providers:
             raise ValueError("ProviderRouter requires at least one provider")
@@ -42,73 +91,602 @@ class ProviderRouter:
             raise ValueError("circuit_breaker_failure_threshold must be >= 1")
         if circuit_breaker_open_seconds <= 0:
             raise ValueError("circuit_breaker_open_seconds must be > 0")
+        if hedge_max_workers < 2:
+            raise ValueError("hedge_max_workers must be >= 2")
         self.providers = providers
         self.primary_provider_name = primary_provider_name
         self.circuit_breaker_failure_threshold = circuit_breaker_failure_threshold
         self.circuit_breaker_open_seconds = circuit_breaker_open_seconds
         self.telemetry = telemetry or ProviderMetrics()
         self._time_fn = time_fn or time.monotonic
-        self._states: dict[str, _CircuitState] = {
-            provider.name: _CircuitState() for provider in providers
+        self.circuit_state_store = circuit_state_store
+        self._breakers: dict[str, CircuitBreaker] = {
+            provider.name: CircuitBreaker(
+                provider.name,
+                failure_threshold=circuit_breaker_failure_threshold,
+                open_seconds=circuit_breaker_open_seconds,
+                half_open_max_probes=circuit_half_open_max_probes,
+                time_fn=self._time_fn,
+                shared_state=circuit_state_store,
+            )
+            for provider in providers
         }
+        self.hedge_policy = hedge_policy
+        self.hedge_max_workers = max(
+            hedge_max_workers, _bulkhead_capacity(providers, bulkheads)
+        )
+        self._hedge_lock = Lock()
+        self._hedge_executor: ThreadPoolExecutor | None = None
+        self._hedge_threads_unavailable = False
+        self.scoreboard = scoreboard
+        self.bulkheads = bulkheads
 
-    def _is_circuit_open(self, provider_name: str) -> bool:
-        state = self._states.setdefault(provider_name, _CircuitState())
-        if state.open_until is None:
-            return False
-        now = self._time_fn()
-        if now >= state.open_until:
-            state.open_until = None
-            state.failures = 0
-            return False
-        return True
+    def _breaker(self, provider_name: str) -> CircuitBreaker:
+        return self._breakers[provider_name]
+
+    def _record_failure(self, provider: Provider) -> None:
+        if self.scoreboard is not None:
+            self.scoreboard.record_failure(provider)
+        self.telemetry.increment(provider=provider.name, event="failure")
+        if self._breaker(provider.name).record_failure():
+            self.telemetry.increment(provider=provider.name, event="circuit_open")
+
+    def _record_error(
+        self, provider: Provider, exc: ProviderError, permit: CircuitPermit
+    ) -> None:
+        if isinstance(exc, _ProviderShedError):
+            # Local overload says nothing about provider health; keep the breaker as is.
+            self._breaker(provider.name).release(permit)
+            self.telemetry.increment(provider=provider.name, event="bulkhead_shed")
+            return
+        self._record_failure(provider)
+
+    def _bulkheaded(
+        self, invoke: Callable[[Provider], ProviderResult]
+    ) -> Callable[[Provider], ProviderResult]:
+        if self.bulkheads is None:
+            return invoke
+        bulkheads = self.bulkheads
+
+        def guarded(provider: Provider) -> ProviderResult:
+            bulkhead = bulkheads.get(provider.name)
+            if bulkhead is None:
+                return invoke(provider)
+            try:
+                bulkhead.acquire()
+            except BulkheadFullError as exc:
+                raise _ProviderShedError(provider.name, exc) from exc
+            try:
+                return invoke(provider)
+            finally:
+                bulkhead.release()
+
+        return guarded
+
+    def _bulkheaded_async(
+        self, invoke: Callable[[Provider], Awaitable[ProviderResult]]
+    ) -> Callable[[Provider], Awaitable[ProviderResult]]:
+        if self.bulkheads is None:
+            return invoke
+        bulkheads = self.bulkheads
+
+        async def guarded(provider: Provider) -> ProviderResult:
+            bulkhead = bulkheads.get(provider.name)
+            if bulkhead is None:
+                return await invoke(provider)
+            try:
+                await bulkhead.acquire_async()
+            except BulkheadFullError as exc:
+                raise _ProviderShedError(provider.name, exc) from exc
+            try:
+                return await invoke(provider)
+            finally:
+                bulkhead.release()
 
-    def _record_failure(self, provider_name: str) -> None:
-        state = self._states.setdefault(provider_name, _CircuitState())
-        state.failures += 1
-        self.telemetry.increment(provider=provider_name, event="failure")
-        if state.failures >= self.circuit_breaker_failure_threshold:
-            state.open_until = self._time_fn() + self.circuit_breaker_open_seconds
-            self.telemetry.increment(provider=provider_name, event="circuit_open")
+        return guarded
 
     def _record_success(self, provider_name: str, *, fallback_used: bool) -> None:
-        state = self._states.setdefault(provider_name, _CircuitState())
-        state.failures = 0
-        state.open_until = None
+        if self._breaker(provider_name).record_success() == "half_open":
+            self.telemetry.increment(provider=provider_name, event="circuit_close")
         self.telemetry.increment(provider=provider_name, event="success")
         if fallback_used:
             self.telemetry.increment(provider=provider_name, event="fallback_success")
 
+    def _record_latency(self, provider: Provider, seconds: float) -> None:
+        if self.hedge_policy is not None:
+            self.hedge_policy.record_latency(provider.name, seconds)
+        if self.scoreboard is not None:
+            self.scoreboard.record_latency(provider, seconds)
+
+    def _attempt_order(self) -> list[Provider]:
+        if self.scoreboard is None:
+            return self.providers
+        return self.scoreboard.order(self.providers)
+
+    def scoring_snapshot(self) -> dict[str, object]:
+        return self.scoreboard.snapshot() if self.scoreboard is not None else {}
+
     def telemetry_snapshot(self) -> dict[str, dict[str, int]]:
         return self.telemetry.snapshot()
 
+    def prompt_token_snapshot(self) -> dict[str, dict[str, int]]:
+        return self.telemetry.prompt_token_snapshot()
+
+    def model_health_snapshot(self) -> dict[str, dict[str, dict[str, object]]]:
+        return self.telemetry.model_health_snapshot()
+
+    def circuit_snapshot(self) -> dict[str, dict[str, object]]:
+        return {name: breaker.snapshot() for name, breaker in self._breakers.items()}
+
+    def close(self) -> None:
+        with self._hedge_lock:
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def generate(self, *, message: str, citations, locale: str) -> RoutingResult:
-        last_error: ProviderError | None = None
+        def call(provider: Provider) -> ProviderResult:
+            return provider.generate(message=message, citations=citations, locale=locale)
 
-        for provider in self.providers:
-            if self._is_circuit_open(provider.name):
-                self.telemetry.increment(provider=provider.name, event="circuit_skip")
-                if last_error is None:
-                    last_error = ProviderError(
-                        provider.name,
-                        "provider_error",
-                        f"Circuit breaker open for provider '{provider.name}'",
-                    )
+        invoke = self._bulkheaded(call)
+        if self.hedge_policy is not None:
+            return self._route_hedged(invoke)
+        return self._route(invoke)
+
+    async def generate_async(
+        self, *, message: str, citations, locale: str
+    ) -> RoutingResult:
+        """Async variant of ``generate`` with the same breaker and telemetry semantics.
+
+        Providers without ``generate_async`` are called on a worker thread.
+        """
+
+        async def call(provider: Provider) -> ProviderResult:
+            generate_async = getattr(provider, "generate_async", None)
+            if callable(generate_async):
+                return await generate_async(
+                    message=message, citations=citations, locale=locale
+                )
+            return await run_blocking(
+                provider.generate, message=message, citations=citations, locale=locale
+            )
+
+        invoke = self._bulkheaded_async(call)
+        if self.hedge_policy is not None:
+            return await self._route_hedged_async(invoke)
+        return await self._route_async(invoke, self._attempt_order())
+
+    def stream_generate(
+        self,
+        *,
+        message: str,
+        citations,
+        locale: str,
+        on_delta: Callable[[str], None],
+    ) -> RoutingResult:
+        """Route like ``generate`` while forwarding answer text deltas to ``on_delta``.
+
+        Providers without a ``stream`` method emit their full answer as one delta.
+        Failover only happens before the first delta; a provider failing mid-stream
+        raises its ``ProviderError`` so callers never see two providers' text mixed.
+        """
+        emitted = False
+
+        def invoke(provider: Provider) -> ProviderResult:
+            nonlocal emitted
+            stream = getattr(provider, "stream", None)
+            if not callable(stream):
+                result = provider.generate(
+                    message=message, citations=citations, locale=locale
+                )
+                emitted = True
+                on_delta(result.answer)
+                return result
+
+            chunks: list[str] = []
+            deltas = stream(message=message, citations=citations, locale=locale)
+            while True:
+                try:
+                    delta = next(deltas)
+                except StopIteration as finished:
+                    # Streams may return their prompt usage after the last delta.
+                    usage = finished.value
+                    break
+                if not delta:
+                    continue
+                chunks.append(delta)
+                emitted = True
+                on_delta(delta)
+            answer = "".join(chunks)
+            if not answer.strip():
+                raise ProviderError(
+                    provider.name, "provider_error", "Empty streamed provider response"
+                )
+            if not isinstance(usage, StreamUsage):
+                usage = StreamUsage()
+            return ProviderResult(
+                provider=provider.name,
+                answer=answer,
+                # Streaming providers emit plain text only; citations come from grounding.
+                citations=[],
+                confidence="medium",
+                prompt_tokens=usage.prompt_tokens,
+                cached_prompt_tokens=usage.cached_prompt_tokens,
+            )
+
+        return self._route(self._bulkheaded(invoke), can_fail_over=lambda: not emitted)
+
+    def _route(
+        self,
+        invoke: Callable[[Provider], ProviderResult],
+        *,
+        can_fail_over: Callable[[], bool] = lambda: True,
+        providers: list[Provider] | None = None,
+        last_error: ProviderError | None = None,
+        lead_name: str | None = None,
+    ) -> RoutingResult:
+        if providers is None:
+            providers = self._attempt_order()
+        lead_name = lead_name or providers[0].name
+        for provider in providers:
+            if self._deadline_expired(provider):
+                raise self._deadline_error(last_error)
+            permit = self._breaker(provider.name).try_acquire()
+            if permit is None:
+                last_error = last_error or self._circuit_skip_error(provider)
                 continue
+            started = time.perf_counter()
             try:
-                result = provider.generate(message=message, citations=citations, locale=locale)
-                fallback_used = provider.name != self.primary_provider_name
-                fallback_reason = last_error.code if fallback_used and last_error else None
-                self._record_success(provider.name, fallback_used=fallback_used)
-                return RoutingResult(
-                    result=result,
-                    fallback_used=fallback_used,
-                    fallback_reason=fallback_reason,
-                )
+                result = invoke(provider)
+            except ProviderError as exc:
+                self._record_error(provider, exc, permit)
+                if not can_fail_over():
+                    raise
+                last_error = exc
+                continue
+            except BaseException:
+                self._breaker(provider.name).release(permit)
+                raise
+            self._record_latency(provider, time.perf_counter() - started)
+            return self._routing_result(
+                provider, result, last_error, lead_name=lead_name
+            )
+        raise self._exhausted_error(last_error)
+
+    async def _route_async(
+        self,
+        invoke: Callable[[Provider], Awaitable[ProviderResult]],
+        providers: list[Provider],
+        *,
+        last_error: ProviderError | None = None,
+        lead_name: str | None = None,
+    ) -> RoutingResult:
+        lead_name = lead_name or providers[0].name
+        for provider in providers:
+            if self._deadline_expired(provider):
+                raise self._deadline_error(last_error)
+            permit = self._breaker(provider.name).try_acquire()
+            if permit is None:
+                last_error = last_error or self._circuit_skip_error(provider)
+                continue
+            started = time.perf_counter()
+            try:
+                result = await invoke(provider)
             except ProviderError as exc:
-                self._record_failure(provider.name)
+                self._record_error(provider, exc, permit)
                 last_error = exc
+                continue
+            except BaseException:
+                self._breaker(provider.name).release(permit)
+                raise
+            self._record_latency(provider, time.perf_counter() - started)
+            return self._routing_result(
+                provider, result, last_error, lead_name=lead_name
+            )
+        raise self._exhausted_error(last_error)
+
+    def _hedge_plan(self, order: list[Provider]) -> _HedgePlan | None:
+        """Pick the primary/hedge pair: the first two providers whose circuits admit
+        calls, and take the primary's admission.
+
+        Returns ``None`` when hedging cannot apply (fewer than two available
+        providers, no latency estimate for the primary yet, or too little of the
+        request deadline left to send a hedge).
+        """
+        assert self.hedge_policy is not None
+        self.hedge_policy.record_request()
+        available = [
+            provider
+            for provider in order
+            if self._breaker(provider.name).allows_requests()
+        ]
+        if len(available) < 2:
+            return None
+        primary, secondary = available[0], available[1]
+        delay = self.hedge_policy.hedge_delay(primary.name)
+        if delay is None:
+            return None
+        # A hedge that could only start after the deadline is never worth sending.
+        deadline = current_deadline()
+        if deadline is not None and not deadline.allows(delay):
+            return None
+        primary_permit = self._breaker(primary.name).try_acquire()
+        if primary_permit is None:
+            return None
+        last_error: ProviderError | None = None
+        for provider in order[: order.index(primary)]:
+            last_error = last_error or self._circuit_skip_error(provider)
+        remaining = [
+            provider
+            for provider in order[order.index(primary) + 1 :]
+            if provider is not secondary
+        ]
+        return _HedgePlan(
+            primary=primary,
+            secondary=secondary,
+            delay=delay,
+            remaining=remaining,
+            last_error=last_error,
+            primary_permit=primary_permit,
+        )
+
+    def _hedge_permit(
+        self, primary: Provider, secondary: Provider
+    ) -> CircuitPermit | None:
+        """Admit a hedge to ``secondary``, or ``None`` when it should not be sent."""
+        assert self.hedge_policy is not None
+        permit = self._breaker(secondary.name).try_acquire()
+        if permit is None:
+            return None
+        if not self.hedge_policy.try_acquire():
+            self._breaker(secondary.name).release(permit)
+            self.telemetry.increment(provider=primary.name, event="hedge_budget_exhausted")
+            return None
+        self.telemetry.increment(provider=secondary.name, event="hedge_sent")
+        return permit
+
+    def _hedge_winner_result(
+        self,
+        *,
+        winner: Provider,
+        primary: Provider,
+        result: ProviderResult,
+        latency_seconds: float,
+        last_error: ProviderError | None,
+        lead_name: str,
+    ) -> RoutingResult:
+        self._record_latency(winner, latency_seconds)
+        if winner is not primary:
+            self.telemetry.increment(provider=winner.name, event="hedge_won")
+            last_error = last_error or ProviderError(
+                primary.name,
+                "timeout",
+                f"Provider '{primary.name}' was slower than its hedge",
+            )
+        return self._routing_result(winner, result, last_error, lead_name=lead_name)
+
+    def _get_hedge_executor(self) -> ThreadPoolExecutor | None:
+        with self._hedge_lock:
+            if self._hedge_threads_unavailable:
+                return None
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=self.hedge_max_workers,
+                    thread_name_prefix="immcad-provider-hedge",
+                )
+            return self._hedge_executor
+
+    def _submit_hedge_call(
+        self,
+        invoke: Callable[[Provider], ProviderResult],
+        provider: Provider,
+    ) -> Future[ProviderResult] | None:
+        executor = self._get_hedge_executor()
+        if executor is None:
+            return None
+        try:
+            return executor.submit(copy_context().run, invoke, provider)
+        except RuntimeError:
+            # Threadless runtimes cannot start workers; route without hedging.
+            with self._hedge_lock:
+                self._hedge_threads_unavailable = True
+            return None
+
+    def _route_hedged(self, invoke: Callable[[Provider], ProviderResult]) -> RoutingResult:
+        order = self._attempt_order()
+        lead_name = order[0].name
+        plan = self._hedge_plan(order)
+        if plan is None:
+            return self._route(invoke, providers=order)
+        primary, secondary, delay = plan.primary, plan.secondary, plan.delay
+        remaining, last_error = plan.remaining, plan.last_error
+        primary_started = Event()
+        primary_started_at: list[float] = []
+
+        def invoke_primary(provider: Provider) -> ProviderResult:
+            primary_started_at.append(time.perf_counter())
+            primary_started.set()
+            return invoke(provider)
+
+        primary_future = self._submit_hedge_call(invoke_primary, primary)
+        if primary_future is None:
+            self._breaker(primary.name).release(plan.primary_permit)
+            return self._route(invoke, providers=order)
+        # The hedge delay is measured from when a worker picks the primary up, so
+        # time queued behind other calls never fires a hedge. A primary still
+        # queued after a whole delay runs on this thread, unhedged, instead.
+        if not primary_started.wait(delay) and primary_future.cancel():
+            self._breaker(primary.name).release(plan.primary_permit)
+            self.telemetry.increment(provider=primary.name, event="hedge_pool_saturated")
+            return self._route(invoke, providers=order)
+        primary_started.wait()
+
+        started_at = primary_started_at[0]
+        calls: dict[Future[ProviderResult], tuple[Provider, float, CircuitPermit]] = {
+            primary_future: (primary, started_at, plan.primary_permit)
+        }
+        done, _ = wait(calls, timeout=max(0.0, delay - (time.perf_counter() - started_at)))
+        hedge_future = None
+        hedge_permit = None if done else self._hedge_permit(primary, secondary)
+        if hedge_permit is not None:
+            hedge_future = self._submit_hedge_call(invoke, secondary)
+            if hedge_future is None:
+                self._breaker(secondary.name).release(hedge_permit)
+        if hedge_future is None or hedge_permit is None:
+            remaining = [secondary, *remaining]
+        else:
+            calls[hedge_future] = (secondary, time.perf_counter(), hedge_permit)
+
+        pending = set(calls)
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    provider, started, permit = calls[future]
+                    try:
+                        result = future.result()
+                    except ProviderError as exc:
+                        self._record_error(provider, exc, permit)
+                        last_error = exc
+                        continue
+                    now = time.perf_counter()
+                    for loser in pending:
+                        # The loser keeps running on its worker; its elapsed time so
+                        # far is a lower bound that keeps the percentile honest.
+                        loser_provider, loser_started, _ = calls[loser]
+                        self._record_latency(loser_provider, now - loser_started)
+                    return self._hedge_winner_result(
+                        winner=provider,
+                        primary=primary,
+                        result=result,
+                        latency_seconds=now - started,
+                        last_error=last_error,
+                        lead_name=lead_name,
+                    )
+        finally:
+            # Abandoned calls give back their breaker admission.
+            for future in pending:
+                loser_provider, _, loser_permit = calls[future]
+                self._breaker(loser_provider.name).release(loser_permit)
+        return self._route(
+            invoke, providers=remaining, last_error=last_error, lead_name=lead_name
+        )
+
+    async def _route_hedged_async(
+        self, invoke: Callable[[Provider], Awaitable[ProviderResult]]
+    ) -> RoutingResult:
+        order = self._attempt_order()
+        lead_name = order[0].name
+        plan = self._hedge_plan(order)
+        if plan is None:
+            return await self._route_async(invoke, order)
+        primary, secondary = plan.primary, plan.secondary
+        remaining, last_error = plan.remaining, plan.last_error
+
+        calls: dict[
+            asyncio.Task[ProviderResult], tuple[Provider, float, CircuitPermit]
+        ] = {
+            asyncio.ensure_future(invoke(primary)): (
+                primary,
+                time.perf_counter(),
+                plan.primary_permit,
+            )
+        }
+        pending = set(calls)
+        try:
+            done, _ = await asyncio.wait(pending, timeout=plan.delay)
+            hedge_permit = None if done else self._hedge_permit(primary, secondary)
+            if hedge_permit is not None:
+                hedge_task = asyncio.ensure_future(invoke(secondary))
+                calls[hedge_task] = (secondary, time.perf_counter(), hedge_permit)
+                pending.add(hedge_task)
+            else:
+                remaining = [secondary, *remaining]
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    provider, started, permit = calls[task]
+                    try:
+                        result = task.result()
+                    except ProviderError as exc:
+                        self._record_error(provider, exc, permit)
+                        last_error = exc
+                        continue
+                    now = time.perf_counter()
+                    for loser in pending:
+                        loser_provider, loser_started, _ = calls[loser]
+                        self._record_latency(loser_provider, now - loser_started)
+                    return self._hedge_winner_result(
+                        winner=provider,
+                        primary=primary,
+                        result=result,
+                        latency_seconds=now - started,
+                        last_error=last_error,
+                        lead_name=lead_name,
+                    )
+        finally:
+            for task in pending:
+                task.cancel()
+                loser_provider, _, loser_permit = calls[task]
+                self._breaker(loser_provider.name).release(loser_permit)
+        return await self._route_async(
+            invoke, remaining, last_error=last_error, lead_name=lead_name
+        )
+
+    def _deadline_expired(self, provider: Provider) -> bool:
+        deadline = current_deadline()
+        if deadline is None or not deadline.expired():
+            return False
+        self.telemetry.increment(provider=provider.name, event="deadline_skip")
+        return True
+
+    @staticmethod
+    def _deadline_error(last_error: ProviderError | None) -> ProviderError:
+        # Keep the provider failure that used up the budget when there is one.
+        if last_error is not None and last_error.code == "timeout":
+            return last_error
+        return ProviderError("router", "timeout", "Request deadline exceeded")
+
+    def _circuit_skip_error(self, provider: Provider) -> ProviderError:
+        self.telemetry.increment(provider=provider.name, event="circuit_skip")
+        return ProviderError(
+            provider.name,
+            "provider_error",
+            f"Circuit breaker open for provider '{provider.name}'",
+        )
+
+    def _routing_result(
+        self,
+        provider: Provider,
+        result: ProviderResult,
+        last_error: ProviderError | None,
+        *,
+        lead_name: str,
+    ) -> RoutingResult:
+        # With adaptive ordering the lead can differ from the configured primary;
+        # answering from the lead is not a fallback.
+        fallback_used = provider.name != lead_name
+        fallback_reason = last_error.code if fallback_used and last_error else None
+        self._record_success(provider.name, fallback_used=fallback_used)
+        if result.prompt_tokens is not None:
+            self.telemetry.record_prompt_tokens(
+                provider=provider.name, tokens=result.prompt_tokens
+            )
+        if result.cached_prompt_tokens is not None:
+            self.telemetry.record_cached_prompt_tokens(
+                provider=provider.name, tokens=result.cached_prompt_tokens
+            )
+        return RoutingResult(
+            result=result,
+            fallback_used=fallback_used,
+            fallback_reason=fallback_reason,
+        )
 
+    @staticmethod
+    def _exhausted_error(last_error: ProviderError | None) -> ProviderError:
         if last_error:
-            raise last_error
-        raise ProviderError("router", "provider_error", "No provider returned a response")
+            return last_error
+        return ProviderError("router", "provider_error", "No provider returned a response")
@@ -21,3 +21,8 @@ class ScaffoldProvider:
             citations=citations,
             confidence="low",
         )
+
+    async def generate_async(
+        self, *, message: str, citations: list[Citation], locale: str
+    ) -> ProviderResult:
+        return self.generate(message=message, citations=citations, locale=locale)
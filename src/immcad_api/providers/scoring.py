@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from threading import Lock
+from typing import Sequence
+
+from immcad_api.providers.base import Provider
+
+
+@dataclass
+class _ProviderScore:
+    latency_seconds: float | None = None
+    error_rate: float = 0.0
+    samples: int = 0
+
+
+class ProviderScoreboard:
+    """Rolling latency/error estimates used to order ``ProviderRouter`` attempts.
+
+    Each provider and model pair keeps exponentially weighted averages of
+    successful-call latency and of its failure rate, so a provider reconfigured to
+    another model is measured afresh instead of inheriting the old model's history.
+    A provider is ranked by the estimate for its current ``model``; fallback models
+    it serves internally are counted against that model, since the router cannot
+    pick them. The score is ``latency * (1 + error_penalty * error_rate)``
+    (lower is better). The leading provider only changes when a challenger scores
+    at least ``switch_margin`` better, so near-ties do not flap. Every
+    ``explore_interval`` orderings the runner-up goes first once, keeping its
+    estimate fresh while the leader serves everything else.
+    """
+
+    def __init__(
+        self,
+        *,
+        smoothing: float = 0.2,
+        min_samples: int = 10,
+        switch_margin: float = 0.2,
+        error_penalty: float = 4.0,
+        explore_interval: int = 50,
+    ) -> None:
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be > 0 and <= 1")
+        if min_samples < 1:
+            raise ValueError("min_samples must be >= 1")
+        if not 0 <= switch_margin < 1:
+            raise ValueError("switch_margin must be >= 0 and < 1")
+        if error_penalty < 0:
+            raise ValueError("error_penalty must be >= 0")
+        if explore_interval < 2:
+            raise ValueError("explore_interval must be >= 2")
+        self.smoothing = smoothing
+        self.min_samples = min_samples
+        self.switch_margin = switch_margin
+        self.error_penalty = error_penalty
+        self.explore_interval = explore_interval
+        self._lock = Lock()
+        self._scores: dict[tuple[str, str | None], _ProviderScore] = {}
+        self._current_models: dict[str, str | None] = {}
+        self._leader: str | None = None
+        self._leader_switches = 0
+        self._orderings = 0
+
+    def _key(self, provider: Provider) -> tuple[str, str | None]:
+        model = getattr(provider, "model", None) or None
+        self._current_models[provider.name] = model
+        return provider.name, model
+
+    def _entry(self, provider: Provider) -> _ProviderScore:
+        key = self._key(provider)
+        entry = self._scores.get(key)
+        if entry is None:
+            entry = _ProviderScore()
+            self._scores[key] = entry
+        return entry
+
+    def record_latency(self, provider: Provider, latency_seconds: float) -> None:
+        latency_seconds = max(0.0, latency_seconds)
+        with self._lock:
+            entry = self._entry(provider)
+            if entry.latency_seconds is None:
+                entry.latency_seconds = latency_seconds
+            else:
+                entry.latency_seconds += self.smoothing * (
+                    latency_seconds - entry.latency_seconds
+                )
+            entry.error_rate -= self.smoothing * entry.error_rate
+            entry.samples += 1
+
+    def record_failure(self, provider: Provider) -> None:
+        with self._lock:
+            entry = self._entry(provider)
+            entry.error_rate += self.smoothing * (1.0 - entry.error_rate)
+            entry.samples += 1
+
+    def _score(self, key: tuple[str, str | None]) -> float | None:
+        entry = self._scores.get(key)
+        if entry is None or entry.samples < self.min_samples:
+            return None
+        if entry.latency_seconds is None:
+            # Only failures observed so far: rank behind every provider that succeeded.
+            return float("inf")
+        return entry.latency_seconds * (1.0 + self.error_penalty * entry.error_rate)
+
+    def order(self, providers: Sequence[Provider]) -> list[Provider]:
+        """Return ``providers`` in attempt order, leader first."""
+        if len(providers) < 2:
+            return list(providers)
+        static_index = {provider.name: index for index, provider in enumerate(providers)}
+        with self._lock:
+            scores = {
+                provider.name: self._score(self._key(provider)) for provider in providers
+            }
+            if self._leader not in static_index:
+                self._leader = providers[0].name
+            leader_score = scores[self._leader]
+            scored = [name for name, score in scores.items() if score is not None]
+            # The leader keeps its place until it has been measured and a challenger
+            # beats it by the hysteresis margin.
+            if scored and leader_score is not None:
+                best = min(scored, key=lambda name: (scores[name], static_index[name]))
+                if best != self._leader and scores[best] < leader_score * (
+                    1.0 - self.switch_margin
+                ):
+                    self._leader = best
+                    self._leader_switches += 1
+            self._orderings += 1
+            explore = self._orderings % self.explore_interval == 0
+            leader = self._leader
+
+        def rank(provider: Provider) -> tuple[bool, float, int]:
+            score = scores[provider.name]
+            return (score is None, score or 0.0, static_index[provider.name])
+
+        ordered = sorted(
+            (provider for provider in providers if provider.name != leader), key=rank
+        )
+        leading = [provider for provider in providers if provider.name == leader]
+        if explore:
+            # Unscored challengers rank last but are still explored, otherwise a
+            # provider that never gets traffic would never be sampled.
+            return [ordered[0], *leading, *ordered[1:]]
+        return [*leading, *ordered]
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "leader": self._leader,
+                "leader_switches": self._leader_switches,
+                "switch_margin": self.switch_margin,
+                "providers": {
+                    name: self._entry_snapshot((name, model))
+                    for name, model in self._current_models.items()
+                },
+            }
+
+    def _entry_snapshot(self, key: tuple[str, str | None]) -> dict[str, object]:
+        entry = self._scores.get(key) or _ProviderScore()
+        score = self._score(key)
+        return {
+            "model": key[1],
+            "latency_ewma_ms": (
+                round(entry.latency_seconds * 1000.0, 2)
+                if entry.latency_seconds is not None
+                else None
+            ),
+            "error_rate": round(entry.error_rate, 4),
+            "samples": entry.samples,
+            "score": round(score, 6) if score is not None and score != float("inf") else None,
+        }
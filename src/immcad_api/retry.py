@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import random
+from threading import Lock
+import time
+from typing import Awaitable, Callable, TypeVar
+
+from immcad_api.deadline import deadline_allows
+
+T = TypeVar("T")
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    if value is None or not value.strip():
+        return None
+    raw_value = value.strip()
+    try:
+        return max(float(raw_value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(raw_value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def retry_after_from_exception(exc: BaseException) -> float | None:
+    """Read ``Retry-After`` from the HTTP response attached to an SDK exception."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    get_header = getattr(headers, "get", None)
+    if not callable(get_header):
+        return None
+    value = get_header("retry-after") or get_header("Retry-After")
+    return parse_retry_after(value) if isinstance(value, str) else None
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How many times and how long to wait between attempts of one call.
+
+    Delays grow exponentially from ``base_delay_seconds`` up to
+    ``max_delay_seconds`` with full jitter, so callers that failed together do
+    not retry together.
+    """
+
+    max_retries: int
+    base_delay_seconds: float = 0.4
+    max_delay_seconds: float = 8.0
+    multiplier: float = 2.0
+
+    def __post_init__(self) -> None:
+        if self.max_retries < 0:
+            raise ValueError("max_retries must be >= 0")
+        if self.base_delay_seconds < 0:
+            raise ValueError("base_delay_seconds must be >= 0")
+        if self.max_delay_seconds < self.base_delay_seconds:
+            raise ValueError("max_delay_seconds must be >= base_delay_seconds")
+        if self.multiplier < 1:
+            raise ValueError("multiplier must be >= 1")
+
+    def backoff_seconds(
+        self, retry_number: int, *, random_fn: Callable[[], float] = random.random
+    ) -> float:
+        """Jittered delay before retry ``retry_number`` (1 for the first retry)."""
+        ceiling = min(
+            self.max_delay_seconds,
+            self.base_delay_seconds * self.multiplier ** max(retry_number - 1, 0),
+        )
+        return ceiling * random_fn()
+
+
+class RetryBudget:
+    """Token bucket that caps retries to a fraction of the calls to one dependency.
+
+    Every call deposits ``retry_ratio`` tokens, up to ``max_tokens``, and every
+    retry spends one. The bucket starts full so occasional failures on a quiet
+    service are still retried; during an incident, retries stop once they exceed
+    ``retry_ratio`` of traffic instead of multiplying the load.
+    """
+
+    def __init__(self, *, retry_ratio: float = 0.2, max_tokens: float = 10.0) -> None:
+        if not 0 <= retry_ratio <= 1:
+            raise ValueError("retry_ratio must be between 0 and 1")
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be >= 1")
+        self.retry_ratio = retry_ratio
+        self.max_tokens = max_tokens
+        self._lock = Lock()
+        self._tokens = max_tokens
+        self._calls = 0
+        self._retries = 0
+        self._retries_denied = 0
+
+    def record_call(self) -> None:
+        with self._lock:
+            self._calls += 1
+            self._tokens = min(self.max_tokens, self._tokens + self.retry_ratio)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1.0:
+                self._retries_denied += 1
+                return False
+            self._tokens -= 1.0
+            self._retries += 1
+            return True
+
+    def snapshot(self) -> dict[str, float | int]:
+        with self._lock:
+            return {
+                "tokens": round(self._tokens, 3),
+                "max_tokens": self.max_tokens,
+                "retry_ratio": self.retry_ratio,
+                "calls": self._calls,
+                "retries": self._retries,
+                "retries_denied": self._retries_denied,
+            }
+
+
+class RetryBudgetRegistry:
+    """One ``RetryBudget`` per dependency name, created on first use."""
+
+    def __init__(self, *, retry_ratio: float = 0.2, max_tokens: float = 10.0) -> None:
+        # Validate once up front rather than on the first dependency lookup.
+        RetryBudget(retry_ratio=retry_ratio, max_tokens=max_tokens)
+        self.retry_ratio = retry_ratio
+        self.max_tokens = max_tokens
+        self._lock = Lock()
+        self._budgets: dict[str, RetryBudget] = {}
+
+    def get(self, dependency: str) -> RetryBudget:
+        with self._lock:
+            budget = self._budgets.get(dependency)
+            if budget is None:
+                budget = RetryBudget(
+                    retry_ratio=self.retry_ratio, max_tokens=self.max_tokens
+                )
+                self._budgets[dependency] = budget
+            return budget
+
+    def snapshot(self) -> dict[str, dict[str, float | int]]:
+        with self._lock:
+            budgets = dict(self._budgets)
+        return {name: budget.snapshot() for name, budget in budgets.items()}
+
+
+def _same_error(exc: Exception) -> Exception:
+    return exc
+
+
+class Retrier:
+    """Runs a call under a ``RetryPolicy``, an optional ``RetryBudget`` and the request deadline.
+
+    A failed attempt is retried only while retries remain, the budget has a
+    token, and the jittered delay (or a longer ``retry_after_seconds`` carried by
+    the error) still fits the current request deadline. A ``Retry-After`` longer
+    than the policy's ``max_delay_seconds`` ends the call instead of waiting.
+    ``call_async`` waits with ``asyncio.sleep`` so the event loop keeps serving.
+    """
+
+    def __init__(
+        self,
+        policy: RetryPolicy,
+        *,
+        budget: RetryBudget | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+        async_sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        random_fn: Callable[[], float] = random.random,
+    ) -> None:
+        self.policy = policy
+        self.budget = budget
+        self._sleep = sleep
+        self._async_sleep = async_sleep
+        self._random_fn = random_fn
+
+    def record_call(self) -> None:
+        if self.budget is not None:
+            self.budget.record_call()
+
+    def next_delay(self, retry_number: int, error: BaseException) -> float | None:
+        """Seconds to wait before retry ``retry_number``, or ``None`` to give up."""
+        if retry_number > self.policy.max_retries:
+            return None
+        delay = self.policy.backoff_seconds(retry_number, random_fn=self._random_fn)
+        retry_after = getattr(error, "retry_after_seconds", None)
+        if isinstance(retry_after, (int, float)):
+            if retry_after > self.policy.max_delay_seconds:
+                return None
+            delay = max(delay, float(retry_after))
+        if not deadline_allows(delay):
+            return None
+        if self.budget is not None and not self.budget.try_spend():
+            return None
+        return delay
+
+    def sleep(self, delay: float) -> None:
+        if delay > 0:
+            self._sleep(delay)
+
+    async def sleep_async(self, delay: float) -> None:
+        if delay > 0:
+            await self._async_sleep(delay)
+
+    def call(
+        self,
+        attempt: Callable[[], T],
+        *,
+        on_error: Callable[[Exception], Exception] = _same_error,
+    ) -> T:
+        """Run ``attempt`` until it succeeds or retrying stops.
+
+        ``on_error`` maps a failure to the error that is retried and finally
+        raised; it may raise itself to stop retrying at once.
+        """
+        self.record_call()
+        retry_number = 0
+        while True:
+            try:
+                return attempt()
+            except Exception as exc:
+                error = on_error(exc)
+            retry_number += 1
+            delay = self.next_delay(retry_number, error)
+            if delay is None:
+                raise error
+            self.sleep(delay)
+
+    async def call_async(
+        self,
+        attempt: Callable[[], Awaitable[T]],
+        *,
+        on_error: Callable[[Exception], Exception] = _same_error,
+    ) -> T:
+        self.record_call()
+        retry_number = 0
+        while True:
+            try:
+                return await attempt()
+            except Exception as exc:
+                error = on_error(exc)
+            retry_number += 1
+            delay = self.next_delay(retry_number, error)
+            if delay is None:
+                raise error
+            await self.sleep_async(delay)
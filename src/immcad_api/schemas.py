@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import date
 from typing import Literal
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator, model_validator
 
 
 Confidence = Literal["low", "medium", "high"]
@@ -55,6 +55,10 @@ class ChatRequest(BaseModel):
 
 
 class Citation(BaseModel):
+    # Immutable so grounding catalogs can hand the same instances to every
+    # request instead of copying them.
+    model_config = ConfigDict(frozen=True)
+
     source_id: str
     title: str
     url: str
@@ -82,6 +86,24 @@ class ChatResponse(BaseModel):
     disclaimer: str
     fallback_used: FallbackUsed
     research_preview: ChatResearchPreview | None = None
+    # Optional retrieval stages not run for this answer (load brownout or deadline).
+    skipped_stages: list[str] = Field(default_factory=list)
+
+
+class ChatBatchRequest(BaseModel):
+    items: list[ChatRequest] = Field(min_length=1, max_length=100)
+
+
+class ChatBatchItemResult(BaseModel):
+    index: int = Field(ge=0)
+    response: ChatResponse | None = None
+    error: ErrorBody | None = None
+
+
+class ChatBatchResponse(BaseModel):
+    results: list[ChatBatchItemResult]
+    succeeded: int = Field(ge=0)
+    failed: int = Field(ge=0)
 
 
 class CaseSearchRequest(BaseModel):
@@ -485,5 +507,7 @@ class ErrorEnvelope(BaseModel):
 
 ChatResearchPreview.model_rebuild()
 ChatResponse.model_rebuild()
+ChatBatchItemResult.model_rebuild()
+ChatBatchResponse.model_rebuild()
 DocumentReadinessResponse.model_rebuild()
 DocumentPackageResponse.model_rebuild()
@@ -1,3 +1,9 @@
+from immcad_api.services.answer_cache import (
+    ChatAnswerCache,
+    SourceCatalogVersionTracker,
+    build_answer_cache,
+    source_catalog_version,
+)
 from immcad_api.services.case_document_resolver import (
     resolve_pdf_status,
     resolve_pdf_status_with_reason,
@@ -15,14 +21,23 @@ from immcad_api.services.document_package_service import DocumentPackageService
 from immcad_api.services.chat_service import ChatService
 from immcad_api.services.grounding import (
     GroundingAdapter,
+    HybridGroundingAdapter,
     KeywordGroundingAdapter,
+    SectionIndexGroundingAdapter,
     StaticGroundingAdapter,
     official_grounding_catalog,
     scaffold_grounded_citations,
 )
 from immcad_api.services.lawyer_case_research_service import LawyerCaseResearchService
+from immcad_api.services.embeddings import HashingEmbedder, build_text_embedder
+from immcad_api.services.section_index import SectionIndex, write_section_index
+from immcad_api.services.section_vectors import SectionVectorIndex, write_section_vectors
 
 __all__ = [
+    "ChatAnswerCache",
+    "SourceCatalogVersionTracker",
+    "build_answer_cache",
+    "source_catalog_version",
     "resolve_pdf_status",
     "resolve_pdf_status_with_reason",
     "CaseSearchService",
@@ -36,8 +51,16 @@ __all__ = [
     "ChatService",
     "LawyerCaseResearchService",
     "GroundingAdapter",
+    "HybridGroundingAdapter",
     "KeywordGroundingAdapter",
+    "SectionIndexGroundingAdapter",
     "StaticGroundingAdapter",
     "official_grounding_catalog",
     "scaffold_grounded_citations",
+    "SectionIndex",
+    "write_section_index",
+    "HashingEmbedder",
+    "build_text_embedder",
+    "SectionVectorIndex",
+    "write_section_vectors",
 ]
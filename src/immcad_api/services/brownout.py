@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+from threading import Lock
+import time
+from typing import Callable
+
+from immcad_api.telemetry import RequestMetrics
+
+
+class BrownoutController:
+    """Load-driven level that tells the chat service which optional stages to skip.
+
+    Three pressure signals are compared with their limits: event-loop lag, the
+    retrieval threadpool queue depth and the recent p95 API latency recorded in
+    ``RequestMetrics``. Signals are re-evaluated at most once per
+    ``evaluation_interval_seconds``. Each evaluation raises the level by one while
+    any signal is over its limit and lowers it by one once every signal is below
+    ``recovery_ratio`` of its limit; in between, the level holds. Level 0 means no
+    brownout and ``max_level`` disables every optional stage.
+    """
+
+    def __init__(
+        self,
+        *,
+        request_metrics: RequestMetrics | None = None,
+        queue_depth_fn: Callable[[], int] | None = None,
+        max_event_loop_lag_seconds: float = 0.25,
+        max_queue_depth: int = 16,
+        max_p95_latency_ms: float = 10000.0,
+        latency_window: int = 200,
+        min_latency_samples: int = 20,
+        recovery_ratio: float = 0.5,
+        evaluation_interval_seconds: float = 1.0,
+        max_level: int = 2,
+        time_fn: Callable[[], float] | None = None,
+    ) -> None:
+        if max_event_loop_lag_seconds <= 0:
+            raise ValueError("max_event_loop_lag_seconds must be > 0")
+        if max_queue_depth < 1:
+            raise ValueError("max_queue_depth must be >= 1")
+        if max_p95_latency_ms <= 0:
+            raise ValueError("max_p95_latency_ms must be > 0")
+        if latency_window < 1:
+            raise ValueError("latency_window must be >= 1")
+        if min_latency_samples < 1:
+            raise ValueError("min_latency_samples must be >= 1")
+        if not 0 < recovery_ratio < 1:
+            raise ValueError("recovery_ratio must be > 0 and < 1")
+        if evaluation_interval_seconds < 0:
+            raise ValueError("evaluation_interval_seconds must be >= 0")
+        if max_level < 1:
+            raise ValueError("max_level must be >= 1")
+        self.request_metrics = request_metrics
+        self.queue_depth_fn = queue_depth_fn
+        self.max_event_loop_lag_seconds = max_event_loop_lag_seconds
+        self.max_queue_depth = max_queue_depth
+        self.max_p95_latency_ms = max_p95_latency_ms
+        self.latency_window = latency_window
+        self.min_latency_samples = min_latency_samples
+        self.recovery_ratio = recovery_ratio
+        self.evaluation_interval_seconds = evaluation_interval_seconds
+        self.max_level = max_level
+        self._time_fn = time_fn or time.monotonic
+        self._lock = Lock()
+        self._level = 0
+        self._evaluated_at: float | None = None
+        # Worst lag observed since the last evaluation, so one spike is seen once.
+        self._pending_event_loop_lag_seconds = 0.0
+        self._signals: dict[str, float] = {
+            "event_loop_lag_ms": 0.0,
+            "queue_depth": 0.0,
+            "latency_p95_ms": 0.0,
+        }
+        self._escalations = 0
+        self._recoveries = 0
+
+    def record_event_loop_lag(self, lag_seconds: float) -> None:
+        with self._lock:
+            self._pending_event_loop_lag_seconds = max(
+                self._pending_event_loop_lag_seconds, lag_seconds
+            )
+
+    async def monitor_event_loop(self, *, interval_seconds: float = 0.25) -> None:
+        """Sample event-loop lag until cancelled; run as a task on the serving loop."""
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be > 0")
+        while True:
+            started_at = time.monotonic()
+            await asyncio.sleep(interval_seconds)
+            self.record_event_loop_lag(
+                max(time.monotonic() - started_at - interval_seconds, 0.0)
+            )
+
+    def _latency_p95_ms(self) -> float | None:
+        if self.request_metrics is None:
+            return None
+        return self.request_metrics.recent_latency_percentile_ms(
+            95.0,
+            window=self.latency_window,
+            min_samples=self.min_latency_samples,
+        )
+
+    def _pressure(self) -> list[float]:
+        """Each signal as a fraction of its limit. Caller holds the lock."""
+        lag_seconds = self._pending_event_loop_lag_seconds
+        self._pending_event_loop_lag_seconds = 0.0
+        queue_depth = self.queue_depth_fn() if self.queue_depth_fn is not None else 0
+        latency_p95_ms = self._latency_p95_ms()
+        self._signals = {
+            "event_loop_lag_ms": lag_seconds * 1000.0,
+            "queue_depth": float(queue_depth),
+            "latency_p95_ms": latency_p95_ms or 0.0,
+        }
+        pressure = [
+            lag_seconds / self.max_event_loop_lag_seconds,
+            queue_depth / self.max_queue_depth,
+        ]
+        if latency_p95_ms is not None:
+            pressure.append(latency_p95_ms / self.max_p95_latency_ms)
+        return pressure
+
+    def level(self) -> int:
+        """Current brownout level, re-evaluating the signals when the interval is up."""
+        now = self._time_fn()
+        with self._lock:
+            if (
+                self._evaluated_at is not None
+                and now - self._evaluated_at < self.evaluation_interval_seconds
+            ):
+                return self._level
+            self._evaluated_at = now
+            pressure = self._pressure()
+            if any(value > 1.0 for value in pressure):
+                if self._level < self.max_level:
+                    self._level += 1
+                    self._escalations += 1
+            elif self._level > 0 and all(
+                value < self.recovery_ratio for value in pressure
+            ):
+                self._level -= 1
+                self._recoveries += 1
+            return self._level
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "level": self._level,
+                "max_level": self.max_level,
+                "escalations": self._escalations,
+                "recoveries": self._recoveries,
+                "signals": dict(self._signals),
+                "limits": {
+                    "event_loop_lag_ms": self.max_event_loop_lag_seconds * 1000.0,
+                    "queue_depth": self.max_queue_depth,
+                    "latency_p95_ms": self.max_p95_latency_ms,
+                },
+            }
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from datetime import date
+import re
+from threading import Lock
+from typing import Protocol
+
+from immcad_api.schemas import CaseSearchRequest, CaseSearchResponse
+
+
+class _CaseSearchProtocol(Protocol):
+    def search(self, request: CaseSearchRequest) -> CaseSearchResponse: ...
+
+
+_MemoKey = tuple[str, str, str, date | None, date | None]
+
+
+def _memo_key(request: CaseSearchRequest) -> _MemoKey:
+    return (
+        re.sub(r"\s+", " ", request.query.strip()),
+        (request.court or "").strip().lower(),
+        request.jurisdiction.strip().lower(),
+        request.decision_date_from,
+        request.decision_date_to,
+    )
+
+
+class RequestCaseSearchContext:
+    """Memoize case-search lookups for the lifetime of a chat turn or chat batch.
+
+    Identical lookups (query, court, jurisdiction, date range) are issued upstream
+    once; a request for a narrower ``limit`` is served by truncating a wider
+    response that is already cached or in flight. Upstream failures are memoized
+    too so repeated lookups in the same turn or batch fail fast instead of
+    re-querying.
+    """
+
+    def __init__(self, case_search_service: _CaseSearchProtocol) -> None:
+        self.case_search_service = case_search_service
+        self._lock = Lock()
+        self._entries: dict[_MemoKey, tuple[int, Future[CaseSearchResponse]]] = {}
+        self.upstream_calls = 0
+        self.memo_hits = 0
+
+    def search(self, request: CaseSearchRequest) -> CaseSearchResponse:
+        key = _memo_key(request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] >= request.limit:
+                self.memo_hits += 1
+                future = entry[1]
+                is_leader = False
+            else:
+                future = Future()
+                self._entries[key] = (request.limit, future)
+                self.upstream_calls += 1
+                is_leader = True
+
+        if is_leader:
+            try:
+                response = self.case_search_service.search(request)
+            except BaseException as exc:
+                future.set_exception(exc)
+                raise
+            future.set_result(response)
+            return response
+
+        response = future.result()
+        return CaseSearchResponse(results=response.results[: request.limit])
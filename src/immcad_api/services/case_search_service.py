@@ -1,26 +1,74 @@
 from __future__ import annotations
 
+from typing import Protocol
+
+from immcad_api.deadline import deadline_expired
 from immcad_api.errors import ApiError, SourceUnavailableError
+from immcad_api.providers.bulkhead import BulkheadFullError, BulkheadRegistry
 from immcad_api.schemas import CaseSearchRequest, CaseSearchResponse
 from immcad_api.sources import CanLIIClient, OfficialCaseLawClient
 
+OFFICIAL_CASE_LAW_BULKHEAD = "official_case_law"
+CANLII_BULKHEAD = "canlii"
+
+
+class _CaseLawSource(Protocol):
+    def search_cases(self, request: CaseSearchRequest) -> CaseSearchResponse: ...
+
 
 class CaseSearchService:
+    """Case-law search over the official sources with a CanLII fallback.
+
+    Source calls run behind the ``official_case_law`` and ``canlii`` bulkheads when
+    ``bulkheads`` defines them; a call shed by a full bulkhead counts as that source
+    being unavailable.
+    """
+
     def __init__(
         self,
         *,
         canlii_client: CanLIIClient | None = None,
         official_client: OfficialCaseLawClient | None = None,
+        bulkheads: BulkheadRegistry | None = None,
     ) -> None:
         self.canlii_client = canlii_client
         self.official_client = official_client
+        self.bulkheads = bulkheads
+
+    def _search_source(
+        self, name: str, client: _CaseLawSource, request: CaseSearchRequest
+    ) -> CaseSearchResponse:
+        bulkhead = self.bulkheads.get(name) if self.bulkheads is not None else None
+        if bulkhead is None:
+            return client.search_cases(request)
+        try:
+            bulkhead.acquire()
+        except BulkheadFullError as exc:
+            raise SourceUnavailableError(
+                "Case-law source is at capacity. Please retry later."
+            ) from exc
+        try:
+            return client.search_cases(request)
+        finally:
+            bulkhead.release()
 
     def search(self, request: CaseSearchRequest) -> CaseSearchResponse:
+        """Search official sources first and fall back to CanLII.
+
+        Under a request deadline each client call gets only the remaining time, and
+        the CanLII fallback is skipped once the deadline has passed.
+        """
+        if deadline_expired():
+            raise SourceUnavailableError(
+                "Request deadline exceeded before case-law sources were queried."
+            )
         official_response: CaseSearchResponse | None = None
         official_error: ApiError | None = None
         if self.official_client is not None:
             try:
-                official_response = self.official_client.search_cases(request)
+                official_response = self._search_source(
+                    OFFICIAL_CASE_LAW_BULKHEAD, self.official_client, request
+                )
             except ApiError as exc:
                 official_error = exc
             except Exception:
@@ -30,12 +78,16 @@ class CaseSearchService:
 
         canlii_response: CaseSearchResponse | None = None
         canlii_error: ApiError | None = None
-        should_query_canlii = self.canlii_client is not None and (
-            official_response is None or not official_response.results
+        should_query_canlii = (
+            self.canlii_client is not None
+            and (official_response is None or not official_response.results)
+            and not deadline_expired()
         )
         if should_query_canlii and self.canlii_client is not None:
             try:
-                canlii_response = self.canlii_client.search_cases(request)
+                canlii_response = self._search_source(
+                    CANLII_BULKHEAD, self.canlii_client, request
+                )
             except ApiError as exc:
                 canlii_error = exc
 
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass, replace
 from datetime import date
 import logging
-import re
-from typing import Protocol, Sequence, cast
+from typing import Awaitable, Callable, Protocol, Sequence, cast
 
+from immcad_api.blocking import run_blocking
+from immcad_api.conversation import (
+    ConversationHistory,
+    conversation_scope,
+    current_conversation,
+)
+from immcad_api.deadline import Deadline, current_deadline, deadline_scope
 from immcad_api.errors import ApiError, ProviderApiError
 from immcad_api.policy.source_policy import SourcePolicy
 from immcad_api.policy.compliance import (
@@ -14,9 +22,9 @@ from immcad_api.policy.compliance import (
     SAFE_CONSTRAINED_RESPONSE,
     enforce_citation_requirement,
     normalize_trusted_domains,
-    should_refuse_for_policy,
 )
-from immcad_api.providers import ProviderError, ProviderRouter
+from immcad_api.policy.message_analysis import DEFAULT_MESSAGE_ANALYZER, MessageAnalyzer
+from immcad_api.providers import ProviderError, ProviderRouter, RoutingResult
 from immcad_api.schemas import (
     CaseSearchRequest,
     CaseSearchResponse,
@@ -29,28 +37,22 @@ from immcad_api.schemas import (
     LawyerCaseResearchRequest,
     LawyerCaseResearchResponse,
 )
+from immcad_api.services.answer_cache import CachedAnswer, ChatAnswerCache
+from immcad_api.services.brownout import BrownoutController
+from immcad_api.services.case_search_context import RequestCaseSearchContext
+from immcad_api.services.precomputed_answers import PrecomputedAnswerStore
+from immcad_api.services.request_coalescing import RequestCoalescer
 from immcad_api.services.grounding import GroundingAdapter, StaticGroundingAdapter
+from immcad_api.services.retrieval_fanout import (
+    RetrievalFanout,
+    RetrievalStage,
+    RetrievalStageOutcome,
+)
+from immcad_api.services.session_memory import SessionMemoryStore
 
 
+LOGGER = logging.getLogger(__name__)
 AUDIT_LOGGER = logging.getLogger("immcad_api.audit")
-_CASE_SEARCH_TOOL_PATTERN = re.compile(
-    r"\b(case law|precedent|judg(?:e)?ment|decision|ruling|canlii|"
-    r"supreme court|federal court|court of appeal)\b",
-    re.IGNORECASE,
-)
-_LEGAL_TOPIC_PATTERN = re.compile(
-    r"\b(irpa|irpr|lipr|immigration|citizenship|citoyennet|visa|permit|permis|"
-    r"application|demande|inadmissib|refugee|refugi|appeal|appel|hearing|audience|"
-    r"court|cour|case|dossier|ircc|express entry|judicial review|"
-    r"sponsorship|parrainage|permanent resident|resident permanent|pr card|"
-    r"lawyer|avocat|rcic)\b",
-    re.IGNORECASE,
-)
-_GREETING_PHRASE_PATTERN = re.compile(
-    r"^(hi|hello|hey|hiya|greetings|good morning|good afternoon|good evening|"
-    r"bonjour|salut|bonsoir)\b",
-    re.IGNORECASE,
-)
 _FRIENDLY_GREETING_RESPONSES = {
     "en-CA": (
         "Hi! I can help with Canadian immigration and citizenship information. "
@@ -63,6 +65,18 @@ _FRIENDLY_GREETING_RESPONSES = {
     ),
 }
 _INSUFFICIENT_CONTEXT_FALLBACK_REASON = "insufficient_context"
+_CASE_SEARCH_STAGE = "case_search"
+_RESEARCH_PREVIEW_STAGE = "research_preview"
+# Audit event and tool name reported when a retrieval stage is dropped.
+_STAGE_ERROR_EVENTS = {
+    _CASE_SEARCH_STAGE: ("case_search_tool_error", "case_search"),
+    _RESEARCH_PREVIEW_STAGE: ("lawyer_research_preview_error", "lawyer_research"),
+}
+# Retrieval stages are skipped rather than started with less time than this.
+_MIN_RETRIEVAL_STAGE_SECONDS = 0.5
+# Optional stages in the order a brownout turns them off: each brownout level
+# disables one more, the most expensive first.
+_BROWNOUT_STAGE_ORDER = (_RESEARCH_PREVIEW_STAGE, _CASE_SEARCH_STAGE)
 
 
 def is_friendly_greeting_answer(answer: str) -> bool:
@@ -83,10 +97,23 @@ class CaseSearchTool(Protocol):
 
 class LawyerResearchTool(Protocol):
     def research(
-        self, request: LawyerCaseResearchRequest
+        self,
+        request: LawyerCaseResearchRequest,
+        *,
+        case_search_service: CaseSearchTool | None = None,
     ) -> LawyerCaseResearchResponse: ...
 
 
+def _batch_item_trace_id(trace_id: str | None, index: int) -> str | None:
+    return f"{trace_id}:{index}" if trace_id else None
+
+
+def _session_key(request: ChatRequest, client_id: str | None) -> str:
+    # Session ids come from the client; scoping them to the caller's identity keeps
+    # one client from reading or extending another client's history.
+    return f"{client_id}:{request.session_id}" if client_id else request.session_id
+
+
 def _extract_rejected_citation_urls(citations: Sequence[object]) -> tuple[str, ...]:
     urls: list[str] = []
     for citation in citations:
@@ -102,6 +129,20 @@ def _extract_rejected_citation_urls(citations: Sequence[object]) -> tuple[str, .
     return tuple(urls)
 
 
+@dataclass(frozen=True)
+class _RetrievalPlan:
+    stages: list[RetrievalStage]
+    skipped_stages: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class _PreparedChatTurn:
+    citations: list[Citation]
+    research_preview: ChatResearchPreview | None
+    cache_key: str | None
+    skipped_stages: tuple[str, ...] = ()
+
+
 class ChatService:
     def __init__(
         self,
@@ -114,11 +155,27 @@ class ChatService:
         case_search_tool_limit: int = 3,
         lawyer_research_service: LawyerResearchTool | None = None,
         research_preview_limit: int = 3,
+        case_search_tool_timeout_seconds: float = 6.0,
+        research_preview_timeout_seconds: float = 8.0,
+        retrieval_fanout: RetrievalFanout | None = None,
+        answer_cache: ChatAnswerCache | None = None,
+        message_analyzer: MessageAnalyzer | None = None,
+        request_coalescer: RequestCoalescer[ChatResponse] | None = None,
+        deadline_reserve_seconds: float = 4.0,
+        brownout_controller: BrownoutController | None = None,
+        precomputed_answers: PrecomputedAnswerStore | None = None,
+        session_memory: SessionMemoryStore | None = None,
     ) -> None:
         if case_search_tool_limit < 1:
             raise ValueError("case_search_tool_limit must be >= 1")
         if research_preview_limit < 1:
             raise ValueError("research_preview_limit must be >= 1")
+        if case_search_tool_timeout_seconds <= 0:
+            raise ValueError("case_search_tool_timeout_seconds must be > 0")
+        if research_preview_timeout_seconds <= 0:
+            raise ValueError("research_preview_timeout_seconds must be > 0")
+        if deadline_reserve_seconds < 0:
+            raise ValueError("deadline_reserve_seconds must be >= 0")
         self.provider_router = provider_router
         self.grounding_adapter = grounding_adapter or StaticGroundingAdapter()
         self.trusted_citation_domains = normalize_trusted_domains(
@@ -131,49 +188,24 @@ class ChatService:
         self.case_search_tool_limit = case_search_tool_limit
         self.lawyer_research_service = lawyer_research_service
         self.research_preview_limit = research_preview_limit
+        self.case_search_tool_timeout_seconds = case_search_tool_timeout_seconds
+        self.research_preview_timeout_seconds = research_preview_timeout_seconds
+        self.retrieval_fanout = retrieval_fanout or RetrievalFanout()
+        self.answer_cache = answer_cache
+        self.message_analyzer = message_analyzer or DEFAULT_MESSAGE_ANALYZER
+        self.request_coalescer = request_coalescer
+        # Share of a request deadline kept for the provider call; retrieval stages
+        # only get what is left above it.
+        self.deadline_reserve_seconds = deadline_reserve_seconds
+        self.brownout_controller = brownout_controller
+        self.precomputed_answers = precomputed_answers
+        self.session_memory = session_memory
 
     def _should_use_case_search_tool(self, message: str) -> bool:
-        return _CASE_SEARCH_TOOL_PATTERN.search(message) is not None
+        return self.message_analyzer.analyze(message).case_law_intent
 
     def _is_greeting_or_small_talk(self, message: str) -> bool:
-        normalized = re.sub(r"\s+", " ", message.strip().lower())
-        if not normalized:
-            return False
-        if _LEGAL_TOPIC_PATTERN.search(normalized):
-            return False
-
-        compact = re.sub(r"[^a-z0-9 ]+", " ", normalized)
-        compact = re.sub(r"\s+", " ", compact).strip()
-        if not compact:
-            return False
-
-        common_small_talk = {
-            "hi",
-            "hello",
-            "hey",
-            "hiya",
-            "greetings",
-            "good morning",
-            "good afternoon",
-            "good evening",
-            "bonjour",
-            "salut",
-            "bonsoir",
-            "how are you",
-            "how are you doing",
-            "comment ca va",
-            "ca va",
-            "thanks",
-            "thank you",
-            "merci",
-        }
-        if compact in common_small_talk:
-            return True
-
-        if _GREETING_PHRASE_PATTERN.search(compact) and len(compact.split()) <= 6:
-            return True
-
-        return False
+        return self.message_analyzer.analyze(message).is_greeting
 
     def _case_result_to_citation(self, result: CaseSearchResult) -> Citation | None:
         case_url = result.url.strip()
@@ -249,14 +281,16 @@ class ChatService:
         *,
         request: ChatRequest,
         trace_id: str | None,
+        search_context: RequestCaseSearchContext | None = None,
     ) -> list[Citation]:
         if self.case_search_tool is None:
             return []
         if not self._should_use_case_search_tool(request.message):
             return []
 
+        case_search_tool: CaseSearchTool = search_context or self.case_search_tool
         try:
-            case_response = self.case_search_tool.search(
+            case_response = case_search_tool.search(
                 CaseSearchRequest(
                     query=request.message,
                     jurisdiction="ca",
@@ -321,6 +355,7 @@ class ChatService:
         *,
         request: ChatRequest,
         trace_id: str | None,
+        search_context: RequestCaseSearchContext | None = None,
     ) -> ChatResearchPreview | None:
         if self.lawyer_research_service is None:
             return None
@@ -334,7 +369,8 @@ class ChatService:
                     matter_summary=request.message,
                     jurisdiction="ca",
                     limit=self.research_preview_limit,
-                )
+                ),
+                case_search_service=search_context,
             )
         except ApiError as exc:
             self._emit_audit_event(
@@ -375,10 +411,623 @@ class ChatService:
             cases=research_response.cases[: self.research_preview_limit],
         )
 
+    def _retrieval_stages(
+        self,
+        *,
+        request: ChatRequest,
+        trace_id: str | None,
+        search_context: RequestCaseSearchContext | None = None,
+    ) -> list[RetrievalStage]:
+        use_case_tools = self._should_use_case_search_tool(request.message)
+        # Chat case search and the research preview share one memoized context
+        # so overlapping lookups within this turn hit the upstream sources once.
+        if search_context is None or not use_case_tools:
+            search_context = (
+                RequestCaseSearchContext(self.case_search_tool)
+                if self.case_search_tool is not None and use_case_tools
+                else None
+            )
+        stages: list[RetrievalStage] = []
+        if self.case_search_tool is not None and use_case_tools:
+            stages.append(
+                RetrievalStage(
+                    name=_CASE_SEARCH_STAGE,
+                    run=lambda: self._fetch_case_search_citations(
+                        request=request,
+                        trace_id=trace_id,
+                        search_context=search_context,
+                    ),
+                    timeout_seconds=self.case_search_tool_timeout_seconds,
+                )
+            )
+        if self.lawyer_research_service is not None and use_case_tools:
+            stages.append(
+                RetrievalStage(
+                    name=_RESEARCH_PREVIEW_STAGE,
+                    run=lambda: self._build_research_preview(
+                        request=request,
+                        trace_id=trace_id,
+                        search_context=search_context,
+                    ),
+                    timeout_seconds=self.research_preview_timeout_seconds,
+                )
+            )
+        return stages
+
+    def _plan_retrieval(
+        self,
+        *,
+        request: ChatRequest,
+        trace_id: str | None,
+        search_context: RequestCaseSearchContext | None = None,
+    ) -> _RetrievalPlan:
+        """Retrieval stages to run for this turn, minus those load or time rule out."""
+        stages = self._retrieval_stages(
+            request=request, trace_id=trace_id, search_context=search_context
+        )
+        if not stages:
+            return _RetrievalPlan(stages=stages)
+        browned_out = self._browned_out_stages()
+        skipped_stages: list[str] = []
+        planned: list[RetrievalStage] = []
+        for stage in stages:
+            if stage.name in browned_out:
+                self._emit_stage_skipped(
+                    stage.name, reason="brownout", request=request, trace_id=trace_id
+                )
+                skipped_stages.append(stage.name)
+            else:
+                planned.append(stage)
+        fitted = self._fit_stages_to_deadline(
+            planned, request=request, trace_id=trace_id
+        )
+        if len(fitted) < len(planned):
+            skipped_stages.extend(stage.name for stage in planned)
+        return _RetrievalPlan(stages=fitted, skipped_stages=tuple(skipped_stages))
+
+    def _browned_out_stages(self) -> tuple[str, ...]:
+        if self.brownout_controller is None:
+            return ()
+        return _BROWNOUT_STAGE_ORDER[: self.brownout_controller.level()]
+
+    def _emit_stage_skipped(
+        self,
+        stage_name: str,
+        *,
+        reason: str,
+        request: ChatRequest,
+        trace_id: str | None,
+    ) -> None:
+        event_type, tool_name = _STAGE_ERROR_EVENTS[stage_name]
+        self._emit_audit_event(
+            trace_id=trace_id,
+            event_type=event_type,
+            locale=request.locale,
+            mode=request.mode,
+            message_length=len(request.message),
+            tool_name=tool_name,
+            tool_error_code=reason,
+        )
+
+    def _fit_stages_to_deadline(
+        self,
+        stages: list[RetrievalStage],
+        *,
+        request: ChatRequest,
+        trace_id: str | None,
+    ) -> list[RetrievalStage]:
+        deadline = current_deadline()
+        if deadline is None or not stages:
+            return stages
+        budget = deadline.remaining() - self.deadline_reserve_seconds
+        if budget >= _MIN_RETRIEVAL_STAGE_SECONDS:
+            return [
+                replace(stage, timeout_seconds=min(stage.timeout_seconds, budget))
+                for stage in stages
+            ]
+        for stage in stages:
+            self._emit_stage_skipped(
+                stage.name, reason="deadline", request=request, trace_id=trace_id
+            )
+        return []
+
+    def _collect_retrieval_outcomes(
+        self,
+        outcomes: Sequence[RetrievalStageOutcome],
+        *,
+        request: ChatRequest,
+        trace_id: str | None,
+    ) -> tuple[list[Citation], ChatResearchPreview | None]:
+        case_search_citations: list[Citation] = []
+        research_preview: ChatResearchPreview | None = None
+        for outcome in outcomes:
+            if outcome.name == _CASE_SEARCH_STAGE:
+                if outcome.timed_out or outcome.shed:
+                    self._emit_audit_event(
+                        trace_id=trace_id,
+                        event_type="case_search_tool_error",
+                        locale=request.locale,
+                        mode=request.mode,
+                        message_length=len(request.message),
+                        tool_name="case_search",
+                        tool_error_code="shed" if outcome.shed else "timeout",
+                    )
+                    continue
+                case_search_citations = cast(list[Citation], outcome.value or [])
+            elif outcome.name == _RESEARCH_PREVIEW_STAGE:
+                if outcome.timed_out or outcome.shed:
+                    self._emit_audit_event(
+                        trace_id=trace_id,
+                        event_type="lawyer_research_preview_error",
+                        locale=request.locale,
+                        mode=request.mode,
+                        message_length=len(request.message),
+                        tool_name="lawyer_research",
+                        tool_error_code="shed" if outcome.shed else "timeout",
+                    )
+                    continue
+                research_preview = cast(ChatResearchPreview | None, outcome.value)
+        return case_search_citations, research_preview
+
+    def _serve_cached_answer(
+        self,
+        *,
+        cache_key: str,
+        request: ChatRequest,
+        citations: list[Citation],
+        research_preview: ChatResearchPreview | None,
+        skipped_stages: tuple[str, ...],
+        trace_id: str | None,
+    ) -> ChatResponse | None:
+        if self.answer_cache is None:
+            return None
+        cached = self.answer_cache.get(cache_key)
+        if cached is None:
+            return None
+        # Re-run the citation gate so a cached answer is never served when the
+        # current grounding or trusted-domain configuration would reject it.
+        answer, validated_citations, confidence = enforce_citation_requirement(
+            cached.answer,
+            cast(list[Citation | dict[str, object] | object], list(cached.citations)),
+            grounded_citations=citations,
+            trusted_domains=self.trusted_citation_domains,
+        )
+        if not validated_citations or answer == SAFE_CONSTRAINED_RESPONSE:
+            self.answer_cache.record_rejected()
+            return None
+        self._emit_audit_event(
+            trace_id=trace_id,
+            event_type="answer_cache_hit",
+            locale=request.locale,
+            mode=request.mode,
+            message_length=len(request.message),
+            provider=cached.provider,
+            candidate_citation_count=len(citations),
+        )
+        return ChatResponse(
+            answer=answer,
+            citations=validated_citations,
+            confidence=confidence,
+            disclaimer=DISCLAIMER_TEXT,
+            fallback_used=FallbackUsed(
+                used=False,
+                provider=None,
+                reason=None,
+            ),
+            research_preview=research_preview,
+            skipped_stages=list(skipped_stages),
+        )
+
+    def _serve_precomputed_answer(
+        self, request: ChatRequest, *, trace_id: str | None
+    ) -> ChatResponse | None:
+        # Stored answers are keyed on the message alone, like the answer cache,
+        # so they only serve turns without session history.
+        if self.precomputed_answers is None or current_conversation() is not None:
+            return None
+        entry = self.precomputed_answers.lookup(
+            message=request.message, locale=request.locale, mode=request.mode
+        )
+        if entry is None:
+            return None
+        # The stored citations were validated offline; re-check them against the
+        # current source policy and trusted domains before answering.
+        citations = self._filter_citations_by_source_policy(
+            citations=list(entry.citations), request=request, trace_id=trace_id
+        )
+        answer, validated_citations, confidence = enforce_citation_requirement(
+            entry.answer,
+            cast(list[Citation | dict[str, object] | object], list(citations)),
+            grounded_citations=citations,
+            trusted_domains=self.trusted_citation_domains,
+        )
+        if not validated_citations or answer == SAFE_CONSTRAINED_RESPONSE:
+            return None
+        self._emit_audit_event(
+            trace_id=trace_id,
+            event_type="precomputed_answer_hit",
+            locale=request.locale,
+            mode=request.mode,
+            message_length=len(request.message),
+            candidate_citation_count=len(citations),
+        )
+        return ChatResponse(
+            answer=answer,
+            citations=validated_citations,
+            confidence=confidence,
+            disclaimer=DISCLAIMER_TEXT,
+            fallback_used=FallbackUsed(used=False, provider=None, reason=None),
+        )
+
     def handle_chat(
-        self, request: ChatRequest, *, trace_id: str | None = None
+        self,
+        request: ChatRequest,
+        *,
+        trace_id: str | None = None,
+        on_answer_delta: Callable[[str], None] | None = None,
+        deadline: Deadline | None = None,
+        client_id: str | None = None,
+    ) -> ChatResponse:
+        """Answer one chat turn.
+
+        ``deadline`` bounds the whole turn: retrieval stages, case-law clients and
+        provider calls each get only the time left, and optional retrieval is
+        skipped when too little remains. ``client_id`` scopes session history to
+        the caller, so guessing another client's ``session_id`` reveals nothing.
+        """
+        with deadline_scope(deadline):
+            return self._handle_chat(
+                request,
+                session_key=_session_key(request, client_id),
+                trace_id=trace_id,
+                on_answer_delta=on_answer_delta,
+            )
+
+    def _session_history(self, session_key: str) -> ConversationHistory | None:
+        if self.session_memory is None:
+            return None
+        return self.session_memory.load(session_key)
+
+    def _remember_turn(
+        self, session_key: str, request: ChatRequest, response: ChatResponse
+    ) -> None:
+        # Only grounded answers become history; refusals, greetings and
+        # constrained fallbacks carry no citations and add nothing to follow-ups.
+        if self.session_memory is None or not response.citations:
+            return
+        self.session_memory.record_turn(
+            session_key, question=request.message, answer=response.answer
+        )
+
+    def _handle_chat(
+        self,
+        request: ChatRequest,
+        *,
+        session_key: str,
+        trace_id: str | None,
+        on_answer_delta: Callable[[str], None] | None,
+    ) -> ChatResponse:
+        with conversation_scope(self._session_history(session_key)):
+            response = self._answer_chat(
+                request, trace_id=trace_id, on_answer_delta=on_answer_delta
+            )
+        self._remember_turn(session_key, request, response)
+        return response
+
+    def _answer_chat(
+        self,
+        request: ChatRequest,
+        *,
+        trace_id: str | None,
+        on_answer_delta: Callable[[str], None] | None,
+    ) -> ChatResponse:
+        early_response = self._early_response(request, trace_id=trace_id)
+        if early_response is not None:
+            return early_response
+
+        # Streamed turns deliver deltas to one caller, and follow-ups depend on
+        # their own session history, so neither is coalesced.
+        if (
+            self.request_coalescer is None
+            or on_answer_delta is not None
+            or current_conversation() is not None
+        ):
+            return self._run_chat_turn(
+                request, trace_id=trace_id, on_answer_delta=on_answer_delta
+            )
+        response, coalesced = self.request_coalescer.run(
+            self._coalescing_key(request),
+            lambda: self._run_chat_turn(request, trace_id=trace_id),
+        )
+        return self._coalesced_response(
+            response, coalesced=coalesced, request=request, trace_id=trace_id
+        )
+
+    def _run_chat_turn(
+        self,
+        request: ChatRequest,
+        *,
+        trace_id: str | None,
+        on_answer_delta: Callable[[str], None] | None = None,
+    ) -> ChatResponse:
+        # Case search and the research preview both call upstream case-law
+        # sources; run them concurrently and merge in the original order.
+        plan = self._plan_retrieval(request=request, trace_id=trace_id)
+        outcomes = self.retrieval_fanout.run(plan.stages) if plan.stages else []
+        prepared = self._prepare_chat_turn(
+            request,
+            outcomes=outcomes,
+            skipped_stages=plan.skipped_stages,
+            trace_id=trace_id,
+        )
+        if isinstance(prepared, ChatResponse):
+            return prepared
+
+        # Streamed deltas are provisional; the returned response stays authoritative
+        # because the citation requirement is only enforced on the full answer.
+        stream_generate = getattr(self.provider_router, "stream_generate", None)
+        try:
+            if on_answer_delta is not None and callable(stream_generate):
+                routed = stream_generate(
+                    message=request.message,
+                    citations=prepared.citations,
+                    locale=request.locale,
+                    on_delta=on_answer_delta,
+                )
+            else:
+                routed = self.provider_router.generate(
+                    message=request.message,
+                    citations=prepared.citations,
+                    locale=request.locale,
+                )
+        except ProviderError as exc:
+            return self._provider_error_response(
+                exc, request=request, prepared=prepared, trace_id=trace_id
+            )
+        return self._complete_chat_turn(
+            request, prepared=prepared, routed=routed, trace_id=trace_id
+        )
+
+    async def handle_chat_async(
+        self,
+        request: ChatRequest,
+        *,
+        trace_id: str | None = None,
+        deadline: Deadline | None = None,
+        client_id: str | None = None,
     ) -> ChatResponse:
-        if should_refuse_for_policy(request.message):
+        session_key = _session_key(request, client_id)
+        with deadline_scope(deadline):
+            history = await run_blocking(self._session_history, session_key)
+            return await self._handle_chat_async(
+                request, session_key=session_key, history=history, trace_id=trace_id
+            )
+
+    async def handle_chat_batch_async(
+        self,
+        requests: Sequence[ChatRequest],
+        *,
+        trace_id: str | None = None,
+        max_concurrency: int = 4,
+        deadline: Deadline | None = None,
+        client_id: str | None = None,
+    ) -> list[ChatResponse | ApiError]:
+        """Answer a batch of chat requests, returning one outcome per request in order.
+
+        Identical items (same normalized message, locale and mode) are answered once
+        and share the response, unless their session has history to follow up on.
+        All items share one case-search memo, so lookups
+        that overlap across the batch reach the upstream sources once. At most
+        ``max_concurrency`` items run at a time, and a failing item yields its
+        ``ApiError`` instead of failing the whole batch. Item ``i`` is audited
+        under ``"<trace_id>:i"``. ``deadline`` bounds the whole batch and
+        ``client_id`` scopes session history as in ``handle_chat``.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        with deadline_scope(deadline):
+            return await self._handle_chat_batch_async(
+                requests,
+                trace_id=trace_id,
+                max_concurrency=max_concurrency,
+                client_id=client_id,
+            )
+
+    async def _handle_chat_batch_async(
+        self,
+        requests: Sequence[ChatRequest],
+        *,
+        trace_id: str | None,
+        max_concurrency: int,
+        client_id: str | None,
+    ) -> list[ChatResponse | ApiError]:
+        search_context = (
+            RequestCaseSearchContext(self.case_search_tool)
+            if self.case_search_tool is not None
+            else None
+        )
+        semaphore = asyncio.Semaphore(max_concurrency)
+        session_keys = [_session_key(request, client_id) for request in requests]
+        histories = await run_blocking(
+            lambda: [self._session_history(session_key) for session_key in session_keys]
+        )
+        leaders: dict[tuple[str, str, str], int] = {}
+        leader_of: list[int] = []
+        for index, request in enumerate(requests):
+            # Follow-ups depend on their own session history, so they are never shared.
+            if histories[index] is not None:
+                leader_of.append(index)
+            else:
+                leader_of.append(leaders.setdefault(self._coalescing_key(request), index))
+
+        async def answer(index: int) -> ChatResponse | ApiError:
+            async with semaphore:
+                try:
+                    return await self._handle_chat_async(
+                        requests[index],
+                        session_key=session_keys[index],
+                        history=histories[index],
+                        trace_id=_batch_item_trace_id(trace_id, index),
+                        search_context=search_context,
+                    )
+                except ApiError as exc:
+                    return exc
+                except Exception:
+                    LOGGER.exception("Unhandled chat batch item exception")
+                    return ProviderApiError("Unexpected server error")
+
+        leader_indexes = sorted(set(leader_of))
+        answers = dict(
+            zip(
+                leader_indexes,
+                await asyncio.gather(*(answer(index) for index in leader_indexes)),
+            )
+        )
+        outcomes: list[ChatResponse | ApiError] = []
+        for index, request in enumerate(requests):
+            leader_index = leader_of[index]
+            outcome = answers[leader_index]
+            if index != leader_index and isinstance(outcome, ChatResponse):
+                outcome = self._coalesced_response(
+                    outcome,
+                    coalesced=True,
+                    request=request,
+                    trace_id=_batch_item_trace_id(trace_id, index),
+                )
+                await run_blocking(
+                    self._remember_turn, session_keys[index], request, outcome
+                )
+            outcomes.append(outcome)
+        return outcomes
+
+    async def _handle_chat_async(
+        self,
+        request: ChatRequest,
+        *,
+        session_key: str,
+        history: ConversationHistory | None,
+        trace_id: str | None,
+        search_context: RequestCaseSearchContext | None = None,
+    ) -> ChatResponse:
+        with conversation_scope(history):
+            response = await self._answer_chat_async(
+                request, trace_id=trace_id, search_context=search_context
+            )
+        await run_blocking(self._remember_turn, session_key, request, response)
+        return response
+
+    async def _answer_chat_async(
+        self,
+        request: ChatRequest,
+        *,
+        trace_id: str | None,
+        search_context: RequestCaseSearchContext | None,
+    ) -> ChatResponse:
+        # Session memory, precomputed and cached answers, grounding and citation
+        # checks are synchronous (Redis, catalog reloads, BM25 scoring), so they
+        # run on worker threads rather than stalling the event loop.
+        early_response = await run_blocking(
+            self._early_response, request, trace_id=trace_id
+        )
+        if early_response is not None:
+            return early_response
+
+        def run_turn() -> Awaitable[ChatResponse]:
+            return self._run_chat_turn_async(
+                request, trace_id=trace_id, search_context=search_context
+            )
+
+        if self.request_coalescer is None or current_conversation() is not None:
+            return await run_turn()
+        response, coalesced = await self.request_coalescer.run_async(
+            self._coalescing_key(request), run_turn
+        )
+        return self._coalesced_response(
+            response, coalesced=coalesced, request=request, trace_id=trace_id
+        )
+
+    async def _run_chat_turn_async(
+        self,
+        request: ChatRequest,
+        *,
+        trace_id: str | None,
+        search_context: RequestCaseSearchContext | None = None,
+    ) -> ChatResponse:
+        plan = self._plan_retrieval(
+            request=request, trace_id=trace_id, search_context=search_context
+        )
+        outcomes = (
+            await self.retrieval_fanout.run_async(plan.stages) if plan.stages else []
+        )
+        prepared = await run_blocking(
+            self._prepare_chat_turn,
+            request,
+            outcomes=outcomes,
+            skipped_stages=plan.skipped_stages,
+            trace_id=trace_id,
+        )
+        if isinstance(prepared, ChatResponse):
+            return prepared
+
+        generate_async = getattr(self.provider_router, "generate_async", None)
+        try:
+            if callable(generate_async):
+                routed = await generate_async(
+                    message=request.message,
+                    citations=prepared.citations,
+                    locale=request.locale,
+                )
+            else:
+                routed = await run_blocking(
+                    self.provider_router.generate,
+                    message=request.message,
+                    citations=prepared.citations,
+                    locale=request.locale,
+                )
+        except ProviderError as exc:
+            return self._provider_error_response(
+                exc, request=request, prepared=prepared, trace_id=trace_id
+            )
+        return await run_blocking(
+            self._complete_chat_turn,
+            request,
+            prepared=prepared,
+            routed=routed,
+            trace_id=trace_id,
+        )
+
+    def _coalescing_key(self, request: ChatRequest) -> tuple[str, str, str]:
+        return (
+            self.message_analyzer.analyze(request.message).normalized,
+            request.locale,
+            request.mode,
+        )
+
+    def _coalesced_response(
+        self,
+        response: ChatResponse,
+        *,
+        coalesced: bool,
+        request: ChatRequest,
+        trace_id: str | None,
+    ) -> ChatResponse:
+        if not coalesced:
+            return response
+        # The leader's pipeline audit events carry the leader's trace id; record
+        # that this request was answered from it under its own trace id.
+        self._emit_audit_event(
+            trace_id=trace_id,
+            event_type="chat_request_coalesced",
+            locale=request.locale,
+            mode=request.mode,
+            message_length=len(request.message),
+        )
+        return response.model_copy(deep=True)
+
+    def _early_response(
+        self, request: ChatRequest, *, trace_id: str | None
+    ) -> ChatResponse | None:
+        if self.message_analyzer.analyze(request.message).should_refuse:
             self._emit_audit_event(
                 trace_id=trace_id,
                 event_type="policy_block",
@@ -418,12 +1067,24 @@ class ChatService:
                 ),
             )
 
+        # Precomputed answers skip retrieval and the provider entirely.
+        return self._serve_precomputed_answer(request, trace_id=trace_id)
+
+    def _prepare_chat_turn(
+        self,
+        request: ChatRequest,
+        *,
+        outcomes: Sequence[RetrievalStageOutcome],
+        skipped_stages: tuple[str, ...] = (),
+        trace_id: str | None,
+    ) -> _PreparedChatTurn | ChatResponse:
         citations = self.grounding_adapter.citation_candidates(
             message=request.message,
             locale=request.locale,
             mode=request.mode,
         )
-        case_search_citations = self._fetch_case_search_citations(
+        case_search_citations, research_preview = self._collect_retrieval_outcomes(
+            outcomes,
             request=request,
             trace_id=trace_id,
         )
@@ -434,64 +1095,102 @@ class ChatService:
             request=request,
             trace_id=trace_id,
         )
-        research_preview = self._build_research_preview(
-            request=request,
-            trace_id=trace_id,
-        )
 
-        try:
-            routed = self.provider_router.generate(
+        cache_key: str | None = None
+        # Cached answers are keyed on the message alone, so follow-up turns that
+        # depend on session history neither read nor fill the cache.
+        if (
+            self.answer_cache is not None
+            and citations
+            and current_conversation() is None
+        ):
+            cache_key = self.answer_cache.build_key(
                 message=request.message,
-                citations=citations,
                 locale=request.locale,
+                mode=request.mode,
+                citations=citations,
             )
-        except ProviderError as exc:
-            self._emit_audit_event(
+            cached_response = self._serve_cached_answer(
+                cache_key=cache_key,
+                request=request,
+                citations=citations,
+                research_preview=research_preview,
+                skipped_stages=skipped_stages,
                 trace_id=trace_id,
-                event_type="provider_error",
-                locale=request.locale,
-                mode=request.mode,
-                message_length=len(request.message),
-                provider=exc.provider,
-                provider_error_code=exc.code,
-            )
-            normalized_message = exc.message.lower()
-            is_transient_provider_failure = (
-                exc.code in {"timeout", "rate_limit"}
-                or "circuit breaker open" in normalized_message
-                or "resource_exhausted" in normalized_message
-                or "quota" in normalized_message
-                or "429" in normalized_message
-                or "not configured" in normalized_message
-                or "sdk unavailable" in normalized_message
-            )
-            if is_transient_provider_failure:
-                return ChatResponse(
-                    answer=SAFE_CONSTRAINED_RESPONSE,
-                    citations=[],
-                    confidence="low",
-                    disclaimer=DISCLAIMER_TEXT,
-                    fallback_used=FallbackUsed(
-                        used=True,
-                        provider=exc.provider,
-                        reason="provider_error",
-                    ),
-                    research_preview=research_preview,
-                )
-            raise ProviderApiError(exc.message) from exc
+            )
+            if cached_response is not None:
+                return cached_response
+
+        return _PreparedChatTurn(
+            citations=citations,
+            research_preview=research_preview,
+            cache_key=cache_key,
+            skipped_stages=skipped_stages,
+        )
+
+    def _provider_error_response(
+        self,
+        exc: ProviderError,
+        *,
+        request: ChatRequest,
+        prepared: _PreparedChatTurn,
+        trace_id: str | None,
+    ) -> ChatResponse:
+        self._emit_audit_event(
+            trace_id=trace_id,
+            event_type="provider_error",
+            locale=request.locale,
+            mode=request.mode,
+            message_length=len(request.message),
+            provider=exc.provider,
+            provider_error_code=exc.code,
+        )
+        normalized_message = exc.message.lower()
+        is_transient_provider_failure = (
+            exc.code in {"timeout", "rate_limit"}
+            or "circuit breaker open" in normalized_message
+            or "resource_exhausted" in normalized_message
+            or "quota" in normalized_message
+            or "429" in normalized_message
+            or "not configured" in normalized_message
+            or "sdk unavailable" in normalized_message
+        )
+        if is_transient_provider_failure:
+            return ChatResponse(
+                answer=SAFE_CONSTRAINED_RESPONSE,
+                citations=[],
+                confidence="low",
+                disclaimer=DISCLAIMER_TEXT,
+                fallback_used=FallbackUsed(
+                    used=True,
+                    provider=exc.provider,
+                    reason="provider_error",
+                ),
+                research_preview=prepared.research_preview,
+                skipped_stages=list(prepared.skipped_stages),
+            )
+        raise ProviderApiError(exc.message) from exc
 
+    def _complete_chat_turn(
+        self,
+        request: ChatRequest,
+        *,
+        prepared: _PreparedChatTurn,
+        routed: RoutingResult,
+        trace_id: str | None,
+    ) -> ChatResponse:
         provider_citations = cast(list[Citation], routed.result.citations)
         citations_to_validate = cast(
             list[Citation | dict[str, object] | object],
-            provider_citations if provider_citations else citations,
+            provider_citations if provider_citations else prepared.citations,
         )
         answer, validated_citations, confidence = enforce_citation_requirement(
             routed.result.answer,
             citations_to_validate,
-            grounded_citations=citations,
+            grounded_citations=prepared.citations,
             trusted_domains=self.trusted_citation_domains,
         )
-        if not provider_citations and citations:
+        if not provider_citations and prepared.citations:
             self._emit_audit_event(
                 trace_id=trace_id,
                 event_type="provider_citations_absent_using_grounded_context",
@@ -500,7 +1199,7 @@ class ChatService:
                 message_length=len(request.message),
                 provider=routed.result.provider,
                 provider_citation_count=0,
-                candidate_citation_count=len(citations),
+                candidate_citation_count=len(prepared.citations),
             )
         if provider_citations and not validated_citations:
             self._emit_audit_event(
@@ -511,7 +1210,7 @@ class ChatService:
                 message_length=len(request.message),
                 provider=routed.result.provider,
                 provider_citation_count=len(provider_citations),
-                candidate_citation_count=len(citations),
+                candidate_citation_count=len(prepared.citations),
                 rejected_citation_urls=_extract_rejected_citation_urls(
                     provider_citations
                 ),
@@ -527,6 +1226,23 @@ class ChatService:
         ):
             fallback_reason = _INSUFFICIENT_CONTEXT_FALLBACK_REASON
 
+        if (
+            prepared.cache_key is not None
+            and self.answer_cache is not None
+            and not routed.fallback_used
+            and validated_citations
+            and answer != SAFE_CONSTRAINED_RESPONSE
+        ):
+            self.answer_cache.put(
+                prepared.cache_key,
+                CachedAnswer(
+                    answer=answer,
+                    citations=tuple(validated_citations),
+                    confidence=confidence,
+                    provider=routed.result.provider,
+                ),
+            )
+
         return ChatResponse(
             answer=answer,
             citations=validated_citations,
@@ -537,7 +1253,8 @@ class ChatService:
                 provider=fallback_provider,
                 reason=fallback_reason,
             ),
-            research_preview=research_preview,
+            research_preview=prepared.research_preview,
+            skipped_stages=list(prepared.skipped_stages),
         )
 
     def _emit_audit_event(
@@ -4,6 +4,7 @@ from datetime import date
 import re
 from typing import Callable, Protocol, cast
 
+from immcad_api.deadline import deadline_allows
 from immcad_api.errors import SourceUnavailableError
 from immcad_api.policy import SourcePolicy, is_source_export_allowed
 from immcad_api.schemas import (
@@ -27,6 +28,7 @@ from immcad_api.services.lawyer_research_planner import (
 from immcad_api.sources import SourceRegistry
 
 _MAX_CASE_SEARCH_QUERY_LENGTH = 300
+_FOLLOW_UP_QUERY_MIN_SECONDS = 1.0
 _CANLII_SOURCE_PREFIX = "CANLII"
 _FALLBACK_OFFICIAL_SOURCE_IDS = frozenset(
     {"FC_DECISIONS", "FCA_DECISIONS", "SCC_DECISIONS"}
@@ -555,8 +557,12 @@ class LawyerCaseResearchService:
         )
 
     def research(
-        self, request: LawyerCaseResearchRequest
+        self,
+        request: LawyerCaseResearchRequest,
+        *,
+        case_search_service: _CaseSearchProtocol | None = None,
     ) -> LawyerCaseResearchResponse:
+        search_service = case_search_service or self.case_search_service
         intake_payload = (
             request.intake.model_dump(mode="json", exclude_none=True)
             if request.intake is not None
@@ -589,11 +595,17 @@ class LawyerCaseResearchService:
 
         source_unavailable_errors = 0
         for query in queries:
+            # Follow-up queries only refine the results; drop them once the request
+            # deadline is nearly spent.
+            if aggregated_results and not deadline_allows(
+                _FOLLOW_UP_QUERY_MIN_SECONDS
+            ):
+                break
             normalized_query = _normalize_case_search_query(query)
             if not normalized_query or len(normalized_query) < 2:
                 continue
             try:
-                response = self.case_search_service.search(
+                response = search_service.search(
                     CaseSearchRequest(
                         query=normalized_query,
                         jurisdiction=request.jurisdiction,
@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+from array import array
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+import hashlib
+import heapq
+import json
+import math
+import mmap
+from pathlib import Path
+import re
+import struct
+import sys
+from typing import Iterable, Mapping
+
+from immcad_api.schemas import Citation
+
+
+SECTION_INDEX_FORMAT_VERSION = 1
+_MAGIC = b"IMCADSX1"
+_HEADER_LENGTH = struct.Struct("<Q")
+_ALIGNMENT = 8
+# Same tokenization as MessageAnalyzer.tokens, so query and section terms line up.
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Frequent English function words carry no ranking signal and would dominate
+# posting-list sizes, so they are neither indexed nor scored.
+_STOPWORDS = frozenset(
+    {
+        "a", "an", "and", "any", "are", "as", "at", "be", "by", "can", "do", "does",
+        "for", "from", "has", "have", "how", "i", "if", "in", "is", "it", "its", "may",
+        "me", "my", "no", "not", "of", "on", "or", "other", "shall", "so", "such",
+        "that", "the", "their", "there", "this", "to", "under", "was", "we", "what",
+        "when", "which", "who", "will", "with", "you", "your",
+    }
+)
+_MAX_SNIPPET_CHARS = 280
+
+
+def section_index_terms(text: str) -> list[str]:
+    return [term for term in _TOKEN_RE.findall(text.lower()) if term not in _STOPWORDS]
+
+
+def _snippet(section_title: str, text: str) -> str:
+    snippet = f"{section_title}: {text}" if section_title else text
+    if len(snippet) <= _MAX_SNIPPET_CHARS:
+        return snippet
+    return f"{snippet[: _MAX_SNIPPET_CHARS - 1].rstrip()}…"
+
+
+def _section_citation(record: Mapping[str, object]) -> dict[str, str] | None:
+    source_id = str(record.get("source_id") or "").strip()
+    url = str(record.get("section_url") or "").strip()
+    section_label = str(record.get("section_label") or "").strip()
+    text = str(record.get("text") or "").strip()
+    if not source_id or not url.startswith("https://") or not section_label or not text:
+        return None
+    return {
+        "source_id": source_id,
+        "title": str(record.get("act_title") or "").strip(),
+        "url": url,
+        "pin": f"s. {section_label}",
+        "snippet": _snippet(str(record.get("section_title") or "").strip(), text),
+    }
+
+
+def _section_text(record: Mapping[str, object]) -> str:
+    fields = (
+        record.get("source_id"),
+        record.get("section_label"),
+        record.get("heading_title"),
+        record.get("section_title"),
+        record.get("text"),
+    )
+    return " ".join(str(field) for field in fields if field)
+
+
+def indexable_sections(
+    records: Iterable[Mapping[str, object]],
+) -> Iterable[tuple[dict[str, str] | None, str]]:
+    """Yield ``(citation, searchable text)`` per record; ``citation`` is ``None`` when skipped.
+
+    Section positions in every index built from the same records follow this
+    sequence, so lexical and vector indexes share section ids.
+    """
+    for record in records:
+        citation = _section_citation(record)
+        yield citation, _section_text(record) if citation is not None else ""
+
+
+def sections_fingerprint(citation_payloads: Iterable[bytes]) -> str:
+    digest = hashlib.sha256()
+    for payload in citation_payloads:
+        digest.update(hashlib.sha256(payload).digest())
+    return digest.hexdigest()
+
+
+def encode_section_citation(citation: Mapping[str, str]) -> bytes:
+    return json.dumps(citation, ensure_ascii=False).encode("utf-8")
+
+
+def _padding(length: int) -> bytes:
+    return b"\0" * (-length % _ALIGNMENT)
+
+
+@dataclass(frozen=True)
+class SectionIndexBuild:
+    sections_indexed: int
+    sections_skipped: int
+    terms: int
+
+
+def write_section_index(
+    path: str | Path,
+    records: Iterable[Mapping[str, object]],
+    *,
+    k1: float = 1.2,
+    b: float = 0.75,
+) -> SectionIndexBuild:
+    """Write a BM25 index over ``FederalLawSectionChunk`` records (``to_dict`` form).
+
+    Records without a source id, an ``https`` section URL, a label or text cannot
+    back a citation and are skipped. BM25 only weighs query terms by presence, so
+    each posting's full contribution (idf, term frequency and the section's length
+    norm) is computed here and stored with the posting, best first; a query just
+    sums the stored impacts.
+    """
+    citations: list[bytes] = []
+    lengths: list[int] = []
+    postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+    skipped = 0
+    for citation, text in indexable_sections(records):
+        if citation is None:
+            skipped += 1
+            continue
+        doc_id = len(citations)
+        terms = Counter(section_index_terms(text))
+        for term, frequency in terms.items():
+            postings[term].append((doc_id, frequency))
+        lengths.append(sum(terms.values()))
+        citations.append(encode_section_citation(citation))
+
+    doc_count = len(citations)
+    average_length = (sum(lengths) / doc_count) if doc_count else 0.0
+    doc_norms = [
+        k1 * (1 - b + b * (length / average_length if average_length else 0.0))
+        for length in lengths
+    ]
+    term_ranges: dict[str, list[int]] = {}
+    posting_docs = array("I")
+    posting_impacts = array("f")
+    for term in sorted(postings):
+        term_postings = postings[term]
+        idf = math.log(1 + (doc_count - len(term_postings) + 0.5) / (len(term_postings) + 0.5))
+        impacts = sorted(
+            (
+                (idf * frequency * (k1 + 1) / (frequency + doc_norms[doc_id]), doc_id)
+                for doc_id, frequency in term_postings
+            ),
+            key=lambda item: (-item[0], item[1]),
+        )
+        term_ranges[term] = [len(posting_docs), len(impacts)]
+        for impact, doc_id in impacts:
+            posting_docs.append(doc_id)
+            posting_impacts.append(impact)
+    citation_offsets = array("Q", [0])
+    for payload in citations:
+        citation_offsets.append(citation_offsets[-1] + len(payload))
+
+    sections: dict[str, bytes] = {
+        "posting_docs": posting_docs.tobytes(),
+        "posting_impacts": posting_impacts.tobytes(),
+        "citation_offsets": citation_offsets.tobytes(),
+        "citations": b"".join(citations),
+    }
+    layout: dict[str, list[int]] = {}
+    offset = 0
+    for name, payload in sections.items():
+        layout[name] = [offset, len(payload)]
+        offset += len(payload) + len(_padding(len(payload)))
+
+    header = json.dumps(
+        {
+            "format_version": SECTION_INDEX_FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "doc_count": doc_count,
+            "fingerprint": sections_fingerprint(citations),
+            "k1": k1,
+            "b": b,
+            "layout": layout,
+            "terms": term_ranges,
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    index_path = Path(path)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    with index_path.open("wb") as handle:
+        handle.write(_MAGIC)
+        handle.write(_HEADER_LENGTH.pack(len(header)))
+        handle.write(header)
+        handle.write(_padding(len(_MAGIC) + _HEADER_LENGTH.size + len(header)))
+        for payload in sections.values():
+            handle.write(payload)
+            handle.write(_padding(len(payload)))
+    return SectionIndexBuild(
+        sections_indexed=doc_count, sections_skipped=skipped, terms=len(term_ranges)
+    )
+
+
+class SectionIndex:
+    """Read-only BM25 index over federal-law sections, memory-mapped from disk.
+
+    Only the header (vocabulary and layout) is parsed at load; postings and
+    citation payloads stay in the mapped file and are read per query, so startup
+    cost and resident memory do not grow with the section text.
+
+    A query scores at most ``max_query_terms`` of its rarest terms and, per term,
+    the ``max_postings_per_term`` highest-impact postings. Terms common enough to
+    hit that cap have a low idf, so the cut rarely changes the top sections, and
+    it keeps query cost flat as the catalog grows.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_query_terms: int = 32,
+        max_postings_per_term: int = 2000,
+    ) -> None:
+        if max_query_terms < 1:
+            raise ValueError("max_query_terms must be >= 1")
+        if max_postings_per_term < 1:
+            raise ValueError("max_postings_per_term must be >= 1")
+        self.path = Path(path)
+        self.max_query_terms = max_query_terms
+        self.max_postings_per_term = max_postings_per_term
+        self._views: list[memoryview] = []
+        with self.path.open("rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._load_header()
+        except Exception:
+            self.close()
+            raise
+
+    def _load_header(self) -> None:
+        if self._mmap[: len(_MAGIC)] != _MAGIC:
+            raise ValueError(f"Not a section index file: {self.path}")
+        header_start = len(_MAGIC) + _HEADER_LENGTH.size
+        (header_length,) = _HEADER_LENGTH.unpack_from(self._mmap, len(_MAGIC))
+        header = json.loads(self._mmap[header_start : header_start + header_length])
+        if header.get("format_version") != SECTION_INDEX_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported section index format: {header.get('format_version')!r}"
+            )
+        if header.get("byteorder") != sys.byteorder:
+            raise ValueError(f"Section index byte order mismatch: {header.get('byteorder')!r}")
+
+        data_start = header_start + header_length
+        data_start += -data_start % _ALIGNMENT
+        mapped = memoryview(self._mmap)
+        self._views.append(mapped)
+
+        def section(name: str, fmt: str) -> memoryview:
+            offset, length = header["layout"][name]
+            start = data_start + offset
+            view = mapped[start : start + length].cast(fmt)
+            self._views.append(view)
+            return view
+
+        self.doc_count: int = header["doc_count"]
+        self.fingerprint: str = header["fingerprint"]
+        self._terms: dict[str, list[int]] = header["terms"]
+        self._posting_docs = section("posting_docs", "I")
+        self._posting_impacts = section("posting_impacts", "f")
+        self._citation_offsets = section("citation_offsets", "Q")
+        self._citations = section("citations", "B")
+
+    def __len__(self) -> int:
+        return self.doc_count
+
+    def search(self, terms: Iterable[str], *, top_k: int) -> list[tuple[int, float]]:
+        """Return up to ``top_k`` ``(section, score)`` pairs, best first.
+
+        Unknown terms and stop words are ignored.
+        """
+        query = sorted(
+            (self._terms[term] for term in set(terms) if term in self._terms),
+            key=lambda term_range: term_range[1],
+        )[: self.max_query_terms]
+        scores: dict[int, float] = {}
+        get_score = scores.get
+        for start, document_frequency in query:
+            end = start + min(document_frequency, self.max_postings_per_term)
+            for doc_id, impact in zip(
+                self._posting_docs[start:end], self._posting_impacts[start:end]
+            ):
+                scores[doc_id] = get_score(doc_id, 0.0) + impact
+        return heapq.nlargest(top_k, scores.items(), key=lambda item: (item[1], -item[0]))
+
+    def citation(self, doc_id: int) -> Citation:
+        start = self._citation_offsets[doc_id]
+        end = self._citation_offsets[doc_id + 1]
+        return Citation.model_validate_json(bytes(self._citations[start:end]))
+
+    def close(self) -> None:
+        # Views must be released before the map can close; last taken, first released.
+        while self._views:
+            self._views.pop().release()
+        if not self._mmap.closed:
+            self._mmap.close()
+
+
+def read_section_records(path: str | Path) -> Iterable[dict[str, object]]:
+    """Yield ``FederalLawSectionChunk`` records from the ingestion JSONL output."""
+    with Path(path).open("r", encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
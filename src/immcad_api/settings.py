@@ -35,10 +35,53 @@ class Settings:
     openai_model: str
     gemini_model: str
     gemini_model_fallbacks: tuple[str, ...]
+    gemini_model_failure_threshold: int
+    gemini_model_cooldown_seconds: float
     provider_timeout_seconds: float
     provider_max_retries: int
+    provider_retry_budget_ratio: float
+    provider_retry_budget_max_tokens: float
+    openai_prompt_token_budget: int
+    gemini_prompt_token_budget: int
+    provider_http_max_connections: int
+    provider_http_max_keepalive_connections: int
+    provider_http_keepalive_expiry_seconds: float
     provider_circuit_breaker_failure_threshold: int
     provider_circuit_breaker_open_seconds: float
+    provider_circuit_breaker_half_open_max_probes: int
+    provider_circuit_breaker_shared_state_enabled: bool
+    provider_hedge_enabled: bool
+    provider_hedge_latency_percentile: float
+    provider_hedge_min_samples: int
+    provider_hedge_max_ratio: float
+    provider_adaptive_ordering_enabled: bool
+    provider_adaptive_min_samples: int
+    provider_adaptive_switch_margin: float
+    provider_bulkhead_max_concurrent: int
+    dependency_bulkhead_limits: tuple[tuple[str, int], ...]
+    bulkhead_max_queue_wait_seconds: float
+    chat_case_search_timeout_seconds: float
+    chat_research_preview_timeout_seconds: float
+    chat_answer_cache_enabled: bool
+    chat_answer_cache_max_entries: int
+    chat_answer_cache_ttl_seconds: float
+    chat_request_coalescing_enabled: bool
+    chat_precomputed_answers_path: str
+    grounding_section_index_path: str
+    grounding_section_index_top_k: int
+    grounding_section_vectors_path: str
+    grounding_embedder: str
+    chat_session_memory_enabled: bool
+    chat_session_memory_max_turns: int
+    chat_session_memory_max_sessions: int
+    chat_session_memory_ttl_seconds: float
+    chat_batch_max_items: int
+    chat_batch_max_concurrency: int
+    chat_request_deadline_seconds: float
+    chat_brownout_enabled: bool
+    chat_brownout_max_event_loop_lag_ms: float
+    chat_brownout_max_queue_depth: int
+    chat_brownout_max_p95_latency_ms: float
     enable_scaffold_provider: bool
     allow_scaffold_synthetic_citations: bool
     export_policy_gate_enabled: bool
@@ -99,6 +142,21 @@ def parse_csv_env(name: str, default: tuple[str, ...]) -> tuple[str, ...]:
     return values
 
 
+def parse_limits_env(name: str) -> tuple[tuple[str, int], ...]:
+    limits: list[tuple[str, int]] = []
+    for entry in parse_csv_env(name, ()):
+        key, separator, raw_limit = entry.partition("=")
+        key = key.strip()
+        try:
+            limit = int(raw_limit.strip())
+        except ValueError:
+            limit = 0
+        if not separator or not key or limit < 1:
+            raise ValueError(f"{name} entries must be name=limit with limit >= 1")
+        limits.append((key, limit))
+    return tuple(limits)
+
+
 def is_unstable_model_name(model_name: str) -> bool:
     normalized = model_name.strip().lower()
     return any(token in normalized for token in _UNSTABLE_MODEL_TOKENS)
@@ -179,6 +237,92 @@ def load_settings() -> Settings:
         raise ValueError(
             "OFFICIAL_CASE_STALE_CACHE_TTL_SECONDS must be >= OFFICIAL_CASE_CACHE_TTL_SECONDS"
         )
+    chat_case_search_timeout_seconds = parse_float_env(
+        "CHAT_CASE_SEARCH_TIMEOUT_SECONDS",
+        6.0,
+    )
+    if chat_case_search_timeout_seconds <= 0:
+        raise ValueError("CHAT_CASE_SEARCH_TIMEOUT_SECONDS must be > 0")
+    chat_research_preview_timeout_seconds = parse_float_env(
+        "CHAT_RESEARCH_PREVIEW_TIMEOUT_SECONDS",
+        8.0,
+    )
+    if chat_research_preview_timeout_seconds <= 0:
+        raise ValueError("CHAT_RESEARCH_PREVIEW_TIMEOUT_SECONDS must be > 0")
+    chat_answer_cache_enabled = parse_bool_env("CHAT_ANSWER_CACHE_ENABLED", True)
+    chat_answer_cache_max_entries = parse_int_env("CHAT_ANSWER_CACHE_MAX_ENTRIES", 512)
+    if chat_answer_cache_max_entries < 1:
+        raise ValueError("CHAT_ANSWER_CACHE_MAX_ENTRIES must be >= 1")
+    chat_answer_cache_ttl_seconds = parse_float_env(
+        "CHAT_ANSWER_CACHE_TTL_SECONDS",
+        3600.0,
+    )
+    if chat_answer_cache_ttl_seconds <= 0:
+        raise ValueError("CHAT_ANSWER_CACHE_TTL_SECONDS must be > 0")
+    grounding_section_index_top_k = parse_int_env("GROUNDING_SECTION_INDEX_TOP_K", 3)
+    if grounding_section_index_top_k < 1:
+        raise ValueError("GROUNDING_SECTION_INDEX_TOP_K must be >= 1")
+    grounding_embedder = parse_str_env("GROUNDING_EMBEDDER") or "hashing"
+    if grounding_embedder != "hashing" and not (
+        grounding_embedder.startswith("sentence-transformers:")
+        and grounding_embedder.split(":", 1)[1].strip()
+    ):
+        raise ValueError(
+            "GROUNDING_EMBEDDER must be 'hashing' or 'sentence-transformers:<model>'"
+        )
+    chat_session_memory_max_turns = parse_int_env("CHAT_SESSION_MEMORY_MAX_TURNS", 4)
+    if chat_session_memory_max_turns < 1:
+        raise ValueError("CHAT_SESSION_MEMORY_MAX_TURNS must be >= 1")
+    chat_session_memory_max_sessions = parse_int_env(
+        "CHAT_SESSION_MEMORY_MAX_SESSIONS", 1000
+    )
+    if chat_session_memory_max_sessions < 1:
+        raise ValueError("CHAT_SESSION_MEMORY_MAX_SESSIONS must be >= 1")
+    chat_session_memory_ttl_seconds = parse_float_env(
+        "CHAT_SESSION_MEMORY_TTL_SECONDS",
+        3600.0,
+    )
+    if chat_session_memory_ttl_seconds <= 0:
+        raise ValueError("CHAT_SESSION_MEMORY_TTL_SECONDS must be > 0")
+    chat_batch_max_items = parse_int_env("CHAT_BATCH_MAX_ITEMS", 25)
+    if not 1 <= chat_batch_max_items <= 100:
+        raise ValueError("CHAT_BATCH_MAX_ITEMS must be between 1 and 100")
+    chat_batch_max_concurrency = parse_int_env("CHAT_BATCH_MAX_CONCURRENCY", 4)
+    if chat_batch_max_concurrency < 1:
+        raise ValueError("CHAT_BATCH_MAX_CONCURRENCY must be >= 1")
+    chat_request_deadline_seconds = parse_float_env("CHAT_REQUEST_DEADLINE_SECONDS", 25.0)
+    if chat_request_deadline_seconds <= 0:
+        raise ValueError("CHAT_REQUEST_DEADLINE_SECONDS must be > 0")
+    chat_brownout_max_event_loop_lag_ms = parse_float_env(
+        "CHAT_BROWNOUT_MAX_EVENT_LOOP_LAG_MS",
+        250.0,
+    )
+    if chat_brownout_max_event_loop_lag_ms <= 0:
+        raise ValueError("CHAT_BROWNOUT_MAX_EVENT_LOOP_LAG_MS must be > 0")
+    chat_brownout_max_queue_depth = parse_int_env("CHAT_BROWNOUT_MAX_QUEUE_DEPTH", 16)
+    if chat_brownout_max_queue_depth < 1:
+        raise ValueError("CHAT_BROWNOUT_MAX_QUEUE_DEPTH must be >= 1")
+    chat_brownout_max_p95_latency_ms = parse_float_env(
+        "CHAT_BROWNOUT_MAX_P95_LATENCY_MS",
+        10000.0,
+    )
+    if chat_brownout_max_p95_latency_ms <= 0:
+        raise ValueError("CHAT_BROWNOUT_MAX_P95_LATENCY_MS must be > 0")
+    gemini_model_failure_threshold = parse_int_env("GEMINI_MODEL_FAILURE_THRESHOLD", 3)
+    if gemini_model_failure_threshold < 1:
+        raise ValueError("GEMINI_MODEL_FAILURE_THRESHOLD must be >= 1")
+    gemini_model_cooldown_seconds = parse_float_env("GEMINI_MODEL_COOLDOWN_SECONDS", 60.0)
+    if gemini_model_cooldown_seconds <= 0:
+        raise ValueError("GEMINI_MODEL_COOLDOWN_SECONDS must be > 0")
+    provider_retry_budget_ratio = parse_float_env("PROVIDER_RETRY_BUDGET_RATIO", 0.2)
+    if not 0 <= provider_retry_budget_ratio <= 1:
+        raise ValueError("PROVIDER_RETRY_BUDGET_RATIO must be between 0 and 1")
+    provider_retry_budget_max_tokens = parse_float_env(
+        "PROVIDER_RETRY_BUDGET_MAX_TOKENS",
+        10.0,
+    )
+    if provider_retry_budget_max_tokens < 1:
+        raise ValueError("PROVIDER_RETRY_BUDGET_MAX_TOKENS must be >= 1")
     enable_scaffold_provider = parse_bool_env("ENABLE_SCAFFOLD_PROVIDER", True)
     enable_openai_provider = parse_bool_env("ENABLE_OPENAI_PROVIDER", True)
     primary_provider = parse_str_env("PRIMARY_PROVIDER", "openai") or "openai"
@@ -317,6 +461,73 @@ def load_settings() -> Settings:
             "GEMINI_MODEL_FALLBACKS must use stable Gemini models in production/prod/ci"
         )
 
+    openai_prompt_token_budget = parse_int_env("OPENAI_PROMPT_TOKEN_BUDGET", 4000)
+    if openai_prompt_token_budget < 0:
+        raise ValueError("OPENAI_PROMPT_TOKEN_BUDGET must be >= 0")
+    gemini_prompt_token_budget = parse_int_env("GEMINI_PROMPT_TOKEN_BUDGET", 4000)
+    if gemini_prompt_token_budget < 0:
+        raise ValueError("GEMINI_PROMPT_TOKEN_BUDGET must be >= 0")
+    provider_http_max_connections = parse_int_env("PROVIDER_HTTP_MAX_CONNECTIONS", 20)
+    if provider_http_max_connections < 1:
+        raise ValueError("PROVIDER_HTTP_MAX_CONNECTIONS must be >= 1")
+    provider_http_max_keepalive_connections = parse_int_env(
+        "PROVIDER_HTTP_MAX_KEEPALIVE_CONNECTIONS",
+        10,
+    )
+    if provider_http_max_keepalive_connections < 0:
+        raise ValueError("PROVIDER_HTTP_MAX_KEEPALIVE_CONNECTIONS must be >= 0")
+    if provider_http_max_keepalive_connections > provider_http_max_connections:
+        raise ValueError(
+            "PROVIDER_HTTP_MAX_KEEPALIVE_CONNECTIONS must be <= PROVIDER_HTTP_MAX_CONNECTIONS"
+        )
+    provider_http_keepalive_expiry_seconds = parse_float_env(
+        "PROVIDER_HTTP_KEEPALIVE_EXPIRY_SECONDS",
+        30.0,
+    )
+    if provider_http_keepalive_expiry_seconds <= 0:
+        raise ValueError("PROVIDER_HTTP_KEEPALIVE_EXPIRY_SECONDS must be > 0")
+    provider_circuit_breaker_half_open_max_probes = parse_int_env(
+        "PROVIDER_CIRCUIT_BREAKER_HALF_OPEN_MAX_PROBES",
+        1,
+    )
+    if provider_circuit_breaker_half_open_max_probes < 1:
+        raise ValueError("PROVIDER_CIRCUIT_BREAKER_HALF_OPEN_MAX_PROBES must be >= 1")
+    provider_bulkhead_max_concurrent = parse_int_env("PROVIDER_BULKHEAD_MAX_CONCURRENT", 16)
+    if provider_bulkhead_max_concurrent < 0:
+        raise ValueError("PROVIDER_BULKHEAD_MAX_CONCURRENT must be >= 0")
+    bulkhead_max_queue_wait_seconds = parse_float_env(
+        "BULKHEAD_MAX_QUEUE_WAIT_SECONDS",
+        0.25,
+    )
+    if bulkhead_max_queue_wait_seconds < 0:
+        raise ValueError("BULKHEAD_MAX_QUEUE_WAIT_SECONDS must be >= 0")
+    provider_hedge_enabled = parse_bool_env("PROVIDER_HEDGE_ENABLED", False)
+    provider_hedge_latency_percentile = parse_float_env(
+        "PROVIDER_HEDGE_LATENCY_PERCENTILE",
+        95.0,
+    )
+    if not 0 < provider_hedge_latency_percentile < 100:
+        raise ValueError("PROVIDER_HEDGE_LATENCY_PERCENTILE must be between 0 and 100")
+    provider_hedge_min_samples = parse_int_env("PROVIDER_HEDGE_MIN_SAMPLES", 20)
+    if provider_hedge_min_samples < 1:
+        raise ValueError("PROVIDER_HEDGE_MIN_SAMPLES must be >= 1")
+    provider_hedge_max_ratio = parse_float_env("PROVIDER_HEDGE_MAX_RATIO", 0.1)
+    if not 0 < provider_hedge_max_ratio <= 1:
+        raise ValueError("PROVIDER_HEDGE_MAX_RATIO must be > 0 and <= 1")
+    provider_adaptive_ordering_enabled = parse_bool_env(
+        "PROVIDER_ADAPTIVE_ORDERING_ENABLED",
+        False,
+    )
+    provider_adaptive_min_samples = parse_int_env("PROVIDER_ADAPTIVE_MIN_SAMPLES", 10)
+    if provider_adaptive_min_samples < 1:
+        raise ValueError("PROVIDER_ADAPTIVE_MIN_SAMPLES must be >= 1")
+    provider_adaptive_switch_margin = parse_float_env(
+        "PROVIDER_ADAPTIVE_SWITCH_MARGIN",
+        0.2,
+    )
+    if not 0 <= provider_adaptive_switch_margin < 1:
+        raise ValueError("PROVIDER_ADAPTIVE_SWITCH_MARGIN must be >= 0 and < 1")
+
     return Settings(
         app_name=parse_str_env("API_APP_NAME", "IMMCAD API") or "IMMCAD API",
         environment=environment,
@@ -338,8 +549,17 @@ def load_settings() -> Settings:
         openai_model=parse_str_env("OPENAI_MODEL", "gpt-4o-mini") or "gpt-4o-mini",
         gemini_model=gemini_model,
         gemini_model_fallbacks=gemini_model_fallbacks,
+        gemini_model_failure_threshold=gemini_model_failure_threshold,
+        gemini_model_cooldown_seconds=gemini_model_cooldown_seconds,
         provider_timeout_seconds=parse_float_env("PROVIDER_TIMEOUT_SECONDS", 15.0),
         provider_max_retries=parse_int_env("PROVIDER_MAX_RETRIES", 1),
+        provider_retry_budget_ratio=provider_retry_budget_ratio,
+        provider_retry_budget_max_tokens=provider_retry_budget_max_tokens,
+        openai_prompt_token_budget=openai_prompt_token_budget,
+        gemini_prompt_token_budget=gemini_prompt_token_budget,
+        provider_http_max_connections=provider_http_max_connections,
+        provider_http_max_keepalive_connections=provider_http_max_keepalive_connections,
+        provider_http_keepalive_expiry_seconds=provider_http_keepalive_expiry_seconds,
         provider_circuit_breaker_failure_threshold=parse_int_env(
             "PROVIDER_CIRCUIT_BREAKER_FAILURE_THRESHOLD",
             3,
@@ -348,6 +568,48 @@ def load_settings() -> Settings:
             "PROVIDER_CIRCUIT_BREAKER_OPEN_SECONDS",
             30.0,
         ),
+        provider_circuit_breaker_half_open_max_probes=(
+            provider_circuit_breaker_half_open_max_probes
+        ),
+        provider_circuit_breaker_shared_state_enabled=parse_bool_env(
+            "PROVIDER_CIRCUIT_BREAKER_SHARED_STATE_ENABLED",
+            False,
+        ),
+        provider_hedge_enabled=provider_hedge_enabled,
+        provider_hedge_latency_percentile=provider_hedge_latency_percentile,
+        provider_hedge_min_samples=provider_hedge_min_samples,
+        provider_hedge_max_ratio=provider_hedge_max_ratio,
+        provider_adaptive_ordering_enabled=provider_adaptive_ordering_enabled,
+        provider_adaptive_min_samples=provider_adaptive_min_samples,
+        provider_adaptive_switch_margin=provider_adaptive_switch_margin,
+        provider_bulkhead_max_concurrent=provider_bulkhead_max_concurrent,
+        dependency_bulkhead_limits=parse_limits_env("DEPENDENCY_BULKHEAD_LIMITS"),
+        bulkhead_max_queue_wait_seconds=bulkhead_max_queue_wait_seconds,
+        chat_case_search_timeout_seconds=chat_case_search_timeout_seconds,
+        chat_research_preview_timeout_seconds=chat_research_preview_timeout_seconds,
+        chat_answer_cache_enabled=chat_answer_cache_enabled,
+        chat_answer_cache_max_entries=chat_answer_cache_max_entries,
+        chat_answer_cache_ttl_seconds=chat_answer_cache_ttl_seconds,
+        chat_request_coalescing_enabled=parse_bool_env(
+            "CHAT_REQUEST_COALESCING_ENABLED", True
+        ),
+        chat_precomputed_answers_path=parse_str_env("CHAT_PRECOMPUTED_ANSWERS_PATH")
+        or "",
+        grounding_section_index_path=parse_str_env("GROUNDING_SECTION_INDEX_PATH") or "",
+        grounding_section_index_top_k=grounding_section_index_top_k,
+        grounding_section_vectors_path=parse_str_env("GROUNDING_SECTION_VECTORS_PATH") or "",
+        grounding_embedder=grounding_embedder,
+        chat_session_memory_enabled=parse_bool_env("CHAT_SESSION_MEMORY_ENABLED", False),
+        chat_session_memory_max_turns=chat_session_memory_max_turns,
+        chat_session_memory_max_sessions=chat_session_memory_max_sessions,
+        chat_session_memory_ttl_seconds=chat_session_memory_ttl_seconds,
+        chat_batch_max_items=chat_batch_max_items,
+        chat_batch_max_concurrency=chat_batch_max_concurrency,
+        chat_request_deadline_seconds=chat_request_deadline_seconds,
+        chat_brownout_enabled=parse_bool_env("CHAT_BROWNOUT_ENABLED", False),
+        chat_brownout_max_event_loop_lag_ms=chat_brownout_max_event_loop_lag_ms,
+        chat_brownout_max_queue_depth=chat_brownout_max_queue_depth,
+        chat_brownout_max_p95_latency_ms=chat_brownout_max_p95_latency_ms,
         enable_scaffold_provider=enable_scaffold_provider,
         allow_scaffold_synthetic_citations=allow_scaffold_synthetic_citations,
         export_policy_gate_enabled=export_policy_gate_enabled,
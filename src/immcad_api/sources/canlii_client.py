@@ -7,6 +7,7 @@ from urllib.parse import quote_plus
 
 import httpx
 
+from immcad_api.deadline import remaining_timeout
 from immcad_api.errors import RateLimitError, SourceUnavailableError
 from immcad_api.schemas import CaseSearchRequest, CaseSearchResponse, CaseSearchResult
 from immcad_api.sources.canlii_usage_limiter import (
@@ -67,7 +68,8 @@ class CanLIIClient:
             return self._fallback_or_error(request)
 
         try:
-            with httpx.Client(timeout=self.timeout_seconds) as client:
+            timeout_seconds = remaining_timeout(self.timeout_seconds)
+            with httpx.Client(timeout=timeout_seconds) as client:
                 response = client.get(endpoint, params=params)
                 response.raise_for_status()
                 payload = response.json()
@@ -81,6 +81,9 @@ class RequestMetrics:
         self._lawyer_research_pdf_unavailable_total = 0
         self._lawyer_research_source_unavailable_events = 0
         self._latencies_ms: deque[float] = deque(maxlen=max_latency_samples)
+        self._max_latency_samples = max_latency_samples
+        self._bulkheads: dict[str, dict[str, int]] = {}
+        self._bulkhead_queue_wait_ms: dict[str, deque[float]] = {}
 
     def record_api_response(self, *, status_code: int, duration_seconds: float) -> None:
         latency_ms = max(duration_seconds * 1000.0, 0.0)
@@ -90,6 +93,20 @@ class RequestMetrics:
                 self._api_errors += 1
             self._latencies_ms.append(latency_ms)
 
+    def recent_latency_percentile_ms(
+        self, percentile: float, *, window: int, min_samples: int = 1
+    ) -> float | None:
+        """Latency percentile over the last ``window`` API responses.
+
+        Returns ``None`` while fewer than ``min_samples`` responses are recorded.
+        """
+        with self._lock:
+            sample_count = min(window, len(self._latencies_ms))
+            if sample_count < max(min_samples, 1):
+                return None
+            recent = list(self._latencies_ms)[-sample_count:]
+        return self._percentile(recent, percentile)
+
     def record_chat_outcome(
         self,
         *,
@@ -109,6 +126,27 @@ class RequestMetrics:
             if constrained_used:
                 self._chat_constrained += 1
 
+    def record_bulkhead_outcome(
+        self,
+        *,
+        dependency: str,
+        shed: bool,
+        queue_depth: int,
+        queue_wait_seconds: float,
+    ) -> None:
+        with self._lock:
+            counters = self._bulkheads.setdefault(
+                dependency,
+                {"admitted": 0, "shed": 0, "queued": 0, "max_queue_depth": 0},
+            )
+            counters["shed" if shed else "admitted"] += 1
+            if queue_depth > 0:
+                counters["queued"] += 1
+                counters["max_queue_depth"] = max(counters["max_queue_depth"], queue_depth)
+                self._bulkhead_queue_wait_ms.setdefault(
+                    dependency, deque(maxlen=self._max_latency_samples)
+                ).append(max(queue_wait_seconds * 1000.0, 0.0))
+
     def record_export_outcome(
         self, *, outcome: str, policy_reason: str | None = None
     ) -> None:
@@ -393,6 +431,14 @@ class RequestMetrics:
                 self._lawyer_research_source_unavailable_events
             )
             latencies = list(self._latencies_ms)
+            bulkheads = {
+                dependency: dict(counters)
+                for dependency, counters in self._bulkheads.items()
+            }
+            bulkhead_queue_wait_ms = {
+                dependency: list(samples)
+                for dependency, samples in self._bulkhead_queue_wait_ms.items()
+            }
 
         request_rate_per_minute = (api_requests / elapsed_seconds) * 60.0
         error_rate = (api_errors / api_requests) if api_requests else 0.0
@@ -509,6 +555,15 @@ class RequestMetrics:
                 "pdf_unavailable_total": lawyer_research_pdf_unavailable_total,
                 "source_unavailable_events": lawyer_research_source_unavailable_events,
             },
+            "bulkheads": {
+                dependency: {
+                    **counters,
+                    "queue_wait_ms_p95": self._percentile(
+                        bulkhead_queue_wait_ms.get(dependency, []), 95.0
+                    ),
+                }
+                for dependency, counters in bulkheads.items()
+            },
             "latency_ms": {
                 "sample_count": len(latencies),
                 "p50": self._percentile(latencies, 50.0),
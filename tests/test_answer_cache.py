@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from immcad_api.policy.source_policy import SourcePolicy
+from immcad_api.schemas import Citation
+from immcad_api.services.answer_cache import (
+    CachedAnswer,
+    ChatAnswerCache,
+    InMemoryAnswerCacheTier,
+    RedisAnswerCacheTier,
+    SourceCatalogVersionTracker,
+    citation_set_fingerprint,
+    source_catalog_version,
+)
+from immcad_api.sources.source_registry import SourceRegistry
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+
+    def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    def setex(self, key: str, ttl: int, value: str) -> None:
+        self.values[key] = value
+        self.ttls[key] = ttl
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _citation(source_id: str = "IRPA") -> Citation:
+    return Citation(
+        source_id=source_id,
+        title="Immigration and Refugee Protection Act",
+        url="https://laws-lois.justice.gc.ca/eng/acts/I-2.5/",
+        pin="s. 11",
+        snippet="A foreign national must apply for a visa.",
+    )
+
+
+def _answer(text: str = "Grounded answer") -> CachedAnswer:
+    return CachedAnswer(
+        answer=text,
+        citations=(_citation(),),
+        confidence="medium",
+        provider="openai",
+    )
+
+
+def test_memory_tier_evicts_least_recently_used_entry() -> None:
+    tier = InMemoryAnswerCacheTier(max_entries=2)
+    tier.put("a", _answer("a"))
+    tier.put("b", _answer("b"))
+    assert tier.get("a") is not None
+
+    tier.put("c", _answer("c"))
+
+    assert tier.get("b") is None
+    assert tier.get("a") is not None
+    assert tier.get("c") is not None
+    assert len(tier) == 2
+
+
+def test_memory_tier_expires_entries_after_ttl() -> None:
+    clock = _Clock()
+    tier = InMemoryAnswerCacheTier(ttl_seconds=10, time_fn=clock)
+    tier.put("key", _answer())
+
+    clock.now = 9.9
+    assert tier.get("key") is not None
+    clock.now = 10.0
+    assert tier.get("key") is None
+
+
+def test_cache_key_normalizes_message_and_tracks_citation_set() -> None:
+    cache = ChatAnswerCache()
+    base = cache.build_key(
+        message="What is IRPA s. 11?",
+        locale="en-CA",
+        mode="standard",
+        citations=[_citation()],
+    )
+
+    assert base == cache.build_key(
+        message="  what is   irpa s. 11? ",
+        locale="en-CA",
+        mode="standard",
+        citations=[_citation()],
+    )
+    assert base != cache.build_key(
+        message="What is IRPA s. 11?",
+        locale="fr-CA",
+        mode="standard",
+        citations=[_citation()],
+    )
+    assert base != cache.build_key(
+        message="What is IRPA s. 11?",
+        locale="en-CA",
+        mode="standard",
+        citations=[_citation("IRPR")],
+    )
+    assert citation_set_fingerprint([_citation()]) != citation_set_fingerprint(
+        [_citation("IRPR")]
+    )
+
+
+def test_catalog_version_change_invalidates_cached_answers() -> None:
+    version = {"value": "v1"}
+    cache = ChatAnswerCache(version_provider=lambda: version["value"])
+    key_kwargs = {
+        "message": "What is IRPA s. 11?",
+        "locale": "en-CA",
+        "mode": "standard",
+        "citations": [_citation()],
+    }
+    key = cache.build_key(**key_kwargs)
+    cache.put(key, _answer())
+    assert cache.get(key) is not None
+
+    version["value"] = "v2"
+    new_key = cache.build_key(**key_kwargs)
+
+    assert new_key != key
+    assert cache.get(new_key) is None
+    assert cache.get(key) is None
+    snapshot = cache.snapshot()
+    assert snapshot["version"] == "v2"
+    assert snapshot["invalidations"] == 1
+    assert snapshot["entries"] == 0
+
+
+def test_redis_tier_round_trips_and_promotes_hits_to_memory() -> None:
+    fake_redis = _FakeRedis()
+    redis_tier = RedisAnswerCacheTier(fake_redis, ttl_seconds=30)
+    writer = ChatAnswerCache(redis_tier=redis_tier)
+    key = writer.build_key(
+        message="What is IRPA s. 11?",
+        locale="en-CA",
+        mode="standard",
+        citations=[_citation()],
+    )
+    writer.put(key, _answer())
+    assert fake_redis.ttls == {f"immcad:chat:answers:{key}": 30}
+
+    reader = ChatAnswerCache(redis_tier=redis_tier)
+    cached = reader.get(key)
+
+    assert cached == _answer()
+    assert len(reader.memory_tier) == 1
+    assert reader.snapshot()["backend"] == "memory+redis"
+    assert reader.snapshot()["hits"] == 1
+
+
+def test_source_catalog_version_reflects_registry_and_policy_versions() -> None:
+    registry = SourceRegistry(version="2026-02-25", jurisdiction="ca", sources=[])
+    policy = SourcePolicy(version="2026-02-26", jurisdiction="ca", sources=[])
+
+    version = source_catalog_version(source_registry=registry, source_policy=policy)
+    bumped = source_catalog_version(
+        source_registry=registry.model_copy(update={"version": "2026-03-01"}),
+        source_policy=policy,
+    )
+
+    assert version.startswith("registry:2026-02-25|policy:2026-02-26|")
+    assert bumped != version
+    assert source_catalog_version(source_registry=None, source_policy=None).startswith(
+        "registry:none|policy:none|"
+    )
+
+
+def test_source_catalog_version_tracker_picks_up_catalog_refreshes() -> None:
+    now = {"value": 0.0}
+    catalog = {
+        "registry": SourceRegistry(version="2026-02-25", jurisdiction="ca", sources=[]),
+        "policy": SourcePolicy(version="2026-02-26", jurisdiction="ca", sources=[]),
+    }
+    loads: list[int] = []
+
+    def load_catalog() -> tuple[SourceRegistry, SourcePolicy]:
+        loads.append(1)
+        if catalog["registry"] is None:
+            raise ValueError("registry is being rewritten")
+        return catalog["registry"], catalog["policy"]
+
+    tracker = SourceCatalogVersionTracker(
+        load_catalog, refresh_seconds=30.0, time_fn=lambda: now["value"]
+    )
+    cache = ChatAnswerCache(version_provider=tracker)
+    key_kwargs = {
+        "message": "What is IRPA s. 11?",
+        "locale": "en-CA",
+        "mode": "standard",
+        "citations": [_citation()],
+    }
+    key = cache.build_key(**key_kwargs)
+    cache.put(key, _answer())
+
+    catalog["registry"] = catalog["registry"].model_copy(update={"version": "2026-03-01"})
+    now["value"] = 10.0
+    assert cache.build_key(**key_kwargs) == key
+    assert cache.get(key) == _answer()
+    assert len(loads) == 1
+
+    now["value"] = 31.0
+    assert cache.build_key(**key_kwargs) != key
+    assert tracker().startswith("registry:2026-03-01|")
+    assert cache.get(key) is None
+    assert cache.snapshot()["invalidations"] == 1
+
+    refreshed_version = tracker()
+    catalog["registry"] = None
+    now["value"] = 62.0
+    assert tracker() == refreshed_version
@@ -67,8 +67,8 @@ def test_chat_policy_block_response() -> None:
 def test_chat_endpoint_includes_research_preview_for_case_law_query(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    def _mock_research(self, request):
-        del self, request
+    def _mock_research(self, request, *, case_search_service=None):
+        del self, request, case_search_service
         return LawyerCaseResearchResponse(
             matter_profile={"target_court": "fc"},
             cases=[
@@ -590,12 +590,12 @@ def test_unhandled_exception_returns_unknown_error_envelope(
     monkeypatch.setenv("OPENAI_API_KEY", "test-openai-key")
     monkeypatch.setenv("GEMINI_API_KEY", "test-gemini-key")
 
-    def crashing_openai_generate(self, *, message: str, citations, locale: str):  # noqa: ANN001
+    async def crashing_openai_generate(self, *, message: str, citations, locale: str):  # noqa: ANN001
         del self, message, citations, locale
         raise RuntimeError("boom")
 
     monkeypatch.setattr(
-        "immcad_api.main.OpenAIProvider.generate", crashing_openai_generate
+        "immcad_api.main.OpenAIProvider.generate_async", crashing_openai_generate
     )
 
     failing_client = TestClient(create_app(), raise_server_exceptions=False)
@@ -625,7 +625,7 @@ def test_transient_openai_failure_falls_back_to_gemini_with_timeout_reason(
 
     openai_calls = {"count": 0}
 
-    def flaky_openai_generate(
+    async def flaky_openai_generate(
         self, *, message: str, citations, locale: str
     ) -> ProviderResult:
         del self, message, citations, locale
@@ -647,7 +647,7 @@ def test_transient_openai_failure_falls_back_to_gemini_with_timeout_reason(
             confidence="medium",
         )
 
-    def gemini_fallback_generate(
+    async def gemini_fallback_generate(
         self, *, message: str, citations, locale: str
     ) -> ProviderResult:
         del self, message, citations, locale
@@ -667,10 +667,10 @@ def test_transient_openai_failure_falls_back_to_gemini_with_timeout_reason(
         )
 
     monkeypatch.setattr(
-        "immcad_api.main.OpenAIProvider.generate", flaky_openai_generate
+        "immcad_api.main.OpenAIProvider.generate_async", flaky_openai_generate
     )
     monkeypatch.setattr(
-        "immcad_api.main.GeminiProvider.generate", gemini_fallback_generate
+        "immcad_api.main.GeminiProvider.generate_async", gemini_fallback_generate
     )
 
     transient_client = TestClient(create_app())
@@ -788,6 +788,129 @@ def test_rate_limit_envelope(monkeypatch: pytest.MonkeyPatch) -> None:
     assert second.headers["x-trace-id"] == body["error"]["trace_id"]
 
 
+def _batch_item(message: str) -> dict[str, str]:
+    return {
+        "session_id": "session-123456",
+        "message": message,
+        "locale": "en-CA",
+        "mode": "standard",
+    }
+
+
+def test_chat_batch_endpoint_returns_results_in_item_order() -> None:
+    response = client.post(
+        "/api/chat/batch",
+        json={
+            "items": [
+                _batch_item("What are the basic PR eligibility pathways?"),
+                _batch_item("Please represent me and file my application"),
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [result["index"] for result in body["results"]] == [0, 1]
+    assert body["succeeded"] == 2
+    assert body["failed"] == 0
+    assert body["results"][0]["response"]["citations"]
+    assert body["results"][1]["response"]["answer"] == POLICY_REFUSAL_TEXT
+    assert all(result["error"] is None for result in body["results"])
+    assert "x-trace-id" in response.headers
+
+
+def test_chat_batch_is_rate_limited_once_by_item_weight(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("API_RATE_LIMIT_PER_MINUTE", "4")
+    throttled_client = TestClient(create_app())
+
+    first = throttled_client.post(
+        "/api/chat/batch",
+        json={"items": [_batch_item("Explain PR pathways in brief.")] * 2},
+    )
+    second = throttled_client.post(
+        "/api/chat/batch",
+        json={"items": [_batch_item("Explain PR pathways in brief.")] * 3},
+    )
+    single = throttled_client.post(
+        "/api/chat", json=_batch_item("Explain PR pathways in brief.")
+    )
+    exhausted = throttled_client.post(
+        "/api/chat", json=_batch_item("Explain PR pathways in brief.")
+    )
+
+    # The middleware charges each batch one unit and the route its other items;
+    # the rejected batch still paid the middleware's unit.
+    assert first.status_code == 200
+    assert second.status_code == 429
+    assert second.json()["error"]["code"] == "RATE_LIMITED"
+    assert single.status_code == 200
+    assert exhausted.status_code == 429
+
+
+def test_chat_batch_rejected_batches_still_count_against_the_rate_limit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("API_RATE_LIMIT_PER_MINUTE", "2")
+    monkeypatch.setenv("CHAT_BATCH_MAX_ITEMS", "2")
+    throttled_client = TestClient(create_app())
+
+    statuses = [
+        throttled_client.post("/api/chat/batch", json=body).status_code
+        for body in (
+            {"items": [_batch_item("Explain PR pathways in brief.")] * 3},
+            {"items": "not-a-list"},
+            {"items": [_batch_item("Explain PR pathways in brief.")]},
+        )
+    ]
+
+    assert statuses == [422, 422, 429]
+
+
+def test_chat_accepts_client_request_timeout_header() -> None:
+    response = client.post(
+        "/api/chat",
+        json=_batch_item("What are the basic PR eligibility pathways?"),
+        headers={"x-request-timeout-ms": "20000"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["citations"]
+
+
+@pytest.mark.parametrize("path", ["/api/chat", "/api/chat/stream"])
+@pytest.mark.parametrize("header_value", ["0", "soon"])
+def test_chat_rejects_invalid_request_timeout_header(path: str, header_value: str) -> None:
+    response = client.post(
+        path,
+        json=_batch_item("What are the basic PR eligibility pathways?"),
+        headers={"x-request-timeout-ms": header_value},
+    )
+
+    assert response.status_code == 422
+    body = response.json()
+    assert body["error"]["code"] == "VALIDATION_ERROR"
+    assert "x-request-timeout-ms" in body["error"]["message"]
+
+
+def test_chat_batch_rejects_batches_over_configured_limit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("CHAT_BATCH_MAX_ITEMS", "2")
+    limited_client = TestClient(create_app())
+
+    response = limited_client.post(
+        "/api/chat/batch",
+        json={"items": [_batch_item("Explain PR pathways in brief.")] * 3},
+    )
+
+    assert response.status_code == 422
+    body = response.json()
+    assert body["error"]["code"] == "VALIDATION_ERROR"
+    assert response.headers["x-trace-id"] == body["error"]["trace_id"]
+
+
 def test_rate_limit_client_id_resolution_failure_returns_validation_envelope(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -1107,6 +1230,10 @@ def test_ops_metrics_endpoint_exposes_observability_baseline(
         "unknown",
     }
     assert "provider_routing_metrics" in payload
+    assert payload["provider_routing_scores"] == {}
+    assert payload["provider_circuits"]["gemini"]["state"] == "closed"
+    assert payload["bulkheads"]["gemini"]["max_concurrent"] == 16
+    assert payload["chat_request_coalescing"]["in_flight"] == 0
     assert "canlii_usage_metrics" in payload
     assert "official_source_freshness" in payload
     official_source_freshness = payload["official_source_freshness"]
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+from threading import Event
+import time
+
+import pytest
+
+from immcad_api.services.brownout import BrownoutController
+from immcad_api.services.retrieval_fanout import RetrievalFanout, RetrievalStage
+from immcad_api.telemetry import RequestMetrics
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_brownout_escalates_one_level_per_evaluation_and_caps_at_max() -> None:
+    clock = _Clock()
+    queue_depth = [20]
+    controller = BrownoutController(
+        queue_depth_fn=lambda: queue_depth[0],
+        max_queue_depth=10,
+        evaluation_interval_seconds=1.0,
+        time_fn=clock,
+    )
+
+    assert controller.level() == 1
+    # Within the evaluation interval the level holds.
+    assert controller.level() == 1
+    clock.now += 1.0
+    assert controller.level() == 2
+    clock.now += 1.0
+    assert controller.level() == 2
+    assert controller.snapshot()["escalations"] == 2
+
+
+def test_brownout_recovers_only_below_recovery_ratio() -> None:
+    clock = _Clock()
+    queue_depth = [20]
+    controller = BrownoutController(
+        queue_depth_fn=lambda: queue_depth[0],
+        max_queue_depth=10,
+        recovery_ratio=0.5,
+        evaluation_interval_seconds=1.0,
+        time_fn=clock,
+    )
+    assert controller.level() == 1
+    clock.now += 1.0
+    assert controller.level() == 2
+
+    # Back under the limit but above the recovery threshold: hold.
+    queue_depth[0] = 8
+    clock.now += 1.0
+    assert controller.level() == 2
+
+    queue_depth[0] = 2
+    clock.now += 1.0
+    assert controller.level() == 1
+    clock.now += 1.0
+    assert controller.level() == 0
+    assert controller.snapshot()["recoveries"] == 2
+
+
+def test_brownout_counts_each_event_loop_lag_spike_once() -> None:
+    clock = _Clock()
+    controller = BrownoutController(
+        max_event_loop_lag_seconds=0.1,
+        evaluation_interval_seconds=1.0,
+        time_fn=clock,
+    )
+    controller.record_event_loop_lag(0.3)
+    controller.record_event_loop_lag(0.05)
+
+    assert controller.level() == 1
+    assert controller.snapshot()["signals"]["event_loop_lag_ms"] == pytest.approx(300.0)
+    clock.now += 1.0
+    assert controller.level() == 0
+
+
+def test_brownout_uses_recent_p95_latency_once_enough_samples_exist() -> None:
+    clock = _Clock()
+    metrics = RequestMetrics()
+    controller = BrownoutController(
+        request_metrics=metrics,
+        max_p95_latency_ms=1000.0,
+        latency_window=10,
+        min_latency_samples=5,
+        evaluation_interval_seconds=0.0,
+        time_fn=clock,
+    )
+    for _ in range(4):
+        metrics.record_api_response(status_code=200, duration_seconds=3.0)
+    assert controller.level() == 0
+
+    metrics.record_api_response(status_code=200, duration_seconds=3.0)
+    assert controller.level() == 1
+
+    # Only the latest window counts, so fast responses bring the p95 back down.
+    for _ in range(10):
+        metrics.record_api_response(status_code=200, duration_seconds=0.1)
+    assert controller.level() == 0
+
+
+def test_brownout_monitor_records_event_loop_lag() -> None:
+    controller = BrownoutController(
+        max_event_loop_lag_seconds=0.01, evaluation_interval_seconds=0.0
+    )
+
+    async def scenario() -> None:
+        monitor = asyncio.create_task(
+            controller.monitor_event_loop(interval_seconds=0.01)
+        )
+        await asyncio.sleep(0.02)
+        time.sleep(0.1)  # Block the loop so the next sample is late.
+        await asyncio.sleep(0.03)
+        monitor.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await monitor
+
+    asyncio.run(scenario())
+
+    assert controller.level() == 1
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"max_event_loop_lag_seconds": 0}, "max_event_loop_lag_seconds must be > 0"),
+        ({"max_queue_depth": 0}, "max_queue_depth must be >= 1"),
+        ({"max_p95_latency_ms": 0}, "max_p95_latency_ms must be > 0"),
+        ({"recovery_ratio": 1.0}, "recovery_ratio must be > 0 and < 1"),
+        ({"max_level": 0}, "max_level must be >= 1"),
+    ],
+)
+def test_brownout_rejects_invalid_configuration(
+    kwargs: dict[str, float], message: str
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        BrownoutController(**kwargs)
+
+
+def test_retrieval_fanout_reports_stages_waiting_for_a_worker() -> None:
+    fanout = RetrievalFanout(max_workers=1)
+    release = Event()
+    started = Event()
+
+    def blocking() -> str:
+        started.set()
+        release.wait(5.0)
+        return "done"
+
+    try:
+        first = fanout._submit(RetrievalStage(name="a", run=blocking, timeout_seconds=5.0))
+        assert started.wait(5.0)
+        second = fanout._submit(
+            RetrievalStage(name="b", run=lambda: "done", timeout_seconds=5.0)
+        )
+        assert fanout.queue_depth() == 1
+
+        assert second is not None
+        fanout._cancel(second)
+        assert fanout.queue_depth() == 0
+        release.set()
+        assert first is not None and first.result(timeout=5.0) == "done"
+    finally:
+        release.set()
+        fanout.close()
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import threading
+import time
+
+import pytest
+
+from immcad_api.providers import (
+    Bulkhead,
+    BulkheadFullError,
+    BulkheadRegistry,
+    ProviderResult,
+    ProviderRouter,
+)
+from immcad_api.services.retrieval_fanout import RetrievalFanout, RetrievalStage
+from immcad_api.telemetry import RequestMetrics
+
+
+def test_bulkhead_sheds_calls_that_wait_past_queue_budget() -> None:
+    metrics = RequestMetrics()
+    bulkhead = Bulkhead(
+        "gemini", max_concurrent=1, max_queue_wait_seconds=0.05, metrics=metrics
+    )
+    bulkhead.acquire()
+
+    with pytest.raises(BulkheadFullError, match="gemini"):
+        bulkhead.acquire()
+
+    bulkhead.release()
+    snapshot = metrics.snapshot()["bulkheads"]["gemini"]
+    assert snapshot["admitted"] == 1
+    assert snapshot["shed"] == 1
+    assert snapshot["max_queue_depth"] == 1
+    assert snapshot["queue_wait_ms_p95"] >= 40.0
+    assert bulkhead.snapshot()["in_flight"] == 0
+
+
+def test_bulkhead_hands_released_slot_to_oldest_waiter() -> None:
+    bulkhead = Bulkhead("openai", max_concurrent=1, max_queue_wait_seconds=2.0)
+    bulkhead.acquire()
+    acquired = threading.Event()
+
+    def waiter() -> None:
+        bulkhead.acquire()
+        acquired.set()
+
+    thread = threading.Thread(target=waiter)
+    thread.start()
+    while bulkhead.snapshot()["queued"] == 0:
+        time.sleep(0.001)
+
+    bulkhead.release()
+    thread.join(timeout=1.0)
+
+    assert acquired.is_set()
+    assert bulkhead.snapshot() == {
+        "max_concurrent": 1,
+        "in_flight": 1,
+        "queued": 0,
+        "max_queue_wait_seconds": 2.0,
+    }
+
+
+def test_bulkhead_async_acquire_queues_and_sheds() -> None:
+    bulkhead = Bulkhead("openai", max_concurrent=1, max_queue_wait_seconds=0.05)
+
+    async def scenario() -> tuple[bool, bool]:
+        await bulkhead.acquire_async()
+        try:
+            await bulkhead.acquire_async()
+            shed = False
+        except BulkheadFullError:
+            shed = True
+
+        waiter = asyncio.ensure_future(bulkhead.acquire_async())
+        await asyncio.sleep(0)
+        bulkhead.release()
+        await asyncio.wait_for(waiter, timeout=1.0)
+        bulkhead.release()
+        return shed, waiter.exception() is None
+
+    assert asyncio.run(scenario()) == (True, True)
+    assert bulkhead.snapshot()["in_flight"] == 0
+
+
+def test_bulkhead_async_cancelled_waiter_does_not_leak_slot() -> None:
+    bulkhead = Bulkhead("openai", max_concurrent=1, max_queue_wait_seconds=5.0)
+
+    async def scenario() -> None:
+        await bulkhead.acquire_async()
+        waiter = asyncio.ensure_future(bulkhead.acquire_async())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        bulkhead.release()
+
+    asyncio.run(scenario())
+
+    assert bulkhead.snapshot()["in_flight"] == 0
+    assert bulkhead.snapshot()["queued"] == 0
+
+
+@dataclass
+class _BlockingProvider:
+    name: str
+    gate: threading.Event
+
+    def generate(self, *, message: str, citations, locale: str) -> ProviderResult:
+        self.gate.wait(timeout=2.0)
+        return ProviderResult(
+            provider=self.name, answer=self.name, citations=[], confidence="medium"
+        )
+
+
+def test_router_fails_over_when_provider_bulkhead_is_saturated() -> None:
+    gate = threading.Event()
+    primary = _BlockingProvider(name="openai", gate=gate)
+    secondary = _BlockingProvider(name="gemini", gate=threading.Event())
+    secondary.gate.set()
+    registry = BulkheadRegistry(limits={"openai": 1}, max_queue_wait_seconds=0.05)
+    router = ProviderRouter(
+        [primary, secondary],
+        "openai",
+        bulkheads=registry,
+        circuit_breaker_failure_threshold=1,
+    )
+    in_flight = threading.Thread(
+        target=router.generate, kwargs={"message": "q", "citations": [], "locale": "en-CA"}
+    )
+    in_flight.start()
+    while registry.get("openai").snapshot()["in_flight"] == 0:
+        time.sleep(0.001)
+
+    shed = router.generate(message="q", citations=[], locale="en-CA")
+    gate.set()
+    in_flight.join(timeout=2.0)
+
+    assert shed.result.provider == "gemini"
+    assert shed.fallback_reason == "timeout"
+    metrics = router.telemetry_snapshot()["openai"]
+    assert metrics["bulkhead_shed"] == 1
+    assert "failure" not in metrics
+    assert router.circuit_snapshot()["openai"]["state"] == "closed"
+
+
+def test_retrieval_fanout_reports_shed_stage() -> None:
+    registry = BulkheadRegistry(limits={"case_search": 1}, max_queue_wait_seconds=0.0)
+    registry.get("case_search").acquire()
+    fanout = RetrievalFanout(bulkheads=registry)
+
+    outcomes = fanout.run(
+        [
+            RetrievalStage(name="case_search", run=lambda: ["case"], timeout_seconds=1.0),
+            RetrievalStage(name="research_preview", run=lambda: "preview", timeout_seconds=1.0),
+        ]
+    )
+    fanout.close()
+
+    assert outcomes[0].shed is True
+    assert outcomes[0].value is None
+    assert outcomes[1].shed is False
+    assert outcomes[1].value == "preview"
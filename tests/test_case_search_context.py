@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from datetime import date
+import threading
+
+import pytest
+
+from immcad_api.errors import SourceUnavailableError
+from immcad_api.providers.base import ProviderResult
+from immcad_api.providers.router import RoutingResult
+from immcad_api.schemas import (
+    CaseSearchRequest,
+    CaseSearchResponse,
+    CaseSearchResult,
+    ChatRequest,
+)
+from immcad_api.services.case_search_context import RequestCaseSearchContext
+from immcad_api.services.chat_service import ChatService
+from immcad_api.services.lawyer_case_research_service import LawyerCaseResearchService
+
+
+def _case(index: int) -> CaseSearchResult:
+    return CaseSearchResult(
+        case_id=f"2026-FC-{index}",
+        title=f"Example {index} v Canada",
+        citation=f"2026 FC {index}",
+        decision_date=date(2026, 2, 1),
+        url=f"https://decisions.fct-cf.gc.ca/fc-cf/decisions/en/item/{index}/index.do",
+        source_id="FC_DECISIONS",
+    )
+
+
+class _CountingCaseSearchService:
+    def __init__(
+        self,
+        *,
+        error: Exception | None = None,
+        gate: threading.Event | None = None,
+    ) -> None:
+        self.error = error
+        self.gate = gate
+        self.requests: list[CaseSearchRequest] = []
+        self._lock = threading.Lock()
+
+    def search(self, request: CaseSearchRequest) -> CaseSearchResponse:
+        with self._lock:
+            self.requests.append(request)
+        if self.gate is not None:
+            self.gate.wait(timeout=2.0)
+        if self.error is not None:
+            raise self.error
+        return CaseSearchResponse(
+            results=[_case(index) for index in range(1, request.limit + 1)]
+        )
+
+
+class _StaticRouter:
+    def generate(self, *, message: str, citations, locale: str) -> RoutingResult:
+        del message, locale
+        return RoutingResult(
+            result=ProviderResult(
+                provider="scaffold",
+                answer="Scaffold response",
+                citations=citations,
+                confidence="low",
+            ),
+            fallback_used=False,
+            fallback_reason=None,
+        )
+
+
+def test_context_deduplicates_identical_lookups() -> None:
+    upstream = _CountingCaseSearchService()
+    context = RequestCaseSearchContext(upstream)
+    request = CaseSearchRequest(query="inadmissibility  appeal", limit=3)
+
+    first = context.search(request)
+    second = context.search(
+        CaseSearchRequest(query=" inadmissibility appeal ", limit=3)
+    )
+
+    assert len(upstream.requests) == 1
+    assert [result.case_id for result in second.results] == [
+        result.case_id for result in first.results
+    ]
+    assert context.upstream_calls == 1
+    assert context.memo_hits == 1
+
+
+def test_context_serves_narrower_limit_from_wider_result() -> None:
+    upstream = _CountingCaseSearchService()
+    context = RequestCaseSearchContext(upstream)
+
+    context.search(CaseSearchRequest(query="inadmissibility", limit=5))
+    narrow = context.search(CaseSearchRequest(query="inadmissibility", limit=2))
+
+    assert len(upstream.requests) == 1
+    assert [result.case_id for result in narrow.results] == [
+        "2026-FC-1",
+        "2026-FC-2",
+    ]
+
+
+def test_context_fetches_again_for_wider_limit_or_different_filters() -> None:
+    upstream = _CountingCaseSearchService()
+    context = RequestCaseSearchContext(upstream)
+
+    context.search(CaseSearchRequest(query="inadmissibility", limit=2))
+    wider = context.search(CaseSearchRequest(query="inadmissibility", limit=4))
+    context.search(CaseSearchRequest(query="inadmissibility", court="fc", limit=2))
+    context.search(
+        CaseSearchRequest(query="inadmissibility", jurisdiction="on", limit=2)
+    )
+    context.search(CaseSearchRequest(query="inadmissibility", limit=3))
+
+    assert [request.limit for request in upstream.requests] == [2, 4, 2, 2]
+    assert len(wider.results) == 4
+
+
+def test_context_memoizes_upstream_failures_within_turn() -> None:
+    upstream = _CountingCaseSearchService(
+        error=SourceUnavailableError("Case-law sources unavailable")
+    )
+    context = RequestCaseSearchContext(upstream)
+    request = CaseSearchRequest(query="inadmissibility", limit=3)
+
+    with pytest.raises(SourceUnavailableError):
+        context.search(request)
+    with pytest.raises(SourceUnavailableError):
+        context.search(request)
+
+    assert len(upstream.requests) == 1
+
+
+def test_context_coalesces_concurrent_identical_lookups() -> None:
+    gate = threading.Event()
+    upstream = _CountingCaseSearchService(gate=gate)
+    context = RequestCaseSearchContext(upstream)
+    request = CaseSearchRequest(query="inadmissibility", limit=3)
+    results: list[CaseSearchResponse] = []
+
+    workers = [
+        threading.Thread(target=lambda: results.append(context.search(request)))
+        for _ in range(3)
+    ]
+    for worker in workers:
+        worker.start()
+    gate.set()
+    for worker in workers:
+        worker.join(timeout=2.0)
+
+    assert len(upstream.requests) == 1
+    assert len(results) == 3
+
+
+def test_chat_turn_shares_case_search_lookups_with_research_preview() -> None:
+    upstream = _CountingCaseSearchService()
+    service = ChatService(
+        _StaticRouter(),
+        case_search_tool=upstream,
+        lawyer_research_service=LawyerCaseResearchService(
+            case_search_service=upstream
+        ),
+    )
+    payload = ChatRequest(
+        session_id="session-123456",
+        message="Find case law on inadmissibility.",
+        locale="en-CA",
+        mode="standard",
+    )
+
+    response = service.handle_chat(payload, trace_id="trace-memo-001")
+
+    assert response.research_preview is not None
+    queries = [request.query for request in upstream.requests]
+    assert queries.count(payload.message) == 1
@@ -2,7 +2,11 @@ from __future__ import annotations
 
 from datetime import date
 
+import pytest
+
+from immcad_api.deadline import Deadline, deadline_scope
 from immcad_api.errors import RateLimitError, SourceUnavailableError
+from immcad_api.providers.bulkhead import BulkheadRegistry
 from immcad_api.schemas import CaseSearchRequest, CaseSearchResponse, CaseSearchResult
 from immcad_api.services.case_search_service import CaseSearchService
 
@@ -191,3 +195,86 @@ def test_case_search_service_falls_back_to_canlii_when_official_returns_other_ap
     assert official.calls == 1
     assert canlii.calls == 1
     assert response.results[0].case_id == "canlii-3"
+
+
+class _SlowOfficialClient(_OfficialClient):
+    def __init__(self, clock: list[float]) -> None:
+        super().__init__(response=CaseSearchResponse(results=[]))
+        self.clock = clock
+
+    def search_cases(self, request: CaseSearchRequest) -> CaseSearchResponse:
+        self.clock[0] += 5.0
+        return super().search_cases(request)
+
+
+def test_case_search_service_skips_canlii_fallback_after_deadline() -> None:
+    clock = [0.0]
+    official = _SlowOfficialClient(clock)
+    canlii = _CanliiClient(response=CaseSearchResponse(results=[]))
+    service = CaseSearchService(canlii_client=canlii, official_client=official)
+
+    with deadline_scope(Deadline.after(3.0, time_fn=lambda: clock[0])):
+        response = service.search(
+            CaseSearchRequest(query="work permit", jurisdiction="ca", court="fc", limit=2)
+        )
+
+    assert official.calls == 1
+    assert canlii.calls == 0
+    assert response.results == []
+
+
+def test_case_search_service_fails_fast_when_deadline_already_passed() -> None:
+    clock = [0.0]
+    official = _OfficialClient()
+    service = CaseSearchService(official_client=official)
+    deadline = Deadline.after(1.0, time_fn=lambda: clock[0])
+    clock[0] = 2.0
+
+    with deadline_scope(deadline):
+        with pytest.raises(SourceUnavailableError, match="deadline"):
+            service.search(
+                CaseSearchRequest(query="work permit", jurisdiction="ca", limit=2)
+            )
+
+    assert official.calls == 0
+
+
+def test_case_search_service_sheds_saturated_sources_behind_their_bulkheads() -> None:
+    official = _OfficialClient()
+    canlii = _CanliiClient(
+        response=CaseSearchResponse(
+            results=[
+                CaseSearchResult(
+                    case_id="canlii-2",
+                    title="CanLII under load",
+                    citation="2026 FC 2",
+                    decision_date=date(2026, 1, 2),
+                    url="https://www.canlii.org/en/ca/fct/doc/2026/2026fc2/2026fc2.html",
+                )
+            ]
+        )
+    )
+    bulkheads = BulkheadRegistry(
+        limits={"official_case_law": 1, "canlii": 1}, max_queue_wait_seconds=0.0
+    )
+    service = CaseSearchService(
+        canlii_client=canlii, official_client=official, bulkheads=bulkheads
+    )
+    request = CaseSearchRequest(query="work permit", jurisdiction="ca", court="fc", limit=2)
+
+    official_bulkhead = bulkheads.get("official_case_law")
+    assert official_bulkhead is not None
+    with official_bulkhead.slot():
+        response = service.search(request)
+
+    assert official.calls == 0
+    assert canlii.calls == 1
+    assert response.results[0].title == "CanLII under load"
+    assert bulkheads.snapshot()["canlii"]["in_flight"] == 0
+
+    canlii_bulkhead = bulkheads.get("canlii")
+    assert canlii_bulkhead is not None
+    with official_bulkhead.slot(), canlii_bulkhead.slot():
+        with pytest.raises(SourceUnavailableError, match="capacity"):
+            service.search(request)
+    assert canlii.calls == 1
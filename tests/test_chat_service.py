@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import date
 import json
 import logging
+import threading
+import time
 
 import pytest
 
-from immcad_api.errors import SourceUnavailableError
+from immcad_api.deadline import Deadline, deadline_scope
+from immcad_api.errors import ProviderApiError, SourceUnavailableError
 from immcad_api.policy.compliance import DISCLAIMER_TEXT, POLICY_REFUSAL_TEXT
 from immcad_api.policy.source_policy import SourcePolicy
 from immcad_api.providers import ProviderError
@@ -23,11 +27,14 @@ from immcad_api.schemas import (
     LawyerCaseResearchResponse,
     LawyerCaseSupport,
 )
+from immcad_api.services.answer_cache import CachedAnswer, ChatAnswerCache
 from immcad_api.services.chat_service import ChatService
 from immcad_api.services.grounding import (
     StaticGroundingAdapter,
     scaffold_grounded_citations,
 )
+from immcad_api.services.request_coalescing import RequestCoalescer
+from immcad_api.services.retrieval_fanout import RetrievalFanout, RetrievalStage
 
 
 @dataclass
@@ -94,8 +101,12 @@ class _RecordingLawyerResearchService:
     requests: list[LawyerCaseResearchRequest] = field(default_factory=list)
 
     def research(
-        self, request: LawyerCaseResearchRequest
+        self,
+        request: LawyerCaseResearchRequest,
+        *,
+        case_search_service=None,  # noqa: ANN001
     ) -> LawyerCaseResearchResponse:
+        del case_search_service
         self.requests.append(request)
         if self.error is not None:
             raise self.error
@@ -840,3 +851,796 @@ def test_chat_service_still_returns_chat_answer_when_research_preview_errors() -
     assert len(lawyer_research_service.requests) == 1
     assert response.answer == "Scaffold response"
     assert response.research_preview is None
+
+
+@dataclass
+class _BarrierCaseSearchTool:
+    barrier: threading.Barrier
+
+    def search(self, request: CaseSearchRequest) -> CaseSearchResponse:
+        del request
+        self.barrier.wait(timeout=2.0)
+        return CaseSearchResponse(
+            results=[
+                CaseSearchResult(
+                    case_id="2026-FC-101",
+                    title="Example v Canada (Citizenship and Immigration)",
+                    citation="2026 FC 101",
+                    decision_date=date(2026, 2, 1),
+                    url="https://www.canlii.org/en/ca/fct/doc/2026/2026fc101/2026fc101.html",
+                    source_id="FC_DECISIONS",
+                )
+            ]
+        )
+
+
+@dataclass
+class _BarrierLawyerResearchService:
+    barrier: threading.Barrier
+
+    def research(
+        self,
+        request: LawyerCaseResearchRequest,
+        *,
+        case_search_service=None,  # noqa: ANN001
+    ) -> LawyerCaseResearchResponse:
+        del request, case_search_service
+        self.barrier.wait(timeout=2.0)
+        return LawyerCaseResearchResponse(
+            matter_profile={},
+            cases=[],
+            source_status={"official": "no_match", "canlii": "not_used"},
+        )
+
+
+def test_chat_service_runs_case_search_and_research_preview_concurrently() -> None:
+    # Each stage blocks until the other arrives; sequential execution would
+    # break the barrier and surface as tool errors.
+    barrier = threading.Barrier(2)
+    service = ChatService(
+        _StaticRouter(citations=[]),
+        case_search_tool=_BarrierCaseSearchTool(barrier),
+        lawyer_research_service=_BarrierLawyerResearchService(barrier),
+        trusted_citation_domains=("canlii.org",),
+    )
+    payload = ChatRequest(
+        session_id="session-123456",
+        message="Find case law about inadmissibility decisions.",
+        locale="en-CA",
+        mode="standard",
+    )
+
+    response = service.handle_chat(payload, trace_id="trace-fanout-001")
+
+    assert [citation.source_id for citation in response.citations] == [
+        "FC_DECISIONS"
+    ]
+    assert response.research_preview is not None
+    assert response.research_preview.source_status == {
+        "official": "no_match",
+        "canlii": "not_used",
+    }
+
+
+def test_chat_service_drops_case_search_stage_after_timeout(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    release = threading.Event()
+
+    @dataclass
+    class _SlowCaseSearchTool:
+        def search(self, request: CaseSearchRequest) -> CaseSearchResponse:
+            del request
+            release.wait(timeout=2.0)
+            return CaseSearchResponse(results=[])
+
+    lawyer_research_service = _RecordingLawyerResearchService()
+    service = ChatService(
+        _StaticRouter(citations=[]),
+        grounding_adapter=StaticGroundingAdapter(scaffold_grounded_citations()),
+        case_search_tool=_SlowCaseSearchTool(),
+        lawyer_research_service=lawyer_research_service,
+        case_search_tool_timeout_seconds=0.05,
+    )
+    payload = ChatRequest(
+        session_id="session-123456",
+        message="Find case law precedent on inadmissibility.",
+        locale="en-CA",
+        mode="standard",
+    )
+
+    try:
+        with caplog.at_level(logging.INFO, logger="immcad_api.audit"):
+            response = service.handle_chat(payload, trace_id="trace-fanout-002")
+    finally:
+        release.set()
+
+    assert response.answer == "Scaffold response"
+    assert [citation.source_id for citation in response.citations] == ["IRPA"]
+    assert response.research_preview is not None
+    timeout_events = [
+        event
+        for event in _audit_events(caplog)
+        if event.get("event_type") == "case_search_tool_error"
+    ]
+    assert len(timeout_events) == 1
+    assert timeout_events[0]["tool_error_code"] == "timeout"
+    assert timeout_events[0]["trace_id"] == "trace-fanout-002"
+
+
+def test_chat_service_runs_retrieval_inline_when_threads_are_unavailable(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fanout = RetrievalFanout()
+
+    def _raise_threadless(*args, **kwargs):  # noqa: ANN002, ANN003
+        raise RuntimeError("can't start new thread")
+
+    monkeypatch.setattr(fanout, "_get_executor", _raise_threadless)
+    case_search_tool = _RecordingCaseSearchTool()
+    lawyer_research_service = _RecordingLawyerResearchService()
+    service = ChatService(
+        _StaticRouter(citations=[]),
+        grounding_adapter=StaticGroundingAdapter(scaffold_grounded_citations()),
+        case_search_tool=case_search_tool,
+        lawyer_research_service=lawyer_research_service,
+        retrieval_fanout=fanout,
+    )
+    payload = ChatRequest(
+        session_id="session-123456",
+        message="Find case law precedent on inadmissibility.",
+        locale="en-CA",
+        mode="standard",
+    )
+
+    response = service.handle_chat(payload, trace_id="trace-fanout-003")
+
+    assert len(case_search_tool.requests) == 1
+    assert len(lawyer_research_service.requests) == 1
+    assert response.answer == "Scaffold response"
+    assert response.research_preview is not None
+
+
+def test_retrieval_fanout_run_async_bounds_stages_as_tasks_when_threadless(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fanout = RetrievalFanout()
+
+    def _raise_threadless(*args, **kwargs):  # noqa: ANN002, ANN003
+        raise RuntimeError("can't start new thread")
+
+    monkeypatch.setattr(fanout, "_get_executor", _raise_threadless)
+    cancelled: list[str] = []
+
+    async def _slow() -> str:
+        try:
+            await asyncio.sleep(2.0)
+        except asyncio.CancelledError:
+            cancelled.append("slow")
+            raise
+        return "late"
+
+    async def _fast() -> str:
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    started = time.perf_counter()
+    outcomes = asyncio.run(
+        fanout.run_async(
+            [
+                RetrievalStage(name="slow", run=_slow, timeout_seconds=0.05),
+                RetrievalStage(name="fast", run=_fast, timeout_seconds=1.0),
+                RetrievalStage(name="sync", run=lambda: "inline", timeout_seconds=1.0),
+            ]
+        )
+    )
+
+    assert time.perf_counter() - started < 1.0
+    assert [(outcome.name, outcome.timed_out, outcome.value) for outcome in outcomes] == [
+        ("slow", True, None),
+        ("fast", False, "ok"),
+        ("sync", False, "inline"),
+    ]
+    assert cancelled == ["slow"]
+
+
+@dataclass
+class _CountingRouter(_StaticRouter):
+    calls: int = 0
+
+    def generate(self, *, message: str, citations, locale: str) -> RoutingResult:
+        self.calls += 1
+        return super().generate(message=message, citations=citations, locale=locale)
+
+
+def test_chat_service_serves_repeated_question_from_answer_cache(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    router = _CountingRouter(citations=[])
+    answer_cache = ChatAnswerCache()
+    service = ChatService(
+        router,
+        grounding_adapter=StaticGroundingAdapter(scaffold_grounded_citations()),
+        answer_cache=answer_cache,
+    )
+    first = ChatRequest(
+        session_id="session-123456",
+        message="Summarize IRPA section 11.",
+        locale="en-CA",
+        mode="standard",
+    )
+    repeat = first.model_copy(update={"message": "  summarize   IRPA section 11. "})
+
+    caplog.set_level(logging.INFO, logger="immcad_api.audit")
+    first_response = service.handle_chat(first, trace_id="trace-cache-001")
+    cached_response = service.handle_chat(repeat, trace_id="trace-cache-002")
+
+    assert router.calls == 1
+    assert cached_response.answer == first_response.answer
+    assert cached_response.citations == first_response.citations
+    assert cached_response.fallback_used.used is False
+    assert answer_cache.snapshot()["hits"] == 1
+    assert answer_cache.snapshot()["stores"] == 1
+    cache_events = [
+        event
+        for event in _audit_events(caplog)
+        if event["event_type"] == "answer_cache_hit"
+    ]
+    assert len(cache_events) == 1
+    assert cache_events[0]["trace_id"] == "trace-cache-002"
+
+
+def test_chat_service_skips_cached_answer_that_fails_citation_gate() -> None:
+    router = _CountingRouter(citations=[])
+    answer_cache = ChatAnswerCache()
+    grounded = scaffold_grounded_citations()
+    service = ChatService(
+        router,
+        grounding_adapter=StaticGroundingAdapter(grounded),
+        answer_cache=answer_cache,
+    )
+    payload = ChatRequest(
+        session_id="session-123456",
+        message="Summarize IRPA section 11.",
+        locale="en-CA",
+        mode="standard",
+    )
+    key = answer_cache.build_key(
+        message=payload.message,
+        locale=payload.locale,
+        mode=payload.mode,
+        citations=grounded,
+    )
+    answer_cache.put(
+        key,
+        CachedAnswer(
+            answer="Stale answer",
+            citations=(
+                Citation(
+                    source_id="UNGROUNDED",
+                    title="Ungrounded",
+                    url="https://example.invalid/ungrounded",
+                    pin="s. 1",
+                    snippet="Not part of the grounding set.",
+                ),
+            ),
+            confidence="medium",
+            provider="scaffold",
+        ),
+    )
+
+    response = service.handle_chat(payload)
+
+    assert router.calls == 1
+    assert response.answer == "Scaffold response"
+    assert answer_cache.snapshot()["rejected"] == 1
+
+
+@dataclass
+class _AsyncOnlyRouter:
+    calls: int = 0
+
+    def generate(self, *, message: str, citations, locale: str) -> RoutingResult:
+        raise AssertionError("handle_chat_async should await generate_async")
+
+    async def generate_async(
+        self, *, message: str, citations, locale: str
+    ) -> RoutingResult:
+        del message, locale
+        self.calls += 1
+        await asyncio.sleep(0)
+        return RoutingResult(
+            result=ProviderResult(
+                provider="openai",
+                answer="Async response",
+                citations=citations,
+                confidence="medium",
+            ),
+            fallback_used=False,
+            fallback_reason=None,
+        )
+
+
+def test_chat_service_handle_chat_async_awaits_async_router() -> None:
+    router = _AsyncOnlyRouter()
+    lawyer_research_service = _RecordingLawyerResearchService()
+    service = ChatService(
+        router,
+        grounding_adapter=StaticGroundingAdapter(scaffold_grounded_citations()),
+        case_search_tool=_RecordingCaseSearchTool(),
+        lawyer_research_service=lawyer_research_service,
+    )
+    payload = ChatRequest(
+        session_id="session-123456",
+        message="Find case law precedent on inadmissibility.",
+        locale="en-CA",
+        mode="standard",
+    )
+
+    response = asyncio.run(
+        service.handle_chat_async(payload, trace_id="trace-async-001")
+    )
+
+    assert router.calls == 1
+    assert response.answer == "Async response"
+    assert [citation.source_id for citation in response.citations] == ["IRPA"]
+    assert response.research_preview is not None
+    assert len(lawyer_research_service.requests) == 1
+
+
+class _SlowGroundingAdapter(StaticGroundingAdapter):
+    def citation_candidates(self, *, message: str, locale: str, mode: str):  # noqa: ANN201
+        time.sleep(0.1)
+        return super().citation_candidates(message=message, locale=locale, mode=mode)
+
+
+def test_chat_service_handle_chat_async_keeps_blocking_grounding_off_the_loop() -> None:
+    service = ChatService(
+        _AsyncOnlyRouter(),
+        grounding_adapter=_SlowGroundingAdapter(scaffold_grounded_citations()),
+    )
+    payload = ChatRequest(
+        session_id="session-123456",
+        message="What are the eligibility rules for study permits?",
+        locale="en-CA",
+        mode="standard",
+    )
+
+    async def _run() -> tuple[str, int]:
+        ticks = 0
+        done = asyncio.Event()
+
+        async def _ticker() -> None:
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker = asyncio.create_task(_ticker())
+        response = await service.handle_chat_async(payload)
+        done.set()
+        await ticker
+        return response.answer, ticks
+
+    answer, ticks = asyncio.run(_run())
+
+    assert answer == "Async response"
+    assert ticks > 5
+
+
+def test_retrieval_fanout_run_async_times_out_without_blocking_loop() -> None:
+    release = threading.Event()
+    fanout = RetrievalFanout()
+
+    async def _run() -> tuple[list, int]:
+        ticks = 0
+
+        async def _ticker() -> None:
+            nonlocal ticks
+            while not release.is_set():
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker = asyncio.create_task(_ticker())
+        outcomes = await fanout.run_async(
+            [
+                RetrievalStage(
+                    name="slow",
+                    run=lambda: release.wait(timeout=2.0),
+                    timeout_seconds=0.1,
+                ),
+                RetrievalStage(name="fast", run=lambda: "ok", timeout_seconds=1.0),
+            ]
+        )
+        release.set()
+        await ticker
+        return outcomes, ticks
+
+    try:
+        outcomes, ticks = asyncio.run(_run())
+    finally:
+        release.set()
+        fanout.close()
+
+    assert [(outcome.name, outcome.timed_out) for outcome in outcomes] == [
+        ("slow", True),
+        ("fast", False),
+    ]
+    assert outcomes[1].value == "ok"
+    assert ticks > 1
+
+
+@dataclass
+class _GatedRouter:
+    gate: threading.Event
+    calls: list[str] = field(default_factory=list)
+    error: ProviderError | None = None
+
+    def generate(self, *, message: str, citations, locale: str) -> RoutingResult:
+        self.calls.append(message)
+        self.gate.wait(timeout=2.0)
+        if self.error is not None:
+            raise self.error
+        return RoutingResult(
+            result=ProviderResult(
+                provider="scaffold",
+                answer="Scaffold response",
+                citations=citations,
+                confidence="low",
+            ),
+            fallback_used=False,
+            fallback_reason=None,
+        )
+
+
+def _run_concurrent_chats(
+    service: ChatService, router: _GatedRouter, messages: list[str]
+) -> list[object]:
+    outcomes: list[object] = [None] * len(messages)
+
+    def run(index: int, message: str) -> None:
+        request = ChatRequest(session_id="session-123456", message=message)
+        try:
+            outcomes[index] = service.handle_chat(request, trace_id=f"trace-{index}")
+        except Exception as exc:
+            outcomes[index] = exc
+
+    threads = [
+        threading.Thread(target=run, args=(index, message))
+        for index, message in enumerate(messages)
+    ]
+    threads[0].start()
+    while not router.calls:
+        time.sleep(0.001)
+    for thread in threads[1:]:
+        thread.start()
+    coalescer = service.request_coalescer
+    assert coalescer is not None
+    while coalescer.snapshot()["followers"] < len(messages) - 1:
+        time.sleep(0.001)
+    router.gate.set()
+    for thread in threads:
+        thread.join(timeout=2.0)
+    return outcomes
+
+
+def test_chat_service_coalesces_identical_concurrent_requests(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    router = _GatedRouter(gate=threading.Event())
+    service = ChatService(
+        router,
+        grounding_adapter=StaticGroundingAdapter(scaffold_grounded_citations()),
+        request_coalescer=RequestCoalescer(),
+    )
+
+    with caplog.at_level(logging.INFO, logger="immcad_api.audit"):
+        responses = _run_concurrent_chats(
+            service,
+            router,
+            [
+                "What is IRPA section 11?",
+                "what is  IRPA section 11?",
+                "WHAT IS IRPA SECTION 11?",
+            ],
+        )
+
+    assert len(router.calls) == 1
+    assert responses[0] == responses[1] == responses[2]
+    assert responses[1] is not responses[0]
+    coalesced = [
+        event for event in _audit_events(caplog) if event["event_type"] == "chat_request_coalesced"
+    ]
+    assert sorted(str(event["trace_id"]) for event in coalesced) == ["trace-1", "trace-2"]
+
+
+def test_chat_service_fans_out_coalesced_failures_without_caching() -> None:
+    router = _GatedRouter(
+        gate=threading.Event(),
+        error=ProviderError("openai", "provider_error", "provider failed"),
+    )
+    service = ChatService(
+        router,
+        grounding_adapter=StaticGroundingAdapter(scaffold_grounded_citations()),
+        request_coalescer=RequestCoalescer(),
+    )
+
+    outcomes = _run_concurrent_chats(
+        service, router, ["What is IRPA section 11?", "What is IRPA section 11?"]
+    )
+
+    assert all(isinstance(outcome, ProviderApiError) for outcome in outcomes)
+    assert len(router.calls) == 1
+    with pytest.raises(ProviderApiError):
+        service.handle_chat(
+            ChatRequest(session_id="session-123456", message="What is IRPA section 11?")
+        )
+    assert len(router.calls) == 2
+
+
+@dataclass
+class _ConcurrencyTrackingRouter:
+    in_flight: int = 0
+    max_in_flight: int = 0
+    calls: list[str] = field(default_factory=list)
+
+    def generate(self, *, message: str, citations, locale: str) -> RoutingResult:
+        raise AssertionError("batches should await generate_async")
+
+    async def generate_async(
+        self, *, message: str, citations, locale: str
+    ) -> RoutingResult:
+        del locale
+        self.calls.append(message)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if "fail" in message:
+            raise ProviderError("openai", "provider_error", "provider failed")
+        return RoutingResult(
+            result=ProviderResult(
+                provider="openai",
+                answer=f"Answer: {message}",
+                citations=citations,
+                confidence="medium",
+            ),
+            fallback_used=False,
+            fallback_reason=None,
+        )
+
+
+def test_chat_service_batch_bounds_concurrency_and_keeps_order() -> None:
+    router = _ConcurrencyTrackingRouter()
+    service = ChatService(
+        router,
+        grounding_adapter=StaticGroundingAdapter(scaffold_grounded_citations()),
+    )
+    messages = [f"What does IRPA section {number} say?" for number in range(6)]
+
+    outcomes = asyncio.run(
+        service.handle_chat_batch_async(
+            [ChatRequest(session_id="session-123456", message=m) for m in messages],
+            trace_id="trace-batch",
+            max_concurrency=2,
+        )
+    )
+
+    assert [outcome.answer for outcome in outcomes] == [f"Answer: {m}" for m in messages]
+    assert router.max_in_flight == 2
+
+
+def test_chat_service_batch_answers_duplicates_once_and_isolates_failures(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    router = _ConcurrencyTrackingRouter()
+    service = ChatService(
+        router,
+        grounding_adapter=StaticGroundingAdapter(scaffold_grounded_citations()),
+    )
+    requests = [
+        ChatRequest(session_id="session-123456", message="What is IRPA section 11?"),
+        ChatRequest(session_id="session-123456", message="Please fail on IRPA section 11"),
+        ChatRequest(session_id="session-123456", message="what is  IRPA section 11?"),
+        ChatRequest(session_id="session-123456", message="Hello"),
+    ]
+
+    with caplog.at_level(logging.INFO, logger="immcad_api.audit"):
+        outcomes = asyncio.run(
+            service.handle_chat_batch_async(requests, trace_id="trace-batch")
+        )
+
+    assert router.calls == ["What is IRPA section 11?", "Please fail on IRPA section 11"]
+    assert outcomes[0] == outcomes[2]
+    assert outcomes[2] is not outcomes[0]
+    assert isinstance(outcomes[1], ProviderApiError)
+    assert outcomes[3].fallback_used.used is False
+    coalesced = [
+        event
+        for event in _audit_events(caplog)
+        if event["event_type"] == "chat_request_coalesced"
+    ]
+    assert [event["trace_id"] for event in coalesced] == ["trace-batch:2"]
+
+
+def test_chat_service_batch_shares_case_search_lookups_across_items() -> None:
+    case_search_tool = _RecordingCaseSearchTool()
+    service = ChatService(
+        _AsyncOnlyRouter(),
+        grounding_adapter=StaticGroundingAdapter(scaffold_grounded_citations()),
+        case_search_tool=case_search_tool,
+    )
+    message = "Find case law about inadmissibility decisions."
+
+    outcomes = asyncio.run(
+        service.handle_chat_batch_async(
+            [
+                ChatRequest(session_id="session-123456", message=message, locale="en-CA"),
+                ChatRequest(session_id="session-123456", message=message, locale="fr-CA"),
+            ]
+        )
+    )
+
+    assert all(outcome.answer == "Async response" for outcome in outcomes)
+    assert len(case_search_tool.requests) == 1
+
+
+def test_chat_service_batch_rejects_invalid_concurrency() -> None:
+    service = ChatService(_StaticRouter(citations=[]))
+
+    with pytest.raises(ValueError, match="max_concurrency must be >= 1"):
+        asyncio.run(service.handle_chat_batch_async([], max_concurrency=0))
+
+
+def test_chat_service_skips_retrieval_stages_when_deadline_is_nearly_spent(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    case_search_tool = _RecordingCaseSearchTool()
+    lawyer_research_service = _RecordingLawyerResearchService()
+    service = ChatService(
+        _StaticRouter(citations=[]),
+        grounding_adapter=StaticGroundingAdapter(scaffold_grounded_citations()),
+        case_search_tool=case_search_tool,
+        lawyer_research_service=lawyer_research_service,
+        deadline_reserve_seconds=4.0,
+    )
+    payload = ChatRequest(
+        session_id="session-123456",
+        message="Find case law precedent on inadmissibility.",
+    )
+
+    with caplog.at_level(logging.INFO, logger="immcad_api.audit"):
+        response = service.handle_chat(
+            payload, trace_id="trace-deadline-001", deadline=Deadline.after(4.2)
+        )
+
+    assert response.answer == "Scaffold response"
+    assert response.research_preview is None
+    assert case_search_tool.requests == []
+    assert lawyer_research_service.requests == []
+    deadline_events = [
+        (event["event_type"], event["tool_name"])
+        for event in _audit_events(caplog)
+        if event.get("tool_error_code") == "deadline"
+    ]
+    assert deadline_events == [
+        ("case_search_tool_error", "case_search"),
+        ("lawyer_research_preview_error", "lawyer_research"),
+    ]
+
+
+def test_chat_service_clamps_retrieval_stage_timeouts_to_deadline() -> None:
+    service = ChatService(
+        _StaticRouter(citations=[]),
+        case_search_tool=_RecordingCaseSearchTool(),
+        case_search_tool_timeout_seconds=6.0,
+        deadline_reserve_seconds=4.0,
+    )
+    payload = ChatRequest(
+        session_id="session-123456",
+        message="Find case law precedent on inadmissibility.",
+    )
+    clock = [0.0]
+
+    with deadline_scope(Deadline.after(6.0, time_fn=lambda: clock[0])):
+        stages = service._plan_retrieval(request=payload, trace_id=None).stages
+
+    assert [stage.timeout_seconds for stage in stages] == [2.0]
+
+
+def test_chat_service_rejects_negative_deadline_reserve() -> None:
+    with pytest.raises(ValueError, match="deadline_reserve_seconds must be >= 0"):
+        ChatService(_StaticRouter(citations=[]), deadline_reserve_seconds=-1.0)
+
+
+class _FixedBrownout:
+    def __init__(self, level: int) -> None:
+        self._level = level
+
+    def level(self) -> int:
+        return self._level
+
+
+@pytest.mark.parametrize(
+    ("level", "expected_skipped"),
+    [
+        (0, []),
+        (1, ["research_preview"]),
+        (2, ["case_search", "research_preview"]),
+    ],
+)
+def test_chat_service_brownout_skips_optional_stages_by_level(
+    level: int,
+    expected_skipped: list[str],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    case_search_tool = _RecordingCaseSearchTool()
+    lawyer_research_service = _RecordingLawyerResearchService()
+    service = ChatService(
+        _StaticRouter(citations=[]),
+        grounding_adapter=StaticGroundingAdapter(scaffold_grounded_citations()),
+        case_search_tool=case_search_tool,
+        lawyer_research_service=lawyer_research_service,
+        brownout_controller=_FixedBrownout(level),  # type: ignore[arg-type]
+    )
+    payload = ChatRequest(
+        session_id="session-123456",
+        message="Find case law precedent on inadmissibility.",
+    )
+
+    with caplog.at_level(logging.INFO, logger="immcad_api.audit"):
+        response = service.handle_chat(payload, trace_id="trace-brownout-001")
+
+    assert response.answer == "Scaffold response"
+    assert response.skipped_stages == expected_skipped
+    assert len(case_search_tool.requests) == (0 if level >= 2 else 1)
+    assert len(lawyer_research_service.requests) == (0 if level >= 1 else 1)
+    assert (response.research_preview is None) is (level >= 1)
+    brownout_tools = sorted(
+        str(event["tool_name"])
+        for event in _audit_events(caplog)
+        if event.get("tool_error_code") == "brownout"
+    )
+    assert brownout_tools == sorted(
+        {"research_preview": "lawyer_research", "case_search": "case_search"}[name]
+        for name in expected_skipped
+    )
+
+
+def test_chat_service_reports_deadline_skipped_stages_on_async_path() -> None:
+    service = ChatService(
+        _StaticRouter(citations=[]),
+        grounding_adapter=StaticGroundingAdapter(scaffold_grounded_citations()),
+        case_search_tool=_RecordingCaseSearchTool(),
+        lawyer_research_service=_RecordingLawyerResearchService(),
+        deadline_reserve_seconds=4.0,
+        brownout_controller=_FixedBrownout(1),  # type: ignore[arg-type]
+    )
+    payload = ChatRequest(
+        session_id="session-123456",
+        message="Find case law precedent on inadmissibility.",
+    )
+
+    response = asyncio.run(
+        service.handle_chat_async(payload, deadline=Deadline.after(4.2))
+    )
+
+    assert response.skipped_stages == ["research_preview", "case_search"]
+
+
+def test_chat_service_leaves_skipped_stages_empty_without_case_law_intent() -> None:
+    service = ChatService(
+        _StaticRouter(citations=[]),
+        grounding_adapter=StaticGroundingAdapter(scaffold_grounded_citations()),
+        case_search_tool=_RecordingCaseSearchTool(),
+        lawyer_research_service=_RecordingLawyerResearchService(),
+        brownout_controller=_FixedBrownout(2),  # type: ignore[arg-type]
+    )
+    payload = ChatRequest(
+        session_id="session-123456",
+        message="What are the basic PR eligibility pathways?",
+    )
+
+    response = service.handle_chat(payload)
+
+    assert response.skipped_stages == []
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import pytest
+
+from immcad_api.deadline import (
+    Deadline,
+    current_deadline,
+    deadline_allows,
+    deadline_expired,
+    deadline_scope,
+    remaining_timeout,
+)
+from immcad_api.services.retrieval_fanout import RetrievalFanout, RetrievalStage
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_deadline_tracks_remaining_time() -> None:
+    clock = _Clock()
+    deadline = Deadline.after(5.0, time_fn=clock)
+
+    assert deadline.remaining() == 5.0
+    assert deadline.clamp(8.0) == 5.0
+    assert deadline.clamp(2.0) == 2.0
+    assert deadline.allows(5.0) is True
+
+    clock.now += 4.5
+    assert deadline.allows(1.0) is False
+    assert deadline.expired() is False
+
+    clock.now += 1.0
+    assert deadline.remaining() == 0.0
+    assert deadline.expired() is True
+
+
+def test_deadline_rejects_non_positive_budget() -> None:
+    with pytest.raises(ValueError, match="seconds must be > 0"):
+        Deadline.after(0)
+
+
+def test_deadline_scope_sets_and_restores_current_deadline() -> None:
+    clock = _Clock()
+    outer = Deadline.after(10.0, time_fn=clock)
+    inner = Deadline.after(2.0, time_fn=clock)
+
+    assert current_deadline() is None
+    assert remaining_timeout(8.0) == 8.0
+    assert deadline_allows(60.0) is True
+    with deadline_scope(outer):
+        assert remaining_timeout(30.0) == 10.0
+        with deadline_scope(None):
+            assert current_deadline() is outer
+        with deadline_scope(inner):
+            assert remaining_timeout(30.0) == 2.0
+            clock.now += 3.0
+            assert deadline_expired() is True
+        assert current_deadline() is outer
+    assert current_deadline() is None
+
+
+def test_retrieval_fanout_stages_see_the_callers_deadline() -> None:
+    fanout = RetrievalFanout(max_workers=2)
+    deadline = Deadline.after(30.0)
+    try:
+        with deadline_scope(deadline):
+            outcomes = fanout.run(
+                [RetrievalStage(name="probe", run=current_deadline, timeout_seconds=2.0)]
+            )
+    finally:
+        fanout.close()
+
+    assert outcomes[0].value is deadline
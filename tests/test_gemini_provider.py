@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 from types import ModuleType, SimpleNamespace
 import sys
 
+from immcad_api.deadline import Deadline, deadline_scope
 from immcad_api.providers.gemini_provider import GeminiProvider
+from immcad_api.providers.http_pool import ProviderHttpPool
+from immcad_api.providers.model_health import ModelHealthTracker
 from immcad_api.providers.prompt_builder import build_combined_runtime_prompt
 
 
@@ -24,27 +28,68 @@ class _FakeModels:
         return _FakeResponse(self.answer_text)
 
 
-def _install_fake_google_sdk(monkeypatch, captured: dict[str, object], answer_text: str = "OK") -> None:  # noqa: ANN001
+class _FakeAsyncModels:
+    def __init__(self, answers: dict[str, str], captured: dict[str, object]) -> None:
+        self.answers = answers
+        self.captured = captured
+
+    async def generate_content(self, *, model: str, contents: str, config) -> _FakeResponse:  # noqa: ANN001
+        self.captured.setdefault("async_models", []).append(model)
+        self.captured["contents"] = contents
+        self.captured["temperature"] = getattr(config, "temperature", None)
+        return _FakeResponse(self.answers.get(model, ""))
+
+
+def _install_fake_google_sdk(
+    monkeypatch,  # noqa: ANN001
+    captured: dict[str, object],
+    answer_text: str = "OK",
+    async_answers: dict[str, str] | None = None,
+) -> None:
+    class _FakeHttpRetryOptions:
+        def __init__(self, *, attempts: int) -> None:
+            self.attempts = attempts
+
     class _FakeHttpOptions:
-        def __init__(self, *, timeout: int) -> None:
+        def __init__(
+            self,
+            *,
+            timeout: int,
+            retry_options: _FakeHttpRetryOptions,
+            httpx_client=None,  # noqa: ANN001
+            httpx_async_client=None,  # noqa: ANN001
+        ) -> None:
             captured["timeout"] = timeout
+            captured["retry_attempts"] = retry_options.attempts
             self.timeout = timeout
+            self.httpx_client = httpx_client
+            self.httpx_async_client = httpx_async_client
 
     class _FakeGenerateContentConfig:
-        def __init__(self, *, temperature: float) -> None:
+        def __init__(
+            self, *, temperature: float, http_options: _FakeHttpOptions | None = None
+        ) -> None:
             self.temperature = temperature
+            captured["config_timeout"] = http_options.timeout if http_options else None
 
     class _FakeClient:
         def __init__(self, *, api_key: str, http_options: _FakeHttpOptions) -> None:
             captured["api_key"] = api_key
             captured["http_options_timeout"] = http_options.timeout
+            captured.setdefault("sdk_http_clients", []).append(
+                (http_options.httpx_client, http_options.httpx_async_client)
+            )
             self.models = _FakeModels(answer_text, captured)
+            self.aio = SimpleNamespace(
+                models=_FakeAsyncModels(async_answers or {}, captured)
+            )
 
     google_module = ModuleType("google")
     genai_module = ModuleType("google.genai")
     genai_module.Client = _FakeClient
     genai_module.types = SimpleNamespace(
         HttpOptions=_FakeHttpOptions,
+        HttpRetryOptions=_FakeHttpRetryOptions,
         GenerateContentConfig=_FakeGenerateContentConfig,
     )
     google_module.genai = genai_module
@@ -67,6 +112,7 @@ def test_gemini_provider_uses_millisecond_timeout(monkeypatch) -> None:  # noqa:
     response = provider.generate(message="hello", citations=[], locale="en-CA")
 
     assert captured["timeout"] == 15_000
+    assert captured["retry_attempts"] == 1
     assert response.answer == "OK"
     assert response.provider == "gemini"
     assert response.citations == []
@@ -87,6 +133,26 @@ def test_gemini_provider_clamps_timeout_to_one_second(monkeypatch) -> None:  # n
     assert captured["timeout"] == 1_000
 
 
+def test_gemini_provider_clamps_sdk_call_timeout_to_request_deadline(monkeypatch) -> None:  # noqa: ANN001
+    captured: dict[str, object] = {}
+    _install_fake_google_sdk(monkeypatch, captured)
+    provider = GeminiProvider(
+        "gemini-key",
+        model="gemini-3-flash-preview",
+        timeout_seconds=15.0,
+        max_retries=0,
+    )
+
+    provider.generate(message="hello", citations=[], locale="en-CA")
+    assert captured["config_timeout"] is None
+
+    with deadline_scope(Deadline.after(2.0)):
+        provider.generate(message="hello", citations=[], locale="en-CA")
+
+    assert captured["http_options_timeout"] == 15_000
+    assert 0 < captured["config_timeout"] <= 2_000
+
+
 def test_gemini_provider_prompt_includes_scope_and_grounding(monkeypatch) -> None:  # noqa: ANN001
     captured: dict[str, object] = {}
     _install_fake_google_sdk(monkeypatch, captured)
@@ -113,3 +179,98 @@ def test_gemini_provider_prompt_includes_scope_and_grounding(monkeypatch) -> Non
     assert "Do not claim model/vendor identity" in prompt
     assert "No grounded citations were provided." in prompt
     assert captured["temperature"] == 0.2
+
+
+def test_gemini_provider_generate_async_uses_aio_client_and_model_fallback(
+    monkeypatch,  # noqa: ANN001
+) -> None:
+    captured: dict[str, object] = {}
+    _install_fake_google_sdk(
+        monkeypatch,
+        captured,
+        async_answers={"gemini-2.5-flash": "Async fallback answer"},
+    )
+    provider = GeminiProvider(
+        "gemini-key",
+        model="gemini-3-flash-preview",
+        fallback_models=("gemini-2.5-flash",),
+        timeout_seconds=15.0,
+        max_retries=0,
+    )
+
+    response = asyncio.run(
+        provider.generate_async(message="hello", citations=[], locale="en-CA")
+    )
+
+    assert response.answer == "Async fallback answer"
+    assert response.provider == "gemini"
+    assert captured["async_models"] == ["gemini-3-flash-preview", "gemini-2.5-flash"]
+    assert captured["timeout"] == 15_000
+
+
+def test_gemini_provider_sdk_sends_through_the_shared_http_pool(monkeypatch) -> None:  # noqa: ANN001
+    captured: dict[str, object] = {}
+    _install_fake_google_sdk(monkeypatch, captured, async_answers={"gemini-x": "ok"})
+    pool = ProviderHttpPool(timeout_seconds=15.0)
+    provider = GeminiProvider(
+        "gemini-key",
+        model="gemini-x",
+        timeout_seconds=15.0,
+        max_retries=0,
+        http_pool=pool,
+    )
+
+    async def scenario() -> object:
+        await provider.generate_async(message="hello", citations=[], locale="en-CA")
+        await provider.generate_async(message="hello", citations=[], locale="en-CA")
+        return pool.async_client()
+
+    provider.generate(message="hello", citations=[], locale="en-CA")
+    first_loop_client = asyncio.run(scenario())
+    second_loop_client = asyncio.run(scenario())
+
+    sync_client = pool.sync_client()
+    # One SDK client for sync calls and one per event loop for async calls.
+    assert captured["sdk_http_clients"] == [
+        (sync_client, None),
+        (sync_client, first_loop_client),
+        (sync_client, second_loop_client),
+    ]
+    assert first_loop_client is not second_loop_client
+
+
+def test_gemini_provider_skips_models_cooling_down_after_failures(
+    monkeypatch,  # noqa: ANN001
+) -> None:
+    captured: dict[str, object] = {}
+    _install_fake_google_sdk(
+        monkeypatch,
+        captured,
+        async_answers={"gemini-2.5-flash": "Fallback answer"},
+    )
+    provider = GeminiProvider(
+        "gemini-key",
+        model="gemini-3-flash-preview",
+        fallback_models=("gemini-2.5-flash",),
+        timeout_seconds=15.0,
+        max_retries=0,
+        model_health=ModelHealthTracker(failure_threshold=1, cooldown_seconds=60.0),
+    )
+
+    for _ in range(2):
+        response = asyncio.run(
+            provider.generate_async(message="hello", citations=[], locale="en-CA")
+        )
+        assert response.answer == "Fallback answer"
+
+    # The empty primary goes into cooldown after its first failure and is not
+    # attempted on the second request.
+    assert captured["async_models"] == [
+        "gemini-3-flash-preview",
+        "gemini-2.5-flash",
+        "gemini-2.5-flash",
+    ]
+    health = provider.model_health.snapshot()
+    assert health["gemini-3-flash-preview"]["state"] == "cooldown"
+    assert health["gemini-3-flash-preview"]["last_error_code"] == "provider_error"
+    assert health["gemini-2.5-flash"]["successes"] == 2
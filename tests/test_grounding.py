@@ -1,6 +1,19 @@
 from __future__ import annotations
 
-from immcad_api.services.grounding import KeywordGroundingAdapter, official_grounding_catalog
+from pydantic import ValidationError
+import pytest
+
+from immcad_api.policy.compliance import (
+    DEFAULT_TRUSTED_CITATION_DOMAINS,
+    verify_grounded_citations,
+)
+from immcad_api.policy.message_analysis import DEFAULT_MESSAGE_ANALYZER
+from immcad_api.schemas import Citation
+from immcad_api.services.grounding import (
+    KeywordGroundingAdapter,
+    StaticGroundingAdapter,
+    official_grounding_catalog,
+)
 
 
 def test_keyword_grounding_adapter_includes_pr_card_sources_for_pr_card_query() -> None:
@@ -79,3 +92,115 @@ def test_keyword_grounding_adapter_surfaces_visitor_status_extension_guidance()
 
     assert citations
     assert any(citation.pin == "Visitor status extension guide" for citation in citations)
+
+
+def test_grounding_shares_frozen_catalog_citations_instead_of_copying() -> None:
+    catalog = official_grounding_catalog()
+    catalog_ids = {id(citation) for citation, _ in catalog}
+    assert catalog_ids == {id(citation) for citation, _ in official_grounding_catalog()}
+
+    keyword_citations = KeywordGroundingAdapter(catalog).citation_candidates(
+        message="How do I extend my study permit as a student?",
+        locale="en-CA",
+        mode="standard",
+    )
+    static_citations = StaticGroundingAdapter(
+        [citation for citation, _ in catalog]
+    ).citation_candidates(message="anything", locale="en-CA", mode="standard")
+    verified = verify_grounded_citations(
+        [citation.model_dump() for citation in keyword_citations],
+        grounded_citations=keyword_citations,
+        trusted_domains=DEFAULT_TRUSTED_CITATION_DOMAINS,
+    )
+
+    assert keyword_citations
+    assert {id(citation) for citation in keyword_citations} <= catalog_ids
+    assert {id(citation) for citation in static_citations} == catalog_ids
+    assert [id(citation) for citation in verified] == [
+        id(citation) for citation in keyword_citations
+    ]
+    with pytest.raises(ValidationError):
+        keyword_citations[0].snippet = "mutated"
+
+
+def _linear_scan_candidates(catalog, message: str, max_citations: int = 3):  # noqa: ANN001, ANN202
+    """The original per-entry scan, kept as the reference for the inverted index."""
+    analysis = DEFAULT_MESSAGE_ANALYZER.analyze(message)
+    scored = []
+    for index, (citation, keywords) in enumerate(catalog):
+        score = 0
+        for keyword in (keyword.strip().lower() for keyword in keywords):
+            if not keyword:
+                continue
+            if " " in keyword:
+                if keyword in analysis.normalized:
+                    score += 2
+                continue
+            if keyword in analysis.tokens:
+                score += 1
+        if score > 0:
+            scored.append((score, -index, citation))
+    selected, seen = [], set()
+    for _, _, citation in sorted(scored, key=lambda item: item[:2], reverse=True):
+        if (citation.source_id, citation.pin) in seen:
+            continue
+        selected.append(citation)
+        seen.add((citation.source_id, citation.pin))
+        if len(selected) >= max_citations:
+            break
+    return selected
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "my pr card expired while I was outside canada, how do I renew?",
+        "How do I extend my study permit as an international student?",
+        "Can I get an open work permit from inside canada with an LMIA?",
+        "I did my homework permits and study permits are confusing",
+        "We are common law partners; can I sponsor my spouse?",
+        "My visitor status expires soon, can I remain in canada?",
+        "Express Entry CRS draw for federal skilled worker",
+        "Tell me about pizza recipes",
+        "",
+    ],
+)
+def test_keyword_index_matches_linear_scan_on_official_catalog(message: str) -> None:
+    catalog = official_grounding_catalog()
+    adapter = KeywordGroundingAdapter(catalog, max_citations=3)
+
+    assert adapter.citation_candidates(
+        message=message, locale="en-CA", mode="standard"
+    ) == _linear_scan_candidates(catalog, message)
+
+
+def test_keyword_index_matches_linear_scan_on_large_synthetic_catalog() -> None:
+    words = ["permit", "study", "work", "visa", "spouse", "card", "entry", "status"]
+    catalog = [
+        (
+            Citation(
+                source_id="IRPA",
+                title="Immigration and Refugee Protection Act",
+                url="https://laws-lois.justice.gc.ca/eng/acts/I-2.5/FullText.html",
+                pin=f"s. {index}",
+                snippet=f"Section {index}",
+            ),
+            (
+                words[index % len(words)],
+                words[(index * 3) % len(words)],
+                f"{words[index % 5]} {words[(index + 1) % len(words)]}",
+                f"section{index}",
+            ),
+        )
+        for index in range(20_000)
+    ]
+    adapter = KeywordGroundingAdapter(catalog, max_citations=5)
+
+    for message in (
+        "study permit for my spouse",
+        "Is section123 about a work visa?",
+        "homework permit and visa card",
+    ):
+        assert adapter.citation_candidates(
+            message=message, locale="en-CA", mode="standard"
+        ) == _linear_scan_candidates(catalog, message, max_citations=5)
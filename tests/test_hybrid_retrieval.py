@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import math
+from pathlib import Path
+
+import pytest
+
+from immcad_api.services.embeddings import HashingEmbedder, build_text_embedder
+from immcad_api.services.grounding import (
+    HybridGroundingAdapter,
+    KeywordGroundingAdapter,
+    official_grounding_catalog,
+)
+from immcad_api.services.section_index import SectionIndex, write_section_index
+from immcad_api.services.section_vectors import SectionVectorIndex, write_section_vectors
+
+
+def _section(label: str, title: str, text: str) -> dict[str, object]:
+    return {
+        "source_id": "IRPA",
+        "act_title": "Immigration and Refugee Protection Act",
+        "section_label": label,
+        "section_title": title,
+        "section_url": f"https://laws-lois.justice.gc.ca/eng/acts/I-2.5/section-{label}.html",
+        "text": text,
+    }
+
+
+_SECTIONS = [
+    _section(
+        "11",
+        "Application before entering Canada",
+        "A foreign national must, before entering Canada, apply to an officer for a visa.",
+    ),
+    _section(
+        "30",
+        "Spouses of students",
+        "The spouse of a student may be authorized to work while the student studies.",
+    ),
+    _section(
+        "31",
+        "Status document",
+        "A permanent resident shall be provided with a document indicating their status.",
+    ),
+]
+
+
+def _cosine(left: list[float], right: list[float]) -> float:
+    return sum(a * b for a, b in zip(left, right))
+
+
+@pytest.fixture
+def retrieval(tmp_path: Path):  # noqa: ANN201
+    embedder = HashingEmbedder(dimensions=128)
+    write_section_index(tmp_path / "sections.idx", _SECTIONS)
+    build = write_section_vectors(tmp_path / "sections.vec", _SECTIONS, embedder=embedder)
+    assert (build.sections_embedded, build.dimensions) == (3, 128)
+    index = SectionIndex(tmp_path / "sections.idx")
+    vectors = SectionVectorIndex(tmp_path / "sections.vec")
+    yield index, vectors, embedder
+    vectors.close()
+    index.close()
+
+
+def test_hashing_embedder_is_deterministic_unit_length_and_morphology_aware() -> None:
+    embedder = HashingEmbedder(dimensions=256)
+    spouse, spousal, unrelated = embedder.embed(
+        ["spouse working", "spousal work", "refugee appeal division"]
+    )
+
+    assert embedder.embed(["spouse working"])[0] == spouse
+    assert math.isclose(math.sqrt(_cosine(spouse, spouse)), 1.0)
+    assert _cosine(spouse, spousal) > _cosine(spouse, unrelated) + 0.2
+    assert build_text_embedder("hashing").name == "hashing-v1-256"
+    with pytest.raises(ValueError, match="Unsupported embedder"):
+        build_text_embedder("chroma")
+
+
+def test_vector_index_finds_inflected_paraphrase_that_lexical_search_misses(
+    retrieval,  # noqa: ANN001
+) -> None:
+    index, vectors, embedder = retrieval
+    query = "Spousal employment for studying"
+
+    assert index.search(["spousal", "employment", "studying"], top_k=3) == []
+    hits = vectors.search(embedder.embed([query])[0], top_k=1, min_similarity=0.1)
+    assert index.citation(hits[0][0]).pin == "s. 30"
+    assert len(vectors) == 3
+    assert vectors.fingerprint == index.fingerprint
+
+
+def test_hybrid_adapter_fuses_lexical_and_dense_rankings(retrieval) -> None:  # noqa: ANN001
+    index, vectors, embedder = retrieval
+    adapter = HybridGroundingAdapter(
+        index,
+        vectors,
+        embedder,
+        max_citations=2,
+        candidates_per_retriever=3,
+        min_dense_similarity=0.1,
+        fallback=KeywordGroundingAdapter(official_grounding_catalog()),
+    )
+
+    paraphrase = adapter.citation_candidates(
+        message="Can my spousal partner get employment while studying?",
+        locale="en-CA",
+        mode="standard",
+    )
+    assert paraphrase[0].pin == "s. 30"
+
+    exact = adapter.citation_candidates(
+        message="Which document shows permanent resident status?",
+        locale="en-CA",
+        mode="standard",
+    )
+    assert exact[0].pin == "s. 31"
+    assert len(exact) <= 2
+
+    fallback = adapter.citation_candidates(
+        message="Express entry CRS draws", locale="en-CA", mode="standard"
+    )
+    assert any(citation.pin == "Program overview" for citation in fallback)
+
+
+def test_hybrid_adapter_rejects_mismatched_vectors_and_embedders(
+    tmp_path: Path,
+    retrieval,  # noqa: ANN001
+) -> None:
+    index, vectors, _ = retrieval
+
+    with pytest.raises(ValueError, match="built with 'hashing-v1-128'"):
+        HybridGroundingAdapter(index, vectors, HashingEmbedder(dimensions=256))
+
+    write_section_vectors(
+        tmp_path / "other.vec", _SECTIONS[:2], embedder=HashingEmbedder(dimensions=128)
+    )
+    other = SectionVectorIndex(tmp_path / "other.vec")
+    try:
+        with pytest.raises(ValueError, match="not built from the indexed sections"):
+            HybridGroundingAdapter(index, other, HashingEmbedder(dimensions=128))
+    finally:
+        other.close()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import date
 
+from immcad_api.deadline import Deadline, deadline_scope
 from immcad_api.errors import SourceUnavailableError
 from immcad_api.schemas import (
     CaseSearchRequest,
@@ -352,3 +353,15 @@ def test_orchestrator_propagates_case_metadata_fields() -> None:
     assert response.cases
     assert response.cases[0].docket_numbers == ["IMM-2026-101"]
     assert response.cases[0].source_event_type == "updated"
+
+
+def test_orchestrator_drops_follow_up_queries_when_deadline_is_nearly_spent() -> None:
+    case_search_service = _MockCaseSearchService()
+    service = LawyerCaseResearchService(case_search_service=case_search_service)
+    clock = [0.0]
+
+    with deadline_scope(Deadline.after(0.5, time_fn=lambda: clock[0])):
+        response = service.research(_request())
+
+    assert len(case_search_service.requests) == 1
+    assert response.cases
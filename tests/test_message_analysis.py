@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import re
+import subprocess
+import sys
+
+import pytest
+
+from immcad_api.policy.message_analysis import (
+    _REFUSAL_LEAD_WORDS,
+    _REFUSAL_PATTERNS,
+    MessageAnalyzer,
+)
+from immcad_api.schemas import Citation
+from immcad_api.services.grounding import KeywordGroundingAdapter
+
+
+@pytest.mark.parametrize(
+    ("message", "category"),
+    [
+        ("Please represent me before the IRB.", "representation"),
+        ("Can you file my immigration application for me?", "filing_on_behalf"),
+        ("Give me a personalized strategy for my case.", "personalized_strategy"),
+        ("Assure me that I will be approved for PR.", "outcome_guarantee"),
+        ("Summarize IRPA inadmissibility grounds in plain language.", None),
+    ],
+)
+def test_analyzer_reports_refusal_category(message: str, category: str | None) -> None:
+    analysis = MessageAnalyzer().analyze(message)
+
+    assert analysis.refusal_category == category
+    assert analysis.should_refuse is (category is not None)
+
+
+def test_every_refusal_pattern_starts_with_a_lead_word() -> None:
+    lead = re.compile(rf"(?:{'|'.join(_REFUSAL_LEAD_WORDS)})")
+    for patterns in _REFUSAL_PATTERNS.values():
+        for pattern in patterns:
+            body = pattern.removeprefix(r"\b").removeprefix("(?:")
+            assert lead.match(body), pattern
+
+
+@pytest.mark.parametrize(
+    ("message", "is_greeting"),
+    [
+        ("Hello!", True),
+        ("  Bonjour   tout le monde ", True),
+        ("thank you", True),
+        ("Hi, what is a visa?", False),
+        ("Hello there, I have a long question about my file today", False),
+        ("???", False),
+    ],
+)
+def test_analyzer_detects_greetings(message: str, is_greeting: bool) -> None:
+    assert MessageAnalyzer().analyze(message).is_greeting is is_greeting
+
+
+def test_analyzer_normalizes_once_and_memoizes_per_message() -> None:
+    analyzer = MessageAnalyzer()
+    message = "Find Federal Court\n\ncase law on H&C   refusals"
+
+    analysis = analyzer.analyze(message)
+
+    assert analysis.normalized == "find federal court case law on h&c refusals"
+    assert analysis.tokens == frozenset(
+        {"find", "federal", "court", "case", "law", "on", "h", "c", "refusals"}
+    )
+    assert analysis.case_law_intent is True
+    assert analyzer.analyze(message) is analysis
+
+
+def test_keyword_grounding_uses_shared_analysis() -> None:
+    class _CountingAnalyzer(MessageAnalyzer):
+        calls = 0
+
+        def _analyze(self, message: str):  # noqa: ANN202
+            type(self).calls += 1
+            return super()._analyze(message)
+
+    analyzer = _CountingAnalyzer()
+    citation = Citation(
+        source_id="IRPR",
+        title="Immigration and Refugee Protection Regulations",
+        url="https://laws-lois.justice.gc.ca/eng/regulations/SOR-2002-227/",
+        pin="s. 117",
+        snippet="Family class.",
+    )
+    adapter = KeywordGroundingAdapter(
+        [(citation, ("spouse", "family class"))], message_analyzer=analyzer
+    )
+    message = "Can I sponsor my spouse in the family class?"
+
+    analyzer.analyze(message)
+    selected = adapter.citation_candidates(message=message, locale="en-CA", mode="standard")
+
+    assert [item.pin for item in selected] == ["s. 117"]
+    assert _CountingAnalyzer.calls == 1
+
+
+def test_benchmark_script_reports_per_message_cost() -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+    result = subprocess.run(
+        [
+            sys.executable,
+            str(repo_root / "scripts" / "benchmark_message_analyzer.py"),
+            "--iterations",
+            "3",
+        ],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+        check=False,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
+    payload = json.loads(result.stdout)
+    assert payload["informational"]["message_chars"] == 8000
+    assert payload["policy_refusal"]["refusal_category"] == "outcome_guarantee"
+    assert payload["greeting"]["is_greeting"] is True
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import pytest
+
+from immcad_api.providers.model_health import ModelHealthTracker
+from immcad_api.telemetry import ProviderMetrics
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_model_health_keeps_configured_order_until_models_are_measured() -> None:
+    tracker = ModelHealthTracker()
+    models = ["primary", "fallback"]
+
+    assert tracker.order(models) == models
+    tracker.record_success("fallback", 0.5)
+    # Measured models rank ahead of models that have not succeeded yet.
+    assert tracker.order(models) == ["fallback", "primary"]
+    tracker.record_success("primary", 0.2)
+    assert tracker.order(models) == ["primary", "fallback"]
+
+
+def test_model_health_skips_models_in_cooldown_until_it_lapses() -> None:
+    clock = _Clock()
+    tracker = ModelHealthTracker(failure_threshold=2, cooldown_seconds=30.0, time_fn=clock)
+    models = ["primary", "fallback"]
+    tracker.record_success("primary", 0.1)
+    tracker.record_success("fallback", 0.4)
+
+    tracker.record_failure("primary", error_code="timeout")
+    assert tracker.order(models) == models
+    tracker.record_failure("primary", error_code="timeout")
+    assert tracker.order(models) == ["fallback"]
+
+    clock.now += 30.0
+    # Back from cooldown with its last latency, the faster model is probed first.
+    assert tracker.order(models) == models
+    tracker.record_failure("primary", error_code="timeout")
+    assert tracker.order(models) == ["fallback"]
+    assert tracker.snapshot()["primary"]["cooldowns"] == 2
+
+    tracker.record_success("primary", 0.1)
+    assert tracker.snapshot()["primary"]["state"] == "healthy"
+    assert tracker.snapshot()["primary"]["consecutive_failures"] == 0
+
+
+def test_model_health_tries_soonest_recovering_model_when_all_are_cooling() -> None:
+    clock = _Clock()
+    tracker = ModelHealthTracker(failure_threshold=1, cooldown_seconds=10.0, time_fn=clock)
+    tracker.record_failure("primary")
+    clock.now += 5.0
+    tracker.record_failure("fallback")
+
+    assert tracker.order(["primary", "fallback"]) == ["primary"]
+
+
+def test_provider_metrics_reports_tracked_model_health() -> None:
+    tracker = ModelHealthTracker()
+    tracker.record_success("gemini-2.5-flash", 0.25)
+    metrics = ProviderMetrics()
+    metrics.track_model_health(provider="gemini", snapshot=tracker.snapshot)
+
+    snapshot = metrics.model_health_snapshot()
+
+    assert snapshot["gemini"]["gemini-2.5-flash"]["latency_ewma_ms"] == 250.0
+    assert snapshot["gemini"]["gemini-2.5-flash"]["state"] == "healthy"
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"failure_threshold": 0}, "failure_threshold must be >= 1"),
+        ({"cooldown_seconds": 0}, "cooldown_seconds must be > 0"),
+        ({"smoothing": 0}, "smoothing must be > 0 and <= 1"),
+    ],
+)
+def test_model_health_rejects_invalid_configuration(
+    kwargs: dict[str, float], message: str
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        ModelHealthTracker(**kwargs)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
 
+import pytest
+
+from immcad_api.deadline import Deadline, deadline_scope
 from immcad_api.providers.openai_provider import OpenAIProvider
-from immcad_api.providers.prompt_builder import build_runtime_prompts
+from immcad_api.providers.prompt_builder import assemble_runtime_prompt, build_runtime_prompts
 from immcad_api.schemas import Citation
 
 
@@ -12,10 +16,11 @@ class _FakeCompletions:
         self.captured = captured
         self.answer_text = answer_text
 
-    def create(self, *, model: str, temperature: float, messages):  # noqa: ANN001
+    def create(self, *, model: str, temperature: float, messages, extra_body=None):  # noqa: ANN001
         self.captured["model"] = model
         self.captured["temperature"] = temperature
         self.captured["messages"] = messages
+        self.captured["extra_body"] = extra_body
         choice = SimpleNamespace(message=SimpleNamespace(content=self.answer_text))
         return SimpleNamespace(choices=[choice])
 
@@ -42,7 +47,7 @@ class _FakeOpenAIClient:
 def test_openai_provider_prompt_includes_scope_and_grounding(monkeypatch) -> None:  # noqa: ANN001
     captured: dict[str, object] = {}
 
-    def _fake_client(*, api_key: str, timeout: float):  # noqa: ANN001
+    def _fake_client(*, api_key: str, timeout: float, max_retries: int):  # noqa: ANN001
         return _FakeOpenAIClient(
             api_key=api_key,
             timeout=timeout,
@@ -95,3 +100,194 @@ def test_openai_provider_prompt_includes_scope_and_grounding(monkeypatch) -> Non
     assert user_message == expected_user_prompt
     assert "Do not claim model/vendor identity" in system_message
     assert "Immigration and Refugee Protection Act" in user_message
+    assert captured["extra_body"] == {
+        "prompt_cache_key": assemble_runtime_prompt(
+            message="How does Express Entry work?", citations=citations, locale="en-CA"
+        ).prompt_cache_key
+    }
+
+
+def test_openai_provider_generate_async_uses_async_client(monkeypatch) -> None:  # noqa: ANN001
+    captured: dict[str, object] = {}
+
+    class _FakeAsyncCompletions:
+        async def create(self, *, model: str, temperature: float, messages, extra_body=None):  # noqa: ANN001
+            captured["model"] = model
+            captured["messages"] = messages
+            choice = SimpleNamespace(message=SimpleNamespace(content="Async answer"))
+            return SimpleNamespace(choices=[choice])
+
+    def _fake_async_client(*, api_key: str, timeout: float, max_retries: int):  # noqa: ANN001
+        captured["api_key"] = api_key
+        captured["timeout"] = timeout
+        captured["max_retries"] = max_retries
+        return SimpleNamespace(chat=SimpleNamespace(completions=_FakeAsyncCompletions()))
+
+    monkeypatch.setattr(
+        "immcad_api.providers.openai_provider.AsyncOpenAI", _fake_async_client
+    )
+    provider = OpenAIProvider(
+        "openai-key",
+        model="gpt-4o-mini",
+        timeout_seconds=12.0,
+        max_retries=0,
+    )
+
+    response = asyncio.run(
+        provider.generate_async(
+            message="How does Express Entry work?",
+            citations=[],
+            locale="en-CA",
+        )
+    )
+
+    assert response.answer == "Async answer"
+    assert response.provider == "openai"
+    assert response.citations == []
+    assert captured["api_key"] == "openai-key"
+    assert captured["timeout"] == 12.0
+    assert captured["max_retries"] == 0
+    assert captured["model"] == "gpt-4o-mini"
+    assert len(captured["messages"]) == 2
+
+
+def test_openai_provider_sdk_stream_sends_cache_key_and_reports_usage(monkeypatch) -> None:  # noqa: ANN001
+    captured: dict[str, object] = {}
+
+    class _FakeStreamCompletions:
+        def create(self, **kwargs):  # noqa: ANN003
+            captured.update(kwargs)
+            delta_chunk = SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content="Streamed answer"))],
+                usage=None,
+            )
+            usage_chunk = SimpleNamespace(
+                choices=[],
+                usage=SimpleNamespace(
+                    prompt_tokens_details=SimpleNamespace(cached_tokens=512)
+                ),
+            )
+            return iter([delta_chunk, usage_chunk])
+
+    def _fake_client(*, api_key: str, timeout: float, max_retries: int):  # noqa: ANN001
+        del api_key, timeout
+        return SimpleNamespace(chat=SimpleNamespace(completions=_FakeStreamCompletions()))
+
+    monkeypatch.setattr("immcad_api.providers.openai_provider.OpenAI", _fake_client)
+    provider = OpenAIProvider(
+        "openai-key", model="gpt-4o-mini", timeout_seconds=12.0, max_retries=0
+    )
+    runtime_prompt = assemble_runtime_prompt(
+        message="How does Express Entry work?", citations=[], locale="en-CA"
+    )
+
+    stream = provider.stream(
+        message="How does Express Entry work?", citations=[], locale="en-CA"
+    )
+    assert next(stream) == "Streamed answer"
+    with pytest.raises(StopIteration) as finished:
+        next(stream)
+    usage = finished.value.value
+    assert usage.prompt_tokens == runtime_prompt.prompt_tokens
+    assert usage.cached_prompt_tokens == 512
+    assert captured["stream"] is True
+    assert captured["extra_body"] == {
+        "prompt_cache_key": runtime_prompt.prompt_cache_key,
+        "stream_options": {"include_usage": True},
+    }
+
+
+def test_openai_provider_sdk_stream_clamps_timeout_to_request_deadline(monkeypatch) -> None:  # noqa: ANN001
+    captured: dict[str, object] = {}
+
+    class _FakeStreamCompletions:
+        def create(self, **kwargs):  # noqa: ANN003
+            captured.update(kwargs)
+            delta = SimpleNamespace(content="Streamed answer")
+            return iter([SimpleNamespace(choices=[SimpleNamespace(delta=delta)])])
+
+    def _fake_client(*, api_key: str, timeout: float, max_retries: int):  # noqa: ANN001
+        del api_key, timeout
+        return SimpleNamespace(chat=SimpleNamespace(completions=_FakeStreamCompletions()))
+
+    monkeypatch.setattr("immcad_api.providers.openai_provider.OpenAI", _fake_client)
+    provider = OpenAIProvider(
+        "openai-key", model="gpt-4o-mini", timeout_seconds=12.0, max_retries=0
+    )
+
+    with deadline_scope(Deadline.after(2.0)):
+        deltas = list(
+            provider.stream(message="How does Express Entry work?", citations=[], locale="en-CA")
+        )
+
+    assert deltas == ["Streamed answer"]
+    assert 0 < captured["timeout"] <= 2.0
+
+
+def test_openai_provider_reuses_and_closes_async_sdk_client(monkeypatch) -> None:  # noqa: ANN001
+    events: list[str] = []
+
+    class _FakeAsyncCompletions:
+        async def create(self, **kwargs):  # noqa: ANN003
+            del kwargs
+            choice = SimpleNamespace(message=SimpleNamespace(content="Async answer"))
+            return SimpleNamespace(choices=[choice])
+
+    class _FakeAsyncClient:
+        def __init__(self, *, api_key: str, timeout: float, max_retries: int) -> None:
+            del api_key, timeout, max_retries
+            events.append("created")
+            self.chat = SimpleNamespace(completions=_FakeAsyncCompletions())
+
+        async def close(self) -> None:
+            events.append("closed")
+
+    monkeypatch.setattr("immcad_api.providers.openai_provider.AsyncOpenAI", _FakeAsyncClient)
+    provider = OpenAIProvider(
+        "openai-key", model="gpt-4o-mini", timeout_seconds=12.0, max_retries=0
+    )
+
+    async def scenario() -> None:
+        for _ in range(3):
+            await provider.generate_async(
+                message="How does Express Entry work?", citations=[], locale="en-CA"
+            )
+        await provider.aclose()
+
+    asyncio.run(scenario())
+
+    assert events == ["created", "closed"]
+
+
+def test_openai_provider_keeps_one_async_sdk_client_per_event_loop(monkeypatch) -> None:  # noqa: ANN001
+    created: list[asyncio.AbstractEventLoop] = []
+
+    class _FakeAsyncCompletions:
+        async def create(self, **kwargs):  # noqa: ANN003
+            del kwargs
+            choice = SimpleNamespace(message=SimpleNamespace(content="Async answer"))
+            return SimpleNamespace(choices=[choice])
+
+    class _FakeAsyncClient:
+        def __init__(self, *, api_key: str, timeout: float, max_retries: int) -> None:
+            del api_key, timeout, max_retries
+            created.append(asyncio.get_running_loop())
+            self.chat = SimpleNamespace(completions=_FakeAsyncCompletions())
+
+    monkeypatch.setattr("immcad_api.providers.openai_provider.AsyncOpenAI", _FakeAsyncClient)
+    provider = OpenAIProvider(
+        "openai-key", model="gpt-4o-mini", timeout_seconds=12.0, max_retries=0
+    )
+
+    async def scenario() -> None:
+        for _ in range(2):
+            await provider.generate_async(
+                message="How does Express Entry work?", citations=[], locale="en-CA"
+            )
+
+    asyncio.run(scenario())
+    asyncio.run(scenario())
+
+    assert len(created) == 2
+    assert created[0] is not created[1]
+    assert len(provider._sdk_clients) == 1
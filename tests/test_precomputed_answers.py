@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import logging
+from pathlib import Path
+
+import pytest
+
+from immcad_api.providers.base import ProviderResult
+from immcad_api.providers.router import RoutingResult
+from immcad_api.schemas import ChatRequest, Citation
+from immcad_api.services.chat_service import ChatService
+from immcad_api.services.grounding import (
+    StaticGroundingAdapter,
+    scaffold_grounded_citations,
+)
+from immcad_api.services.precomputed_answers import (
+    PrecomputedAnswerStore,
+    build_precomputed_answers,
+    load_precomputed_answer_store,
+    normalize_precomputed_question,
+    write_precomputed_answers,
+)
+
+
+@dataclass
+class _CountingRouter:
+    citations: list[Citation] | None = None
+    calls: int = 0
+
+    def generate(self, *, message: str, citations, locale: str) -> RoutingResult:  # noqa: ANN001
+        del message, locale
+        self.calls += 1
+        return RoutingResult(
+            result=ProviderResult(
+                provider="scaffold",
+                answer="Precomputable answer",
+                citations=citations if self.citations is None else self.citations,
+                confidence="medium",
+            ),
+            fallback_used=False,
+            fallback_reason=None,
+        )
+
+
+class _CountingGrounding(StaticGroundingAdapter):
+    def __init__(self) -> None:
+        super().__init__(scaffold_grounded_citations())
+        self.calls = 0
+
+    def citation_candidates(self, *, message: str, locale: str, mode: str):  # noqa: ANN201
+        self.calls += 1
+        return super().citation_candidates(message=message, locale=locale, mode=mode)
+
+
+def _request(message: str) -> ChatRequest:
+    return ChatRequest(session_id="session-123456", message=message)
+
+
+def test_normalize_precomputed_question_ignores_case_spacing_and_trailing_punctuation() -> None:
+    assert normalize_precomputed_question("  What is   IRPA section 11?? ") == (
+        "what is irpa section 11"
+    )
+
+
+def test_precomputed_answers_are_built_offline_and_served_without_pipeline_work(
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    builder = ChatService(
+        _CountingRouter(),
+        grounding_adapter=StaticGroundingAdapter(scaffold_grounded_citations()),
+    )
+    build = build_precomputed_answers(
+        builder,
+        ["Summarize IRPA section 11?", "summarize irpa section 11"],
+        catalog_version="catalog-v1",
+    )
+    assert len(build.answers) == 1
+    assert build.answers[0].citations
+    store_path = tmp_path / "precomputed.json"
+    write_precomputed_answers(store_path, build.answers)
+
+    router = _CountingRouter()
+    grounding = _CountingGrounding()
+    store = load_precomputed_answer_store(
+        store_path, version_provider=lambda: "catalog-v1"
+    )
+    service = ChatService(router, grounding_adapter=grounding, precomputed_answers=store)
+
+    caplog.set_level(logging.INFO, logger="immcad_api.audit")
+    response = service.handle_chat(
+        _request("  SUMMARIZE irpa Section 11. "), trace_id="trace-precomputed"
+    )
+
+    assert response.answer == "Precomputable answer"
+    assert response.citations == list(build.answers[0].citations)
+    assert router.calls == 0
+    assert grounding.calls == 0
+    assert store.snapshot()["hits"] == 1
+    events = [
+        record.audit_event for record in caplog.records if hasattr(record, "audit_event")
+    ]
+    assert [event["event_type"] for event in events] == ["precomputed_answer_hit"]
+
+
+def test_precomputed_answers_from_an_older_catalog_version_are_not_served() -> None:
+    builder = ChatService(
+        _CountingRouter(),
+        grounding_adapter=StaticGroundingAdapter(scaffold_grounded_citations()),
+    )
+    build = build_precomputed_answers(
+        builder, ["Summarize IRPA section 11."], catalog_version="catalog-v1"
+    )
+    store = PrecomputedAnswerStore(build.answers, version_provider=lambda: "catalog-v2")
+    router = _CountingRouter()
+    service = ChatService(
+        router,
+        grounding_adapter=StaticGroundingAdapter(scaffold_grounded_citations()),
+        precomputed_answers=store,
+    )
+
+    service.handle_chat(_request("Summarize IRPA section 11."))
+
+    assert router.calls == 1
+    assert store.snapshot()["stale_rejections"] == 1
+
+
+def test_precomputed_answer_build_rejects_ungrounded_answers() -> None:
+    builder = ChatService(
+        _CountingRouter(citations=[]),
+        grounding_adapter=StaticGroundingAdapter([]),
+    )
+
+    build = build_precomputed_answers(
+        builder, ["Summarize IRPA section 11."], catalog_version="catalog-v1"
+    )
+
+    assert build.answers == ()
+    assert build.rejected == (("Summarize IRPA section 11.", "ungrounded"),)
+
+
+def test_load_precomputed_answer_store_rejects_unknown_format(tmp_path: Path) -> None:
+    store_path = tmp_path / "precomputed.json"
+    store_path.write_text(json.dumps({"format_version": 99, "answers": []}), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Unsupported precomputed answer store format"):
+        load_precomputed_answer_store(store_path, version_provider=lambda: "v1")
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from immcad_api.providers import ProviderResult, ProviderRouter
+from immcad_api.providers.prompt_builder import (
+    assemble_runtime_prompt,
+    build_runtime_prompts,
+    estimate_tokens,
+)
+from immcad_api.schemas import Citation
+
+
+def _citation(source_id: str, title: str, snippet: str) -> Citation:
+    return Citation(
+        source_id=source_id,
+        title=title,
+        url=f"https://example.test/{source_id}",
+        pin="s. 1",
+        snippet=snippet,
+    )
+
+
+def test_estimate_tokens_counts_words_punctuation_and_long_words() -> None:
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("Go now.") == 3
+    assert estimate_tokens("immigration") == 3
+
+
+def test_unbudgeted_prompt_keeps_first_eight_citations_verbatim() -> None:
+    citations = [_citation(f"SRC{index}", f"Title {index}", "x " * 400) for index in range(10)]
+
+    prompt = assemble_runtime_prompt(
+        message="What is required?", citations=citations, locale="en-CA"
+    )
+
+    assert prompt.citations_included == 8
+    assert "[SRC7]" in prompt.user_prompt
+    assert "[SRC8]" not in prompt.user_prompt
+    assert (prompt.system_prompt, prompt.user_prompt) == build_runtime_prompts(
+        message="What is required?", citations=citations, locale="en-CA"
+    )
+
+
+def test_budgeted_prompt_ranks_truncates_and_drops_citations_to_fit() -> None:
+    filler = " ".join(["procedural background text"] * 120)
+    citations = [
+        _citation("IRPR-OFF", "Temporary resident visas", filler),
+        _citation("IRPR-117", "Spousal sponsorship", f"A sponsor may sponsor a spouse. {filler}"),
+        _citation("IRPR-OTHER", "Work permits", filler),
+    ]
+    message = "Can I sponsor my spouse?"
+    baseline = assemble_runtime_prompt(message=message, citations=[], locale="en-CA")
+    budget = baseline.prompt_tokens + 450
+
+    prompt = assemble_runtime_prompt(
+        message=message, citations=citations, locale="en-CA", token_budget=budget
+    )
+
+    assert prompt.prompt_tokens <= budget
+    assert prompt.prompt_tokens == estimate_tokens(prompt.system_prompt) + estimate_tokens(
+        prompt.user_prompt
+    )
+    # The best-matching citation is kept (with a truncated excerpt) ahead of the
+    # earlier, less relevant ones, which no longer fit.
+    assert "[IRPR-117]" in prompt.user_prompt
+    assert "A sponsor may sponsor a spouse." in prompt.user_prompt
+    assert '…"' in prompt.user_prompt
+    assert "[IRPR-OFF]" not in prompt.user_prompt
+    assert prompt.citations_included == 1
+
+
+def test_budget_smaller_than_fixed_prompt_keeps_question_and_omits_citations() -> None:
+    prompt = assemble_runtime_prompt(
+        message="How long is processing?",
+        citations=[_citation("SRC", "Processing times", "Six months.")],
+        locale="en-CA",
+        token_budget=10,
+    )
+
+    assert prompt.citations_included == 0
+    assert "How long is processing?" in prompt.user_prompt
+    assert "omitted to fit the prompt budget" in prompt.user_prompt
+
+
+@dataclass
+class _PromptCountingProvider:
+    name: str
+    prompt_tokens: int
+
+    def generate(self, *, message: str, citations, locale: str) -> ProviderResult:
+        return ProviderResult(
+            provider=self.name,
+            answer="ok",
+            citations=[],
+            confidence="medium",
+            prompt_tokens=self.prompt_tokens,
+        )
+
+
+def test_router_records_prompt_tokens_per_provider() -> None:
+    provider = _PromptCountingProvider(name="gemini", prompt_tokens=1200)
+    router = ProviderRouter([provider], "gemini")
+
+    for tokens in (1200, 1500, 900):
+        provider.prompt_tokens = tokens
+        router.generate(message="q", citations=[], locale="en-CA")
+
+    assert router.telemetry_snapshot()["gemini"]["prompt_tokens_total"] == 3600
+    assert router.prompt_token_snapshot()["gemini"] == {
+        "requests": 3,
+        "last": 900,
+        "p50": 1200,
+        "p95": 1500,
+        "max": 1500,
+    }
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+
+import pytest
+
+from immcad_api.providers import GeminiProvider, OpenAIProvider, ProviderRouter
+from immcad_api.providers.prompt_builder import assemble_runtime_prompt
+from immcad_api.schemas import Citation
+from immcad_api.telemetry import ProviderMetrics
+
+# The fake endpoint reports cache hits in whole blocks of this many characters,
+# loosely mirroring how hosted providers cache prompt prefixes in fixed chunks.
+_CACHE_BLOCK_CHARS = 128
+
+
+def _shared_prefix_length(left: str, right: str) -> int:
+    length = 0
+    for left_char, right_char in zip(left, right):
+        if left_char != right_char:
+            break
+        length += 1
+    return length
+
+
+class _PrefixCachingServer:
+    """Local provider endpoint that reports cached tokens for repeated prompt prefixes."""
+
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+        self.payloads: list[dict] = []
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:  # noqa: N802
+                length = int(self.headers.get("content-length") or 0)
+                payload = json.loads(self.rfile.read(length))
+                server.payloads.append(payload)
+                if "messages" in payload:
+                    prompt = "\n\n".join(
+                        message["content"] for message in payload["messages"]
+                    )
+                else:
+                    prompt = payload["contents"][0]["parts"][0]["text"]
+                cached_tokens = server._cached_tokens(prompt)
+                server.prompts.append(prompt)
+                if "messages" in payload:
+                    body = {
+                        "choices": [{"message": {"content": "Cached answer"}}],
+                        "usage": {"prompt_tokens_details": {"cached_tokens": cached_tokens}},
+                    }
+                else:
+                    body = {
+                        "candidates": [
+                            {"content": {"parts": [{"text": "Cached answer"}]}}
+                        ],
+                        "usageMetadata": {"cachedContentTokenCount": cached_tokens},
+                    }
+                encoded = json.dumps(body).encode("utf-8")
+                self.send_response(200)
+                self.send_header("content-type", "application/json")
+                self.send_header("content-length", str(len(encoded)))
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            def log_message(self, format: str, *args) -> None:  # noqa: A002, ANN002
+                del format, args
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.base_url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def _cached_tokens(self, prompt: str) -> int:
+        shared = max(
+            (_shared_prefix_length(prompt, previous) for previous in self.prompts),
+            default=0,
+        )
+        return (shared // _CACHE_BLOCK_CHARS) * _CACHE_BLOCK_CHARS // 4
+
+    def close(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def caching_server() -> Iterator[_PrefixCachingServer]:
+    server = _PrefixCachingServer()
+    try:
+        yield server
+    finally:
+        server.close()
+
+
+_QUESTIONS = (
+    ("Do I need a visa to visit Canada?", "IRPA", "A foreign national must apply for a visa."),
+    (
+        "How long is a study permit valid?",
+        "IRPR",
+        "A study permit becomes invalid 90 days after the program ends.",
+    ),
+    ("Can my spouse sponsor me?", "IRPR-130", "A sponsor must be a Canadian citizen."),
+)
+
+
+def _citations(source_id: str, snippet: str) -> list[Citation]:
+    return [
+        Citation(
+            source_id=source_id,
+            title="Immigration and Refugee Protection",
+            url="https://laws-lois.justice.gc.ca/eng/acts/I-2.5/",
+            pin="s. 11",
+            snippet=snippet,
+        )
+    ]
+
+
+def _openai_provider(
+    monkeypatch: pytest.MonkeyPatch, server: _PrefixCachingServer
+) -> OpenAIProvider:
+    monkeypatch.setattr(
+        OpenAIProvider,
+        "_OPENAI_CHAT_COMPLETIONS_URL",
+        f"{server.base_url}/v1/chat/completions",
+    )
+    monkeypatch.setattr(
+        OpenAIProvider, "_resolve_openai_client_constructor", staticmethod(lambda: None)
+    )
+    return OpenAIProvider(
+        "openai-key", model="gpt-4o-mini", timeout_seconds=5.0, max_retries=0
+    )
+
+
+def _gemini_provider(
+    monkeypatch: pytest.MonkeyPatch, server: _PrefixCachingServer
+) -> GeminiProvider:
+    monkeypatch.setattr(
+        GeminiProvider,
+        "_GEMINI_API_ENDPOINT",
+        f"{server.base_url}/v1beta/models/{{model}}:generateContent",
+    )
+    monkeypatch.setattr(
+        GeminiProvider, "_load_google_genai_sdk", staticmethod(lambda: (None, None))
+    )
+    return GeminiProvider(
+        "gemini-key", model="gemini-2.5-flash", timeout_seconds=5.0, max_retries=0
+    )
+
+
+def test_prompt_prefix_is_identical_across_questions_and_citations() -> None:
+    prompts = [
+        assemble_runtime_prompt(
+            message=message,
+            citations=_citations(source_id, snippet),
+            locale="en-CA",
+            token_budget=4000,
+        )
+        for message, source_id, snippet in _QUESTIONS
+    ]
+
+    assert len({prompt.system_prompt for prompt in prompts}) == 1
+    assert len({prompt.prompt_cache_key for prompt in prompts}) == 1
+    assert len({prompt.user_prompt for prompt in prompts}) == len(_QUESTIONS)
+    for prompt in prompts:
+        assert prompt.combined.startswith(prompts[0].system_prompt)
+        assert "Question:" not in prompt.system_prompt
+        assert "Excerpt:" not in prompt.system_prompt
+
+
+def test_prompt_prefix_and_cache_key_vary_by_locale() -> None:
+    english = assemble_runtime_prompt(message="Hi", citations=[], locale="en-CA")
+    french = assemble_runtime_prompt(message="Hi", citations=[], locale="fr-CA")
+
+    assert english.system_prompt != french.system_prompt
+    assert english.prompt_cache_key != french.prompt_cache_key
+    assert english.prompt_cache_key.startswith("immcad-")
+
+
+@pytest.mark.parametrize("provider_factory", [_openai_provider, _gemini_provider])
+def test_repeated_requests_report_cached_prefix_tokens(
+    monkeypatch: pytest.MonkeyPatch,
+    caching_server: _PrefixCachingServer,
+    provider_factory,
+) -> None:
+    provider = provider_factory(monkeypatch, caching_server)
+
+    results = [
+        provider.generate(
+            message=message, citations=_citations(source_id, snippet), locale="en-CA"
+        )
+        for message, source_id, snippet in _QUESTIONS
+    ]
+
+    assert results[0].cached_prompt_tokens == 0
+    prefix = assemble_runtime_prompt(message="", citations=[], locale="en-CA")
+    for result in results[1:]:
+        # The whole shared prefix (rounded down to a cache block) is a cache hit.
+        assert result.cached_prompt_tokens is not None
+        assert result.cached_prompt_tokens * 4 >= len(prefix.system_prompt) - _CACHE_BLOCK_CHARS
+    for prompt in caching_server.prompts:
+        assert prompt.startswith(prefix.system_prompt)
+
+
+def test_openai_requests_share_prompt_cache_key(
+    monkeypatch: pytest.MonkeyPatch,
+    caching_server: _PrefixCachingServer,
+) -> None:
+    provider = _openai_provider(monkeypatch, caching_server)
+
+    for message, source_id, snippet in _QUESTIONS:
+        provider.generate(
+            message=message, citations=_citations(source_id, snippet), locale="en-CA"
+        )
+
+    system_messages = {payload["messages"][0]["content"] for payload in caching_server.payloads}
+    cache_keys = {payload["prompt_cache_key"] for payload in caching_server.payloads}
+    assert len(system_messages) == 1
+    assert len(cache_keys) == 1
+
+
+def test_router_records_cached_prompt_tokens(
+    monkeypatch: pytest.MonkeyPatch,
+    caching_server: _PrefixCachingServer,
+) -> None:
+    telemetry = ProviderMetrics()
+    router = ProviderRouter(
+        [_openai_provider(monkeypatch, caching_server)],
+        primary_provider_name="openai",
+        telemetry=telemetry,
+    )
+
+    for message, source_id, snippet in _QUESTIONS:
+        router.generate(
+            message=message, citations=_citations(source_id, snippet), locale="en-CA"
+        )
+
+    counters = telemetry.snapshot()["openai"]
+    assert counters["prompt_cache_reports"] == 3
+    assert counters["prompt_cache_hits"] == 2
+    assert counters["cached_prompt_tokens_total"] > 0
@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import sys
+import threading
+import types
+
+import pytest
+
+from immcad_api.providers import (
+    CircuitBreaker,
+    ProviderError,
+    ProviderResult,
+    ProviderRouter,
+    RedisCircuitStateStore,
+)
+from immcad_api.providers.circuit_breaker import build_circuit_state_store
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeRedis:
+    """Minimal Redis double; TTLs are driven by the shared test clock."""
+
+    def __init__(self, clock: _Clock) -> None:
+        self.clock = clock
+        self.expires_at: dict[str, float] = {}
+
+    def _live(self, key: str) -> bool:
+        expires_at = self.expires_at.get(key)
+        if expires_at is None:
+            return False
+        if self.clock() >= expires_at:
+            del self.expires_at[key]
+            return False
+        return True
+
+    def set(self, key: str, _value: str, *, px: int, nx: bool = False) -> bool:
+        if nx and self._live(key):
+            return False
+        self.expires_at[key] = self.clock() + px / 1000.0
+        return True
+
+    def pttl(self, key: str) -> int:
+        if not self._live(key):
+            return -2
+        return int((self.expires_at[key] - self.clock()) * 1000)
+
+    def delete(self, *keys: str) -> int:
+        return sum(1 for key in keys if self.expires_at.pop(key, None) is not None)
+
+
+def test_breaker_opens_after_threshold_and_half_opens_after_cooldown() -> None:
+    clock = _Clock()
+    breaker = CircuitBreaker("openai", failure_threshold=2, open_seconds=10.0, time_fn=clock)
+
+    assert breaker.try_acquire() is not None
+    assert breaker.record_failure() is False
+    assert breaker.try_acquire() is not None
+    assert breaker.record_failure() is True
+    assert breaker.state == "open"
+    assert breaker.try_acquire() is None
+
+    clock.now = 10.0
+
+    assert breaker.state == "half_open"
+    assert breaker.try_acquire() is not None
+    assert breaker.try_acquire() is None
+    assert breaker.record_success() == "half_open"
+    assert breaker.state == "closed"
+
+
+def test_breaker_probe_failure_reopens_circuit() -> None:
+    clock = _Clock()
+    breaker = CircuitBreaker("openai", failure_threshold=1, open_seconds=5.0, time_fn=clock)
+    breaker.record_failure()
+    clock.now = 5.0
+
+    assert breaker.try_acquire() is not None
+    assert breaker.record_failure() is True
+    assert breaker.state == "open"
+    assert breaker.snapshot()["open_remaining_seconds"] == 5.0
+
+
+def test_breaker_frees_released_and_abandoned_probe_slots() -> None:
+    clock = _Clock()
+    breaker = CircuitBreaker("openai", failure_threshold=1, open_seconds=5.0, time_fn=clock)
+    breaker.record_failure()
+    clock.now = 5.0
+
+    permit = breaker.try_acquire()
+    assert permit is not None and permit.probe
+    breaker.release(permit)
+    assert breaker.try_acquire() is not None
+    assert breaker.try_acquire() is None
+
+    clock.now = 10.0
+
+    assert breaker.try_acquire() is not None
+
+
+def test_breaker_ignores_late_success_while_open() -> None:
+    clock = _Clock()
+    breaker = CircuitBreaker("openai", failure_threshold=1, open_seconds=5.0, time_fn=clock)
+    breaker.record_failure()
+
+    assert breaker.record_success() == "open"
+    assert breaker.state == "open"
+
+
+def test_breaker_admits_bounded_probes_under_concurrency() -> None:
+    clock = _Clock()
+    breaker = CircuitBreaker(
+        "openai",
+        failure_threshold=1,
+        open_seconds=5.0,
+        half_open_max_probes=3,
+        time_fn=clock,
+    )
+    breaker.record_failure()
+    clock.now = 5.0
+    barrier = threading.Barrier(32)
+
+    def acquire() -> bool:
+        barrier.wait()
+        return breaker.try_acquire() is not None
+
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        admitted = list(executor.map(lambda _: acquire(), range(32)))
+
+    assert admitted.count(True) == 3
+
+
+def test_shared_state_propagates_open_circuit_between_workers() -> None:
+    clock = _Clock()
+    store = RedisCircuitStateStore(_FakeRedis(clock))
+    worker_a = CircuitBreaker(
+        "openai",
+        failure_threshold=1,
+        open_seconds=30.0,
+        time_fn=clock,
+        shared_state=store,
+        shared_refresh_seconds=0.0,
+    )
+    worker_b = CircuitBreaker(
+        "openai",
+        failure_threshold=1,
+        open_seconds=30.0,
+        time_fn=clock,
+        shared_state=store,
+        shared_refresh_seconds=0.0,
+    )
+
+    assert worker_a.record_failure() is True
+
+    assert worker_b.try_acquire() is None
+    assert worker_b.state == "open"
+
+    clock.now = 30.0
+
+    assert worker_a.try_acquire() is not None
+    assert worker_b.try_acquire() is None
+    worker_a.record_success()
+    clock.now = 31.0
+    assert store.remaining_open_seconds("openai") == 0.0
+
+
+def test_shared_state_reopens_half_open_worker_after_remote_probe_failure() -> None:
+    clock = _Clock()
+    store = RedisCircuitStateStore(_FakeRedis(clock))
+    breakers = [
+        CircuitBreaker(
+            "openai",
+            failure_threshold=1,
+            open_seconds=10.0,
+            time_fn=clock,
+            shared_state=store,
+            shared_refresh_seconds=0.0,
+        )
+        for _ in range(2)
+    ]
+    for breaker in breakers:
+        breaker.record_failure()
+    clock.now = 10.0
+
+    assert breakers[0].try_acquire() is not None
+    breakers[0].record_failure()
+
+    assert breakers[1].try_acquire() is None
+    assert breakers[1].state == "open"
+
+
+def test_shared_state_released_probe_lets_another_worker_probe() -> None:
+    clock = _Clock()
+    store = RedisCircuitStateStore(_FakeRedis(clock))
+    breakers = [
+        CircuitBreaker(
+            "openai",
+            failure_threshold=1,
+            open_seconds=10.0,
+            time_fn=clock,
+            shared_state=store,
+            shared_refresh_seconds=0.0,
+        )
+        for _ in range(2)
+    ]
+    for breaker in breakers:
+        breaker.record_failure()
+    clock.now = 10.0
+
+    permit = breakers[0].try_acquire()
+    assert permit is not None
+    assert breakers[1].try_acquire() is None
+    breakers[0].release(permit)
+
+    assert breakers[1].try_acquire() is not None
+    assert breakers[0].try_acquire() is None
+
+
+def test_releasing_a_closed_circuit_permit_keeps_probe_slots_and_shared_lock() -> None:
+    clock = _Clock()
+    redis = _FakeRedis(clock)
+    store = RedisCircuitStateStore(redis)
+    breaker = CircuitBreaker(
+        "openai",
+        failure_threshold=1,
+        open_seconds=10.0,
+        time_fn=clock,
+        shared_state=store,
+        shared_refresh_seconds=0.0,
+    )
+    closed_permit = breaker.try_acquire()
+    assert closed_permit is not None and not closed_permit.probe
+    breaker.record_failure()
+    clock.now = 10.0
+    probe_permit = breaker.try_acquire()
+    assert probe_permit is not None and probe_permit.probe
+
+    # The call admitted while closed ends late; it must not free the live probe.
+    breaker.release(closed_permit)
+
+    assert breaker.snapshot()["probes_in_flight"] == 1
+    assert redis.pttl("immcad:circuit:openai:probe") > 0
+    assert breaker.try_acquire() is None
+
+    breaker.release(probe_permit)
+    breaker.release(probe_permit)
+
+    assert breaker.snapshot()["probes_in_flight"] == 0
+    assert redis.pttl("immcad:circuit:openai:probe") == -2
+
+
+def test_build_circuit_state_store_falls_back_when_redis_unavailable(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class _BrokenRedisClient:
+        def ping(self) -> None:
+            raise RuntimeError("redis unavailable")
+
+    class _BrokenRedis:
+        @staticmethod
+        def from_url(*_args, **_kwargs):
+            return _BrokenRedisClient()
+
+    monkeypatch.setitem(sys.modules, "redis", types.SimpleNamespace(Redis=_BrokenRedis))
+
+    assert build_circuit_state_store(redis_url="redis://localhost:6379/0") is None
+    assert build_circuit_state_store(redis_url=None) is None
+
+
+@dataclass
+class _RecoveringProvider:
+    name: str
+    failures_left: int
+
+    def generate(self, *, message: str, citations, locale: str) -> ProviderResult:
+        if self.failures_left > 0:
+            self.failures_left -= 1
+            raise ProviderError(self.name, "provider_error", "still failing")
+        return ProviderResult(
+            provider=self.name, answer="recovered", citations=[], confidence="medium"
+        )
+
+
+@dataclass
+class _StaticProvider:
+    name: str
+
+    def generate(self, *, message: str, citations, locale: str) -> ProviderResult:
+        return ProviderResult(
+            provider=self.name, answer="fallback", citations=[], confidence="medium"
+        )
+
+
+def test_router_half_open_probe_failure_reopens_and_success_closes() -> None:
+    clock = _Clock()
+    primary = _RecoveringProvider(name="openai", failures_left=2)
+    router = ProviderRouter(
+        [primary, _StaticProvider(name="gemini")],
+        "openai",
+        circuit_breaker_failure_threshold=1,
+        circuit_breaker_open_seconds=5.0,
+        time_fn=clock,
+    )
+
+    router.generate(message="q", citations=[], locale="en-CA")
+    clock.now = 5.0
+    probe_failed = router.generate(message="q", citations=[], locale="en-CA")
+    skipped = router.generate(message="q", citations=[], locale="en-CA")
+    clock.now = 10.0
+    recovered = router.generate(message="q", citations=[], locale="en-CA")
+
+    assert probe_failed.result.provider == "gemini"
+    assert skipped.result.provider == "gemini"
+    assert recovered.result.provider == "openai"
+    metrics = router.telemetry_snapshot()["openai"]
+    assert metrics["circuit_open"] == 2
+    assert metrics["circuit_skip"] == 1
+    assert metrics["circuit_close"] == 1
+    assert router.circuit_snapshot()["openai"]["state"] == "closed"
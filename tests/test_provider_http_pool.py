@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+
+from fastapi.testclient import TestClient
+import pytest
+
+from immcad_api.main import create_app
+from immcad_api.providers import OpenAIProvider, ProviderHttpPool
+from immcad_api.schemas import Citation
+
+
+class _KeepAliveServer:
+    """HTTP/1.1 server that records which client connections served requests."""
+
+    def __init__(self) -> None:
+        self.connections: list[tuple[str, int]] = []
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:  # noqa: N802
+                length = int(self.headers.get("content-length") or 0)
+                self.rfile.read(length)
+                server.connections.append(self.client_address)
+                body = json.dumps(
+                    {"choices": [{"message": {"content": "Pooled answer"}}]}
+                ).encode("utf-8")
+                self.send_response(200)
+                self.send_header("content-type", "application/json")
+                self.send_header("content-length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:  # noqa: A002, ANN002
+                del format, args
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.base_url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def keep_alive_server() -> Iterator[_KeepAliveServer]:
+    server = _KeepAliveServer()
+    try:
+        yield server
+    finally:
+        server.close()
+
+
+def _citations() -> list[Citation]:
+    return [
+        Citation(
+            source_id="IRPA",
+            title="Immigration and Refugee Protection Act",
+            url="https://laws-lois.justice.gc.ca/eng/acts/I-2.5/",
+            pin="s. 11",
+            snippet="A foreign national must apply for a visa.",
+        )
+    ]
+
+
+def _openai_provider(
+    monkeypatch: pytest.MonkeyPatch,
+    server: _KeepAliveServer,
+    *,
+    http_pool: ProviderHttpPool | None,
+) -> OpenAIProvider:
+    monkeypatch.setattr(
+        OpenAIProvider,
+        "_OPENAI_CHAT_COMPLETIONS_URL",
+        f"{server.base_url}/v1/chat/completions",
+    )
+    monkeypatch.setattr(
+        OpenAIProvider, "_resolve_openai_client_constructor", staticmethod(lambda: None)
+    )
+    monkeypatch.setattr(
+        OpenAIProvider,
+        "_resolve_async_openai_client_constructor",
+        staticmethod(lambda: None),
+    )
+    return OpenAIProvider(
+        "openai-key",
+        model="gpt-4o-mini",
+        timeout_seconds=5.0,
+        max_retries=0,
+        http_pool=http_pool,
+    )
+
+
+def test_pool_rejects_invalid_limits() -> None:
+    with pytest.raises(ValueError, match="max_connections must be >= 1"):
+        ProviderHttpPool(timeout_seconds=5.0, max_connections=0)
+    with pytest.raises(ValueError, match="keepalive_expiry_seconds must be > 0"):
+        ProviderHttpPool(timeout_seconds=5.0, keepalive_expiry_seconds=0)
+
+
+def test_pool_reuses_sync_client_until_closed() -> None:
+    pool = ProviderHttpPool(timeout_seconds=5.0, max_connections=4)
+
+    client = pool.sync_client()
+    assert pool.sync_client() is client
+
+    asyncio.run(pool.aclose())
+
+    assert client.is_closed
+    with pytest.raises(RuntimeError, match="closed"):
+        pool.sync_client()
+
+
+def test_pooled_openai_provider_reuses_one_connection(
+    monkeypatch: pytest.MonkeyPatch,
+    keep_alive_server: _KeepAliveServer,
+) -> None:
+    pool = ProviderHttpPool(timeout_seconds=5.0)
+    provider = _openai_provider(monkeypatch, keep_alive_server, http_pool=pool)
+
+    for _ in range(3):
+        result = provider.generate(
+            message="Do I need a visa?", citations=_citations(), locale="en-CA"
+        )
+        assert result.answer == "Pooled answer"
+
+    assert len(keep_alive_server.connections) == 3
+    assert len(set(keep_alive_server.connections)) == 1
+    asyncio.run(provider.aclose())
+
+
+def test_unpooled_openai_provider_opens_a_connection_per_call(
+    monkeypatch: pytest.MonkeyPatch,
+    keep_alive_server: _KeepAliveServer,
+) -> None:
+    provider = _openai_provider(monkeypatch, keep_alive_server, http_pool=None)
+
+    for _ in range(3):
+        provider.generate(
+            message="Do I need a visa?", citations=_citations(), locale="en-CA"
+        )
+
+    assert len(set(keep_alive_server.connections)) == 3
+
+
+def test_pooled_openai_provider_reuses_connection_on_async_path(
+    monkeypatch: pytest.MonkeyPatch,
+    keep_alive_server: _KeepAliveServer,
+) -> None:
+    pool = ProviderHttpPool(timeout_seconds=5.0)
+    provider = _openai_provider(monkeypatch, keep_alive_server, http_pool=pool)
+
+    async def scenario() -> list[str]:
+        answers = []
+        for _ in range(3):
+            result = await provider.generate_async(
+                message="Do I need a visa?", citations=_citations(), locale="en-CA"
+            )
+            answers.append(result.answer)
+        await provider.aclose()
+        return answers
+
+    assert asyncio.run(scenario()) == ["Pooled answer"] * 3
+    assert len(set(keep_alive_server.connections)) == 1
+
+
+def test_create_app_closes_provider_pools_on_shutdown(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    closed: list[str] = []
+
+    async def record_close(self: ProviderHttpPool) -> None:
+        closed.append("pool")
+
+    monkeypatch.setattr(ProviderHttpPool, "aclose", record_close)
+
+    with TestClient(create_app()) as client:
+        assert client.get("/healthz").status_code == 200
+        assert closed == []
+
+    assert closed == ["pool", "pool"]
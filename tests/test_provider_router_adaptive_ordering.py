@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+
+from immcad_api.providers import (
+    ProviderError,
+    ProviderResult,
+    ProviderRouter,
+    ProviderScoreboard,
+)
+
+
+@dataclass
+class _NamedProvider:
+    name: str
+    model: str = "test-model"
+    fail: bool = False
+
+    def __post_init__(self) -> None:
+        self.calls = 0
+
+    def generate(self, *, message: str, citations, locale: str) -> ProviderResult:
+        self.calls += 1
+        if self.fail:
+            raise ProviderError(self.name, "provider_error", "provider failed")
+        return ProviderResult(
+            provider=self.name,
+            answer=f"{self.name} answer",
+            citations=[],
+            confidence="medium",
+        )
+
+
+def _names(providers) -> list[str]:
+    return [provider.name for provider in providers]
+
+
+def _feed(
+    scoreboard: ProviderScoreboard, provider: _NamedProvider, latency: float, count: int
+) -> None:
+    for _ in range(count):
+        scoreboard.record_latency(provider, latency)
+
+
+def test_scoreboard_keeps_static_order_until_providers_are_scored() -> None:
+    openai, gemini = _NamedProvider("openai"), _NamedProvider("gemini")
+    scoreboard = ProviderScoreboard(min_samples=3)
+    _feed(scoreboard, gemini, 0.1, 3)
+
+    assert _names(scoreboard.order([openai, gemini])) == ["openai", "gemini"]
+
+
+def test_scoreboard_promotes_clearly_faster_provider() -> None:
+    openai, gemini = _NamedProvider("openai"), _NamedProvider("gemini")
+    scoreboard = ProviderScoreboard(min_samples=3, switch_margin=0.2)
+    _feed(scoreboard, openai, 1.0, 3)
+    _feed(scoreboard, gemini, 0.2, 3)
+
+    assert _names(scoreboard.order([openai, gemini])) == ["gemini", "openai"]
+    snapshot = scoreboard.snapshot()
+    assert snapshot["leader"] == "gemini"
+    assert snapshot["leader_switches"] == 1
+    assert snapshot["providers"]["gemini"]["model"] == "test-model"
+    assert snapshot["providers"]["gemini"]["latency_ewma_ms"] == pytest.approx(200.0)
+
+
+def test_scoreboard_scores_each_provider_model_separately() -> None:
+    openai, gemini = _NamedProvider("openai"), _NamedProvider("gemini")
+    scoreboard = ProviderScoreboard(min_samples=3, switch_margin=0.2)
+    _feed(scoreboard, openai, 0.5, 3)
+    _feed(scoreboard, gemini, 2.0, 3)
+    assert _names(scoreboard.order([openai, gemini])) == ["openai", "gemini"]
+
+    gemini.model = "gemini-next"
+    _feed(scoreboard, gemini, 0.1, 2)
+    assert scoreboard.snapshot()["providers"]["gemini"] == {
+        "model": "gemini-next",
+        "latency_ewma_ms": pytest.approx(100.0),
+        "error_rate": 0.0,
+        "samples": 2,
+        "score": None,
+    }
+    assert _names(scoreboard.order([openai, gemini])) == ["openai", "gemini"]
+
+    _feed(scoreboard, gemini, 0.1, 1)
+    assert _names(scoreboard.order([openai, gemini])) == ["gemini", "openai"]
+
+    gemini.model = "test-model"
+    assert _names(scoreboard.order([openai, gemini])) == ["openai", "gemini"]
+    assert scoreboard.snapshot()["providers"]["gemini"]["latency_ewma_ms"] == pytest.approx(
+        2000.0
+    )
+
+
+def test_scoreboard_hysteresis_ignores_near_ties() -> None:
+    openai, gemini = _NamedProvider("openai"), _NamedProvider("gemini")
+    scoreboard = ProviderScoreboard(min_samples=3, switch_margin=0.2)
+    _feed(scoreboard, openai, 1.0, 3)
+    _feed(scoreboard, gemini, 0.9, 3)
+
+    for _ in range(10):
+        assert scoreboard.order([openai, gemini])[0].name == "openai"
+    assert scoreboard.snapshot()["leader_switches"] == 0
+
+
+def test_scoreboard_penalizes_error_rate() -> None:
+    openai, gemini = _NamedProvider("openai"), _NamedProvider("gemini")
+    scoreboard = ProviderScoreboard(min_samples=3, switch_margin=0.2)
+    _feed(scoreboard, openai, 0.5, 3)
+    _feed(scoreboard, gemini, 0.6, 3)
+    for _ in range(3):
+        scoreboard.record_failure(openai)
+
+    assert scoreboard.order([openai, gemini])[0].name == "gemini"
+
+
+def test_scoreboard_explores_runner_up_periodically() -> None:
+    openai, gemini = _NamedProvider("openai"), _NamedProvider("gemini")
+    scoreboard = ProviderScoreboard(min_samples=3, explore_interval=4)
+
+    leads = [scoreboard.order([openai, gemini])[0].name for _ in range(8)]
+
+    assert leads == ["openai", "openai", "openai", "gemini"] * 2
+
+
+def test_router_routes_to_scored_leader_without_reporting_fallback() -> None:
+    openai, gemini = _NamedProvider("openai"), _NamedProvider("gemini")
+    scoreboard = ProviderScoreboard(min_samples=2, explore_interval=1000)
+    _feed(scoreboard, openai, 2.0, 2)
+    _feed(scoreboard, gemini, 0.1, 2)
+    router = ProviderRouter([openai, gemini], "openai", scoreboard=scoreboard)
+
+    result = router.generate(message="q", citations=[], locale="en-CA")
+
+    assert result.result.provider == "gemini"
+    assert result.fallback_used is False
+    assert openai.calls == 0
+    assert router.scoring_snapshot()["leader"] == "gemini"
+
+
+def test_router_failures_demote_leader_and_feed_scoreboard() -> None:
+    openai = _NamedProvider("openai", fail=True)
+    gemini = _NamedProvider("gemini")
+    scoreboard = ProviderScoreboard(min_samples=2, explore_interval=1000)
+    router = ProviderRouter(
+        [openai, gemini],
+        "openai",
+        scoreboard=scoreboard,
+        circuit_breaker_failure_threshold=100,
+    )
+
+    first = router.generate(message="q", citations=[], locale="en-CA")
+    router.generate(message="q", citations=[], locale="en-CA")
+    third = router.generate(message="q", citations=[], locale="en-CA")
+
+    assert first.fallback_used is True
+    assert third.result.provider == "gemini"
+    assert third.fallback_used is False
+    assert openai.calls == 2
+    snapshot = router.scoring_snapshot()
+    assert snapshot["providers"]["openai"]["error_rate"] > 0
+    assert snapshot["providers"]["openai"]["score"] is None
+
+
+def test_router_scoring_snapshot_is_empty_without_scoreboard() -> None:
+    router = ProviderRouter([_NamedProvider("openai")], "openai")
+
+    assert router.scoring_snapshot() == {}
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
+import time
 
 import pytest
 
+from immcad_api.deadline import Deadline, deadline_scope
 from immcad_api.providers import ProviderError, ProviderResult, ProviderRouter
 
 
@@ -126,3 +129,129 @@ def test_router_requires_primary_provider_first_in_order() -> None:
 
     with pytest.raises(ValueError, match="primary provider to be first"):
         ProviderRouter([router_fallback, router_primary], "openai")
+
+
+@dataclass
+class _AsyncProvider:
+    name: str
+    delay_seconds: float = 0.0
+    error_code: str | None = None
+    calls: int = 0
+
+    def generate(self, *, message: str, citations, locale: str) -> ProviderResult:
+        raise AssertionError("async routing should not call generate")
+
+    async def generate_async(
+        self, *, message: str, citations, locale: str
+    ) -> ProviderResult:
+        self.calls += 1
+        await asyncio.sleep(self.delay_seconds)
+        if self.error_code is not None:
+            raise ProviderError(self.name, self.error_code, "async failure")
+        return ProviderResult(
+            provider=self.name,
+            answer=f"{self.name} answer",
+            citations=citations,
+            confidence="medium",
+        )
+
+
+def test_router_generate_async_falls_back_and_opens_circuit() -> None:
+    now = {"value": 0.0}
+    failing = _AsyncProvider(name="openai", error_code="timeout")
+    fallback = _AsyncProvider(name="gemini")
+    router = ProviderRouter(
+        [failing, fallback],
+        "openai",
+        circuit_breaker_failure_threshold=2,
+        circuit_breaker_open_seconds=30.0,
+        time_fn=lambda: now["value"],
+    )
+
+    async def _route_three_times():
+        return [
+            await router.generate_async(message="q", citations=[], locale="en-CA")
+            for _ in range(3)
+        ]
+
+    results = asyncio.run(_route_three_times())
+
+    assert [result.result.provider for result in results] == ["gemini"] * 3
+    assert results[0].fallback_reason == "timeout"
+    assert results[2].fallback_reason == "provider_error"
+    assert failing.calls == 2
+    snapshot = router.telemetry_snapshot()
+    assert snapshot["openai"]["circuit_open"] == 1
+    assert snapshot["openai"]["circuit_skip"] == 1
+    assert snapshot["gemini"]["fallback_success"] == 3
+
+
+def test_router_generate_async_uses_sync_generate_for_legacy_providers() -> None:
+    router = ProviderRouter([_SuccessProvider(name="scaffold", answer="sync")], "scaffold")
+
+    result = asyncio.run(router.generate_async(message="q", citations=[], locale="en-CA"))
+
+    assert result.result.answer == "sync"
+    assert result.fallback_used is False
+
+
+def test_router_generate_async_overlaps_concurrent_provider_calls() -> None:
+    provider = _AsyncProvider(name="openai", delay_seconds=0.2)
+    router = ProviderRouter([provider], "openai")
+
+    async def _fan_out() -> float:
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(
+                router.generate_async(message="q", citations=[], locale="en-CA")
+                for _ in range(200)
+            )
+        )
+        return time.perf_counter() - started
+
+    elapsed = asyncio.run(_fan_out())
+
+    assert provider.calls == 200
+    assert elapsed < 2.0
+
+
+@dataclass
+class _ClockAdvancingProvider:
+    name: str
+    clock: list[float]
+    seconds: float
+
+    def generate(self, *, message: str, citations, locale: str) -> ProviderResult:
+        self.clock[0] += self.seconds
+        raise ProviderError(self.name, "provider_error", "slow failure")
+
+
+def test_router_stops_failing_over_once_request_deadline_passes() -> None:
+    clock = [0.0]
+    primary = _ClockAdvancingProvider(name="openai", clock=clock, seconds=5.0)
+    fallback = _SuccessProvider(name="gemini")
+    router = ProviderRouter([primary, fallback], "openai")
+
+    with deadline_scope(Deadline.after(3.0, time_fn=lambda: clock[0])):
+        with pytest.raises(ProviderError) as exc_info:
+            router.generate(message="q", citations=[], locale="en-CA")
+
+    assert exc_info.value.code == "timeout"
+    assert exc_info.value.provider == "router"
+    snapshot = router.telemetry_snapshot()
+    assert snapshot["gemini"]["deadline_skip"] == 1
+    assert "success" not in snapshot["gemini"]
+
+
+def test_router_async_path_honours_request_deadline() -> None:
+    clock = [10.0]
+    router = ProviderRouter([_SuccessProvider(name="openai")], "openai")
+    deadline = Deadline.after(1.0, time_fn=lambda: clock[0])
+    clock[0] += 2.0
+
+    async def scenario() -> None:
+        with deadline_scope(deadline):
+            await router.generate_async(message="q", citations=[], locale="en-CA")
+
+    with pytest.raises(ProviderError, match="Request deadline exceeded"):
+        asyncio.run(scenario())
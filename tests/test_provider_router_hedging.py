@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import threading
+import time
+
+import pytest
+
+from immcad_api.providers import HedgePolicy, ProviderError, ProviderResult, ProviderRouter
+from immcad_api.providers.bulkhead import BulkheadRegistry
+
+
+@dataclass
+class _SlowProvider:
+    name: str
+    delay_seconds: float = 0.0
+    fail: bool = False
+
+    def __post_init__(self) -> None:
+        self.calls = 0
+        self.cancelled = 0
+
+    def _result(self) -> ProviderResult:
+        if self.fail:
+            raise ProviderError(self.name, "provider_error", "provider failed")
+        return ProviderResult(
+            provider=self.name,
+            answer=f"{self.name} answer",
+            citations=[],
+            confidence="medium",
+        )
+
+    def generate(self, *, message: str, citations, locale: str) -> ProviderResult:
+        self.calls += 1
+        time.sleep(self.delay_seconds)
+        return self._result()
+
+    async def generate_async(
+        self, *, message: str, citations, locale: str
+    ) -> ProviderResult:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay_seconds)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return self._result()
+
+
+def _warm_policy(*, max_hedge_ratio: float = 1.0) -> HedgePolicy:
+    policy = HedgePolicy(
+        latency_percentile=90.0,
+        min_samples=5,
+        max_hedge_ratio=max_hedge_ratio,
+        min_delay_seconds=0.0,
+    )
+    for _ in range(10):
+        policy.record_latency("openai", 0.02)
+    return policy
+
+
+def test_hedge_policy_uses_latency_percentile_after_min_samples() -> None:
+    policy = HedgePolicy(latency_percentile=50.0, min_samples=4, min_delay_seconds=0.0)
+    for seconds in (0.1, 0.2, 0.3):
+        policy.record_latency("openai", seconds)
+
+    assert policy.hedge_delay("openai") is None
+
+    policy.record_latency("openai", 0.4)
+
+    assert policy.hedge_delay("openai") == pytest.approx(0.3)
+
+
+def test_hedge_policy_budget_refills_at_max_ratio() -> None:
+    policy = HedgePolicy(max_hedge_ratio=0.5)
+
+    assert policy.try_acquire() is True
+    assert policy.try_acquire() is False
+
+    policy.record_request()
+    assert policy.try_acquire() is False
+    policy.record_request()
+    assert policy.try_acquire() is True
+
+
+def test_router_hedges_slow_primary_and_returns_first_success() -> None:
+    primary = _SlowProvider(name="openai", delay_seconds=0.5)
+    secondary = _SlowProvider(name="gemini")
+    router = ProviderRouter([primary, secondary], "openai", hedge_policy=_warm_policy())
+
+    started = time.perf_counter()
+    result = router.generate(message="q", citations=[], locale="en-CA")
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.4
+    assert result.result.provider == "gemini"
+    assert result.fallback_used is True
+    assert result.fallback_reason == "timeout"
+    snapshot = router.telemetry_snapshot()
+    assert snapshot["gemini"]["hedge_sent"] == 1
+    assert snapshot["gemini"]["hedge_won"] == 1
+    assert "failure" not in snapshot.get("openai", {})
+    router.close()
+
+
+def test_router_does_not_hedge_fast_primary() -> None:
+    primary = _SlowProvider(name="openai")
+    secondary = _SlowProvider(name="gemini")
+    router = ProviderRouter([primary, secondary], "openai", hedge_policy=_warm_policy())
+
+    result = router.generate(message="q", citations=[], locale="en-CA")
+
+    assert result.result.provider == "openai"
+    assert result.fallback_used is False
+    assert secondary.calls == 0
+    assert "hedge_sent" not in router.telemetry_snapshot().get("gemini", {})
+    router.close()
+
+
+def test_router_waits_for_primary_when_hedge_budget_is_exhausted() -> None:
+    primary = _SlowProvider(name="openai", delay_seconds=0.15)
+    secondary = _SlowProvider(name="gemini")
+    policy = _warm_policy(max_hedge_ratio=0.01)
+    assert policy.try_acquire() is True
+    router = ProviderRouter([primary, secondary], "openai", hedge_policy=policy)
+
+    result = router.generate(message="q", citations=[], locale="en-CA")
+
+    assert result.result.provider == "openai"
+    assert secondary.calls == 0
+    assert router.telemetry_snapshot()["openai"]["hedge_budget_exhausted"] == 1
+    router.close()
+
+
+def test_router_runs_queued_primary_inline_without_firing_a_hedge() -> None:
+    primary = _SlowProvider(name="openai", delay_seconds=0.05)
+    secondary = _SlowProvider(name="gemini")
+    router = ProviderRouter(
+        [primary, secondary], "openai", hedge_policy=_warm_policy(), hedge_max_workers=2
+    )
+    release = threading.Event()
+    executor = router._get_hedge_executor()
+    assert executor is not None
+    blockers = [executor.submit(release.wait, 2.0) for _ in range(2)]
+
+    try:
+        result = router.generate(message="q", citations=[], locale="en-CA")
+    finally:
+        release.set()
+        for blocker in blockers:
+            blocker.result()
+
+    assert result.result.provider == "openai"
+    assert result.fallback_used is False
+    assert (primary.calls, secondary.calls) == (1, 0)
+    snapshot = router.telemetry_snapshot()
+    assert snapshot["openai"]["hedge_pool_saturated"] == 1
+    assert "hedge_sent" not in snapshot.get("gemini", {})
+    router.close()
+
+
+def test_router_sizes_hedge_pool_from_provider_bulkheads() -> None:
+    providers = [_SlowProvider(name="openai"), _SlowProvider(name="gemini")]
+
+    sized = ProviderRouter(
+        providers,
+        "openai",
+        hedge_policy=_warm_policy(),
+        bulkheads=BulkheadRegistry(limits={"openai": 12, "gemini": 10}),
+    )
+    partial = ProviderRouter(
+        providers,
+        "openai",
+        hedge_policy=_warm_policy(),
+        bulkheads=BulkheadRegistry(limits={"openai": 12}),
+    )
+
+    assert sized.hedge_max_workers == 22
+    assert partial.hedge_max_workers == 16
+
+
+def test_router_skips_hedging_until_primary_latency_is_known() -> None:
+    primary = _SlowProvider(name="openai", delay_seconds=0.05)
+    secondary = _SlowProvider(name="gemini")
+    policy = HedgePolicy(min_samples=3, min_delay_seconds=0.0)
+    router = ProviderRouter([primary, secondary], "openai", hedge_policy=policy)
+
+    for _ in range(3):
+        router.generate(message="q", citations=[], locale="en-CA")
+
+    assert secondary.calls == 0
+    assert policy.hedge_delay("openai") is not None
+
+
+def test_router_generate_async_hedges_and_cancels_loser() -> None:
+    primary = _SlowProvider(name="openai", delay_seconds=1.0)
+    secondary = _SlowProvider(name="gemini")
+    router = ProviderRouter([primary, secondary], "openai", hedge_policy=_warm_policy())
+
+    async def scenario():
+        started = time.perf_counter()
+        routed = await router.generate_async(message="q", citations=[], locale="en-CA")
+        await asyncio.sleep(0)
+        return routed, time.perf_counter() - started
+
+    result, elapsed = asyncio.run(scenario())
+
+    assert elapsed < 0.5
+    assert result.result.provider == "gemini"
+    assert primary.cancelled == 1
+    assert router.telemetry_snapshot()["gemini"]["hedge_won"] == 1
+
+
+def test_router_generate_async_falls_through_when_hedged_calls_fail() -> None:
+    primary = _SlowProvider(name="openai", delay_seconds=0.2, fail=True)
+    secondary = _SlowProvider(name="gemini", fail=True)
+    tertiary = _SlowProvider(name="scaffold")
+    router = ProviderRouter(
+        [primary, secondary, tertiary], "openai", hedge_policy=_warm_policy()
+    )
+
+    result = asyncio.run(
+        router.generate_async(message="q", citations=[], locale="en-CA")
+    )
+
+    assert result.result.provider == "scaffold"
+    assert result.fallback_reason == "provider_error"
+    snapshot = router.telemetry_snapshot()
+    assert snapshot["openai"]["failure"] == 1
+    assert snapshot["gemini"]["failure"] == 1
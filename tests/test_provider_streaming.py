@@ -0,0 +1,411 @@
+from __future__ import annotations
+
+from collections.abc import Generator, Iterator
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+
+from fastapi.testclient import TestClient
+import pytest
+
+from immcad_api.main import create_app
+from immcad_api.providers import GeminiProvider, OpenAIProvider, ProviderError
+from immcad_api.providers.base import ProviderResult, StreamUsage
+from immcad_api.providers.prompt_builder import assemble_runtime_prompt
+from immcad_api.providers.router import ProviderRouter
+from immcad_api.providers.streaming import iter_sse_data
+from immcad_api.schemas import Citation
+
+
+@dataclass
+class _FakeRoute:
+    status: int = 200
+    events: list[str] = field(default_factory=list)
+    body: str = ""
+
+
+class _FakeProviderServer:
+    """Local HTTP server that replays canned SSE provider responses."""
+
+    def __init__(self) -> None:
+        self.routes: dict[str, _FakeRoute] = {}
+        self.requests: list[tuple[str, dict[str, object]]] = []
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:  # noqa: N802
+                length = int(self.headers.get("content-length") or 0)
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                server.requests.append((self.path, payload))
+                route = server.routes.get(self.path.split("?")[0], _FakeRoute(status=404))
+                self.send_response(route.status)
+                if route.status >= 400:
+                    body = route.body.encode("utf-8")
+                    self.send_header("content-type", "application/json")
+                    self.send_header("content-length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+                self.send_header("content-type", "text/event-stream")
+                self.end_headers()
+                for event in route.events:
+                    self.wfile.write(f"data: {event}\n\n".encode("utf-8"))
+                    self.wfile.flush()
+
+            def log_message(self, format: str, *args) -> None:  # noqa: A002, ANN002
+                del format, args
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.base_url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def fake_provider_server() -> Iterator[_FakeProviderServer]:
+    server = _FakeProviderServer()
+    try:
+        yield server
+    finally:
+        server.close()
+
+
+def _openai_chunk(text: str) -> str:
+    return json.dumps({"choices": [{"delta": {"content": text}}]})
+
+
+def _gemini_chunk(text: str) -> str:
+    return json.dumps({"candidates": [{"content": {"parts": [{"text": text}]}}]})
+
+
+def _citations() -> list[Citation]:
+    return [
+        Citation(
+            source_id="IRPA",
+            title="Immigration and Refugee Protection Act",
+            url="https://laws-lois.justice.gc.ca/eng/acts/I-2.5/",
+            pin="s. 11",
+            snippet="A foreign national must apply for a visa.",
+        )
+    ]
+
+
+def _openai_provider(
+    monkeypatch: pytest.MonkeyPatch, server: _FakeProviderServer
+) -> OpenAIProvider:
+    monkeypatch.setattr(
+        OpenAIProvider,
+        "_OPENAI_CHAT_COMPLETIONS_URL",
+        f"{server.base_url}/v1/chat/completions",
+    )
+    monkeypatch.setattr(
+        OpenAIProvider, "_resolve_openai_client_constructor", staticmethod(lambda: None)
+    )
+    return OpenAIProvider(
+        "openai-key", model="gpt-4o-mini", timeout_seconds=5.0, max_retries=0
+    )
+
+
+def _drain(stream: Generator[str, None, StreamUsage]) -> tuple[list[str], StreamUsage]:
+    deltas: list[str] = []
+    while True:
+        try:
+            deltas.append(next(stream))
+        except StopIteration as finished:
+            return deltas, finished.value
+
+
+def test_iter_sse_data_joins_multiline_data_and_skips_comments() -> None:
+    lines = [": keep-alive", "event: delta", "data: first", "data: second", "", "data: x"]
+
+    assert list(iter_sse_data(lines)) == ["first\nsecond", "x"]
+
+
+def test_openai_provider_streams_deltas_from_sse_endpoint(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_provider_server: _FakeProviderServer,
+) -> None:
+    fake_provider_server.routes["/v1/chat/completions"] = _FakeRoute(
+        events=[_openai_chunk("Visa "), _openai_chunk("rules apply."), "[DONE]"]
+    )
+    provider = _openai_provider(monkeypatch, fake_provider_server)
+
+    deltas = list(
+        provider.stream(message="What is s. 11?", citations=_citations(), locale="en-CA")
+    )
+
+    assert deltas == ["Visa ", "rules apply."]
+    path, payload = fake_provider_server.requests[0]
+    assert path == "/v1/chat/completions"
+    assert payload["stream"] is True
+    assert payload["model"] == "gpt-4o-mini"
+
+
+def test_openai_provider_stream_sends_cache_key_and_returns_usage(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_provider_server: _FakeProviderServer,
+) -> None:
+    fake_provider_server.routes["/v1/chat/completions"] = _FakeRoute(
+        events=[
+            _openai_chunk("Visa rules apply."),
+            json.dumps(
+                {"choices": [], "usage": {"prompt_tokens_details": {"cached_tokens": 1024}}}
+            ),
+            "[DONE]",
+        ]
+    )
+    provider = _openai_provider(monkeypatch, fake_provider_server)
+    runtime_prompt = assemble_runtime_prompt(
+        message="What is s. 11?", citations=_citations(), locale="en-CA"
+    )
+
+    deltas, usage = _drain(
+        provider.stream(message="What is s. 11?", citations=_citations(), locale="en-CA")
+    )
+
+    assert deltas == ["Visa rules apply."]
+    assert usage == StreamUsage(
+        prompt_tokens=runtime_prompt.prompt_tokens, cached_prompt_tokens=1024
+    )
+    _, payload = fake_provider_server.requests[0]
+    assert payload["prompt_cache_key"] == runtime_prompt.prompt_cache_key
+    assert payload["stream_options"] == {"include_usage": True}
+
+
+def test_openai_provider_stream_maps_rate_limit_status(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_provider_server: _FakeProviderServer,
+) -> None:
+    fake_provider_server.routes["/v1/chat/completions"] = _FakeRoute(
+        status=429, body='{"error": "slow down"}'
+    )
+    provider = _openai_provider(monkeypatch, fake_provider_server)
+
+    with pytest.raises(ProviderError) as exc_info:
+        list(provider.stream(message="What is s. 11?", citations=[], locale="en-CA"))
+
+    assert exc_info.value.code == "rate_limit"
+
+
+def test_gemini_provider_stream_falls_back_to_next_model_before_first_delta(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_provider_server: _FakeProviderServer,
+) -> None:
+    monkeypatch.setattr(
+        GeminiProvider,
+        "_GEMINI_STREAM_API_ENDPOINT",
+        f"{fake_provider_server.base_url}/models/{{model}}:streamGenerateContent?alt=sse",
+    )
+    monkeypatch.setattr(
+        GeminiProvider, "_load_google_genai_sdk", staticmethod(lambda: (None, None))
+    )
+    fake_provider_server.routes["/models/primary:streamGenerateContent"] = _FakeRoute(
+        status=503, body='{"error": "unavailable"}'
+    )
+    fake_provider_server.routes["/models/backup:streamGenerateContent"] = _FakeRoute(
+        events=[_gemini_chunk("Apply "), _gemini_chunk("before entry.")]
+    )
+    provider = GeminiProvider(
+        "gemini-key",
+        model="primary",
+        fallback_models=("backup",),
+        timeout_seconds=5.0,
+        max_retries=0,
+    )
+
+    deltas = list(
+        provider.stream(message="What is s. 11?", citations=_citations(), locale="en-CA")
+    )
+
+    assert deltas == ["Apply ", "before entry."]
+    assert [path.split("?")[0] for path, _ in fake_provider_server.requests] == [
+        "/models/primary:streamGenerateContent",
+        "/models/backup:streamGenerateContent",
+    ]
+
+
+@dataclass
+class _ScriptedStreamingProvider:
+    name: str
+    deltas: list[str]
+    fail_after: int | None = None
+
+    def generate(self, *, message: str, citations, locale: str) -> ProviderResult:
+        raise AssertionError("streaming path should not call generate")
+
+    def stream(
+        self, *, message: str, citations, locale: str
+    ) -> Generator[str, None, StreamUsage]:
+        del message, citations, locale
+        for index, delta in enumerate(self.deltas):
+            if self.fail_after is not None and index >= self.fail_after:
+                raise ProviderError(self.name, "timeout", "stream interrupted")
+            yield delta
+        if self.fail_after is not None and self.fail_after >= len(self.deltas):
+            raise ProviderError(self.name, "timeout", "stream interrupted")
+        return StreamUsage(prompt_tokens=120, cached_prompt_tokens=64)
+
+
+@dataclass
+class _GenerateOnlyProvider:
+    name: str = "scaffold"
+
+    def generate(self, *, message: str, citations, locale: str) -> ProviderResult:
+        del message, locale
+        return ProviderResult(
+            provider=self.name,
+            answer="Full answer",
+            citations=citations,
+            confidence="low",
+        )
+
+
+def test_router_stream_fails_over_before_first_delta() -> None:
+    router = ProviderRouter(
+        [
+            _ScriptedStreamingProvider("openai", ["unused"], fail_after=0),
+            _ScriptedStreamingProvider("gemini", ["Hello ", "world"]),
+        ],
+        "openai",
+    )
+    deltas: list[str] = []
+
+    routed = router.stream_generate(
+        message="hi", citations=[], locale="en-CA", on_delta=deltas.append
+    )
+
+    assert deltas == ["Hello ", "world"]
+    assert routed.result.answer == "Hello world"
+    assert routed.result.provider == "gemini"
+    assert routed.fallback_used is True
+    assert routed.fallback_reason == "timeout"
+    assert routed.result.prompt_tokens == 120
+    assert routed.result.cached_prompt_tokens == 64
+
+
+def test_router_stream_does_not_fail_over_after_partial_output() -> None:
+    router = ProviderRouter(
+        [
+            _ScriptedStreamingProvider("openai", ["Partial "], fail_after=1),
+            _ScriptedStreamingProvider("gemini", ["never"]),
+        ],
+        "openai",
+    )
+    deltas: list[str] = []
+
+    with pytest.raises(ProviderError) as exc_info:
+        router.stream_generate(
+            message="hi", citations=[], locale="en-CA", on_delta=deltas.append
+        )
+
+    assert exc_info.value.provider == "openai"
+    assert deltas == ["Partial "]
+    assert router.telemetry_snapshot()["openai"]["failure"] == 1
+
+
+def test_router_stream_emits_full_answer_for_non_streaming_provider() -> None:
+    router = ProviderRouter([_GenerateOnlyProvider()], "scaffold")
+    deltas: list[str] = []
+
+    routed = router.stream_generate(
+        message="hi", citations=[], locale="en-CA", on_delta=deltas.append
+    )
+
+    assert deltas == ["Full answer"]
+    assert routed.result.confidence == "low"
+
+
+def _parse_sse_stream(lines: Iterator[str]) -> list[tuple[str, dict[str, object]]]:
+    events: list[tuple[str, dict[str, object]]] = []
+    event_name = "message"
+    for line in lines:
+        if line.startswith("event: "):
+            event_name = line[len("event: ") :]
+        elif line.startswith("data: "):
+            events.append((event_name, json.loads(line[len("data: ") :])))
+    return events
+
+
+def test_chat_stream_endpoint_emits_deltas_then_final_event(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_provider_server: _FakeProviderServer,
+) -> None:
+    monkeypatch.setenv("ENABLE_SCAFFOLD_PROVIDER", "false")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-openai-key")
+    monkeypatch.setenv("PROVIDER_MAX_RETRIES", "0")
+    _openai_provider(monkeypatch, fake_provider_server)
+    fake_provider_server.routes["/v1/chat/completions"] = _FakeRoute(
+        events=[
+            _openai_chunk("A foreign national "),
+            _openai_chunk("must apply for a visa."),
+            "[DONE]",
+        ]
+    )
+    stream_client = TestClient(create_app())
+
+    with stream_client.stream(
+        "POST",
+        "/api/chat/stream",
+        json={
+            "session_id": "session-123456",
+            "message": "Summarize IRPA section 11.",
+            "locale": "en-CA",
+            "mode": "standard",
+        },
+    ) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        trace_id = response.headers["x-trace-id"]
+        events = _parse_sse_stream(response.iter_lines())
+
+    assert [name for name, _ in events] == ["delta", "delta", "final"]
+    assert "".join(str(data["text"]) for _, data in events[:2]) == (
+        "A foreign national must apply for a visa."
+    )
+    final = events[-1][1]
+    assert final["answer"] == "A foreign national must apply for a visa."
+    assert final["citations"]
+    assert final["fallback_used"]["used"] is False
+    assert final["trace_id"] == trace_id
+
+
+def test_chat_stream_endpoint_emits_error_event_on_provider_failure(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_provider_server: _FakeProviderServer,
+) -> None:
+    monkeypatch.setenv("ENABLE_SCAFFOLD_PROVIDER", "false")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-openai-key")
+    monkeypatch.setenv("GEMINI_API_KEY", "test-gemini-key")
+    monkeypatch.setenv("PROVIDER_MAX_RETRIES", "0")
+    _openai_provider(monkeypatch, fake_provider_server)
+    monkeypatch.setattr(
+        GeminiProvider,
+        "_GEMINI_STREAM_API_ENDPOINT",
+        f"{fake_provider_server.base_url}/models/{{model}}:streamGenerateContent?alt=sse",
+    )
+    monkeypatch.setattr(
+        GeminiProvider, "_load_google_genai_sdk", staticmethod(lambda: (None, None))
+    )
+    stream_client = TestClient(create_app())
+
+    with stream_client.stream(
+        "POST",
+        "/api/chat/stream",
+        json={
+            "session_id": "session-123456",
+            "message": "Summarize IRPA section 11.",
+            "locale": "en-CA",
+            "mode": "standard",
+        },
+    ) as response:
+        events = _parse_sse_stream(response.iter_lines())
+
+    assert [name for name, _ in events] == ["error"]
+    error = events[0][1]["error"]
+    assert error["code"] == "PROVIDER_ERROR"
+    assert error["trace_id"] == response.headers["x-trace-id"]
@@ -18,8 +18,12 @@ class _FakeRedis:
         self.store: dict[str, int] = {}
         self.expiries: dict[str, int] = {}
 
-    def incr(self, key: str) -> int:
-        self.store[key] = self.store.get(key, 0) + 1
+    def incr(self, key: str, amount: int = 1) -> int:
+        self.store[key] = self.store.get(key, 0) + amount
+        return self.store[key]
+
+    def decr(self, key: str, amount: int = 1) -> int:
+        self.store[key] = self.store.get(key, 0) - amount
         return self.store[key]
 
     def expire(self, key: str, ttl_seconds: int) -> None:
@@ -41,6 +45,32 @@ def test_redis_rate_limiter_blocks_after_limit() -> None:
     assert limiter.allow("client-a") is False
 
 
+def test_in_memory_rate_limiter_charges_weighted_requests_once() -> None:
+    limiter = InMemoryRateLimiter(limit_per_minute=5)
+    assert limiter.allow("client-a", weight=3) is True
+    assert limiter.allow("client-a", weight=3) is False
+    assert limiter.allow("client-a", weight=2) is True
+    assert limiter.allow("client-a") is False
+
+
+def test_redis_rate_limiter_charges_weighted_requests() -> None:
+    fake_redis = _FakeRedis()
+    limiter = RedisRateLimiter(fake_redis, limit_per_minute=5)
+    assert limiter.allow("client-a", weight=4) is True
+    assert limiter.allow("client-a", weight=2) is False
+    assert list(fake_redis.expiries.values()) == [65]
+
+
+def test_redis_rate_limiter_rejected_weighted_request_charges_nothing() -> None:
+    fake_redis = _FakeRedis()
+    limiter = RedisRateLimiter(fake_redis, limit_per_minute=5)
+    assert limiter.allow("client-a", weight=3) is True
+    assert limiter.allow("client-a", weight=50) is False
+    assert list(fake_redis.store.values()) == [3]
+    assert limiter.allow("client-a", weight=2) is True
+    assert limiter.allow("client-a") is False
+
+
 def test_build_rate_limiter_logs_fallback_when_redis_unavailable(
     monkeypatch: pytest.MonkeyPatch,
     caplog: pytest.LogCaptureFixture,
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from immcad_api.services.request_coalescing import RequestCoalescer
+
+
+def _wait_for_followers(coalescer: RequestCoalescer, count: int) -> None:
+    while coalescer.snapshot()["followers"] < count:
+        time.sleep(0.001)
+
+
+def test_concurrent_identical_calls_share_one_execution() -> None:
+    coalescer: RequestCoalescer[str] = RequestCoalescer()
+    gate = threading.Event()
+    calls: list[int] = []
+    results: list[tuple[str, bool]] = []
+
+    def call() -> str:
+        calls.append(1)
+        gate.wait(timeout=2.0)
+        return "answer"
+
+    threads = [
+        threading.Thread(target=lambda: results.append(coalescer.run("key", call)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    _wait_for_followers(coalescer, 3)
+    gate.set()
+    for thread in threads:
+        thread.join(timeout=2.0)
+
+    assert len(calls) == 1
+    assert sorted(results) == [("answer", False)] + [("answer", True)] * 3
+    assert coalescer.snapshot() == {"in_flight": 0, "leaders": 1, "followers": 3}
+
+
+def test_failures_fan_out_to_followers_and_are_not_cached() -> None:
+    coalescer: RequestCoalescer[str] = RequestCoalescer()
+    gate = threading.Event()
+    errors: list[Exception] = []
+
+    def failing() -> str:
+        gate.wait(timeout=2.0)
+        raise RuntimeError("upstream failed")
+
+    def attempt() -> None:
+        try:
+            coalescer.run("key", failing)
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=attempt) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    _wait_for_followers(coalescer, 1)
+    gate.set()
+    for thread in threads:
+        thread.join(timeout=2.0)
+
+    assert [str(error) for error in errors] == ["upstream failed"] * 2
+    assert coalescer.run("key", lambda: "recovered") == ("recovered", False)
+
+
+def test_async_followers_share_result_and_rerun_when_leader_is_cancelled() -> None:
+    coalescer: RequestCoalescer[str] = RequestCoalescer()
+    calls: list[str] = []
+
+    async def scenario() -> tuple[list[tuple[str, bool]], tuple[str, bool]]:
+        release = asyncio.Event()
+
+        async def call() -> str:
+            calls.append("shared")
+            await release.wait()
+            return "answer"
+
+        tasks = [asyncio.ensure_future(coalescer.run_async("a", call)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        shared = list(await asyncio.gather(*tasks))
+
+        async def slow() -> str:
+            calls.append("cancelled-leader")
+            await asyncio.sleep(10)
+            return "never"
+
+        async def own() -> str:
+            calls.append("follower-own")
+            return "own"
+
+        leader = asyncio.ensure_future(coalescer.run_async("b", slow))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(coalescer.run_async("b", own))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return shared, await follower
+
+    shared, rerun = asyncio.run(scenario())
+
+    assert sorted(shared) == [("answer", False), ("answer", True), ("answer", True)]
+    assert rerun == ("own", False)
+    assert calls == ["shared", "cancelled-leader", "follower-own"]
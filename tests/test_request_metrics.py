@@ -366,3 +366,16 @@ def test_request_metrics_tracks_document_compilation_block_rates_and_reasons() -
         ]
         == 1
     )
+
+
+def test_request_metrics_recent_latency_percentile_uses_latest_window() -> None:
+    metrics = RequestMetrics()
+    assert metrics.recent_latency_percentile_ms(95.0, window=3) is None
+
+    for duration_seconds in (5.0, 5.0, 0.1, 0.1, 0.1):
+        metrics.record_api_response(status_code=200, duration_seconds=duration_seconds)
+
+    assert metrics.recent_latency_percentile_ms(95.0, window=3) == pytest.approx(100.0)
+    assert metrics.recent_latency_percentile_ms(
+        95.0, window=5, min_samples=6
+    ) is None
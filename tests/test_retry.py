@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from immcad_api.deadline import Deadline, deadline_scope
+from immcad_api.providers.base import ProviderError
+from immcad_api.providers.openai_provider import OpenAIProvider
+from immcad_api.providers.streaming import stream_with_retries
+from immcad_api.retry import (
+    Retrier,
+    RetryBudget,
+    RetryBudgetRegistry,
+    RetryPolicy,
+    parse_retry_after,
+    retry_after_from_exception,
+)
+from immcad_api.schemas import Citation
+
+
+def _retrier(max_retries: int = 2, **kwargs) -> tuple[Retrier, list[float]]:  # noqa: ANN003
+    sleeps: list[float] = []
+    retrier = Retrier(
+        RetryPolicy(max_retries=max_retries),
+        sleep=sleeps.append,
+        random_fn=lambda: 1.0,
+        **kwargs,
+    )
+    return retrier, sleeps
+
+
+def _flaky(failures: int, error: Exception):  # noqa: ANN202
+    calls = {"count": 0}
+
+    def attempt() -> str:
+        calls["count"] += 1
+        if calls["count"] <= failures:
+            raise error
+        return "ok"
+
+    return attempt, calls
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates() -> None:
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(" 1.5 ") == 1.5
+    assert parse_retry_after("-4") == 0.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+    response = SimpleNamespace(headers={"retry-after": "2"})
+    assert retry_after_from_exception(SimpleNamespace(response=response)) == 2.0
+    assert retry_after_from_exception(RuntimeError("no response")) is None
+
+
+def test_retry_policy_backoff_grows_exponentially_with_full_jitter() -> None:
+    policy = RetryPolicy(max_retries=5, base_delay_seconds=0.5, max_delay_seconds=3.0)
+
+    assert [policy.backoff_seconds(n, random_fn=lambda: 1.0) for n in (1, 2, 3, 4)] == [
+        0.5,
+        1.0,
+        2.0,
+        3.0,
+    ]
+    assert policy.backoff_seconds(3, random_fn=lambda: 0.25) == 0.5
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"max_retries": -1}, "max_retries must be >= 0"),
+        (
+            {"max_retries": 1, "base_delay_seconds": 2.0, "max_delay_seconds": 1.0},
+            "max_delay_seconds must be >= base_delay_seconds",
+        ),
+        ({"max_retries": 1, "multiplier": 0.5}, "multiplier must be >= 1"),
+    ],
+)
+def test_retry_policy_rejects_invalid_configuration(
+    kwargs: dict[str, float], message: str
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        RetryPolicy(**kwargs)
+
+
+def test_retrier_retries_until_success_and_stops_after_max_retries() -> None:
+    retrier, sleeps = _retrier(max_retries=2)
+    attempt, calls = _flaky(2, RuntimeError("boom"))
+    assert retrier.call(attempt) == "ok"
+    assert calls["count"] == 3
+    assert sleeps == [0.4, 0.8]
+
+    retrier, sleeps = _retrier(max_retries=1)
+    attempt, calls = _flaky(5, RuntimeError("boom"))
+    with pytest.raises(RuntimeError, match="boom"):
+        retrier.call(attempt)
+    assert calls["count"] == 2
+
+
+def test_retrier_on_error_maps_failures_and_can_stop_retrying() -> None:
+    retrier, _ = _retrier(max_retries=3)
+    attempt, calls = _flaky(5, ValueError("bad"))
+
+    def non_transient(exc: Exception) -> Exception:
+        raise ProviderError("openai", "provider_error", str(exc))
+
+    with pytest.raises(ProviderError, match="bad"):
+        retrier.call(attempt, on_error=non_transient)
+    assert calls["count"] == 1
+
+
+def test_retrier_honours_retry_after_within_max_delay() -> None:
+    retrier, sleeps = _retrier(max_retries=2)
+    error = ProviderError("openai", "rate_limit", "slow down", retry_after_seconds=3.0)
+    attempt, calls = _flaky(1, error)
+    assert retrier.call(attempt) == "ok"
+    assert sleeps == [3.0]
+
+    retrier, sleeps = _retrier(max_retries=2)
+    error = ProviderError("openai", "rate_limit", "later", retry_after_seconds=60.0)
+    attempt, calls = _flaky(1, error)
+    with pytest.raises(ProviderError, match="later"):
+        retrier.call(attempt)
+    assert calls["count"] == 1
+    assert sleeps == []
+
+
+def test_retrier_does_not_wait_past_the_request_deadline() -> None:
+    retrier, sleeps = _retrier(max_retries=2)
+    attempt, calls = _flaky(1, RuntimeError("boom"))
+
+    with deadline_scope(Deadline.after(0.1)):
+        with pytest.raises(RuntimeError, match="boom"):
+            retrier.call(attempt)
+    assert calls["count"] == 1
+    assert sleeps == []
+
+
+def test_retry_budget_caps_retries_to_a_fraction_of_calls() -> None:
+    budget = RetryBudget(retry_ratio=0.5, max_tokens=2.0)
+    retrier, _ = _retrier(max_retries=1, budget=budget)
+
+    outcomes = []
+    for _ in range(4):
+        attempt, calls = _flaky(5, RuntimeError("down"))
+        with pytest.raises(RuntimeError):
+            retrier.call(attempt)
+        outcomes.append(calls["count"])
+
+    # Each call deposits half a token on top of the full bucket, so three
+    # retries are funded before the fourth call is denied.
+    assert outcomes == [2, 2, 2, 1]
+    snapshot = budget.snapshot()
+    assert snapshot["calls"] == 4
+    assert snapshot["retries"] == 3
+    assert snapshot["retries_denied"] == 1
+
+
+def test_retry_budget_registry_shares_one_budget_per_dependency() -> None:
+    registry = RetryBudgetRegistry(retry_ratio=0.1, max_tokens=3.0)
+    assert registry.get("openai") is registry.get("openai")
+    assert registry.get("openai") is not registry.get("gemini")
+    assert set(registry.snapshot()) == {"openai", "gemini"}
+
+    with pytest.raises(ValueError, match="retry_ratio must be between 0 and 1"):
+        RetryBudgetRegistry(retry_ratio=1.5)
+
+
+def test_retrier_call_async_waits_without_blocking_the_event_loop() -> None:
+    async_sleeps: list[float] = []
+
+    async def fake_async_sleep(delay: float) -> None:
+        async_sleeps.append(delay)
+
+    def blocking_sleep(delay: float) -> None:
+        raise AssertionError("async retries must not block the event loop")
+
+    retrier = Retrier(
+        RetryPolicy(max_retries=1),
+        sleep=blocking_sleep,
+        async_sleep=fake_async_sleep,
+        random_fn=lambda: 1.0,
+    )
+    sync_attempt, calls = _flaky(1, RuntimeError("boom"))
+
+    async def attempt() -> str:
+        return sync_attempt()
+
+    assert asyncio.run(retrier.call_async(attempt)) == "ok"
+    assert calls["count"] == 2
+    assert async_sleeps == [0.4]
+
+
+def test_stream_with_retries_spends_the_shared_budget() -> None:
+    budget = RetryBudget(retry_ratio=0.0, max_tokens=1.0)
+    retrier, sleeps = _retrier(max_retries=3, budget=budget)
+    opened = {"count": 0}
+
+    def open_stream():  # noqa: ANN202
+        opened["count"] += 1
+        raise ProviderError("openai", "timeout", "stalled")
+        yield ""  # pragma: no cover
+
+    with pytest.raises(ProviderError, match="stalled"):
+        list(stream_with_retries("openai", open_stream, retrier=retrier))
+    assert opened["count"] == 2
+    assert budget.snapshot()["retries_denied"] == 1
+
+
+def test_openai_provider_stops_retrying_once_its_budget_is_spent(monkeypatch) -> None:  # noqa: ANN001
+    attempts = {"count": 0}
+
+    class _FailingCompletions:
+        def create(self, **kwargs):  # noqa: ANN003, ANN202
+            attempts["count"] += 1
+            raise TimeoutError("upstream timeout")
+
+    def _fake_client(**kwargs):  # noqa: ANN003, ANN202
+        return SimpleNamespace(chat=SimpleNamespace(completions=_FailingCompletions()))
+
+    monkeypatch.setattr("immcad_api.providers.openai_provider.OpenAI", _fake_client)
+    provider = OpenAIProvider(
+        "openai-key",
+        model="gpt-4o-mini",
+        timeout_seconds=5.0,
+        max_retries=2,
+        retry_budget=RetryBudget(retry_ratio=0.0, max_tokens=1.0),
+    )
+    provider.retrier._sleep = lambda delay: None
+    citation = Citation(
+        source_id="IRPA",
+        title="Immigration and Refugee Protection Act",
+        url="https://laws-lois.justice.gc.ca/eng/acts/I-2.5/",
+        pin="s. 11",
+        snippet="Application before entering Canada.",
+    )
+
+    with pytest.raises(ProviderError):
+        provider.generate(message="Visa rules?", citations=[citation], locale="en-CA")
+    # One initial attempt plus the single retry the budget allows.
+    assert attempts["count"] == 2
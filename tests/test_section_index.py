@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from immcad_api.services.grounding import (
+    KeywordGroundingAdapter,
+    SectionIndexGroundingAdapter,
+    official_grounding_catalog,
+)
+from immcad_api.services.section_index import (
+    SectionIndex,
+    read_section_records,
+    write_section_index,
+)
+from immcad_api.sources.federal_laws_bulk_xml import FederalLawSectionChunk
+
+
+def _chunk(label: str, title: str, text: str, *, url: bool = True) -> dict[str, object]:
+    return FederalLawSectionChunk(
+        source_id="IRPA",
+        official_number="I-2.5",
+        act_title="Immigration and Refugee Protection Act",
+        current_to_date=None,
+        heading_label=None,
+        heading_title="Requirements Before Entering Canada",
+        section_label=label,
+        section_title=title,
+        section_url=(
+            f"https://laws-lois.justice.gc.ca/eng/acts/I-2.5/section-{label}.html"
+            if url
+            else None
+        ),
+        text=text,
+        content_hash_sha256=f"hash-{label}",
+    ).to_dict()
+
+
+_SECTIONS = [
+    _chunk(
+        "11",
+        "Application before entering Canada",
+        "A foreign national must, before entering Canada, apply to an officer for a "
+        "visa or for any other document required by the regulations.",
+    ),
+    _chunk(
+        "31",
+        "Status document",
+        "A permanent resident and a protected person shall be provided with a "
+        "document indicating their status.",
+    ),
+    _chunk(
+        "30",
+        "Work and study in Canada",
+        "A foreign national may not work or study in Canada unless authorized to do "
+        "so under this Act.",
+    ),
+    _chunk("99", "Claim for refugee protection", "A claim may be made.", url=False),
+]
+
+
+@pytest.fixture
+def index_path(tmp_path: Path) -> Path:
+    path = tmp_path / "sections.idx"
+    build = write_section_index(path, _SECTIONS)
+    assert (build.sections_indexed, build.sections_skipped) == (3, 1)
+    return path
+
+
+def test_section_index_ranks_matching_sections_and_materializes_citations(
+    index_path: Path,
+) -> None:
+    index = SectionIndex(index_path)
+    try:
+        hits = index.search(["permanent", "resident", "document"], top_k=2)
+        assert len(index) == 3
+        assert [index.citation(doc_id).pin for doc_id, _ in hits] == ["s. 31", "s. 11"]
+
+        citation = index.citation(hits[0][0])
+        assert citation.source_id == "IRPA"
+        assert citation.title == "Immigration and Refugee Protection Act"
+        assert citation.url == (
+            "https://laws-lois.justice.gc.ca/eng/acts/I-2.5/section-31.html"
+        )
+        assert citation.snippet.startswith("Status document: A permanent resident")
+        assert index.search(["refugee", "claim"], top_k=3) == []
+    finally:
+        index.close()
+
+
+def test_section_index_round_trips_through_ingestion_jsonl(tmp_path: Path) -> None:
+    sections_path = tmp_path / "federal-laws-sections.jsonl"
+    sections_path.write_text(
+        "\n".join(json.dumps(section) for section in _SECTIONS) + "\n", encoding="utf-8"
+    )
+    index_path = tmp_path / "grounding" / "sections.idx"
+
+    write_section_index(index_path, read_section_records(sections_path))
+
+    index = SectionIndex(index_path)
+    try:
+        hits = index.search(["study", "work"], top_k=1)
+        assert index.citation(hits[0][0]).pin == "s. 30"
+    finally:
+        index.close()
+
+
+def test_section_index_rejects_files_that_are_not_indexes(tmp_path: Path) -> None:
+    path = tmp_path / "sections.idx"
+    path.write_bytes(b"not an index file")
+
+    with pytest.raises(ValueError, match="Not a section index file"):
+        SectionIndex(path)
+
+
+def test_section_grounding_adapter_uses_index_and_falls_back_without_hits(
+    index_path: Path,
+) -> None:
+    index = SectionIndex(index_path)
+    adapter = SectionIndexGroundingAdapter(
+        index,
+        max_citations=2,
+        fallback=KeywordGroundingAdapter(official_grounding_catalog()),
+    )
+    try:
+        citations = adapter.citation_candidates(
+            message="Do I need a visa before entering Canada?",
+            locale="en-CA",
+            mode="standard",
+        )
+        assert citations[0].pin == "s. 11"
+        assert len(citations) <= 2
+
+        fallback = adapter.citation_candidates(
+            message="How are express entry CRS draws scored?",
+            locale="en-CA",
+            mode="standard",
+        )
+        assert any(citation.pin == "Program overview" for citation in fallback)
+    finally:
+        index.close()
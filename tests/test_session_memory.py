@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+
+from immcad_api.conversation import (
+    ConversationHistory,
+    ConversationTurn,
+    current_conversation,
+)
+from immcad_api.providers.base import ProviderResult
+from immcad_api.providers.prompt_builder import assemble_runtime_prompt, estimate_tokens
+from immcad_api.providers.router import RoutingResult
+from immcad_api.schemas import ChatRequest
+from immcad_api.services.answer_cache import ChatAnswerCache
+from immcad_api.services.chat_service import ChatService
+from immcad_api.services.grounding import (
+    StaticGroundingAdapter,
+    scaffold_grounded_citations,
+)
+from immcad_api.services.session_memory import (
+    InMemorySessionTier,
+    RedisSessionTier,
+    SessionMemoryStore,
+)
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+
+    def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    def setex(self, key: str, ttl: int, value: str) -> None:
+        self.values[key] = value
+        self.ttls[key] = ttl
+
+    def eval(
+        self, _script: str, _numkeys: int, key: str, expected: str, ttl: int, value: str
+    ) -> int:
+        # Mirrors the compare-and-set script used by RedisSessionTier.update.
+        if self.values.get(key, "") != expected:
+            return 0
+        self.setex(key, ttl, value)
+        return 1
+
+
+class _RacingRedis(_FakeRedis):
+    """Lets another worker record a turn between the first read and write."""
+
+    def __init__(self, racer: SessionMemoryStore) -> None:
+        super().__init__()
+        self.racer = racer
+        self.raced = False
+
+    def eval(self, *args):  # noqa: ANN002, ANN201
+        if not self.raced:
+            self.raced = True
+            self.racer.record_turn("session-a", question="Racing question?", answer="Racing.")
+        return super().eval(*args)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@dataclass
+class _HistoryRecordingRouter:
+    histories: list[ConversationHistory | None] = field(default_factory=list)
+
+    def generate(self, *, message: str, citations, locale: str) -> RoutingResult:  # noqa: ANN001
+        del locale
+        self.histories.append(current_conversation())
+        return RoutingResult(
+            result=ProviderResult(
+                provider="scaffold",
+                answer=f"Answer to {message}. More detail follows here.",
+                citations=citations,
+                confidence="medium",
+            ),
+            fallback_used=False,
+            fallback_reason=None,
+        )
+
+
+def _request(message: str, session_id: str = "session-123456") -> ChatRequest:
+    return ChatRequest(session_id=session_id, message=message)
+
+
+def _record(store: SessionMemoryStore, session_id: str, count: int) -> None:
+    for index in range(count):
+        store.record_turn(
+            session_id,
+            question=f"Question {index} about study permits?",
+            answer=f"Answer {index} sentence one. Answer {index} sentence two.",
+        )
+
+
+def test_memory_tier_evicts_least_recently_used_session_and_expires_idle_ones() -> None:
+    clock = _Clock()
+    tier = InMemorySessionTier(max_sessions=2, ttl_seconds=60, time_fn=clock)
+    history = ConversationHistory(turns=(ConversationTurn("q", "a"),))
+    tier.put("a", history)
+    tier.put("b", history)
+    assert tier.get("a") is not None
+    tier.put("c", history)
+    assert tier.get("b") is None
+
+    clock.now = 61.0
+    assert tier.get("a") is None
+
+
+def test_store_folds_oldest_turns_into_a_bounded_rolling_summary() -> None:
+    store = SessionMemoryStore(max_recent_turns=2, max_summary_chars=300)
+
+    _record(store, "session-a", 3)
+    history = store.load("session-a")
+    assert history is not None
+    assert [turn.question for turn in history.turns] == [
+        "Question 1 about study permits?",
+        "Question 2 about study permits?",
+    ]
+    assert history.summary == (
+        "Asked: Question 0 about study permits? Answered: Answer 0 sentence one."
+    )
+
+    _record(store, "session-a", 40)
+    history = store.load("session-a")
+    assert history is not None
+    assert len(history.turns) == 2
+    assert len(history.summary) <= 300
+    assert history.summary.splitlines()[-1].startswith("Asked: Question 37")
+    assert store.snapshot()["turns_summarized"] == 41
+
+
+def test_redis_tier_shares_history_across_store_instances() -> None:
+    redis = _FakeRedis()
+    writer = SessionMemoryStore(redis_tier=RedisSessionTier(redis, ttl_seconds=120))
+    reader = SessionMemoryStore(redis_tier=RedisSessionTier(redis, ttl_seconds=120))
+
+    _record(writer, "session-a", 1)
+
+    history = reader.load("session-a")
+    assert history is not None
+    assert history.turns[0].question == "Question 0 about study permits?"
+    assert redis.ttls == {"immcad:chat:sessions:session-a": 120}
+
+
+def test_redis_tier_recomputes_a_turn_when_another_worker_wrote_first() -> None:
+    racer = SessionMemoryStore()
+    redis = _RacingRedis(racer)
+    racer.redis_tier = RedisSessionTier(redis, ttl_seconds=120)
+    store = SessionMemoryStore(redis_tier=RedisSessionTier(redis, ttl_seconds=120))
+
+    store.record_turn("session-a", question="My question?", answer="My answer.")
+
+    history = SessionMemoryStore(redis_tier=RedisSessionTier(redis)).load("session-a")
+    assert history is not None
+    assert [turn.question for turn in history.turns] == [
+        "Racing question?",
+        "My question?",
+    ]
+
+
+def test_prompt_history_stays_bounded_however_long_the_session_runs() -> None:
+    citations = scaffold_grounded_citations()
+    store = SessionMemoryStore(max_recent_turns=4)
+    baseline = assemble_runtime_prompt(
+        message="And for my spouse?", citations=citations, locale="en-CA"
+    )
+
+    history_tokens = []
+    for turns in (5, 50, 500):
+        _record(store, f"session-{turns}", turns)
+        prompt = assemble_runtime_prompt(
+            message="And for my spouse?",
+            citations=citations,
+            locale="en-CA",
+            history=store.load(f"session-{turns}"),
+        )
+        assert "Conversation So Far" in prompt.user_prompt
+        assert f"Question {turns - 1} about study permits?" in prompt.user_prompt
+        assert prompt.system_prompt == baseline.system_prompt
+        history_tokens.append(
+            estimate_tokens(prompt.user_prompt) - estimate_tokens(baseline.user_prompt)
+        )
+
+    assert all(tokens <= 620 for tokens in history_tokens)
+    # Once the summary is full, a session ten times longer costs about the same
+    # prompt; the remaining drift is only longer turn numbers in the text.
+    assert abs(history_tokens[2] - history_tokens[1]) < 50
+
+
+def test_chat_service_passes_session_history_to_follow_up_turns() -> None:
+    router = _HistoryRecordingRouter()
+    service = ChatService(
+        router,
+        grounding_adapter=StaticGroundingAdapter(scaffold_grounded_citations()),
+        session_memory=SessionMemoryStore(),
+    )
+
+    service.handle_chat(_request("Summarize IRPA section 11."))
+    service.handle_chat(_request("Does that apply to visitors?"))
+    service.handle_chat(_request("Summarize IRPA section 11.", session_id="session-other"))
+
+    first, follow_up, other_session = router.histories
+    assert first is None
+    assert follow_up is not None
+    assert follow_up.turns[0].question == "Summarize IRPA section 11."
+    assert follow_up.turns[0].answer.startswith("Answer to Summarize IRPA section 11.")
+    assert other_session is None
+    assert current_conversation() is None
+
+
+def test_session_history_is_scoped_to_the_client_identity() -> None:
+    router = _HistoryRecordingRouter()
+    service = ChatService(
+        router,
+        grounding_adapter=StaticGroundingAdapter(scaffold_grounded_citations()),
+        session_memory=SessionMemoryStore(),
+    )
+
+    service.handle_chat(_request("Summarize IRPA section 11."), client_id="client-a")
+    service.handle_chat(_request("Does that apply to visitors?"), client_id="client-b")
+    asyncio.run(
+        service.handle_chat_async(
+            _request("Does that apply to visitors?"), client_id="client-a"
+        )
+    )
+
+    first, other_client, same_client = router.histories
+    assert first is None
+    assert other_client is None
+    assert same_client is not None
+    assert same_client.turns[0].question == "Summarize IRPA section 11."
+
+
+def test_follow_up_turns_bypass_the_answer_cache() -> None:
+    router = _HistoryRecordingRouter()
+    cache = ChatAnswerCache()
+    service = ChatService(
+        router,
+        grounding_adapter=StaticGroundingAdapter(scaffold_grounded_citations()),
+        answer_cache=cache,
+        session_memory=SessionMemoryStore(),
+    )
+
+    service.handle_chat(_request("Summarize IRPA section 11."))
+    service.handle_chat(_request("Summarize IRPA section 11."))
+
+    assert len(router.histories) == 2
+    assert router.histories[1] is not None
+    assert cache.snapshot()["hits"] == 0
+
+
+def test_batch_items_share_answers_only_across_sessions_without_history() -> None:
+    router = _HistoryRecordingRouter()
+    store = SessionMemoryStore()
+    service = ChatService(
+        router,
+        grounding_adapter=StaticGroundingAdapter(scaffold_grounded_citations()),
+        session_memory=store,
+    )
+    _record(store, "session-history", 1)
+
+    outcomes = asyncio.run(
+        service.handle_chat_batch_async(
+            [
+                _request("Summarize IRPA section 11.", session_id="session-history"),
+                _request("Summarize IRPA section 11.", session_id="session-fresh-a"),
+                _request("summarize IRPA section 11.", session_id="session-fresh-b"),
+            ]
+        )
+    )
+
+    assert len(router.histories) == 2
+    follow_up, fresh = router.histories
+    assert follow_up is not None
+    assert follow_up.turns[0].question == "Question 0 about study permits?"
+    assert fresh is None
+    assert outcomes[1] == outcomes[2]
+    for session_id, question in (
+        ("session-fresh-a", "Summarize IRPA section 11."),
+        ("session-fresh-b", "summarize IRPA section 11."),
+    ):
+        history = store.load(session_id)
+        assert history is not None
+        assert [turn.question for turn in history.turns] == [question]
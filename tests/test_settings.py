@@ -708,3 +708,402 @@ def test_load_settings_rejects_scaffold_primary_in_hardened_modes(
 
     with pytest.raises(ValueError, match="PRIMARY_PROVIDER cannot be scaffold"):
         load_settings()
+
+
+def test_load_settings_parses_chat_retrieval_stage_timeouts(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("CHAT_CASE_SEARCH_TIMEOUT_SECONDS", "2.5")
+    monkeypatch.setenv("CHAT_RESEARCH_PREVIEW_TIMEOUT_SECONDS", "4")
+
+    settings = load_settings()
+
+    assert settings.chat_case_search_timeout_seconds == 2.5
+    assert settings.chat_research_preview_timeout_seconds == 4.0
+
+
+def test_load_settings_rejects_non_positive_chat_stage_timeout(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("CHAT_RESEARCH_PREVIEW_TIMEOUT_SECONDS", "0")
+
+    with pytest.raises(
+        ValueError, match="CHAT_RESEARCH_PREVIEW_TIMEOUT_SECONDS must be > 0"
+    ):
+        load_settings()
+
+
+def test_load_settings_parses_chat_answer_cache_controls(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("CHAT_ANSWER_CACHE_ENABLED", "false")
+    monkeypatch.setenv("CHAT_ANSWER_CACHE_MAX_ENTRIES", "64")
+    monkeypatch.setenv("CHAT_ANSWER_CACHE_TTL_SECONDS", "120")
+
+    settings = load_settings()
+
+    assert settings.chat_answer_cache_enabled is False
+    assert settings.chat_answer_cache_max_entries == 64
+    assert settings.chat_answer_cache_ttl_seconds == 120.0
+
+
+def test_load_settings_rejects_invalid_chat_answer_cache_size(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("CHAT_ANSWER_CACHE_MAX_ENTRIES", "0")
+
+    with pytest.raises(ValueError, match="CHAT_ANSWER_CACHE_MAX_ENTRIES must be >= 1"):
+        load_settings()
+
+
+def test_load_settings_parses_provider_http_pool_controls(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("PROVIDER_HTTP_MAX_CONNECTIONS", "8")
+    monkeypatch.setenv("PROVIDER_HTTP_MAX_KEEPALIVE_CONNECTIONS", "4")
+    monkeypatch.setenv("PROVIDER_HTTP_KEEPALIVE_EXPIRY_SECONDS", "12.5")
+
+    settings = load_settings()
+
+    assert settings.provider_http_max_connections == 8
+    assert settings.provider_http_max_keepalive_connections == 4
+    assert settings.provider_http_keepalive_expiry_seconds == 12.5
+
+
+def test_load_settings_rejects_keepalive_pool_larger_than_connection_pool(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("PROVIDER_HTTP_MAX_CONNECTIONS", "2")
+    monkeypatch.setenv("PROVIDER_HTTP_MAX_KEEPALIVE_CONNECTIONS", "5")
+
+    with pytest.raises(
+        ValueError,
+        match="PROVIDER_HTTP_MAX_KEEPALIVE_CONNECTIONS must be <= PROVIDER_HTTP_MAX_CONNECTIONS",
+    ):
+        load_settings()
+
+
+def test_load_settings_parses_provider_hedge_controls(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("PROVIDER_HEDGE_ENABLED", "true")
+    monkeypatch.setenv("PROVIDER_HEDGE_LATENCY_PERCENTILE", "90")
+    monkeypatch.setenv("PROVIDER_HEDGE_MIN_SAMPLES", "10")
+    monkeypatch.setenv("PROVIDER_HEDGE_MAX_RATIO", "0.05")
+
+    settings = load_settings()
+
+    assert settings.provider_hedge_enabled is True
+    assert settings.provider_hedge_latency_percentile == 90.0
+    assert settings.provider_hedge_min_samples == 10
+    assert settings.provider_hedge_max_ratio == 0.05
+
+
+def test_load_settings_rejects_invalid_provider_hedge_ratio(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("PROVIDER_HEDGE_MAX_RATIO", "1.5")
+
+    with pytest.raises(ValueError, match="PROVIDER_HEDGE_MAX_RATIO must be > 0 and <= 1"):
+        load_settings()
+
+
+def test_load_settings_parses_provider_adaptive_ordering_controls(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("PROVIDER_ADAPTIVE_ORDERING_ENABLED", "true")
+    monkeypatch.setenv("PROVIDER_ADAPTIVE_MIN_SAMPLES", "5")
+    monkeypatch.setenv("PROVIDER_ADAPTIVE_SWITCH_MARGIN", "0.3")
+
+    settings = load_settings()
+
+    assert settings.provider_adaptive_ordering_enabled is True
+    assert settings.provider_adaptive_min_samples == 5
+    assert settings.provider_adaptive_switch_margin == 0.3
+
+
+def test_load_settings_rejects_invalid_provider_adaptive_switch_margin(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("PROVIDER_ADAPTIVE_SWITCH_MARGIN", "1")
+
+    with pytest.raises(
+        ValueError, match="PROVIDER_ADAPTIVE_SWITCH_MARGIN must be >= 0 and < 1"
+    ):
+        load_settings()
+
+
+def test_load_settings_parses_provider_circuit_breaker_probe_controls(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("PROVIDER_CIRCUIT_BREAKER_HALF_OPEN_MAX_PROBES", "2")
+    monkeypatch.setenv("PROVIDER_CIRCUIT_BREAKER_SHARED_STATE_ENABLED", "true")
+
+    settings = load_settings()
+
+    assert settings.provider_circuit_breaker_half_open_max_probes == 2
+    assert settings.provider_circuit_breaker_shared_state_enabled is True
+
+
+def test_load_settings_rejects_zero_half_open_probes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("PROVIDER_CIRCUIT_BREAKER_HALF_OPEN_MAX_PROBES", "0")
+
+    with pytest.raises(
+        ValueError, match="PROVIDER_CIRCUIT_BREAKER_HALF_OPEN_MAX_PROBES must be >= 1"
+    ):
+        load_settings()
+
+
+def test_load_settings_parses_bulkhead_controls(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("PROVIDER_BULKHEAD_MAX_CONCURRENT", "6")
+    monkeypatch.setenv("DEPENDENCY_BULKHEAD_LIMITS", "gemini=4, case_search=2")
+    monkeypatch.setenv("BULKHEAD_MAX_QUEUE_WAIT_SECONDS", "0.5")
+
+    settings = load_settings()
+
+    assert settings.provider_bulkhead_max_concurrent == 6
+    assert settings.dependency_bulkhead_limits == (("gemini", 4), ("case_search", 2))
+    assert settings.bulkhead_max_queue_wait_seconds == 0.5
+
+
+def test_load_settings_rejects_malformed_dependency_bulkhead_limits(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("DEPENDENCY_BULKHEAD_LIMITS", "gemini")
+
+    with pytest.raises(
+        ValueError, match="DEPENDENCY_BULKHEAD_LIMITS entries must be name=limit"
+    ):
+        load_settings()
+
+
+def test_load_settings_parses_prompt_token_budgets(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("OPENAI_PROMPT_TOKEN_BUDGET", "3000")
+    monkeypatch.setenv("GEMINI_PROMPT_TOKEN_BUDGET", "0")
+
+    settings = load_settings()
+
+    assert settings.openai_prompt_token_budget == 3000
+    assert settings.gemini_prompt_token_budget == 0
+
+
+def test_load_settings_rejects_negative_prompt_token_budget(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("GEMINI_PROMPT_TOKEN_BUDGET", "-1")
+
+    with pytest.raises(ValueError, match="GEMINI_PROMPT_TOKEN_BUDGET must be >= 0"):
+        load_settings()
+
+
+def test_load_settings_parses_chat_request_coalescing_toggle(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    assert load_settings().chat_request_coalescing_enabled is True
+
+    monkeypatch.setenv("CHAT_REQUEST_COALESCING_ENABLED", "false")
+
+    assert load_settings().chat_request_coalescing_enabled is False
+
+
+def test_load_settings_reads_chat_batch_limits(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("CHAT_BATCH_MAX_ITEMS", "40")
+    monkeypatch.setenv("CHAT_BATCH_MAX_CONCURRENCY", "8")
+
+    settings = load_settings()
+
+    assert settings.chat_batch_max_items == 40
+    assert settings.chat_batch_max_concurrency == 8
+
+
+@pytest.mark.parametrize(
+    ("env_name", "value", "message"),
+    [
+        ("CHAT_BATCH_MAX_ITEMS", "0", "CHAT_BATCH_MAX_ITEMS must be between 1 and 100"),
+        ("CHAT_BATCH_MAX_ITEMS", "101", "CHAT_BATCH_MAX_ITEMS must be between 1 and 100"),
+        ("CHAT_BATCH_MAX_CONCURRENCY", "0", "CHAT_BATCH_MAX_CONCURRENCY must be >= 1"),
+    ],
+)
+def test_load_settings_rejects_invalid_chat_batch_limits(
+    monkeypatch: pytest.MonkeyPatch, env_name: str, value: str, message: str
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv(env_name, value)
+
+    with pytest.raises(ValueError, match=message):
+        load_settings()
+
+
+def test_load_settings_reads_chat_request_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    assert load_settings().chat_request_deadline_seconds == 25.0
+
+    monkeypatch.setenv("CHAT_REQUEST_DEADLINE_SECONDS", "12.5")
+    assert load_settings().chat_request_deadline_seconds == 12.5
+
+    monkeypatch.setenv("CHAT_REQUEST_DEADLINE_SECONDS", "0")
+    with pytest.raises(ValueError, match="CHAT_REQUEST_DEADLINE_SECONDS must be > 0"):
+        load_settings()
+
+
+def test_load_settings_reads_chat_brownout_configuration(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    settings = load_settings()
+    assert settings.chat_brownout_enabled is False
+    assert settings.chat_brownout_max_event_loop_lag_ms == 250.0
+    assert settings.chat_brownout_max_queue_depth == 16
+    assert settings.chat_brownout_max_p95_latency_ms == 10000.0
+
+    monkeypatch.setenv("CHAT_BROWNOUT_ENABLED", "true")
+    monkeypatch.setenv("CHAT_BROWNOUT_MAX_QUEUE_DEPTH", "4")
+    settings = load_settings()
+    assert settings.chat_brownout_enabled is True
+    assert settings.chat_brownout_max_queue_depth == 4
+
+    monkeypatch.setenv("CHAT_BROWNOUT_MAX_QUEUE_DEPTH", "0")
+    with pytest.raises(ValueError, match="CHAT_BROWNOUT_MAX_QUEUE_DEPTH must be >= 1"):
+        load_settings()
+
+
+def test_load_settings_reads_provider_retry_budget(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    settings = load_settings()
+    assert settings.provider_retry_budget_ratio == 0.2
+    assert settings.provider_retry_budget_max_tokens == 10.0
+
+    monkeypatch.setenv("PROVIDER_RETRY_BUDGET_RATIO", "0.5")
+    monkeypatch.setenv("PROVIDER_RETRY_BUDGET_MAX_TOKENS", "4")
+    settings = load_settings()
+    assert settings.provider_retry_budget_ratio == 0.5
+    assert settings.provider_retry_budget_max_tokens == 4.0
+
+    monkeypatch.setenv("PROVIDER_RETRY_BUDGET_RATIO", "1.5")
+    with pytest.raises(
+        ValueError, match="PROVIDER_RETRY_BUDGET_RATIO must be between 0 and 1"
+    ):
+        load_settings()
+
+    monkeypatch.setenv("PROVIDER_RETRY_BUDGET_RATIO", "0.2")
+    monkeypatch.setenv("PROVIDER_RETRY_BUDGET_MAX_TOKENS", "0")
+    with pytest.raises(ValueError, match="PROVIDER_RETRY_BUDGET_MAX_TOKENS must be >= 1"):
+        load_settings()
+
+
+def test_load_settings_reads_gemini_model_health_configuration(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    settings = load_settings()
+    assert settings.gemini_model_failure_threshold == 3
+    assert settings.gemini_model_cooldown_seconds == 60.0
+
+    monkeypatch.setenv("GEMINI_MODEL_FAILURE_THRESHOLD", "5")
+    monkeypatch.setenv("GEMINI_MODEL_COOLDOWN_SECONDS", "15")
+    settings = load_settings()
+    assert settings.gemini_model_failure_threshold == 5
+    assert settings.gemini_model_cooldown_seconds == 15.0
+
+    monkeypatch.setenv("GEMINI_MODEL_COOLDOWN_SECONDS", "0")
+    with pytest.raises(ValueError, match="GEMINI_MODEL_COOLDOWN_SECONDS must be > 0"):
+        load_settings()
+
+
+def test_load_settings_reads_chat_precomputed_answers_path(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    assert load_settings().chat_precomputed_answers_path == ""
+
+    monkeypatch.setenv("CHAT_PRECOMPUTED_ANSWERS_PATH", "artifacts/chat/answers.json")
+    assert load_settings().chat_precomputed_answers_path == "artifacts/chat/answers.json"
+
+
+def test_load_settings_reads_chat_session_memory_configuration(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    settings = load_settings()
+    assert settings.chat_session_memory_enabled is False
+    assert settings.chat_session_memory_max_turns == 4
+    assert settings.chat_session_memory_max_sessions == 1000
+    assert settings.chat_session_memory_ttl_seconds == 3600.0
+
+    monkeypatch.setenv("CHAT_SESSION_MEMORY_ENABLED", "true")
+    monkeypatch.setenv("CHAT_SESSION_MEMORY_MAX_TURNS", "2")
+    monkeypatch.setenv("CHAT_SESSION_MEMORY_MAX_SESSIONS", "50")
+    monkeypatch.setenv("CHAT_SESSION_MEMORY_TTL_SECONDS", "600")
+    settings = load_settings()
+    assert settings.chat_session_memory_enabled is True
+    assert settings.chat_session_memory_max_turns == 2
+    assert settings.chat_session_memory_max_sessions == 50
+    assert settings.chat_session_memory_ttl_seconds == 600.0
+
+    monkeypatch.setenv("CHAT_SESSION_MEMORY_MAX_TURNS", "0")
+    with pytest.raises(ValueError, match="CHAT_SESSION_MEMORY_MAX_TURNS must be >= 1"):
+        load_settings()
+
+
+def test_load_settings_reads_grounding_section_index_configuration(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    settings = load_settings()
+    assert settings.grounding_section_index_path == ""
+    assert settings.grounding_section_index_top_k == 3
+
+    monkeypatch.setenv("GROUNDING_SECTION_INDEX_PATH", "artifacts/grounding/sections.idx")
+    monkeypatch.setenv("GROUNDING_SECTION_INDEX_TOP_K", "5")
+    settings = load_settings()
+    assert settings.grounding_section_index_path == "artifacts/grounding/sections.idx"
+    assert settings.grounding_section_index_top_k == 5
+
+    monkeypatch.setenv("GROUNDING_SECTION_INDEX_TOP_K", "0")
+    with pytest.raises(ValueError, match="GROUNDING_SECTION_INDEX_TOP_K must be >= 1"):
+        load_settings()
+
+
+def test_load_settings_reads_hybrid_grounding_configuration(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    settings = load_settings()
+    assert settings.grounding_section_vectors_path == ""
+    assert settings.grounding_embedder == "hashing"
+
+    monkeypatch.setenv("GROUNDING_SECTION_VECTORS_PATH", "artifacts/grounding/sections.vec")
+    monkeypatch.setenv("GROUNDING_EMBEDDER", "sentence-transformers:all-MiniLM-L6-v2")
+    settings = load_settings()
+    assert settings.grounding_section_vectors_path == "artifacts/grounding/sections.vec"
+    assert settings.grounding_embedder == "sentence-transformers:all-MiniLM-L6-v2"
+
+    monkeypatch.setenv("GROUNDING_EMBEDDER", "sentence-transformers:")
+    with pytest.raises(ValueError, match="GROUNDING_EMBEDDER must be 'hashing'"):
+        load_settings()